@@ -0,0 +1,67 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures how long `import pywwise` takes, in a fresh interpreter per run. Exits with a non-zero status if the median
+import time exceeds the threshold, so it can guard against regressions (e.g. a module-level import of `waapi`).
+Usage: `python benchmarks/import_time.py [--runs 20] [--max-ms 100] [--statement "import pywwise"]`
+"""
+
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from subprocess import run
+from sys import executable, exit
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure_import(statement: str) -> float:
+    """
+    Runs a statement in a fresh interpreter, with `-X importtime`.
+    :param statement: The statement to run (e.g. `import pywwise`).
+    :return: The cumulative import time of the top-level modules imported by the statement, in milliseconds.
+    """
+    result = run([executable, "-X", "importtime", "-c", statement], cwd=_ROOT, capture_output=True, text=True,
+                 check=True)
+    baseline = run([executable, "-X", "importtime", "-c", "pass"], cwd=_ROOT, capture_output=True, text=True,
+                   check=True)
+    return (_top_level_total(result.stderr) - _top_level_total(baseline.stderr)) / 1000
+
+
+def _top_level_total(report: str) -> int:
+    """
+    Sums the cumulative times of the top-level modules in an `-X importtime` report.
+    :param report: The report (i.e. the interpreter's stderr).
+    :return: The total, in microseconds.
+    """
+    total = 0
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):  # Nested imports are indented.
+            total += int(cumulative)
+    return total
+
+
+def main():
+    parser = ArgumentParser(description="Measures the import time of PyWwise.")
+    parser.add_argument("--runs", type=int, default=20, help="The amount of fresh interpreters to measure.")
+    parser.add_argument("--max-ms", type=float, default=100.0, help="The maximum median import time, in ms.")
+    parser.add_argument("--statement", default="import pywwise", help="The import statement to measure.")
+    args = parser.parse_args()
+    
+    measure_import(args.statement)  # Warm-up (e.g. writes the bytecode cache).
+    times = sorted(measure_import(args.statement) for _ in range(args.runs))
+    
+    print(f"{args.statement}: median {median(times):.1f} ms, min {times[0]:.1f} ms, max {times[-1]:.1f} ms "
+          f"({args.runs} runs)")
+    
+    if median(times) > args.max_ms:
+        print(f"FAILED: the median import time exceeds {args.max_ms:.1f} ms.")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
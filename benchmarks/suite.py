@@ -0,0 +1,489 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the hot paths of PyWwise: decoding WAAPI results (`ak.wwise.core.object.get`, profiler voices and
+contributions, `ak.wwise.core.soundbank.generated` events), `WwiseProperty` access, enum lookups, and WAQL building.
+Decoding benchmarks use canned payloads; `WwiseProperty` benchmarks run against a local `FakeWaapiServer`, so no
+instance of Wwise is needed. Results are written as a JSON report, which can be compared with a report made by another
+version.
+Usage: `python benchmarks/suite.py [--filter get] [--output report.json] [--compare baseline.json]`
+"""
+
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from json import dump, load
+from pathlib import Path
+from platform import machine, platform, python_implementation, python_version
+from statistics import mean, median, stdev
+from subprocess import CalledProcessError, run
+from sys import exit, path as sys_path
+from timeit import Timer
+from tomllib import load as load_toml
+from typing import Any, Callable
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys_path.insert(0, str(_ROOT))  # Benchmark the working tree, even if another version of PyWwise is installed.
+
+import pywwise
+from pywwise.enums import EGeneratedSoundBankType, ELogSeverity, EObjectType, EReturnOptions, EWaqlLogicalOperator
+from pywwise.statics import EnumStatics
+from pywwise.structs import WwiseObjectInfo
+from pywwise.waapi.ak.wwise.core.object import Object
+from pywwise.waapi.ak.wwise.core.profiler import Profiler
+from pywwise.waapi.ak.wwise.core.soundbank import SoundBank
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from pywwise.waapi.live_snapshot import LiveProjectSnapshot
+from pywwise.waql import CompiledWaqlQuery, PreparedWaqlQuery, WaqlQuery
+
+REPORT_SCHEMA = 1
+"""The version of the report format. Reports with different schemas are not compared."""
+
+_BENCHMARKS = dict[str, Callable[["_Context"], tuple[Callable[[], Any], int]]]()
+"""The benchmarks, by name. Each one makes the function to time, and the amount of items it processes per call."""
+
+
+def benchmark(name: str) -> Callable:
+    """
+    A decorator registering a benchmark. The decorated function sets the benchmark up, and returns the function to
+    time along with the amount of items (e.g. objects decoded) it processes per call.
+    :param name: The name of the benchmark, as used in reports. Names are stable across versions.
+    :return: The decorator.
+    """
+    
+    def decorator(func: Callable[["_Context"], tuple[Callable[[], Any], int]]) -> Callable:
+        _BENCHMARKS[name] = func
+        return func
+    
+    return decorator
+
+
+class _CannedClient:
+    """A stand-in for `waapi.WaapiClient` returning canned results per URI. Subscriptions are accepted and ignored."""
+    
+    def __init__(self, results: dict[str, dict[str, Any]]):
+        """
+        Constructor.
+        :param results: The result to return for each URI.
+        """
+        self._results = results
+    
+    def call(self, _uri: str, *args, **kwargs) -> dict[str, Any] | None:
+        """
+        Returns the canned result for a URI.
+        :param _uri: The URI of the function.
+        :param args: Ignored.
+        :param kwargs: Ignored.
+        :return: The canned result, or `None` if there is none.
+        """
+        return self._results.get(_uri)
+    
+    def subscribe(self, _uri: str, *args, **kwargs) -> None:
+        """
+        Ignores a subscription.
+        :param _uri: The URI of the topic.
+        :param args: Ignored.
+        :param kwargs: Ignored.
+        """
+        return None
+
+
+class _Context:
+    """Resources shared by benchmarks, created on first use (e.g. the fake server is only started if needed)."""
+    
+    def __init__(self, latency: float):
+        """
+        Constructor.
+        :param latency: The latency of the fake server, in seconds.
+        """
+        self._latency = latency
+        self._server: FakeWaapiServer | None = None
+        self._ak: pywwise.WwiseConnection | None = None
+        self._cached_ak: pywwise.WwiseConnection | None = None
+    
+    @property
+    def ak(self) -> "pywwise.WwiseConnection":
+        """
+        :return: A connection to a fake server serving a synthetic project of 1000 Sounds. The first Sound has 16
+                 effect slots (in its `Effects` list).
+        """
+        if self._ak is None:
+            project = new_synthetic_project(1000)
+            sound = project.of_type("Sound")[0]
+            slots = [project.add({"name": f"Slot_{index:02}", "type": "EffectSlot"}, sound) for index in range(16)]
+            project.set_value(sound, "@Effects", [{"id": slot["id"], "name": slot["name"]} for slot in slots])
+            self._server = FakeWaapiServer(project, latency=self._latency).start()
+            self._ak = pywwise.new_waapi_connection(self._server.url)
+        return self._ak
+    
+    @property
+    def cached_ak(self) -> "pywwise.WwiseConnection":
+        """:return: Another connection to the fake server, with the property and query caches enabled."""
+        if self._cached_ak is None:
+            self._cached_ak = pywwise.new_waapi_connection(self.server.url)
+            self._cached_ak.enable_property_cache()
+            self._cached_ak.enable_query_cache()
+        return self._cached_ak
+    
+    @property
+    def server(self) -> FakeWaapiServer:
+        """:return: The fake server."""
+        _ = self.ak
+        return self._server
+    
+    def close(self):
+        """Disconnects from, and stops, the fake server (if it was started)."""
+        if self._cached_ak is not None:
+            self._cached_ak.disconnect()
+        if self._ak is not None:
+            self._ak.disconnect()
+            self._server.stop()
+
+
+def _object_rows(count: int) -> list[dict[str, Any]]:
+    """
+    Makes the rows of an `ak.wwise.core.object.get` result, with the default return options and two properties.
+    :param count: The amount of rows.
+    :return: The rows.
+    """
+    return [{"id": f"{{{index:08X}-0000-4000-8000-000000000000}}", "name": f"Sound_{index:06}", "type": "Sound",
+             "path": f"\\Actor-Mixer Hierarchy\\Default Work Unit\\Sound_{index:06}", "@Volume": -float(index % 24),
+             "@Pitch": index % 1200} for index in range(count)]
+
+
+def _generated_payload(count: int) -> dict[str, Any]:
+    """
+    Makes the data of an `ak.wwise.core.soundbank.generated` event, with the info file, bank data and plugin info.
+    :param count: The amount of media files and events in the bank.
+    :return: The event data.
+    """
+    media = [{"Id": str(index), "Language": "SFX", "ShortName": f"Sound_{index:06}.wav",
+              "Path": f"Media/{index}.wem"} for index in range(count)]
+    events = [{"Id": str(1000000 + index), "Name": f"Play_Sound_{index:06}", "ObjectPath": f"\\Events\\Play_{index}",
+               "GUID": f"{{{index:08X}-0000-4000-8000-000000000000}}"} for index in range(count)]
+    bank_info = {"Id": "1355168291", "Type": "User", "Language": "SFX",
+                 "Hash": "{C0FFEE00-0000-4000-8000-000000000000}", "ShortName": "Main", "Path": "Main.bnk",
+                 "ObjectPath": "\\SoundBanks\\Default Work Unit\\Main",
+                 "Media": media, "Events": events, "Busses": [{"Id": "3803692087", "Name": "Master Audio Bus"}],
+                 "GameParameters": [], "StateGroups": [], "SwitchGroups": [], "Triggers": []}
+    plugins = [{"LibName": f"Plugin {index}", "LibId": str(index), "Type": "Effect", "DLL": f"Plugin{index}",
+                "StaticLib": f"Plugin{index}FX"} for index in range(8)]
+    return {"soundbank": {"id": "{C0FFEE00-0000-4000-8000-000000000000}", "name": "Main",
+                          "path": "\\SoundBanks\\Default Work Unit\\Main"},
+            "bankInfo": [bank_info], "pluginInfo": {"PluginLibs": plugins}, "bankData": {"data": "QktIRA==", "size": 4},
+            "platform": {"id": "{B2C33B6B-0000-4000-8000-000000000000}", "name": "Windows"}, "language": "SFX"}
+
+
+def _voice_rows(count: int) -> list[dict[str, Any]]:
+    """
+    Makes the rows of an `ak.wwise.core.profiler.getVoices` result, with a few additional return options.
+    :param count: The amount of voices.
+    :return: The rows.
+    """
+    return [{"pipelineID": index, "gameObjectID": 100 + index % 16,
+             "objectGUID": f"{{{index:08X}-0000-4000-8000-000000000000}}", "objectName": f"Sound_{index:06}",
+             "playingID": 5000 + index, "isVirtual": index % 5 == 0, "baseVolume": -3.0, "pitch": 0.0}
+            for index in range(count)]
+
+
+def _contribution_tree(depth: int, width: int) -> list[dict[str, Any]]:
+    """
+    Makes the objects of an `ak.wwise.core.profiler.getVoiceContributions` result.
+    :param depth: The depth of the hierarchy.
+    :param width: The amount of children per object.
+    :return: The top-level objects.
+    """
+    if depth == 0:
+        return []
+    parameters = [{"propertyType": "Volume", "reason": "RTPC", "driver": "Distance", "driverValue": 12.5,
+                   "value": -6.0}, {"propertyType": "LPF", "reason": "State", "driver": "Underwater",
+                                    "driverValue": 1.0, "value": 20.0}]
+    return [{"name": f"Object_{depth}_{index}", "volume": -1.0, "LPF": 0.0, "HPF": 0.0, "parameters": parameters,
+             "children": _contribution_tree(depth - 1, width)} for index in range(width)]
+
+
+@benchmark("object.get.decode[1000]")
+def _object_get_decode(context: _Context) -> tuple[Callable[[], Any], int]:
+    rows = _object_rows(1000)
+    obj = Object(_CannedClient({"ak.wwise.core.object.get": {"return": rows}}))
+    return lambda: obj.get("$ from type Sound", ("@Volume", "@Pitch")), len(rows)
+
+
+@benchmark("object.get.decode[100000]")
+def _object_get_decode_large(context: _Context) -> tuple[Callable[[], Any], int]:
+    rows = _object_rows(100000)
+    obj = Object(_CannedClient({"ak.wwise.core.object.get": {"return": rows}}))
+    return lambda: obj.get("$ from type Sound", ("@Volume", "@Pitch")), len(rows)
+
+
+@benchmark("object_info.from_dict[100000]")
+def _object_info_from_dict(context: _Context) -> tuple[Callable[[], Any], int]:
+    rows = _object_rows(100000)
+    
+    def decode():  # One validated instance at a time, without `other` (for comparison with `object.get`).
+        return [WwiseObjectInfo.from_dict(row) for row in rows]
+    
+    return decode, len(rows)
+
+
+@benchmark("object.get_columns.decode[1000]")
+def _object_get_columns_decode(context: _Context) -> tuple[Callable[[], Any], int]:
+    rows = _object_rows(1000)
+    obj = Object(_CannedClient({"ak.wwise.core.object.get": {"return": rows}}))
+    return lambda: obj.get_columns("$ from type Sound", ("@Volume", "@Pitch")), len(rows)
+
+
+@benchmark("object.get.poll[100]")
+def _object_get_poll(context: _Context) -> tuple[Callable[[], Any], int]:
+    obj = context.ak.wwise.core.object
+    return lambda: obj.get('$ from type Sound where name : "Sound_0000"', ("@Volume",)), 100
+
+
+@benchmark("object.get.poll[100].cached")
+def _object_get_poll_cached(context: _Context) -> tuple[Callable[[], Any], int]:
+    obj = context.cached_ak.wwise.core.object
+    return lambda: obj.get('$ from type Sound where name : "Sound_0000"', ("@Volume",)), 100
+
+
+@benchmark("object.snapshot.load")
+def _object_snapshot_load(context: _Context) -> tuple[Callable[[], Any], int]:
+    snapshot = LiveProjectSnapshot(context.ak.wwise.core.object, ("@Volume",))
+    return snapshot.load, len(context.server.project)
+
+
+@benchmark("property.get.float")
+def _property_get_float(context: _Context) -> tuple[Callable[[], Any], int]:
+    sound = pywwise.Sound(pywwise.GUID(context.server.project.of_type("Sound")[0]), context.ak)
+    return lambda: sound.volume, 1
+
+
+@benchmark("property.get.reference")
+def _property_get_reference(context: _Context) -> tuple[Callable[[], Any], int]:
+    sound = pywwise.Sound(pywwise.GUID(context.server.project.of_type("Sound")[0]), context.ak)
+    return lambda: sound.output_bus, 1
+
+
+@benchmark("property.get.list[16]")
+def _property_get_list(context: _Context) -> tuple[Callable[[], Any], int]:
+    sound = pywwise.Sound(pywwise.GUID(context.server.project.of_type("Sound")[0]), context.ak)
+    return lambda: sound.effects, 16
+
+
+@benchmark("property.get.float.cached")
+def _property_get_float_cached(context: _Context) -> tuple[Callable[[], Any], int]:
+    sound = pywwise.Sound(pywwise.GUID(context.server.project.of_type("Sound")[0]), context.cached_ak)
+    return lambda: sound.volume, 1
+
+
+@benchmark("property.set.float")
+def _property_set_float(context: _Context) -> tuple[Callable[[], Any], int]:
+    sound = pywwise.Sound(pywwise.GUID(context.server.project.of_type("Sound")[0]), context.ak)
+    
+    def set_volume():
+        sound.volume = -6.0
+    
+    return set_volume, 1
+
+
+@benchmark("property.set.float.batched[1000]")
+def _property_set_float_batched(context: _Context) -> tuple[Callable[[], Any], int]:
+    sounds = [pywwise.Sound(pywwise.GUID(guid), context.ak) for guid in context.server.project.of_type("Sound")]
+    
+    def set_volumes():
+        with context.ak.batch():
+            for sound in sounds:
+                sound.volume = -6.0
+    
+    return set_volumes, len(sounds)
+
+
+@benchmark("property.fetch.declared")
+def _property_fetch_declared(context: _Context) -> tuple[Callable[[], Any], int]:
+    sound = pywwise.Sound(pywwise.GUID(context.server.project.of_type("Sound")[0]), context.ak)
+    return sound.fetch, len(pywwise.Sound.get_declared_properties())
+
+
+@benchmark("enums.from_type_name")
+def _from_type_name(context: _Context) -> tuple[Callable[[], Any], int]:
+    names = [member.get_type_name() for member in EObjectType][::-1]  # Worst case first: the last members.
+    return lambda: [EObjectType.from_type_name(name) for name in names], len(names)
+
+
+@benchmark("statics.from_value")
+def _from_value(context: _Context) -> tuple[Callable[[], Any], int]:
+    lookups = [(enum_type, member.value) for enum_type in (EGeneratedSoundBankType, ELogSeverity, EReturnOptions)
+               for member in enum_type]
+    return lambda: [EnumStatics.from_value(enum_type, value) for enum_type, value in lookups], len(lookups)
+
+
+@benchmark("waql.build")
+def _waql_build(context: _Context) -> tuple[Callable[[], Any], int]:
+    def build() -> str:
+        query = WaqlQuery()
+        query.from_type(EObjectType.SOUND, EObjectType.RANDOM_SEQUENCE_CONTAINER)
+        query.where()
+        query.open_bracket()
+        query.expression("Volume", EWaqlLogicalOperator.LESS_THAN, -6)
+        query.or_operator()
+        query.expression("name", EWaqlLogicalOperator.CONTAINS, "Footstep")
+        query.close_bracket()
+        query.and_operator()
+        query.expression("IsStreamingEnabled", EWaqlLogicalOperator.EQUAL, True)
+        query.select("parent")
+        query.distinct()
+        return str(query)
+    
+    return build, 1
+
+
+@benchmark("waql.prepared.bind")
+def _waql_prepared_bind(context: _Context) -> tuple[Callable[[], Any], int]:
+    template = "$ from type {types:type} where Volume < {volume:float} and name : {pattern:regex} select parent"
+    
+    def bind() -> str:
+        return PreparedWaqlQuery.prepare(template).bind(EObjectType.SOUND, -6.0, "Footstep")
+    
+    return bind, 1
+
+
+@benchmark("waql.evaluate[1000]")
+def _waql_evaluate(context: _Context) -> tuple[Callable[[], Any], int]:
+    project = new_synthetic_project(1000, 100, with_events=False)
+    query = CompiledWaqlQuery.compile('$ from type Sound where Volume < -6 and not parent.name : "Container_00001"')
+    return lambda: query.evaluate(project), len(project.of_type("Sound"))
+
+
+@benchmark("soundbank.generated.decode[500]")
+def _soundbank_generated(context: _Context) -> tuple[Callable[[], Any], int]:
+    soundbank = SoundBank(_CannedClient({}))
+    soundbank.generated.add(lambda info: None)  # The payload is only decoded if the event has subscribers.
+    payload = _generated_payload(500)
+    return lambda: soundbank._on_generated(**payload), 1
+
+
+@benchmark("profiler.get_voices.decode[500]")
+def _profiler_get_voices(context: _Context) -> tuple[Callable[[], Any], int]:
+    rows = _voice_rows(500)
+    profiler = Profiler(_CannedClient({"ak.wwise.core.profiler.getVoices": {"return": rows}}))
+    return lambda: profiler.get_voices(0), len(rows)
+
+
+@benchmark("profiler.get_voice_contributions.decode[4x4]")
+def _profiler_get_voice_contributions(context: _Context) -> tuple[Callable[[], Any], int]:
+    objects = _contribution_tree(4, 4)
+    result = {"return": {"volume": -12.0, "LPF": 10.0, "HPF": 0.0, "objects": objects}}
+    profiler = Profiler(_CannedClient({"ak.wwise.core.profiler.getVoiceContributions": result}))
+    return lambda: profiler.get_voice_contributions(0, 1), sum(4 ** level for level in range(1, 5))
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int, min_time: float) -> dict[str, Any]:
+    """
+    Times a function: the amount of calls per sample is picked so that each sample lasts at least `min_time`.
+    :param func: The function to time.
+    :param items: The amount of items the function processes per call.
+    :param repeat: The amount of samples.
+    :param min_time: The minimum duration of a sample, in seconds.
+    :return: The results: seconds per call (min, median, mean, standard deviation), and items per second.
+    """
+    timer = Timer(func)
+    calls = 1
+    while (elapsed := timer.timeit(calls)) < min_time:  # Same approach as `Timer.autorange`, with a custom minimum.
+        calls = max(calls * 2, int(calls * min_time / elapsed * 1.1) if elapsed > 0 else calls * 10)
+    samples = [timer.timeit(calls) / calls for _ in range(repeat)]
+    return {"unit": "s", "calls_per_sample": calls, "items_per_call": items, "min": min(samples),
+            "median": median(samples), "mean": mean(samples), "stdev": stdev(samples) if len(samples) > 1 else 0.0,
+            "items_per_second": items / median(samples)}
+
+
+def _pywwise_version() -> str:
+    """:return: The version of PyWwise being benchmarked (from `pyproject.toml`, if it is the working tree)."""
+    pyproject = _ROOT / "pyproject.toml"
+    if pyproject.is_file():
+        with open(pyproject, "rb") as file:
+            return load_toml(file)["project"]["version"]
+    try:
+        return version("pywwise")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _git_revision() -> str | None:
+    """:return: The Git commit of the working tree, or `None` if it is not a Git repository."""
+    try:
+        return run(["git", "rev-parse", "HEAD"], cwd=_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (CalledProcessError, FileNotFoundError):
+        return None
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], max_ratio: float) -> bool:
+    """
+    Prints how each benchmark changed relative to a baseline report (by median time per call).
+    :param report: The new report.
+    :param baseline: The baseline report (e.g. made with the previous version).
+    :param max_ratio: The maximum new/baseline ratio before a benchmark is considered a regression.
+    :return: Whether no benchmark regressed.
+    """
+    if baseline.get("schema") != report["schema"]:
+        print(f"Cannot compare: the baseline uses report schema {baseline.get('schema')}.")
+        return False
+    
+    passed = True
+    print(f"\nCompared with {baseline['pywwise']} ({baseline.get('git') or 'unknown revision'}):")
+    for name, result in report["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"  {name:<48} (new)")
+            continue
+        ratio = result["median"] / old["median"]
+        regressed = ratio > max_ratio
+        passed &= not regressed
+        print(f"  {name:<48} {ratio:6.2f}x time{'  REGRESSION' if regressed else ''}")
+    return passed
+
+
+def main():
+    parser = ArgumentParser(description="Measures the hot paths of PyWwise, and writes a JSON report.")
+    parser.add_argument("--filter", default="", help="Only run the benchmarks whose name contains this text.")
+    parser.add_argument("--repeat", type=int, default=5, help="The amount of samples per benchmark.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="The minimum duration of a sample, in seconds.")
+    parser.add_argument("--latency", type=float, default=0.0, help="The latency of the fake server, in seconds.")
+    parser.add_argument("--output", type=Path, help="The path of the JSON report to write.")
+    parser.add_argument("--compare", type=Path, help="The path of a JSON report to compare the results with.")
+    parser.add_argument("--max-ratio", type=float, default=1.25, help="The maximum slowdown when comparing.")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks, then exit.")
+    args = parser.parse_args()
+    
+    names = [name for name in _BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return
+    
+    report = {"schema": REPORT_SCHEMA, "pywwise": _pywwise_version(), "git": _git_revision(),
+              "python": f"{python_implementation()} {python_version()}", "platform": platform(), "machine": machine(),
+              "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+              "settings": {"repeat": args.repeat, "min_time": args.min_time, "latency": args.latency},
+              "results": dict[str, Any]()}
+    
+    context = _Context(args.latency)
+    try:
+        for name in names:
+            func, items = _BENCHMARKS[name](context)
+            func()  # Warm-up (e.g. lazy imports, first subscription).
+            result = report["results"][name] = measure(func, items, args.repeat, args.min_time)
+            print(f"{name:<48} {result['median'] * 1e6:12.2f} us/call {result['items_per_second']:14,.0f} items/s")
+    finally:
+        context.close()
+    
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump(report, file, indent=2)
+    
+    if args.compare is not None:
+        with open(args.compare, encoding="utf-8") as file:
+            if not compare(report, load(file), args.max_ratio):
+                exit(1)
+
+
+if __name__ == "__main__":
+    main()
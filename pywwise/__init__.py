@@ -1,38 +1,46 @@
 # Copyright 2024 Matheus Vilano
 # SPDX-License-Identifier: Apache-2.0
 
+from importlib import import_module as _import_module
+from importlib.util import find_spec as _find_spec
 from logging import CRITICAL as _LEVEL_CRITICAL, getLogger as _getLogger
+from typing import Any as _Any
 
-from waapi import CallbackExecutor, SequentialThreadExecutor
-
-from pywwise.aliases import *
-from pywwise.enums import *
-from pywwise.objects import *
-from pywwise.primitives import *
-from pywwise.structs import *
-from pywwise.waapi.ak import Ak as _Ak, WwiseConnection
-from pywwise.waql import *
+from pywwise._names import NAMES as _LAZY_MODULES
 
 _getLogger("waapi").setLevel(_LEVEL_CRITICAL)
 
+_LAZY_NAMES = {name: module_name for module_name, names in _LAZY_MODULES.items() for name in names}
+"""The module defining each public name of this package, from the `__all__` of each module (as generated in
+`pywwise._names`). Modules are only imported once one of their names is accessed (e.g. `pywwise.EObjectType`), so that
+`import pywwise` stays fast; in particular, the WAAPI client is only imported when a connection is needed. Unknown names
+are rejected without importing anything."""
+
 
-def new_waapi_connection(url: str = "ws://127.0.0.1:8080/waapi", *, allow_exception: bool = False,
-                         callback_executor: CallbackExecutor = SequentialThreadExecutor,
-                         is_debug_build: bool = False, is_console_instance: bool = False,
-                         watch_list: tuple[WwiseObjectWatch, ...] = ()) -> WwiseConnection:
+def __getattr__(name: str) -> _Any:
     """
-    Connects to an instance of Wwise.
-    :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
-    :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
-    :param callback_executor: Executor strategy for event callbacks.
-    :param is_debug_build: Should be set to true if the instance of Wwise is a debug build and debug-only.
-    :param is_console_instance: Should be set to true if the instance of Wwise is running in a console window.
-                                functions/topics are required.
-    :param watch_list: A tuple of `WwiseObjectWatch` instances. This will be used to set up the
-                       `ak.wwise.core.object.property_changed` event.
-    :return: A WAAPI connection.
+    Resolves a public name of this package on first access, by importing the module defining it. The result is then
+    stored in this package, so this function is only called once per name.
+    :param name: The name of the attribute (e.g. `EObjectType`, `Sound` or `new_waapi_connection`).
+    :raise AttributeError: If no module of this package defines the name.
+    :return: The attribute.
     """
-    return _Ak(url, allow_exception, callback_executor, is_debug_build, is_console_instance, watch_list)
+    if name == "__all__":
+        return sorted([*_LAZY_NAMES, "set_waapi_logging"])
+    
+    if (module_name := _LAZY_NAMES.get(name)) is not None:
+        value = globals()[name] = getattr(_import_module(module_name), name)
+        return value
+    
+    if not name.startswith("_") and _find_spec(f"{__name__}.{name}") is not None:  # A submodule (e.g. `descriptors`).
+        return _import_module(f"{__name__}.{name}")
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """:return: The names in this package, including the ones that have not been resolved yet."""
+    return sorted(set(globals()) | set(__getattr__("__all__")))
 
 
 def set_waapi_logging(level: int):
@@ -0,0 +1,138 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+The public names of the `pywwise` package, per module. `NAMES` is generated from the `__all__` of each module listed in
+`MODULES`: do not edit it by hand; instead, run `python -m pywwise._names` after changing an `__all__` (or `MODULES`).
+"""
+
+MODULES = ("pywwise.aliases", "pywwise.primitives", "pywwise.enums", "pywwise.structs", "pywwise.waql",
+           "pywwise.objects", "pywwise.connections")
+"""The modules whose public names (i.e. their `__all__`) are exposed by the `pywwise` package."""
+
+# BEGIN GENERATED NAMES
+NAMES = {
+    "pywwise.aliases": ("ListOrTuple", "ListOrTupleOrSet", "RegexPattern", "SystemPath", "UnionType"),
+    "pywwise.primitives": ("GUID", "GameObjectID", "Name", "OriginalsPath", "PlayingID", "ProjectPath", "ShortID"),
+    "pywwise.enums": ("E3DPosition", "E3DSpatialization", "EActionNamePosition", "EActionOnEventType", "EActionType",
+                      "EAllowStingerNext", "EAttenuationCurveShape", "EAttenuationCurveType", "EAttenuationCurveUsage",
+                      "EAudioImportOperation", "EAudioObjectOptions", "EBasePlatform", "EBitDepth",
+                      "EBuiltInGameParameter", "EBusChannelConfiguration", "EBusOptions", "ECaptureLogItemType",
+                      "ECaptureLogSeverity", "ECaseStyle", "ECaseStyleSimple", "EChannelConversionSettings", "EColour",
+                      "ECommand", "EContainerPlayMode", "EControlSurfaceBindingGroupType",
+                      "EControlSurfaceBindingTargetType", "EConvolutionReverbAlgorithm", "EConvolutionReverbBlockSize",
+                      "EConvolutionReverbIrChannelSelection", "EConvolutionReverbIrLpfSlope", "ECurve",
+                      "ECustomCueJumpMatchMode", "EDataTypes", "EDestinationContextType", "EDiscardBehaviour",
+                      "EDispatchStrategy", "EEnvelopeTriggerOn", "EExternalAnalysisType", "EFadeCurve", "EFadeMode",
+                      "EFadeShape", "EFadeType", "EFftWindowSize", "EFilterBehaviour", "EFrequencyMode",
+                      "EGameParameterValueChangeAction", "EGeneratedSoundBankType", "EGuitarDistortionFilterType",
+                      "EGuitarDistortionType", "EHarmonizerFilterType", "EHarmonizerInput", "EHdrReleaseTimeMode",
+                      "EImportOperation", "EInclusionFilter", "EInclusionOperation", "EInterpolationMode",
+                      "ELineEnding", "EListMode", "ELogChannel", "ELogSeverity", "ELogicalOperator",
+                      "ELoudnessNormalizationType", "EMainMixConfiguration", "EMarkerInputMode",
+                      "EMasteringSuiteFilterMode", "EMasteringSuiteLimiterMode", "EMasteringSuiteLinkMode",
+                      "EMatchMode", "EMatrixReverbDelayCount", "EMatrixReverbDelayLengthsMode", "EMechanismPlayMode",
+                      "EMeterMode", "EMeterScope", "EMidiPlayOnNoteType", "EMidiTempoSource", "EModPhaseMode",
+                      "EModWaveform", "EModulatorScope", "EModulatorScopeLimited", "EMotionChannelConfig",
+                      "EMotionDriver", "EMultiPositionType", "EMusicClipType", "EMusicCueType",
+                      "EMusicDestinationJumpTo", "EMusicDestinationSyncTo", "EMusicFadeShape", "EMusicPlaylistItemType",
+                      "EMusicSegmentPlayPoint", "EMusicSourceExitPoint", "EMusicTrackType", "EMusicalDuration",
+                      "EMusicalGridFrequency", "ENameConflictStrategy", "ENoiseColour", "EObjectType",
+                      "EObjectTypeQuery", "EOverLimitBehaviour", "EParametricEqFilterType", "EPassthroughMixPolicy",
+                      "EPitchShifterFilterType", "EPitchShifterInput", "EPlatformOption", "EPlayMechanismLoopType",
+                      "EPlayMechanismSpecialTransitionsType", "EPlaylistMode", "EPlaylistRestartBehaviour",
+                      "EPropertyPasteMode", "ERandomOrSequence", "ERandomType", "ERecorderAmbisonicsChannelOrdering",
+                      "ERecorderFormat", "EReflectAlgorithm", "EReflectChannelConfig",
+                      "EReflectDecorrelationStrengthSource", "EReflectFilterType", "EReflectThresholdMode",
+                      "EReturnOptions", "ERoomVerbFilterType", "ERoomVerbInsertPosition", "ERtpcMode", "ESampleRate",
+                      "ESampleRateConversionQuality", "EScope", "ESearchCriteriaContainerType",
+                      "ESearchCriteriaCurveType", "ESearchCriteriaCurveUsage", "ESearchCriteriaLfeOption",
+                      "ESearchCriteriaMode", "ESearchCriteriaNumericOperator",
+                      "ESearchCriteriaOtherChannelsCountOption", "ESearchCriteriaRtpcOperator",
+                      "ESearchCriteriaSampleRateConversionType", "ESearchCriteriaSoundType",
+                      "ESearchCriteriaSoundbankReferences", "ESearchCriteriaStateProperty",
+                      "ESearchCriteriaSwitchingOperator", "ESearchCriteriaUsingOperator", "ESeekType",
+                      "ESegmentSyncPoint", "ESetterType", "ESoundBankDefinitionFormat", "ESoundSeedAirChannelMask",
+                      "ESoundSeedGrainChannelConfig", "ESoundSeedGrainDurationLink", "ESoundSeedGrainEnvelopeType",
+                      "ESoundSeedGrainFilterType", "ESoundSeedGrainFrequencyTime", "ESoundSeedGrainPositioning",
+                      "ESoundSeedGrainQuantization", "ESoundSeedGrainQuantizationSimple", "ESoundSeedGrainSelection",
+                      "ESoundSeedGrainWaveform", "ESoundSeedGrainWindowMode", "ESourceControlSearchFilter",
+                      "ESourceFileReturnOptions", "ESpeakerBitMask", "ESpeakerPanning", "EStartMode",
+                      "EStereoDelayFilterType", "EStereoDelayInput", "ESwitchOrState", "ESyncGroupType",
+                      "ESynthOneOperationMode", "ESynthOneWaveform", "ESystemAudioObjectsPolicy", "ETimeCursor",
+                      "ETimeSignature", "ETimeStretchMode", "ETimeStretchStereoProcessing", "EToneGenChannelMask",
+                      "EToneGenDurationMode", "EToneGenSweepFrequencyType", "EToneGenWaveform",
+                      "ETransportExecuteActions", "ETransportState", "EVirtualVoiceBehaviour",
+                      "EVirtualVoiceQueueBehaviour", "EVoicePipelineReturnOptions", "EWaqlLogicalOperator",
+                      "EWaqlSelectExpression", "EWaveformInt", "EWaveformStr", "EWwiseBuildConfiguration",
+                      "EWwiseBuildPlatform"),
+    "pywwise.structs": ("ActiveRTPCInfo", "AttenuationCurve", "AudioImportEntry", "AudioObjectInfo",
+                        "AudioObjectMetadata", "AuxSendValue", "BusPipelineInfo", "CPUStatisticsInfo", "CaptureLogItem",
+                        "CommandInfo", "ConnectionStatusInfo", "ContextMenuInfo", "ConversionLogItem",
+                        "ExternalSourceInfo", "GameObjectRegistrationData", "GraphPoint2D", "LanguageInfo",
+                        "LoadedMediaInfo", "LogItem", "MainMenuInfo", "PerformanceMonitorCounterInfo", "PlatformInfo",
+                        "PlayingVoiceProperties", "PluginLibraryInfo", "PropertyInfo", "Rect",
+                        "RemoteConsoleInformation", "SetImportNode", "SetObjectNode", "SetOperation", "SoundBankData",
+                        "SoundBankGenerationInfo", "SoundBankInclusion", "SoundBankInfo", "SourceControlStatus",
+                        "SourceFileInfo", "StreamObjectInfo", "SwitchContainerAssignment", "TransportObjectInfo",
+                        "Vector2", "Vector3", "VoiceContributionHierarchy", "VoiceContributionParameter",
+                        "VoiceInspectorContribution", "WaapiCallRecord", "WaapiCallStats", "WwiseDirectories",
+                        "WwiseGlobalDirectories", "WwiseGlobalInfo", "WwiseObjectColumns", "WwiseObjectInfo",
+                        "WwiseObjectWatch", "WwiseProjectDirectories", "WwiseProjectInfo", "WwiseVersionInfo"),
+    "pywwise.waql": ("CompiledWaqlQuery", "PreparedWaqlQuery", "ProjectSnapshot", "WaqlQuery", "evaluate_waql",
+                     "tokenize_waql"),
+    "pywwise.objects": ("AcousticTexture", "Action", "ActionException", "ActorMixer", "Attenuation", "AudioDevice",
+                        "AudioSource", "AuxBus", "BlendContainer", "BlendTrack", "Bus", "ControlSurfaceBinding",
+                        "ControlSurfaceBindingGroup", "ControlSurfaceSession", "Conversion", "Curve", "CustomState",
+                        "DialogueEvent", "Effect", "EffectSlot", "Event", "ExternalSource", "ExternalSourceFile",
+                        "Folder", "GameParameter", "Impacter", "Language", "Marker", "MasteringSuite", "Metadata",
+                        "MidiFileSource", "MidiParameter", "MixingSession", "Modifier", "ModulatorEnvelope",
+                        "ModulatorLfo", "ModulatorTime", "MotionSource", "MultiSwitchEntry", "MusicClip",
+                        "MusicClipMidi", "MusicCue", "MusicEventCue", "MusicFade", "MusicPlaylistContainer",
+                        "MusicPlaylistItem", "MusicSegment", "MusicStinger", "MusicSwitchContainer", "MusicTrack",
+                        "MusicTrackSequence", "MusicTransition", "ObjectSettingAssoc", "Panner", "Path2D", "Platform",
+                        "PluginDataSource", "Position", "Project", "Query", "RandomSequenceContainer", "Rtpc",
+                        "SearchCriteria", "Sound", "SoundBank", "SoundSeedAirWind", "SoundSeedAirWoosh",
+                        "SoundSeedGrain", "SoundcasterSession", "SourcePlugin", "State", "StateGroup", "Switch",
+                        "SwitchContainer", "SwitchGroup", "Trigger", "UserProjectSettings", "WorkUnit",
+                        "Wwise3DAudioBedMixer", "WwiseCompressor", "WwiseConvolutionReverb", "WwiseDelay",
+                        "WwiseExpander", "WwiseFlanger", "WwiseGain", "WwiseGuitarDistortion", "WwiseHarmonizer",
+                        "WwiseMatrixReverb", "WwiseMeter", "WwiseObject", "WwiseObjectType", "WwiseParametricEq",
+                        "WwisePeakLimiter", "WwisePitchShifter", "WwiseRecorder", "WwiseReflect", "WwiseRoomVerb",
+                        "WwiseSilence", "WwiseStereoDelay", "WwiseSynthOne", "WwiseTimeStretch", "WwiseToneGenerator",
+                        "WwiseTremolo"),
+    "pywwise.connections": ("AsyncWwiseConnection", "CallbackExecutor", "SequentialThreadExecutor", "WwiseConnection",
+                            "WwiseConnectionPool", "new_async_waapi_connection", "new_replay_connection",
+                            "new_waapi_connection"),
+}
+"""The public names of each module listed in `MODULES` (generated from their `__all__`)."""
+# END GENERATED NAMES
+
+
+def render() -> str:
+    """
+    Generates the source of `NAMES`, from the `__all__` of each module listed in `MODULES`. Imports all the modules.
+    :return: The source, as found between the `GENERATED NAMES` comments of this file.
+    """
+    from importlib import import_module
+    from textwrap import wrap
+    
+    lines = ["NAMES = {"]
+    for module_name in MODULES:
+        names = ", ".join(f'"{name}"' for name in sorted(import_module(module_name).__all__))
+        prefix = f'    "{module_name}": ('
+        lines.extend(wrap(f"{prefix}{names}),", 120, initial_indent="", subsequent_indent=" " * len(prefix),
+                          break_long_words=False, break_on_hyphens=False))
+    lines.append("}")
+    lines.append('"""The public names of each module listed in `MODULES` (generated from their `__all__`)."""')
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+    from re import DOTALL, sub
+    
+    path = Path(__file__)
+    source = sub(r"(# BEGIN GENERATED NAMES\n).*?(# END GENERATED NAMES\n)",
+                 lambda match: f"{match[1]}{render()}\n{match[2]}", path.read_text(), flags=DOTALL)
+    path.write_text(source)
@@ -6,6 +6,8 @@ from re import Pattern as _Pattern
 from typing import (List as _List, Set as _Set, Tuple as _Tuple, TypeAlias as _TypeAlias, TypeVar as _TypeVar,
                     Union as _Union)
 
+__all__ = ["ListOrTuple", "ListOrTupleOrSet", "RegexPattern", "SystemPath", "UnionType"]
+
 # region BuiltIn
 
 SystemPath: _TypeAlias = _Path
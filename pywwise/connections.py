@@ -0,0 +1,85 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from waapi import CallbackExecutor, SequentialThreadExecutor
+
+from pywwise.aliases import SystemPath as _SystemPath
+from pywwise.structs import WwiseObjectWatch as _WwiseObjectWatch
+from pywwise.waapi.ak import Ak as _Ak, AsyncAk as _AsyncAk, AsyncWwiseConnection, WwiseConnection
+from pywwise.waapi.pool import WwiseConnectionPool
+from pywwise.waapi.recording import ReplayWaapiClient as _ReplayWaapiClient
+
+__all__ = ["AsyncWwiseConnection", "CallbackExecutor", "SequentialThreadExecutor", "WwiseConnection",
+           "WwiseConnectionPool", "new_async_waapi_connection", "new_replay_connection", "new_waapi_connection"]
+
+
+def new_waapi_connection(url: str = "ws://127.0.0.1:8080/waapi", *, allow_exception: bool = False,
+                         callback_executor: type[CallbackExecutor] = SequentialThreadExecutor,
+                         is_debug_build: bool = False, is_console_instance: bool = False,
+                         watch_list: tuple[_WwiseObjectWatch, ...] = (), pipelined: bool = False,
+                         max_concurrency: int = 64, record_to: _SystemPath | None = None) -> WwiseConnection:
+    """
+    Connects to an instance of Wwise.
+    :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+    :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+    :param callback_executor: Executor strategy for event callbacks.
+    :param is_debug_build: Should be set to true if the instance of Wwise is a debug build and debug-only.
+    :param is_console_instance: Should be set to true if the instance of Wwise is running in a console window.
+                                functions/topics are required.
+    :param watch_list: A tuple of `WwiseObjectWatch` instances. This will be used to set up the
+                       `ak.wwise.core.object.property_changed` event.
+    :param pipelined: Whether requests should be sent without waiting for the results of previous ones. Recommended
+                      when making calls from several threads, or through the connection's `futures`.
+    :param max_concurrency: The maximum amount of functions called through the connection's `futures` that can be in
+                            flight at once.
+    :param record_to: If specified, every call (URI, arguments, options, result and duration) and every published
+                      event is written to a log at this path, so it can be replayed with `new_replay_connection`. If
+                      the path ends with `.gz`, the log is compressed.
+    :return: A WAAPI connection.
+    """
+    return _Ak(url, allow_exception, callback_executor, is_debug_build, is_console_instance, watch_list,
+               pipelined=pipelined, max_concurrency=max_concurrency, record_to=record_to)
+
+
+async def new_async_waapi_connection(url: str = "ws://127.0.0.1:8080/waapi", *, allow_exception: bool = False,
+                                     callback_executor: type[CallbackExecutor] | None = SequentialThreadExecutor,
+                                     is_debug_build: bool = False, is_console_instance: bool = False,
+                                     watch_list: tuple[_WwiseObjectWatch, ...] = (),
+                                     max_concurrency: int = 64) -> AsyncWwiseConnection:
+    """
+    Connects to an instance of Wwise, using the running event loop. The connection exposes the same functions as the
+    one returned by `new_waapi_connection`, but they are all awaitable, and many of them can be in flight at once.
+    :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+    :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+    :param callback_executor: Executor strategy for event callbacks. If `None`, callbacks are called on the event loop.
+    :param is_debug_build: Should be set to true if the instance of Wwise is a debug build and debug-only.
+    :param is_console_instance: Should be set to true if the instance of Wwise is running in a console window.
+                                functions/topics are required.
+    :param watch_list: A tuple of `WwiseObjectWatch` instances. This will be used to set up the
+                       `ak.wwise.core.object.property_changed` event.
+    :param max_concurrency: The maximum amount of functions that can be in flight at once.
+    :return: An asyncio-native WAAPI connection.
+    """
+    return await _AsyncAk.connect(url, allow_exception, callback_executor, is_debug_build, is_console_instance,
+                                  watch_list, max_concurrency)
+
+
+def new_replay_connection(path: _SystemPath, *, allow_exception: bool = False, is_debug_build: bool = False,
+                          is_console_instance: bool = False, watch_list: tuple[_WwiseObjectWatch, ...] = (),
+                          max_concurrency: int = 64) -> WwiseConnection:
+    """
+    Creates a connection serving the traffic recorded by `new_waapi_connection(record_to=...)`, without an instance of
+    Wwise. Each function returns the result recorded for the same arguments. Recorded events are published to
+    subscribers when calling `connection.client.publish_events()`. Useful to benchmark or profile PyWwise itself.
+    :param path: The path of the log to replay.
+    :param allow_exception: Whether functions that were not recorded (or that failed) should raise an exception.
+    :param is_debug_build: Should match the value used when recording.
+    :param is_console_instance: Should match the value used when recording.
+    :param watch_list: A tuple of `WwiseObjectWatch` instances. This will be used to set up the
+                       `ak.wwise.core.object.property_changed` event.
+    :param max_concurrency: The maximum amount of functions called through the connection's `futures` that can be in
+                            flight at once.
+    :return: A WAAPI connection, backed by a `ReplayWaapiClient`.
+    """
+    return _Ak(is_debug_build=is_debug_build, is_console_instance=is_console_instance, watch_list=watch_list,
+               max_concurrency=max_concurrency, client=_ReplayWaapiClient(path, allow_exception))
@@ -1,7 +1,9 @@
 # Copyright 2024 Matheus Vilano
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Callable as _Callable
+from functools import cached_property as _cached_property, wraps as _wraps
+from threading import RLock as _RLock
+from typing import Any as _Any, Callable as _Callable
 
 
 def callback(func: _Callable) -> _Callable:
@@ -73,3 +75,55 @@ def debug_build_only(func: _Callable) -> _Callable:
         return func(self, *args, **kwargs)
     
     return wrapper
+
+
+def invalidates_query_cache(func: _Callable) -> _Callable:
+    """
+    A decorator for PyWwise functions that modify a project. Discards the results cached by the owner object's query
+    cache (see `QueryCache`), by calling its `_invalidate_query_cache` function both before and after the decorated
+    function. Before, so that the decorated function itself reads up-to-date results; after, so that later reads do
+    not depend on when Wwise publishes the change (if it does at all, e.g. for properties that are not watched).
+    :param func: The function to decorate.
+    :return: The decorated function.
+    """
+    
+    @_wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate_query_cache()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._invalidate_query_cache()
+    
+    return wrapper
+
+
+class synchronized_cached_property(_cached_property):
+    """
+    A `functools.cached_property` whose value is computed at most once, even if several threads get it at the same
+    time (`functools.cached_property` has no lock since Python 3.12). Used for the wrappers of the WAAPI tree (e.g.
+    `ak.wwise.core.object`), since two instances of the same wrapper would each hold their own topic subscriptions.
+    Once computed, the value is stored in the instance's `__dict__`, so getting it again does not lock anything.
+    """
+    
+    def __init__(self, func: _Callable):
+        """
+        Constructor.
+        :param func: The function computing the value.
+        """
+        super().__init__(func)
+        self._lock = _RLock()
+    
+    def __get__(self, instance: _Any, owner: type | None = None) -> _Any:
+        """
+        Gets the value, computing it (with the lock held) if it was not computed yet.
+        :param instance: The instance to get the value of.
+        :param owner: The class of the instance.
+        :return: The value, or this descriptor if accessed through the class.
+        """
+        if instance is None:
+            return self
+        with self._lock:
+            if self.attrname in instance.__dict__:
+                return instance.__dict__[self.attrname]  # Computed by another thread while this one was waiting.
+            return super().__get__(instance, owner)
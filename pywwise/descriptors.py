@@ -2,18 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from enum import Enum as _Enum
-from typing import Any as _Any, Generic as _Generic, Self as _Self, Type as _Type, TypeVar as _TypeVar
+from typing import (Any as _Any, Generic as _Generic, Iterable as _Iterable, Self as _Self, Type as _Type,
+                    TypeVar as _TypeVar)
 
 from pywwise.aliases import SystemPath
+from pywwise.enums import EObjectType
 from pywwise.modules import LazyModule
 from pywwise.primitives import GUID
 from pywwise.statics import EnumStatics
 from pywwise.structs import WwiseObjectInfo
+from pywwise.waql import PreparedWaqlQuery
 
 _pywwise_objects = LazyModule("pywwise.objects")
 
 _T = _TypeVar("_T")
 
+_OBJECTS_QUERY = PreparedWaqlQuery.prepare("$ from object {objects:object}")
+"""Gets several objects at once (see `PreparedWaqlQuery.bind_many`)."""
+
 
 class WwiseProperty(_Generic[_T]):
     """A descriptor for Wwise properties, references, and lists. Supports the `WwiseProperty[Type]` syntax to allow
@@ -49,6 +55,21 @@ class WwiseProperty(_Generic[_T]):
         if ak is None:
             raise TypeError("Encapsulators of `WwiseProperty` must define a protected `WwiseConnection` named `_ak`.")
         
+        cache = vars(ak).get("property_cache")  # Only exists once caching was enabled on the connection.
+        if cache is not None and cache.is_enabled():
+            platform = getattr(instance, "_platform", None)
+            return cache.get(instance.guid, self._name, platform, lambda: self._read(instance, ak, getter))
+        
+        return self._read(instance, ak, getter)
+    
+    def _read(self, instance: _Any, ak: _Any, getter: _Any) -> _T | str:
+        """
+        Reads the current value from Wwise, converting it to the type of this property.
+        :param instance: The caller.
+        :param ak: The connection of the caller.
+        :param getter: The `get_property` function of the caller.
+        :return: The current value.
+        """
         value = getter(self._name)
         
         _type = self._type if self._type is not _Self else instance.__class__  # Class is referencing itself.
@@ -56,24 +77,16 @@ class WwiseProperty(_Generic[_T]):
         match _type:  # Decide on what kind of object to return.
             
             case _ if isinstance(_type, tuple) and isinstance(value, dict):
-                query = f"$ from object \"{value.get('id', GUID.get_null())}\" take 1"
-                info_tuple: tuple[WwiseObjectInfo, ...] = ak.wwise.core.object.get(query)
-                if info_tuple is None or not info_tuple:  # Invalid or empty.
+                objects = self._resolve(ak, (value,))
+                if not objects:  # Invalid or empty.
                     raise ValueError(f"Invalid object returned for property `{self._name}`. Either `None` or empty.")
-                info_tuple: WwiseObjectInfo = info_tuple[0]  # Still tuple; convert to single value (GUIDs are unique).
-                return info_tuple.type.get_class()(info_tuple.guid, ak)
+                return objects[0]
             
             case _ if (_type is list or _type is tuple) and (isinstance(value, list) or isinstance(value, tuple)):
-                info_list = list[WwiseObjectInfo]()  # Get `WwiseObjectInfo` objs.
-                for dictionary in value:
-                    query = f"$ from object \"{dictionary.get('id', GUID.get_null())}\" take 1"
-                    info_tuple: tuple[WwiseObjectInfo, ...] = ak.wwise.core.object.get(query)
-                    if info_tuple is not None and info_tuple:  # Valid, not empty.
-                        info_list.append(info_tuple[0])  # GUIDs are unique, so there is only one value in that tuple.
-                return tuple(info.type.get_class()(info.guid, ak) for info in info_list)
+                return self._resolve(ak, value)
             
             case _ if issubclass(_type, _pywwise_objects.WwiseObject) and isinstance(value, dict):  # WwiseObject
-                return _type(value.get("id", GUID.get_null()), ak)
+                return _type(GUID.intern(value["id"], False) if value.get("id") else GUID.get_null(), ak)
             
             case _ if issubclass(_type, _Enum):  # Any generic enum.Enum, but usually a pywwise.enums type.
                 return EnumStatics.from_value(_type, value)
@@ -81,6 +94,38 @@ class WwiseProperty(_Generic[_T]):
             case _:  # Anything else, including GUID, ProjectPath, GameObjectID, SystemPath, etc.
                 return _type(value)  # PyCharm might throw a warning here about a missing `ak`; false negative.
     
+    @staticmethod
+    def _resolve(ak: _Any, references: _Iterable[dict[str, _Any]]) -> tuple[_Any, ...]:
+        """
+        Converts references (e.g. the elements of a list property) to instances of the matching `WwiseObject` classes.
+        References whose type is unknown are resolved with a single query for all of them.
+        :param ak: The connection to use.
+        :param references: The references, as returned by WAAPI (e.g. `{"id": ..., "name": ...}`).
+        :return: The objects, in the same order. References to objects that could not be found are skipped.
+        """
+        references = [reference for reference in references if isinstance(reference, dict)]
+        types = {reference.get("id", GUID.get_null()): reference["type"] for reference in references
+                 if "type" in reference}
+        unknown = list(dict.fromkeys(reference.get("id", GUID.get_null()) for reference in references
+                                     if "type" not in reference))
+        
+        if unknown:  # One query for all references, instead of one per reference.
+            for query in _OBJECTS_QUERY.bind_many(unknown):
+                infos: tuple[WwiseObjectInfo, ...] = ak.wwise.core.object.get(query) or ()
+                types.update((info.guid, info.type) for info in infos)
+        
+        types = {guid.upper(): etype for guid, etype in types.items()}
+        objects = list[_Any]()
+        for reference in references:
+            guid = GUID.intern(reference.get("id", GUID.get_null()), False)
+            etype = types.get(guid.upper())
+            if etype is None:
+                continue
+            if not isinstance(etype, EObjectType):
+                etype = EObjectType.from_type_name(etype)
+            objects.append(etype.get_class()(guid, ak))
+        return tuple(objects)
+    
     def __set__(self, instance: _Any, value: _T):
         """
         Setter.
@@ -99,6 +144,11 @@ class WwiseProperty(_Generic[_T]):
         
         instance.set_property(self._name, value, isinstance(value, GUID) or value is None)
     
+    @property
+    def name(self) -> str:
+        """:return: The name of this property, as used by WAAPI (e.g. `Volume`)."""
+        return self._name
+    
     @property
     def type(self) -> _Type[_T]:
         """:return: The type of this property."""
@@ -6,8 +6,56 @@ from typing import Self as _Self
 
 from pywwise.modules import LazyModule
 
+__all__ = ["E3DPosition", "E3DSpatialization", "EActionNamePosition", "EActionOnEventType", "EActionType",
+           "EAllowStingerNext", "EAttenuationCurveShape", "EAttenuationCurveType", "EAttenuationCurveUsage",
+           "EAudioImportOperation", "EAudioObjectOptions", "EBasePlatform", "EBitDepth", "EBuiltInGameParameter",
+           "EBusChannelConfiguration", "EBusOptions", "ECaptureLogItemType", "ECaptureLogSeverity", "ECaseStyle",
+           "ECaseStyleSimple", "EChannelConversionSettings", "EColour", "ECommand", "EContainerPlayMode",
+           "EControlSurfaceBindingGroupType", "EControlSurfaceBindingTargetType", "EConvolutionReverbAlgorithm",
+           "EConvolutionReverbBlockSize", "EConvolutionReverbIrChannelSelection", "EConvolutionReverbIrLpfSlope",
+           "ECurve", "ECustomCueJumpMatchMode", "EDataTypes", "EDestinationContextType", "EDiscardBehaviour",
+           "EDispatchStrategy", "EEnvelopeTriggerOn", "EExternalAnalysisType", "EFadeCurve", "EFadeMode", "EFadeShape",
+           "EFadeType", "EFftWindowSize", "EFilterBehaviour", "EFrequencyMode", "EGameParameterValueChangeAction",
+           "EGeneratedSoundBankType", "EGuitarDistortionFilterType", "EGuitarDistortionType", "EHarmonizerFilterType",
+           "EHarmonizerInput", "EHdrReleaseTimeMode", "EImportOperation", "EInclusionFilter", "EInclusionOperation",
+           "EInterpolationMode", "ELineEnding", "EListMode", "ELogChannel", "ELogSeverity", "ELogicalOperator",
+           "ELoudnessNormalizationType", "EMainMixConfiguration", "EMarkerInputMode", "EMasteringSuiteFilterMode",
+           "EMasteringSuiteLimiterMode", "EMasteringSuiteLinkMode", "EMatchMode", "EMatrixReverbDelayCount",
+           "EMatrixReverbDelayLengthsMode", "EMechanismPlayMode", "EMeterMode", "EMeterScope", "EMidiPlayOnNoteType",
+           "EMidiTempoSource", "EModPhaseMode", "EModWaveform", "EModulatorScope", "EModulatorScopeLimited",
+           "EMotionChannelConfig", "EMotionDriver", "EMultiPositionType", "EMusicClipType", "EMusicCueType",
+           "EMusicDestinationJumpTo", "EMusicDestinationSyncTo", "EMusicFadeShape", "EMusicPlaylistItemType",
+           "EMusicSegmentPlayPoint", "EMusicSourceExitPoint", "EMusicTrackType", "EMusicalDuration",
+           "EMusicalGridFrequency", "ENameConflictStrategy", "ENoiseColour", "EObjectType", "EObjectTypeQuery",
+           "EOverLimitBehaviour", "EParametricEqFilterType", "EPassthroughMixPolicy", "EPitchShifterFilterType",
+           "EPitchShifterInput", "EPlatformOption", "EPlayMechanismLoopType", "EPlayMechanismSpecialTransitionsType",
+           "EPlaylistMode", "EPlaylistRestartBehaviour", "EPropertyPasteMode", "ERandomOrSequence", "ERandomType",
+           "ERecorderAmbisonicsChannelOrdering", "ERecorderFormat", "EReflectAlgorithm", "EReflectChannelConfig",
+           "EReflectDecorrelationStrengthSource", "EReflectFilterType", "EReflectThresholdMode", "EReturnOptions",
+           "ERoomVerbFilterType", "ERoomVerbInsertPosition", "ERtpcMode", "ESampleRate", "ESampleRateConversionQuality",
+           "EScope", "ESearchCriteriaContainerType", "ESearchCriteriaCurveType", "ESearchCriteriaCurveUsage",
+           "ESearchCriteriaLfeOption", "ESearchCriteriaMode", "ESearchCriteriaNumericOperator",
+           "ESearchCriteriaOtherChannelsCountOption", "ESearchCriteriaRtpcOperator",
+           "ESearchCriteriaSampleRateConversionType", "ESearchCriteriaSoundType", "ESearchCriteriaSoundbankReferences",
+           "ESearchCriteriaStateProperty", "ESearchCriteriaSwitchingOperator", "ESearchCriteriaUsingOperator",
+           "ESeekType", "ESegmentSyncPoint", "ESetterType", "ESoundBankDefinitionFormat", "ESoundSeedAirChannelMask",
+           "ESoundSeedGrainChannelConfig", "ESoundSeedGrainDurationLink", "ESoundSeedGrainEnvelopeType",
+           "ESoundSeedGrainFilterType", "ESoundSeedGrainFrequencyTime", "ESoundSeedGrainPositioning",
+           "ESoundSeedGrainQuantization", "ESoundSeedGrainQuantizationSimple", "ESoundSeedGrainSelection",
+           "ESoundSeedGrainWaveform", "ESoundSeedGrainWindowMode", "ESourceControlSearchFilter",
+           "ESourceFileReturnOptions", "ESpeakerBitMask", "ESpeakerPanning", "EStartMode", "EStereoDelayFilterType",
+           "EStereoDelayInput", "ESwitchOrState", "ESyncGroupType", "ESynthOneOperationMode", "ESynthOneWaveform",
+           "ESystemAudioObjectsPolicy", "ETimeCursor", "ETimeSignature", "ETimeStretchMode",
+           "ETimeStretchStereoProcessing", "EToneGenChannelMask", "EToneGenDurationMode", "EToneGenSweepFrequencyType",
+           "EToneGenWaveform", "ETransportExecuteActions", "ETransportState", "EVirtualVoiceBehaviour",
+           "EVirtualVoiceQueueBehaviour", "EVoicePipelineReturnOptions", "EWaqlLogicalOperator",
+           "EWaqlSelectExpression", "EWaveformInt", "EWaveformStr", "EWwiseBuildConfiguration", "EWwiseBuildPlatform"]
+
 _pywwise_objects = LazyModule("pywwise.objects")
 
+_OBJECT_TYPE_INDEXES = dict[str, dict]()
+"""The lookup tables of `EObjectType` members (by plugin ID, class ID and type name), built on first use."""
+
 
 # region WAAPI
 
@@ -608,10 +656,7 @@ class EObjectType(tuple[int, int, str], _Enum):
         :return: An enum member whose plugin ID matches the specified plugin ID. If no valid member was found, UNKNOWN
                  is returned instead.
         """
-        for member in cls:
-            if member.get_plugin_id() == plugin_id:
-                return member
-        return cls.UNKNOWN
+        return cls._get_index("plugin_id").get(plugin_id, cls.UNKNOWN)
     
     @classmethod
     def from_class_id(cls, class_id: int) -> _Self:
@@ -621,24 +666,38 @@ class EObjectType(tuple[int, int, str], _Enum):
         :return: An enum member whose class ID matches the specified class ID. If no valid member was found, UNKNOWN
                  is returned instead.
         """
-        for member in cls:
-            if member.get_class_id() == class_id:
-                return member
-        return cls.UNKNOWN
+        return cls._get_index("class_id").get(class_id, cls.UNKNOWN)
     
     @classmethod
     def from_type_name(cls, type_name: str) -> _Self:
         """
         Gets an enum member by type name.
-        :param type_name: The type name.
+        :param type_name: The type name. Not case-sensitive.
         :return: An enum member whose type name matches the specified type name. If no valid member was found, UNKNOWN
                  is returned instead.
         """
-        type_name = type_name.upper()  # The comparisons are all case-insensitive
-        for member in cls:
-            if member.get_type_name().upper() == type_name:
-                return member
-        return cls.UNKNOWN
+        index = cls._get_index("type_name")
+        member = index.get(type_name)  # Exact case first (e.g. as returned by Wwise), to avoid `upper`.
+        return member if member is not None else index.get(type_name.upper(), cls.UNKNOWN)
+    
+    @classmethod
+    def _get_index(cls, key: str) -> dict:
+        """
+        Gets a lookup table of the members, building all of them on first use. If several members share a key, the
+        first one (in definition order) is kept.
+        :param key: The key of the table: `plugin_id`, `class_id` or `type_name` (both as defined, and upper case).
+        :return: The lookup table.
+        """
+        if not _OBJECT_TYPE_INDEXES:
+            plugin_ids, class_ids, type_names = dict[int, _Self](), dict[int, _Self](), dict[str, _Self]()
+            for member in cls:
+                plugin_ids.setdefault(member.get_plugin_id(), member)
+                class_ids.setdefault(member.get_class_id(), member)
+                type_names.setdefault(member.get_type_name().upper(), member)
+            for member in cls:
+                type_names.setdefault(member.get_type_name(), member)
+            _OBJECT_TYPE_INDEXES.update(plugin_id=plugin_ids, class_id=class_ids, type_name=type_names)
+        return _OBJECT_TYPE_INDEXES[key]
     
     @classmethod
     def from_class(cls, etype: type) -> _Self:
@@ -2083,6 +2142,16 @@ class EGeneratedSoundBankType(_StrEnum):
     """Auto-defined (based on a Bus)."""
 
 
+class EDispatchStrategy(_StrEnum):
+    """An enumeration of strategies used by a connection pool to pick a connection for each request."""
+    
+    ROUND_ROBIN = "roundRobin"
+    """Connections are picked in turn."""
+    
+    LEAST_BUSY = "leastBusy"
+    """The connection with the fewest requests in flight is picked."""
+
+
 # endregion
 
 # region Types
@@ -22,3 +22,21 @@ from pywwise.objects.types import (AcousticTexture, Action, ActionException, Act
                                    Position, Project, Query, RandomSequenceContainer, Rtpc, SearchCriteria, Sound,
                                    SoundBank, SoundcasterSession, SourcePlugin, State, StateGroup, Switch,
                                    SwitchContainer, SwitchGroup, Trigger, UserProjectSettings, WorkUnit)
+
+__all__ = ["AcousticTexture", "Action", "ActionException", "ActorMixer", "Attenuation", "AudioDevice", "AudioSource",
+           "AuxBus", "BlendContainer", "BlendTrack", "Bus", "ControlSurfaceBinding", "ControlSurfaceBindingGroup",
+           "ControlSurfaceSession", "Conversion", "Curve", "CustomState", "DialogueEvent", "Effect", "EffectSlot",
+           "Event", "ExternalSource", "ExternalSourceFile", "Folder", "GameParameter", "Impacter", "Language", "Marker",
+           "MasteringSuite", "Metadata", "MidiFileSource", "MidiParameter", "MixingSession", "Modifier",
+           "ModulatorEnvelope", "ModulatorLfo", "ModulatorTime", "MotionSource", "MultiSwitchEntry", "MusicClip",
+           "MusicClipMidi", "MusicCue", "MusicEventCue", "MusicFade", "MusicPlaylistContainer", "MusicPlaylistItem",
+           "MusicSegment", "MusicStinger", "MusicSwitchContainer", "MusicTrack", "MusicTrackSequence",
+           "MusicTransition", "ObjectSettingAssoc", "Panner", "Path2D", "Platform", "PluginDataSource", "Position",
+           "Project", "Query", "RandomSequenceContainer", "Rtpc", "SearchCriteria", "Sound", "SoundBank",
+           "SoundSeedAirWind", "SoundSeedAirWoosh", "SoundSeedGrain", "SoundcasterSession", "SourcePlugin", "State",
+           "StateGroup", "Switch", "SwitchContainer", "SwitchGroup", "Trigger", "UserProjectSettings", "WorkUnit",
+           "Wwise3DAudioBedMixer", "WwiseCompressor", "WwiseConvolutionReverb", "WwiseDelay", "WwiseExpander",
+           "WwiseFlanger", "WwiseGain", "WwiseGuitarDistortion", "WwiseHarmonizer", "WwiseMatrixReverb", "WwiseMeter",
+           "WwiseObject", "WwiseObjectType", "WwiseParametricEq", "WwisePeakLimiter", "WwisePitchShifter",
+           "WwiseRecorder", "WwiseReflect", "WwiseRoomVerb", "WwiseSilence", "WwiseStereoDelay", "WwiseSynthOne",
+           "WwiseTimeStretch", "WwiseToneGenerator", "WwiseTremolo"]
@@ -3,56 +3,205 @@
 
 from __future__ import annotations
 
-from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING, TypeVar as _TypeVar
+from typing import (Any as _Any, ClassVar as _ClassVar, Iterator as _Iterator, Self as _Self,
+                    TYPE_CHECKING as _TYPE_CHECKING, TypeVar as _TypeVar)
 
 if _TYPE_CHECKING:
     from pywwise.structs import WwiseObjectInfo
+    from pywwise.waapi.batch import WriteBatch
+    from pywwise.waapi.ak.ak import WwiseConnection
 
 from abc import ABC as _ABC
+from contextlib import contextmanager as _contextmanager
 from enum import Enum as _Enum
 from types import NoneType as _NoneType
 
+from pywwise.descriptors import WwiseProperty
 from pywwise.enums import EObjectType
+from pywwise.modules import LazyModule
 from pywwise.primitives import GUID, Name, ProjectPath
-from pywwise.waapi.ak.ak import WwiseConnection, Ak
+from pywwise.waql import PreparedWaqlQuery
+
+_pywwise_ak = LazyModule("pywwise.waapi.ak.ak")  # Only needed once a connection exists.
+
+_OBJECT_QUERY = PreparedWaqlQuery.prepare("$ from object {object:object} take 1")
+"""Gets a single object."""
+
+_ABSENT = object()
+"""Marks a fetched property that Wwise did not return (e.g. a property the object's type does not have)."""
 
 
 class WwiseObject(_ABC):
     """
     https://www.audiokinetic.com/en/library/edge/?source=SDK&id=wobjects_index.html \n
-    The base class for any class that serves as interface for getting/setting properties on Wwise objects.
+    The base class for any class that serves as interface for getting/setting properties on Wwise objects. Instances
+    use `__slots__`; subclasses should declare `__slots__` too (e.g. `__slots__ = ()`) to stay compact.
     """
     
+    __slots__ = ("_ak", "_guid", "_query_string", "_platform", "_fetched", "__weakref__")
+    
+    prefetch_all: _ClassVar[bool] = False
+    """If True, the first read of any property fetches all the properties declared by the class (see `fetch`), in a
+    single call. Later reads are served from the fetched values, until `clear_fetched` is called."""
+    
+    def __new__(cls, guid: GUID | WwiseObjectInfo = None, ak: WwiseConnection = None,
+                platform: GUID | Name | _NoneType = None) -> _Self:
+        """
+        Gets the instance representing an object. Each connection keeps a single instance per class, GUID and platform
+        (as long as it is in use), so that creating an instance for the same object in several places (including
+        references returned by `WwiseProperty` attributes) returns the same instance, sharing its fetched values.
+        :param guid: The GUID of the object, or a `WwiseObjectInfo` instance.
+        :param ak: The connection to use. If not specified, the most recent connection will be used.
+        :param platform: The platform the instance is used on, if any.
+        :return: The instance.
+        """
+        if guid is None:  # E.g. copy or unpickle: no identity.
+            return super().__new__(cls)
+        ak = ak if ak is not None else _pywwise_ak.Ak.get_connections()[-1]
+        guid = guid if isinstance(guid, GUID) else getattr(guid, "guid", GUID.get_null())
+        return ak._get_object((cls, guid.upper(), platform), lambda: super(WwiseObject, cls).__new__(cls))
+    
     def __init__(self, guid: GUID | WwiseObjectInfo, ak: WwiseConnection = None,
                  platform: GUID | Name | _NoneType = None):
         """
         Uses a GUID to initialize a strongly-typed dynamic object, capable of fetching information from Wwise as needed.
+        If an instance for the same object already exists (see `__new__`), it is returned as is.
         :param guid: If you may also pass a `WwiseObjectInfo` instance - this function will extract only the GUID.
         :param ak: If you want to use a specific connection, specify it here. If not, the most recent connection will
                    be used.
         :param platform: If you want your object to only be used on a specific platform, specify which one here.
         """
-        self._ak: WwiseConnection = ak if ak is not None else Ak.get_connections()[-1]
+        if hasattr(self, "_guid"):  # Already initialized (shared instance).
+            return
+        self._ak: WwiseConnection = ak if ak is not None else _pywwise_ak.Ak.get_connections()[-1]
         self._guid: GUID = guid if isinstance(guid, GUID) else getattr(guid, "guid", GUID.get_null())
-        self._query: str = f"$ from object \"{self._guid}\" take 1"
+        self._query_string: str | None = None  # Built on first use (see `_query`).
         self._platform: GUID | Name | _NoneType = platform
+        self._fetched: dict[str, _Any] | None = None
+    
+    @property
+    def _query(self) -> str:
+        """:return: The WAQL query selecting this object. It is built on first use, then reused."""
+        if self._query_string is None:
+            self._query_string = _OBJECT_QUERY.bind(self._guid)
+        return self._query_string
+    
+    @classmethod
+    def get_declared_properties(cls) -> tuple[str, ...]:
+        """
+        Lists the properties declared by this class (and its base classes) as `WwiseProperty` attributes.
+        :return: The names of the properties, as used by WAAPI (e.g. `Volume`).
+        """
+        names = dict[str, None]()  # Dictionary, as an ordered set.
+        for klass in reversed(cls.__mro__):
+            for attribute in vars(klass).values():
+                if isinstance(attribute, WwiseProperty):
+                    names[attribute.name] = None
+        return tuple(names)
+    
+    def fetch(self, *properties: str) -> dict[str, _Any]:
+        """
+        Gets several properties in a single call to Wwise, along with the name, path and type of this object. Later
+        reads of these properties (including via `WwiseProperty` attributes) are served from the fetched values,
+        without any call, until `clear_fetched` is called. Since the instance is shared by every holder of the same
+        object (see `__new__`), fetched values are discarded as soon as Wwise reports a change (see `FetchTracker`);
+        writes through this instance discard the fetched value of the written property.
+        :param properties: The names of the properties, references, or lists to fetch. If none are specified, all the
+                           properties declared by this class are fetched (see `get_declared_properties`).
+        :raise ValueError: If the object could not be found in Wwise.
+        :return: The fetched values, per property name. Properties that Wwise did not return are omitted.
+        """
+        properties = properties or self.get_declared_properties()
+        tracker = self._ak._fetch_tracker
+        generation = tracker.begin(self)  # Before getting the values, so that no change can be missed.
+        infos = self._ak.wwise.core.object.get(self._query, properties)
+        if not infos:
+            raise ValueError(f"Could not fetch the properties of object {self._guid}.")
+        
+        info = infos[0]
+        values = {name: info.other.get(name, _ABSENT) for name in properties}
+        tracker.store(self, generation, {**values, "name": info.name, "path": info.path, "type": info.type})
+        return {name: value for name, value in values.items() if value is not _ABSENT}
+    
+    @_contextmanager
+    def prefetch(self, *properties: str) -> _Iterator[_Self]:
+        """
+        Fetches several properties in a single call (see `fetch`) for the duration of a `with` block. The values fetched
+        by the block are discarded when it exits (values that were fetched before the block are kept, as refreshed by
+        the block).
+        :param properties: The names of the properties to fetch. If none are specified, all the properties declared by
+                           this class are fetched.
+        :return: This instance.
+        """
+        previous = set(self._fetched) if self._fetched is not None else None
+        try:
+            self.fetch(*properties)
+            yield self
+        finally:
+            if previous is None:
+                self._fetched = None
+            elif self._fetched is not None:
+                self._discard_fetched(*(name for name in tuple(self._fetched) if name not in previous))
+    
+    def clear_fetched(self):
+        """Discards the values fetched by `fetch`, so that later reads get the current values from Wwise."""
+        self._fetched = None
+    
+    def _get_fetched(self, name: str) -> _Any:
+        """
+        Gets a fetched value, fetching all declared properties first if `prefetch_all` is enabled.
+        :param name: The name of the property, or `name`, `path` or `type`.
+        :return: The value, `_ABSENT` if Wwise did not return it, or `None` if it was not fetched.
+        """
+        if self._fetched is None and self.prefetch_all:
+            self.fetch()
+        return self._fetched.get(name) if self._fetched is not None else None
+    
+    def _discard_fetched(self, *names: str):
+        """
+        Discards fetched values (e.g. after writing them).
+        :param names: The names of the values to discard.
+        """
+        if self._fetched is not None:
+            for name in names:
+                self._fetched.pop(name, None)
     
     def get_property(self, name: str, default: _Any = None) -> _NoneType | bool | int | float | str | GUID | _Enum:
         """
-        Gets the value of a property, reference, or list from this object in Wwise.
+        Gets the value of a property, reference, or list from this object in Wwise. Values fetched with `fetch` (or
+        `prefetch`) are returned without calling Wwise.
         :param name: The name of the property, reference, or list.
         :param default: The default value, in case retrieving the value fails.
         :return: The value of the property. This *can* be `None`.
         """
+        value = self._get_fetched(name)
+        if value is not None:
+            return default if value is _ABSENT else value
         info = self._ak.wwise.core.object.get(self._query, (name,))[0]
         return info.other.get(name, default)
     
     def set_property(self, name: str, value: _Any, is_reference: bool = False):
-        if not is_reference:
+        self._discard_fetched(name)
+        if (cache := vars(self._ak).get("property_cache")) is not None:
+            cache.invalidate(self._guid, name)
+        if (batch := self._ak.active_batch) is not None:
+            batch.set_property(self, name, value, is_reference, self._platform)
+        elif not is_reference:
             self._ak.wwise.core.object.set_property(self._guid, name, value, self._platform)
         else:
             self._ak.wwise.core.object.set_reference(self._guid, name, value, self._platform)
     
+    def batch(self, display_name: str = "PyWwise Batch", max_objects_per_call: int = 1000) -> WriteBatch:
+        """
+        Creates a write batch on the connection of this instance (see `WwiseConnection.batch`). Within its `with`
+        statement, the properties set on this instance (and on any other instance using the same connection) are queued,
+        then set with as few calls as possible, inside a single undo group.
+        :param display_name: The name of the undo group, as displayed in Wwise.
+        :param max_objects_per_call: The maximum amount of objects set by each `ak.wwise.core.object.set` call.
+        :return: The batch.
+        """
+        return self._ak.batch(display_name, max_objects_per_call)
+    
     @property
     def is_connected(self) -> bool:
         """
@@ -75,6 +224,8 @@ class WwiseObject(_ABC):
         Get name.
         :return: Current name.
         """
+        if (name := self._get_fetched("name")) is not None:
+            return name
         return self._ak.wwise.core.object.get(self._query)[0].name
     
     @name.setter
@@ -83,6 +234,7 @@ class WwiseObject(_ABC):
         Set name.
         :param name: New name.
         """
+        self._discard_fetched("name", "path")
         self._ak.wwise.core.object.set_name(self._guid, name)
     
     @property
@@ -91,6 +243,8 @@ class WwiseObject(_ABC):
         Get path.
         :return: Current path.
         """
+        if (path := self._get_fetched("path")) is not None:
+            return path
         return self._ak.wwise.core.object.get(self._query)[0].path
     
     @path.setter
@@ -104,6 +258,7 @@ class WwiseObject(_ABC):
         tokens = path.split('\\')
         if tokens[-1] == self.name:  # We only need the path up to the parent.
             path = tokens[:-1]  # Remove name.
+        self._discard_fetched("path")
         self._ak.wwise.core.object.move(self.guid, path)
     
     @property
@@ -112,6 +267,8 @@ class WwiseObject(_ABC):
         Get type.
         :return: The type.
         """
+        if (etype := self._get_fetched("type")) is not None:
+            return etype
         return self._ak.wwise.core.object.get(self._query)[0].type
 
 
@@ -12,6 +12,8 @@ class MasteringSuite(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MASTERING_SUITE`.
     """
+    __slots__ = ()
+    
     compressor_band1_attack = WwiseProperty[float]("compressorBand1Attack", float)
     compressor_band1_enabled = WwiseProperty[bool]("compressorBand1Enabled", bool)
     compressor_band1_knee = WwiseProperty[float]("compressorBand1Knee", float)
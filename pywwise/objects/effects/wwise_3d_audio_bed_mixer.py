@@ -12,6 +12,8 @@ class Wwise3DAudioBedMixer(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_3D_AUDIO_BED_MIXER`.
     """
+    __slots__ = ()
+    
     main_mix_configuration = WwiseProperty[EMainMixConfiguration]("MainMixConfiguration", EMainMixConfiguration)
     passthrough_mix_policy = WwiseProperty[EPassthroughMixPolicy]("PassThroughMixPolicy", EPassthroughMixPolicy)
     system_audio_object_limit = WwiseProperty[int]("SystemAudioObjectLimit", int)
@@ -11,6 +11,8 @@ class WwiseCompressor(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_COMPRESSOR`.
     """
+    __slots__ = ()
+    
     attack_time = WwiseProperty[float]("AttackTime", float)
     channel_link = WwiseProperty[bool]("ChannelLink", bool)
     output_gain = WwiseProperty[float]("OutputGain", float)
@@ -13,6 +13,8 @@ class WwiseConvolutionReverb(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_CONVOLUTION_REVERB`.
     """
+    __slots__ = ()
+    
     algo_type_select = WwiseProperty[EConvolutionReverbAlgorithm]("AlgoTypeSelect", EConvolutionReverbAlgorithm)
     centre_level = WwiseProperty[float]("CenterLevel", float)
     channel_config_override = WwiseProperty[ESpeakerBitMask]("ChannelConfigOverride", ESpeakerBitMask)
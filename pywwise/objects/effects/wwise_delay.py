@@ -11,6 +11,8 @@ class WwiseDelay(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_DELAY`.
     """
+    __slots__ = ()
+    
     delay_time = WwiseProperty[float]("DelayTime", float)
     feedback = WwiseProperty[float]("Feedback", float)
     feedback_enabled = WwiseProperty[bool]("FeedbackEnabled", bool)
@@ -12,6 +12,8 @@ class WwiseFlanger(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_FLANGER`.
     """
+    __slots__ = ()
+    
     delay_time = WwiseProperty[float]("DelayTime", float)
     dry_level = WwiseProperty[float]("DryLevel", float)
     enable_lfo = WwiseProperty[bool]("EnableLFO", bool)
@@ -11,5 +11,7 @@ class WwiseGain(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WwiseGain`.
     """
+    __slots__ = ()
+    
     full_band_gain = WwiseProperty[float]("FullBandGain", float)
     lfe_gain = WwiseProperty[float]("LFEGain", float)
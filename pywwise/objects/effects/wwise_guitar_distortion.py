@@ -12,6 +12,8 @@ class WwiseGuitarDistortion(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_GUITAR_DISTORTION`.
     """
+    __slots__ = ()
+    
     distortion_drive = WwiseProperty[float]("DistortionDrive", float)
     distortion_tone = WwiseProperty[float]("DistortionTone", float)
     distortion_type = WwiseProperty[EGuitarDistortionType]("DistortionType", EGuitarDistortionType)
@@ -12,6 +12,8 @@ class WwiseHarmonizer(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_HARMONIZER`.
     """
+    __slots__ = ()
+    
     dry_level = WwiseProperty[float]("DryLevel", float)
     input_format = WwiseProperty[EHarmonizerInput]("Input", EHarmonizerInput)
     process_lfe = WwiseProperty[bool]("ProcessLFE", bool)
@@ -12,6 +12,8 @@ class WwiseMatrixReverb(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_MATRIX_REVERB`.
     """
+    __slots__ = ()
+    
     delay_lengths_mode = WwiseProperty[EMatrixReverbDelayLengthsMode]("DelayLengthsMode", EMatrixReverbDelayLengthsMode)
     delay_time_1 = WwiseProperty[float]("DelayTime1", float)
     delay_time_2 = WwiseProperty[float]("DelayTime2", float)
@@ -12,6 +12,8 @@ class WwiseMeter(WwiseObject):  # TODO: add RTPC property once available
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_METER`.
     """
+    __slots__ = ()
+    
     apply_downstream_volume = WwiseProperty[bool]("ApplyDownstreamVolume", bool)
     attack_time = WwiseProperty[float]("AttackTime", float)
     hold = WwiseProperty[float]("Hold", float)
@@ -11,6 +11,8 @@ class WwisePeakLimiter(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WwisePeakLimiter`.
     """
+    __slots__ = ()
+    
     channel_link = WwiseProperty[bool]("ChannelLink", bool)
     look_ahead = WwiseProperty[float]("LookAhead", float)
     output_gain = WwiseProperty[float]("OutputGain", float)
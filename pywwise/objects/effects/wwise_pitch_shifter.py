@@ -12,6 +12,8 @@ class WwisePitchShifter(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_PITCH_SHIFTER`.
     """
+    __slots__ = ()
+    
     delay_time = WwiseProperty[float]("DelayTime", float)
     dry_level = WwiseProperty[float]("DryLevel", float)
     filter_frequency = WwiseProperty[float]("FilterFrequency", float)
@@ -12,6 +12,8 @@ class WwiseRecorder(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_RECORDER`.
     """
+    __slots__ = ()
+    
     ambisonics_channel_ordering = WwiseProperty[ERecorderAmbisonicsChannelOrdering](
         "AmbisonicsChannelOrdering", ERecorderAmbisonicsChannelOrdering)
     apply_downstream_volume = WwiseProperty[bool]("ApplyDownstreamVolume", bool)
@@ -13,6 +13,8 @@ class WwiseReflect(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_REFLECT`.
     """
+    __slots__ = ()
+    
     base_texture_frequency = WwiseProperty[float]("BaseTextureFrequency", float)
     centre_percentage = WwiseProperty[float]("CenterPerc", float)
     curve_usage_mask = WwiseProperty[int]("CurveUsageMask", int)
@@ -12,6 +12,8 @@ class WwiseRoomVerb(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_ROOMVERB`.
     """
+    __slots__ = ()
+    
     centre_level = WwiseProperty[float]("CenterLevel", float)
     dc_filter_cutoff_frequency = WwiseProperty[float]("DCFilterCutFreq", float)
     decay_time = WwiseProperty[float]("DecayTime", float)
@@ -12,6 +12,8 @@ class WwiseStereoDelay(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_STEREO_DELAY`.
     """
+    __slots__ = ()
+    
     dry_level = WwiseProperty[float]("DryLevel", float)
     enable_cross_feed = WwiseProperty[bool]("EnableCrossFeed", bool)
     enable_feedback = WwiseProperty[bool]("EnableFeedback", bool)
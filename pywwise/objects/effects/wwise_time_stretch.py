@@ -12,6 +12,8 @@ class WwiseTimeStretch(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_TIME_STRETCH`.
     """
+    __slots__ = ()
+    
     output_gain = WwiseProperty[float]("OutputGain", float)
     pitch_shift = WwiseProperty[float]("PitchShift", float)
     pitch_shift_random = WwiseProperty[float]("PitchShiftRandom", float)
@@ -12,6 +12,8 @@ class WwiseTremolo(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.WWISE_TREMOLO`.
     """
+    __slots__ = ()
+    
     mod_depth = WwiseProperty[float]("ModDepth", float)
     mod_frequency = WwiseProperty[float]("ModFrequency", float)
     mod_pwm = WwiseProperty[float]("ModPWM", float)
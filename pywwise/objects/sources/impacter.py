@@ -12,6 +12,8 @@ class Impacter(WwiseObject):  # TODO: Implement enums for this class once the pl
     the class represented by `EObjectType.SOURCE_PLUGIN`. Note: this plugin is in BETA and subject to change. Some
     properties might also not work as expected or even be displayed in the Wwise UI.
     """
+    __slots__ = ()
+    
     excitation_mask = WwiseProperty[int]("ExcitationMask", int)
     excitation_selection_mode = WwiseProperty[int]("ExcitationSelectionMode", int)
     fm_depth = WwiseProperty[float]("FMDepth", float)
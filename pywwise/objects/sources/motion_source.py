@@ -12,6 +12,8 @@ class MotionSource(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     channel_1 = WwiseProperty[EMotionDriver]("Channel1", EMotionDriver)
     channel_2 = WwiseProperty[EMotionDriver]("Channel2", EMotionDriver)
     channel_3 = WwiseProperty[EMotionDriver]("Channel3", EMotionDriver)
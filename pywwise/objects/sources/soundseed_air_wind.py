@@ -12,6 +12,8 @@ class SoundSeedAirWind(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     attenuation_roll_of = WwiseProperty[float]("AttenuationRollOff", float)
     average_velocity = WwiseProperty[float]("AverageVelocity", float)
     average_velocity_automate = WwiseProperty[bool]("AverageVelocityAutomate", bool)
@@ -12,6 +12,8 @@ class SoundSeedAirWoosh(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     attenuation_roll_of = WwiseProperty[float]("AttenuationRollOff", float)
     channel_mask = WwiseProperty[ESoundSeedAirChannelMask]("ChannelMask", ESoundSeedAirChannelMask)
     distance_attenuation = WwiseProperty[bool]("DistanceAttenuation", bool)
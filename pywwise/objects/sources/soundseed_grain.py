@@ -15,6 +15,8 @@ class SoundSeedGrain(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     amplitude = WwiseProperty[float]("Amplitude", float)
     amplitude_mod1_depth = WwiseProperty[float]("AmplitudeMod1Depth", float)
     amplitude_mod1_quantization = WwiseProperty[ESoundSeedGrainQuantizationSimple](
@@ -11,6 +11,8 @@ class WwiseSilence(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     length = WwiseProperty[float]("Length", float)
     length_max = WwiseProperty[float]("LengthMax", float)
     length_min = WwiseProperty[float]("LengthMin", float)
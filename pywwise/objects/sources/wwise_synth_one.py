@@ -12,6 +12,8 @@ class WwiseSynthOne(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     base_frequency = WwiseProperty[float]("BaseFrequency", float)
     fm_amount = WwiseProperty[float]("FMAmount", float)
     frequency_mode = WwiseProperty[EFrequencyMode]("FrequencyMode", EFrequencyMode)
@@ -12,6 +12,8 @@ class WwiseToneGenerator(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     attack_time = WwiseProperty[float]("AttackTime", float)
     channel_mask = WwiseProperty[EToneGenChannelMask]("ChannelMask", EToneGenChannelMask)
     decay_time = WwiseProperty[float]("DecayTime", float)
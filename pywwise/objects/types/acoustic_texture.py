@@ -12,6 +12,8 @@ class AcousticTexture(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.ACOUSTIC_TEXTURE`.
     """
+    __slots__ = ()
+    
     absorption_high = WwiseProperty[float]("AbsorptionHigh", float)
     absorption_low = WwiseProperty[float]("AbsorptionLow", float)
     absorption_mid_high = WwiseProperty[float]("AbsorptionMidHigh", float)
@@ -14,6 +14,8 @@ class Action(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.ACTION`.
     """
+    __slots__ = ()
+    
     absolute_or_relative = WwiseProperty[ESetterType]("AbsoluteOrRelative", ESetterType)
     action_type = WwiseProperty[EActionType]("ActionType", EActionType)
     apply_to_dynamic_sequence = WwiseProperty[bool]("ApplyToDynamicSequence", bool)
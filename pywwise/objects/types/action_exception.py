@@ -12,6 +12,8 @@ class ActionException(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.ACTION_EXCEPTION`
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
     target = WwiseProperty[WwiseObject]("Target", WwiseObject)
@@ -21,6 +21,8 @@ class ActorMixer(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.ACTOR_MIXER`.
     """
+    __slots__ = ()
+    
     position_3d = WwiseProperty[E3DPosition]("3DPosition", E3DPosition)
     spatialization_3d = WwiseProperty[E3DSpatialization]("3DSpatialization", E3DSpatialization)
     attenuation = WwiseProperty[Attenuation]("Attenuation", Attenuation)
@@ -13,6 +13,8 @@ class Attenuation(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.ATTENUATION`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     cone_attenuation = WwiseProperty[float]("ConeAttenuation", float)
     cone_high_pass_filter_value = WwiseProperty[int]("ConeHighPassFilterAngle", int)
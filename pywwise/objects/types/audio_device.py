@@ -14,6 +14,8 @@ class AudioDevice(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.AUDIO_DEVICE`.
     """
+    __slots__ = ()
+    
     bypass_effect = WwiseProperty[bool]("BypassEffect", bool)
     colour = WwiseProperty[EColour]("Color", EColour)
     effects = WwiseProperty[list[EffectSlot]]("Effects", list[EffectSlot])
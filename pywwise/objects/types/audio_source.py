@@ -14,6 +14,8 @@ class AudioSource(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.AUDIO_SOURCE`.
     """
+    __slots__ = ()
+    
     channel_config_override = WwiseProperty[ESpeakerBitMask]("ChannelConfigOverride", ESpeakerBitMask)
     colour = WwiseProperty[EColour]("Color", EColour)
     conversion = WwiseProperty[Conversion]("Conversion", Conversion)
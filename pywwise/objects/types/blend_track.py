@@ -12,6 +12,8 @@ class BlendTrack(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.BLEND_TRACK`.
     """
+    __slots__ = ()
+    
     enable_cross_fading = WwiseProperty[bool]("EnableCrossFading", bool)
     highpass = WwiseProperty[int]("Highpass", int)
     layer_cross_fade_control_input = WwiseProperty[Rtpc]("LayerCrossFadeControlInput", Rtpc)
@@ -12,6 +12,8 @@ class ControlSurfaceBinding(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.CONTROL_SURFACE_BINDING`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     hardware_controller_key = WwiseProperty[str]("HardwareControllerKey", str)
     object_index_in_view = WwiseProperty[int]("ObjectIndexInView", int)
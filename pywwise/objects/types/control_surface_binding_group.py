@@ -12,6 +12,8 @@ class ControlSurfaceBindingGroup(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.CONTROL_SURFACE_BINDING_GROUP`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     group_type = WwiseProperty[EControlSurfaceBindingGroupType]("GroupType", EControlSurfaceBindingGroupType)
     hardware_controller_key = WwiseProperty[str]("HardwareControllerKey", str)
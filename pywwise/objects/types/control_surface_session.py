@@ -12,5 +12,7 @@ class ControlSurfaceSession(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.CONTROL_SURFACE_SESSION`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
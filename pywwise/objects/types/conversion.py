@@ -12,6 +12,8 @@ class Conversion(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.CONVERSION`.
     """
+    __slots__ = ()
+    
     allow_channel_upmix = WwiseProperty[bool]("AllowChannelUpmix", bool)
     channels = WwiseProperty[EChannelConversionSettings]("Channels", EChannelConversionSettings)
     colour = WwiseProperty[EColour]("Color", EColour)
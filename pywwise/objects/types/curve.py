@@ -11,4 +11,6 @@ class Curve(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.CURVE`.
     """
+    __slots__ = ()
+    
     flags = WwiseProperty[int]("Flags", int)
@@ -15,6 +15,8 @@ class DialogueEvent(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.DIALOGUE_EVENT`.
     """
+    __slots__ = ()
+    
     arguments = WwiseProperty[tuple[SwitchGroup | StateGroup, ...]]("Arguments", tuple)
     colour = WwiseProperty[EColour]("Color", EColour)
     entries = WwiseProperty[tuple[MultiSwitchEntry, ...]]("Entries", tuple)
@@ -13,6 +13,8 @@ class Effect(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.EFFECT`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     inclusion = WwiseProperty[bool]("Inclusion", bool)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
@@ -13,6 +13,8 @@ class EffectSlot(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.EFFECT_SLOT`.
     """
+    __slots__ = ()
+    
     bypass = WwiseProperty[bool]("Bypass", bool)
     effect = WwiseProperty[Effect]("Effect", Effect)
     rtpc = WwiseProperty[tuple[Rtpc, ...]]("RTPC", tuple)
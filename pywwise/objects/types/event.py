@@ -12,6 +12,8 @@ class Event(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.EVENT`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     inclusion = WwiseProperty[bool]("Inclusion", bool)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
@@ -10,4 +10,6 @@ class ExternalSource(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.EXTERNAL_SOURCE`.
     """
+    __slots__ = ()
+    
     pass  # There are no properties, currently.
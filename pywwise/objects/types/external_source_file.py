@@ -13,6 +13,8 @@ class ExternalSourceFile(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.EXTERNAL_SOURCE_FILE`.
     """
+    __slots__ = ()
+    
     analysis_type = WwiseProperty[EExternalAnalysisType]("AnalysisType", EExternalAnalysisType)
     conversion = WwiseProperty[Conversion]("Conversion", Conversion)
     loudness_normalization_target = WwiseProperty[float]("LoudnessNormalizationTarget", float)
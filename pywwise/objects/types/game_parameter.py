@@ -12,6 +12,8 @@ class GameParameter(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.GAME_PARAMETER`.
     """
+    __slots__ = ()
+    
     bind_to_built_in_param = WwiseProperty[EBuiltInGameParameter]("BindToBuiltInParam", EBuiltInGameParameter)
     colour = WwiseProperty[EColour]("Color", EColour)
     filter_time_down = WwiseProperty[float]("FilterTimeDown", float)
@@ -11,4 +11,6 @@ class Language(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.LANGUAGE`.
     """
+    __slots__ = ()
+    
     volume_offset = WwiseProperty[float]("VolumeOffset", float)
@@ -12,6 +12,8 @@ class Marker(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MARKER`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     label = WwiseProperty[str]("Label", str)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
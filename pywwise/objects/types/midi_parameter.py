@@ -11,4 +11,6 @@ class MidiParameter(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MIDI_PARAMETER`.
     """
+    __slots__ = ()
+    
     simulation_value = WwiseProperty[float]("SimulationValue", float)
@@ -11,6 +11,8 @@ class Modifier(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MODIFIER`.
     """
+    __slots__ = ()
+    
     enabled = WwiseProperty[bool]("Enabled", bool)
     max = WwiseProperty[float]("Max", float)
     min = WwiseProperty[float]("Min", float)
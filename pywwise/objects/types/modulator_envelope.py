@@ -19,6 +19,8 @@ class ModulatorEnvelope(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MODULATOR_ENVELOPE`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     envelope_attack_curve = WwiseProperty[float]("EnvelopeAttackCurve", float)
     envelope_attack_time = WwiseProperty[float]("EnvelopeAttackTime", float)
@@ -19,6 +19,8 @@ class ModulatorLfo(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MODULATOR_LFO`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     lfo_attack = WwiseProperty[float]("LfoAttack", float)
     lfo_depth = WwiseProperty[float]("LfoDepth", float)
@@ -32,6 +32,8 @@ class MultiSwitchEntry(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MULTI_SWITCH_ENTRY`.
     """
+    __slots__ = ()
+    
     audio_node = WwiseProperty[_AudioNodeType]("AudioNode", _AudioNodeTypeTuple)
     entry_path = WwiseProperty[tuple[SwitchGroup | Switch | StateGroup | State, ...]]("EntryPath", tuple)
     probability = WwiseProperty[int]("Probability", int)
@@ -12,6 +12,8 @@ class MusicClip(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_CLIP`.
     """
+    __slots__ = ()
+    
     begin_trim_offset = WwiseProperty[float]("BeginTrimOffset", float)
     colour = WwiseProperty[EColour]("Color", EColour)
     end_trim_offset = WwiseProperty[float]("EndTrimOffset", float)
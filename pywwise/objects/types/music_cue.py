@@ -12,6 +12,8 @@ class MusicCue(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_CUE`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     cue_type = WwiseProperty[EMusicCueType]("CueType", EMusicCueType)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
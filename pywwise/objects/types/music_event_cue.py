@@ -12,5 +12,7 @@ class MusicEventCue(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_EVENT_CUE`.
     """
+    __slots__ = ()
+    
     play_at = WwiseProperty[float]("PlayAt", float)
     post_event_target = WwiseProperty[Event]("PostEventTarget", Event)
@@ -12,6 +12,8 @@ class MusicFade(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_FADE`.
     """
+    __slots__ = ()
+    
     fade_curve = WwiseProperty[EMusicFadeShape]("FadeCurve", EMusicFadeShape)
     fade_offset = WwiseProperty[float]("FadeOffset", float)
     fade_time = WwiseProperty[float]("FadeTime", float)
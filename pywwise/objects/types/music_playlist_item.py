@@ -13,6 +13,8 @@ class MusicPlaylistItem(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_PLAYLIST_ITEM`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     loop_count = WwiseProperty[int]("LoopCount", int)
     normal_or_shuffle = WwiseProperty[ERandomType]("NormalOrShuffle", ERandomType)
@@ -20,6 +20,8 @@ class MusicStinger(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_STINGER`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     custom_cue_match_name = WwiseProperty[str]("CustomCueMatchName", str)
     dont_play_again_time = WwiseProperty[float]("DontPlayAgainTime", float)
@@ -38,6 +38,8 @@ class MusicSwitchContainer(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_SWITCH_CONTAINER`.
     """
+    __slots__ = ()
+    
     position_3d = WwiseProperty[E3DPosition]("3DPosition", E3DPosition)
     spatialization_3d = WwiseProperty[E3DSpatialization]("3DSpatialization", E3DSpatialization)
     arguments = WwiseProperty[tuple[ESyncGroupType, ...]]("Arguments", tuple)
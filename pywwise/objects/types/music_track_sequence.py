@@ -12,6 +12,8 @@ class MusicTrackSequence(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_TRACK_SEQUENCE`.
     """
+    __slots__ = ()
+    
     clips = WwiseProperty[tuple[EMusicClipType, ...]]("Clips", tuple)
     colour = WwiseProperty[EColour]("Color", EColour)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
@@ -28,6 +28,8 @@ class MusicTransition(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.MUSIC_TRANSITION`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     destination_context_object = WwiseProperty[_InteractiveMusicType]("DestinationContextObject",
                                                                       _InteractiveMusicTypeTuple)
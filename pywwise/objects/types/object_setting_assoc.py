@@ -11,6 +11,8 @@ class ObjectSettingAssoc(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.OBJECT_SETTING_ASSOC`.
     """
+    __slots__ = ()
+    
     continue_play = WwiseProperty[bool]("ContinuePlay", bool)
     fade_in_time = WwiseProperty[float]("FadeInTime", float)
     fade_out_time = WwiseProperty[float]("FadeOutTime", float)
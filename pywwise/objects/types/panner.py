@@ -12,6 +12,8 @@ class Panner(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.PANNER`.
     """
+    __slots__ = ()
+    
     pan_x = WwiseProperty[float]("PanX", float)
     pan_y = WwiseProperty[float]("PanY", float)
     pan_z = WwiseProperty[float]("PanZ", float)
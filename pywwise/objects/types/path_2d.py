@@ -11,6 +11,8 @@ class Path2D(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.PATH_2D`.
     """
+    __slots__ = ()
+    
     append_offset = WwiseProperty[int]("AppendOffset", int)
     duration = WwiseProperty[int]("Duration", int)
     flags = WwiseProperty[int]("Flags", int)
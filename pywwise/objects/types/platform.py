@@ -10,4 +10,6 @@ class Platform(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.PLATFORM`.
     """
+    __slots__ = ()
+    
     pass  # There are no properties, currently.
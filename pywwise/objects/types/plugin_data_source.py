@@ -11,4 +11,6 @@ class PluginDataSource(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.PLUGIN_DATA_SOURCE`.
     """
+    __slots__ = ()
+    
     data_file_name = WwiseProperty[str]("DataFileName", str)
@@ -13,6 +13,8 @@ class Position(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.POSITION`.
     """
+    __slots__ = ()
+    
     new_path_for_each_sound = WwiseProperty[bool]("NewPathForEachSound", bool)
     pan_x = WwiseProperty[float]("PanX", float)
     pan_y = WwiseProperty[float]("PanY", float)
@@ -14,6 +14,8 @@ class Project(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.PROJECT`.
     """
+    __slots__ = ()
+    
     always_save_media_ids_file = WwiseProperty[bool]("AlwaysSaveMediaIdsFile", bool)
     auto_detect_fft_window_size = WwiseProperty[EFftWindowSize]("AutoDetectFFTWindowSize", EFftWindowSize)
     auto_detect_threshold_high = WwiseProperty[float]("AutoDetectThresholdHigh", float)
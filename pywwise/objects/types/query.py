@@ -12,6 +12,8 @@ class Query(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.QUERY`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     logical_operator = WwiseProperty[ELogicalOperator]("LogicalOperator", ELogicalOperator)
     object_type = WwiseProperty[EObjectTypeQuery]("ObjectType", EObjectTypeQuery)
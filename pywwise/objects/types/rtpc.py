@@ -24,6 +24,8 @@ class Rtpc(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.RTPC`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     control_input = WwiseProperty[_ControlInputType]("ControlInput", _ControlInputTypeTuple)
     curve = WwiseProperty[Curve]("Curve", Curve)
@@ -17,6 +17,8 @@ class SearchCriteria(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SEARCH_CRITERIA`.
     """
+    __slots__ = ()
+    
     attenuation = WwiseProperty[str]("Attenuation", str)
     conditional_operator = WwiseProperty[ELogicalOperator]("ConditionalOperator", ELogicalOperator)
     conversion = WwiseProperty[str]("Conversion", str)
@@ -12,6 +12,8 @@ class SoundBank(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOUND_BANK`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     fill = WwiseProperty[bool]("Fill", bool)
     maximum = WwiseProperty[int]("Maximum", int)
@@ -13,6 +13,8 @@ class SourcePlugin(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SOURCE_PLUGIN`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
     rtpc = WwiseProperty[tuple[Rtpc, ...]]("RTPC", tuple)
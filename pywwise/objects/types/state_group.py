@@ -12,6 +12,8 @@ class StateGroup(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.STATE_GROUP`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     default_transition_time = WwiseProperty[float]("DefaultTransitionTime", float)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
@@ -12,6 +12,8 @@ class SwitchGroup(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.SWITCH_GROUP`.
     """
+    __slots__ = ()
+    
     colour = WwiseProperty[EColour]("Color", EColour)
     override_colour = WwiseProperty[bool]("OverrideColor", bool)
     use_game_parameter = WwiseProperty[bool]("UseGameParameter", bool)
@@ -14,6 +14,8 @@ class UserProjectSettings(WwiseObject):
     A class serving as an interface for getting/setting properties on Wwise objects. This type specifically targets
     the class represented by `EObjectType.USER_PROJECT_SETTINGS`.
     """
+    __slots__ = ()
+    
     auto_sound_bank_all_events = WwiseProperty[bool]("AutoSoundBankAllEvents", bool)
     auto_sound_bank_enabled = WwiseProperty[bool]("AutoSoundBankEnabled", bool)
     conversion = WwiseProperty[Conversion]("Conversion", Conversion)
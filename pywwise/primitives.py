@@ -4,6 +4,9 @@
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 from typing import Self as _Self
 from uuid import UUID as _UUID
+from weakref import WeakValueDictionary as _WeakValueDictionary
+
+__all__ = ["GUID", "GameObjectID", "Name", "OriginalsPath", "PlayingID", "ProjectPath", "ShortID"]
 
 
 class _PyWwiseType(_ABC):
@@ -69,6 +72,8 @@ class _PyWwiseStr(str, _PyWwiseType):
 
 class _PyWwisePath(_PyWwiseStr):
     
+    _delimiter = "\\"  # Only set per instance for non-Windows-style paths, so that most paths do not need a `__dict__`.
+    
     def __new__(cls, path: str, windows_style: bool = True) -> _Self:
         """
         Creates a new path-like object using a `str` as the container. By default, any path will be automatically
@@ -85,7 +90,8 @@ class _PyWwisePath(_PyWwiseStr):
         
         if path == "\0":
             path = super().__new__(cls, path)
-            path._delimiter = delimiter
+            if delimiter != path._delimiter:
+                path._delimiter = delimiter
             return path
         
         if windows_style:
@@ -103,7 +109,8 @@ class _PyWwisePath(_PyWwiseStr):
             path = path[:-1]
         
         path = super().__new__(cls, path)
-        path._delimiter = delimiter
+        if delimiter != path._delimiter:
+            path._delimiter = delimiter
         return path
     
     def __getitem__(self, item: int | slice) -> str | list[str]:
@@ -176,6 +183,51 @@ class GUID(_PyWwiseStr):
             return True
         except ValueError:
             return False
+    
+    @classmethod
+    def intern(cls, guid: str, validate: bool = True) -> _Self:
+        """
+        Gets the shared instance of a GUID, creating it if there is none. As long as an instance is in use, every GUID
+        interned with the same string is that same instance, so repeated GUIDs (e.g. references, or playing voices of
+        the same object) take no extra memory, and are only validated once.
+        :param guid: The GUID, in the WAAPI string form (e.g. `"{63726145-57FB-490B-B611-738BD3EF2F72}"`).
+        :param validate: Whether to validate the GUID, if it was not interned yet. Skip this only for trusted values
+                         (e.g. returned by WAAPI).
+        :return: The shared instance.
+        :raise ValueError: If `validate` is True and the GUID is in the wrong format.
+        """
+        try:
+            return _INTERNED_GUIDS[guid]
+        except KeyError:
+            key = str(guid)  # A plain string: the key must not keep the instance alive.
+            if type(guid) is not cls:
+                guid = cls(key) if validate else str.__new__(cls, key)
+            return _INTERNED_GUIDS.setdefault(key, guid)
+    
+    @classmethod
+    def from_int(cls, value: int) -> _Self:
+        """
+        Creates a GUID from its 128-bit integer form (see `to_int`).
+        :param value: The integer.
+        :return: The GUID, in the WAAPI string form (upper case).
+        :raise ValueError: If the integer is not a 128-bit unsigned integer.
+        """
+        if not 0 <= value < 1 << 128:
+            raise ValueError("A GUID must be a 128-bit unsigned integer.")
+        digits = f"{value:032X}"
+        return str.__new__(cls, f"{{{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}}}")
+    
+    def to_int(self) -> int:
+        """
+        Converts this GUID to a 128-bit integer, a compact form to store or compare many GUIDs (e.g. in large sets or
+        as dictionary keys). The conversion is not case-sensitive. Use `from_int` to convert it back.
+        :return: The integer.
+        """
+        return int(self[1:-1].replace("-", ""), 16)
+
+
+_INTERNED_GUIDS = _WeakValueDictionary[str, GUID]()
+"""The GUIDs in use that were interned (see `GUID.intern`), per string."""
 
 
 class ProjectPath(_PyWwisePath):
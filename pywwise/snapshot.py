@@ -0,0 +1,338 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any as _Any, Iterable as _Iterable, Iterator as _Iterator
+from uuid import uuid4 as _uuid4
+
+
+def new_guid() -> str:
+    """:return: A new, random GUID, in the format used by WAAPI (e.g. `"{63726145-57FB-490B-B611-738BD3EF2F72}"`)."""
+    return f"{{{str(_uuid4()).upper()}}}"
+
+
+def _iter_references(value: _Any) -> _Iterator[str]:
+    """
+    Lists the references held by a value of a record.
+    :param value: The value (e.g. `{"id": ...}`, or a list of them).
+    :return: An iterator over the GUIDs of the referenced objects.
+    """
+    for reference in (value if isinstance(value, list) else (value,)):
+        if isinstance(reference, dict) and reference.get("id") is not None:
+            yield reference["id"]
+
+
+def _has_references(value: _Any) -> bool:
+    """
+    Checks whether a value of a record holds references.
+    :param value: The value.
+    :return: Whether the value holds at least one reference.
+    """
+    return next(_iter_references(value), None) is not None
+
+
+class ProjectSnapshot:
+    """
+    An in-memory index of the objects of a Wwise project. Each object is a record (a dictionary) using the same keys as
+    WAAPI's `return` options: `id`, `name`, `type` and `path`, plus any property or reference, prefixed with `@` (e.g.
+    `@Volume`). References are stored as `{"id": ...}` dictionaries. Objects can be looked up by GUID, path, type,
+    parent, and typed name (e.g. `Event:Play_Footstep`).
+    """
+    
+    def __init__(self):
+        """Constructor. The snapshot starts empty."""
+        self._objects = dict[str, dict[str, _Any]]()
+        self._paths = dict[str, str]()
+        self._types = dict[str, dict[str, None]]()  # Dictionaries, as ordered sets.
+        self._typed_names = dict[tuple[str, str], str]()
+        self._parents = dict[str, str | None]()
+        self._children = dict[str, dict[str, None]]()
+        self._referrers: dict[str, list[str]] | None = None  # Built on demand (see `referrers`).
+    
+    def __len__(self) -> int:
+        """:return: The amount of objects in this snapshot."""
+        return len(self._objects)
+    
+    def __contains__(self, guid: str) -> bool:
+        """
+        Checks if an object is in this snapshot.
+        :param guid: The GUID of the object.
+        :return: Whether the object is in this snapshot.
+        """
+        return guid in self._objects
+    
+    def __iter__(self) -> _Iterator[str]:
+        """:return: An iterator over the GUIDs of all objects, in insertion order."""
+        return iter(self._objects)
+    
+    def get(self, guid: str) -> dict[str, _Any] | None:
+        """
+        Gets the record of an object. The record must not be modified directly; use `set_value` instead.
+        :param guid: The GUID of the object.
+        :return: The record, or `None` if the object is not in this snapshot.
+        """
+        return self._objects.get(guid)
+    
+    def find(self, reference: str) -> str | None:
+        """
+        Finds an object the same way WAAPI resolves object arguments.
+        :param reference: A GUID, a project path (e.g. `\\Events\\Default Work Unit\\Play_Footstep`), or a typed name
+                          (e.g. `Event:Play_Footstep`).
+        :return: The GUID of the object, or `None` if there is no such object.
+        """
+        if reference.startswith("{"):
+            return reference.upper() if reference.upper() in self._objects else None
+        if reference.startswith("\\"):
+            return self._paths.get(reference.rstrip("\\"))
+        type_name, separator, name = reference.partition(":")
+        return self._typed_names.get((type_name.lower(), name)) if separator else None
+    
+    def of_type(self, type_name: str) -> tuple[str, ...]:
+        """
+        Lists the objects of a type.
+        :param type_name: The name of the type (e.g. `Sound`). Not case-sensitive.
+        :return: The GUIDs of the objects of that type, in insertion order.
+        """
+        return tuple(self._types.get(type_name.lower(), ()))
+    
+    def roots(self) -> tuple[str, ...]:
+        """:return: The GUIDs of the objects without a parent (e.g. `\\Actor-Mixer Hierarchy`)."""
+        return tuple(guid for guid, parent in self._parents.items() if parent is None)
+    
+    def parent(self, guid: str) -> str | None:
+        """
+        Gets the parent of an object.
+        :param guid: The GUID of the object.
+        :return: The GUID of the parent, or `None` if the object has no parent (or is not in this snapshot).
+        """
+        return self._parents.get(guid)
+    
+    def children(self, guid: str) -> tuple[str, ...]:
+        """
+        Lists the children of an object.
+        :param guid: The GUID of the object.
+        :return: The GUIDs of the children, in insertion order.
+        """
+        return tuple(self._children.get(guid, ()))
+    
+    def descendants(self, guid: str) -> _Iterator[str]:
+        """
+        Lists the descendants of an object, depth-first.
+        :param guid: The GUID of the object.
+        :return: An iterator over the GUIDs of the descendants. The object itself is not included.
+        """
+        for child in self.children(guid):
+            yield child
+            yield from self.descendants(child)
+    
+    def referrers(self, guid: str) -> tuple[str, ...]:
+        """
+        Lists the objects referencing an object (e.g. the actions targeting a sound). The reference index is built on
+        the first call, then kept until a change adds or removes a reference.
+        :param guid: The GUID of the referenced object. Not case-sensitive.
+        :return: The GUIDs of the referencing objects, in insertion order.
+        """
+        if self._referrers is None:
+            referrers = dict[str, list[str]]()
+            for referrer, record in self._objects.items():
+                for value in record.values():
+                    for reference in _iter_references(value):
+                        referrers.setdefault(str(reference).upper(), []).append(referrer)
+            self._referrers = referrers
+        return tuple(self._referrers.get(guid.upper(), ()))
+    
+    def add(self, record: dict[str, _Any], parent: str | None = None) -> dict[str, _Any]:
+        """
+        Adds an object. Its path is computed from its parent and name.
+        :param record: The record of the object. It must contain at least a `name` and a `type`. If it has no `id`, a
+                       new GUID is generated.
+        :param parent: The GUID of the parent, or `None` for a root object.
+        :raise KeyError: If the parent is not in this snapshot.
+        :raise ValueError: If the object is already in this snapshot, or if its path is already taken.
+        :return: The record, as stored in this snapshot.
+        """
+        if parent is not None and parent not in self._objects:
+            raise KeyError(f"Unknown parent: {parent}.")
+        return self._insert({**record, "path": self._make_path(parent, record["name"])}, parent)
+    
+    def _insert(self, record: dict[str, _Any], parent: str | None) -> dict[str, _Any]:
+        """
+        Adds an object at the path of its record (e.g. as returned by WAAPI), rather than computing it like `add` does.
+        :param record: The record of the object. It must contain at least a `name`, a `type` and a `path`. If it has no
+                       `id`, a new GUID is generated.
+        :param parent: The GUID of the parent, or `None` for a root object.
+        :raise KeyError: If the parent is not in this snapshot.
+        :raise ValueError: If the object is already in this snapshot, or if its path is already taken.
+        :return: The record, as stored in this snapshot.
+        """
+        if parent is not None and parent not in self._objects:
+            raise KeyError(f"Unknown parent: {parent}.")
+        
+        record = {**record, "id": record.get("id") or new_guid()}
+        guid = record["id"]
+        
+        if guid in self._objects:
+            raise ValueError(f"An object with GUID {guid} already exists.")
+        if record["path"] in self._paths:
+            raise ValueError(f"An object with path {record['path']} already exists.")
+        
+        self._objects[guid] = record
+        if any(_has_references(value) for value in record.values()):
+            self._referrers = None
+        self._paths[record["path"]] = guid
+        self._types.setdefault(record["type"].lower(), {})[guid] = None
+        self._typed_names[(record["type"].lower(), record["name"])] = guid
+        self._parents[guid] = parent
+        self._children[guid] = {}
+        if parent is not None:
+            self._children[parent][guid] = None
+        return record
+    
+    def remove(self, guid: str) -> list[dict[str, _Any]]:
+        """
+        Removes an object and all of its descendants.
+        :param guid: The GUID of the object.
+        :raise KeyError: If the object is not in this snapshot.
+        :return: The records of the removed objects, descendants first.
+        """
+        removed = [self._objects[descendant] for descendant in reversed(list(self.descendants(guid)))]
+        removed.append(self._objects[guid])
+        
+        parent = self._parents.get(guid)
+        if parent is not None:
+            del self._children[parent][guid]
+        
+        if any(_has_references(value) for record in removed for value in record.values()):
+            self._referrers = None
+        for record in removed:
+            self._unindex(record)
+            del self._objects[record["id"]]
+            del self._parents[record["id"]]
+            del self._children[record["id"]]
+        return removed
+    
+    def rename(self, guid: str, name: str) -> str:
+        """
+        Renames an object, updating the paths of its descendants.
+        :param guid: The GUID of the object.
+        :param name: The new name.
+        :raise KeyError: If the object is not in this snapshot.
+        :raise ValueError: If the new path is already taken.
+        :return: The old name.
+        """
+        record = self._objects[guid]
+        old_name = record["name"]
+        self._relocate(guid, self._parents[guid], name)
+        return old_name
+    
+    def move(self, guid: str, parent: str):
+        """
+        Moves an object under a new parent, updating the paths of its descendants.
+        :param guid: The GUID of the object.
+        :param parent: The GUID of the new parent.
+        :raise KeyError: If the object or the parent is not in this snapshot.
+        :raise ValueError: If the parent is the object itself or one of its descendants, or if the new path is taken.
+        """
+        if parent not in self._objects:
+            raise KeyError(f"Unknown parent: {parent}.")
+        if parent == guid or parent in set(self.descendants(guid)):
+            raise ValueError("An object cannot be moved under itself.")
+        self._relocate(guid, parent, self._objects[guid]["name"])
+    
+    def set_value(self, guid: str, key: str, value: _Any) -> _Any:
+        """
+        Sets a value in the record of an object (e.g. a property). Use `rename` and `move` to change names and paths.
+        :param guid: The GUID of the object.
+        :param key: The key of the value (e.g. `@Volume`, or `notes`).
+        :param value: The new value. If `None`, the value is removed.
+        :raise KeyError: If the object is not in this snapshot.
+        :raise ValueError: If the key is `id`, `name`, `type` or `path`.
+        :return: The old value, or `None` if there was none.
+        """
+        if key in ("id", "name", "type", "path"):
+            raise ValueError(f"`{key}` cannot be set directly.")
+        record = self._objects[guid]
+        old = record.get(key)
+        if _has_references(old) or _has_references(value):
+            self._referrers = None
+        if value is None:
+            record.pop(key, None)
+        else:
+            record[key] = value
+        return old
+    
+    def values(self, guid: str, returns: _Iterable[str]) -> dict[str, _Any]:
+        """
+        Gets values of an object, the same way WAAPI's `return` options do. Besides the keys of the record, `parent`
+        (as `{"id": ..., "name": ...}`) and `childrenCount` are supported, and properties can be requested without their
+        `@` prefix. References are returned with their current name. Keys that the object does not have are omitted.
+        :param guid: The GUID of the object.
+        :param returns: The keys to get (e.g. `("id", "name", "@Volume")`).
+        :raise KeyError: If the object is not in this snapshot.
+        :return: The values, per key.
+        """
+        record = self._objects[guid]
+        values = dict[str, _Any]()
+        for key in returns:
+            if key == "parent":
+                parent = self._parents[guid]
+                if parent is not None:
+                    values[key] = {"id": parent, "name": self._objects[parent]["name"]}
+            elif key == "childrenCount":
+                values[key] = len(self._children[guid])
+            elif key in record or f"@{key}" in record:  # Properties can be requested with or without `@`.
+                value = record[key] if key in record else record[f"@{key}"]
+                if isinstance(value, dict) and value.get("id") in self._objects:  # Reference: refresh the name.
+                    value = {"id": value["id"], "name": self._objects[value["id"]]["name"]}
+                values[key] = value
+        return values
+    
+    def _make_path(self, parent: str | None, name: str) -> str:
+        """
+        Computes the path of an object.
+        :param parent: The GUID of the parent, or `None` for a root object.
+        :param name: The name of the object.
+        :return: The path.
+        """
+        return f"{self._objects[parent]['path'] if parent is not None else ''}\\{name}"
+    
+    def _unindex(self, record: dict[str, _Any]):
+        """
+        Removes an object from the path, type and typed name indexes.
+        :param record: The record of the object.
+        """
+        self._paths.pop(record["path"], None)
+        self._types.get(record["type"].lower(), {}).pop(record["id"], None)
+        if self._typed_names.get((record["type"].lower(), record["name"])) == record["id"]:
+            del self._typed_names[(record["type"].lower(), record["name"])]
+    
+    def _relocate(self, guid: str, parent: str | None, name: str):
+        """
+        Changes the parent and/or name of an object, then updates the paths of the object and its descendants.
+        :param guid: The GUID of the object.
+        :param parent: The GUID of the new parent, or `None` for a root object.
+        :param name: The new name.
+        :raise ValueError: If the new path is already taken.
+        """
+        record = self._objects[guid]
+        path = self._make_path(parent, name)
+        if path != record["path"] and path in self._paths:
+            raise ValueError(f"An object with path {path} already exists.")
+        
+        if self._typed_names.get((record["type"].lower(), record["name"])) == guid:
+            del self._typed_names[(record["type"].lower(), record["name"])]
+        record["name"] = name
+        self._typed_names[(record["type"].lower(), name)] = guid
+        
+        old_parent = self._parents[guid]
+        if old_parent != parent:
+            if old_parent is not None:
+                del self._children[old_parent][guid]
+            if parent is not None:
+                self._children[parent][guid] = None
+            self._parents[guid] = parent
+        
+        for current in (guid, *self.descendants(guid)):
+            current_record = self._objects[current]
+            self._paths.pop(current_record["path"], None)
+            current_record["path"] = self._make_path(self._parents[current], current_record["name"])
+            self._paths[current_record["path"]] = current
@@ -11,6 +11,10 @@ from pywwise.modules import LazyModule
 _EnumType = _TypeVar("_EnumType", bound=_Enum)
 _pywwise_enums = LazyModule("pywwise.enums")  # To avoid circular imports.
 
+_VALUE_INDEXES = dict[type, dict[_Any, _Enum] | None]()
+"""The members of each enum type, per value, built on first use by `EnumStatics.from_value` (`None` for plain `Enum`
+types, whose members only equal themselves, and for enum types whose values are not hashable)."""
+
 
 class EnumStatics(metaclass=StaticMeta):
     """A static class containing useful utility functions for enums."""
@@ -24,10 +28,29 @@ class EnumStatics(metaclass=StaticMeta):
         :raise: ValueError, if the provided value does not exist in the enum type.
         :return: An enum member instance.
         """
-        for member in enum_type:
-            if member == enum_value:
-                return member
-        raise ValueError(f"No {_EnumType.__name__} member with value {enum_value}")
+        if isinstance(enum_value, enum_type):
+            return enum_value
+        if enum_type not in _VALUE_INDEXES:
+            index = None
+            if all(member == member.value for member in enum_type):  # e.g. `IntEnum`, but not plain `Enum` types.
+                index = dict[_Any, _Enum]()
+                try:
+                    for member in enum_type:
+                        index.setdefault(member.value, member)  # The first member wins, as with a linear search.
+                except TypeError:  # Unhashable values: search linearly.
+                    index = None
+            _VALUE_INDEXES[enum_type] = index
+        index = _VALUE_INDEXES[enum_type]
+        if index is not None:
+            try:
+                return index[enum_value]
+            except (KeyError, TypeError):  # Not found, or an unhashable value.
+                pass
+        else:
+            for member in enum_type:
+                if member == enum_value:
+                    return member
+        raise ValueError(f"No {enum_type.__name__} member with value {enum_value}")
     
     @staticmethod
     def get_all_members(enum_type: _Type[_EnumType]) -> tuple[_EnumType, ...]:
@@ -3,12 +3,15 @@
 
 from __future__ import annotations
 
-from typing import Any as _Any, Self as _Self, TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any, Iterable as _Iterable, Self as _Self, TYPE_CHECKING as _TYPE_CHECKING
 
 if _TYPE_CHECKING:
     from pywwise.descriptors import WwiseProperty
 
+from array import array as _array
 from dataclasses import dataclass as _dataclass, field as _field
+from math import nan as _nan
+from sys import intern as _intern
 from types import NoneType as _NoneType
 
 from pywwise.aliases import ListOrTuple, SystemPath
@@ -20,6 +23,19 @@ from pywwise.enums import (EAttenuationCurveShape, EAttenuationCurveType, EAtten
 from pywwise.primitives import GameObjectID, GUID, Name, OriginalsPath, PlayingID, ProjectPath, ShortID
 from pywwise.statics import EnumStatics
 
+__all__ = ["ActiveRTPCInfo", "AttenuationCurve", "AudioImportEntry", "AudioObjectInfo", "AudioObjectMetadata",
+           "AuxSendValue", "BusPipelineInfo", "CPUStatisticsInfo", "CaptureLogItem", "CommandInfo",
+           "ConnectionStatusInfo", "ContextMenuInfo", "ConversionLogItem", "ExternalSourceInfo",
+           "GameObjectRegistrationData", "GraphPoint2D", "LanguageInfo", "LoadedMediaInfo", "LogItem", "MainMenuInfo",
+           "PerformanceMonitorCounterInfo", "PlatformInfo", "PlayingVoiceProperties", "PluginLibraryInfo",
+           "PropertyInfo", "Rect", "RemoteConsoleInformation", "SetImportNode", "SetObjectNode", "SetOperation",
+           "SoundBankData", "SoundBankGenerationInfo", "SoundBankInclusion", "SoundBankInfo", "SourceControlStatus",
+           "SourceFileInfo", "StreamObjectInfo", "SwitchContainerAssignment", "TransportObjectInfo", "Vector2",
+           "Vector3", "VoiceContributionHierarchy", "VoiceContributionParameter", "VoiceInspectorContribution",
+           "WaapiCallRecord", "WaapiCallStats", "WwiseDirectories", "WwiseGlobalDirectories", "WwiseGlobalInfo",
+           "WwiseObjectColumns", "WwiseObjectInfo", "WwiseObjectWatch", "WwiseProjectDirectories", "WwiseProjectInfo",
+           "WwiseVersionInfo"]
+
 
 @_dataclass
 class Vector2:
@@ -131,7 +147,7 @@ class ExternalSourceInfo:
         return as_dict
 
 
-@_dataclass
+@_dataclass(slots=True)
 class WwiseObjectInfo:
     """Data-only class storing core information about a Wwise object."""
     
@@ -167,6 +183,126 @@ class WwiseObjectInfo:
         etype = EObjectType.from_type_name(kvpairs["type"]) if kvpairs.get("type") is not None else EObjectType.UNKNOWN
         path = ProjectPath(kvpairs["path"]) if kvpairs.get("path", "") != "" else ProjectPath.get_null()
         return cls(guid, name, etype, path)
+    
+    @classmethod
+    def from_dicts(cls, objects: _Iterable[dict[str, _Any]]) -> list[_Self]:
+        """
+        Uses dictionaries returned by WAAPI (e.g. by `ak.wwise.core.object.get`) to initialize new instances, in bulk.
+        Unlike `from_dict`, values are trusted: GUIDs and paths are not validated nor normalized. Objects sharing a name
+        or a type share the same `Name` and `EObjectType` instances. Any key other than the default return options
+        (see `EReturnOptions.get_defaults`) is stored in `other`.
+        :param objects: The dictionaries to extract information from.
+        :return: The new instances, in the same order.
+        """
+        default_keys = frozenset(str(option) for option in EReturnOptions.get_defaults())  # Plain strings compare faster.
+        names = dict[str, Name]()
+        types = dict[str, EObjectType]()
+        new_str = str.__new__
+        null_guid, null_name, null_path = GUID.get_null(), Name.get_null(), ProjectPath.get_null()
+        
+        infos = list[_Self]()
+        for obj in objects:
+            guid = new_str(GUID, guid) if (guid := obj.get("id")) is not None else null_guid
+            if not (name := obj.get("name")):
+                name = null_name
+            elif (shared_name := names.get(name)) is not None:
+                name = shared_name
+            else:
+                name = names.setdefault(name, new_str(Name, name))
+            if (etype := obj.get("type")) is None:
+                etype = EObjectType.UNKNOWN
+            elif (shared_type := types.get(etype)) is not None:
+                etype = shared_type
+            else:
+                etype = types.setdefault(etype, EObjectType.from_type_name(etype))
+            path = new_str(ProjectPath, path) if (path := obj.get("path")) else null_path
+            other = {key: value for key, value in obj.items() if key not in default_keys}
+            infos.append(cls(guid, name, etype, path, other))
+        return infos
+
+
+@_dataclass(frozen=True)
+class WwiseObjectColumns:
+    """Data-only class storing the results of a query column by column, instead of one `WwiseObjectInfo` per object (see
+    `ak.wwise.core.object.get_columns`). All columns have one entry per object, in the order returned by Wwise."""
+    
+    guids: list[str]
+    """The GUIDs of the objects (as plain strings)."""
+    
+    names: list[str]
+    """The names of the objects. Names are interned, so repeated names share the same string."""
+    
+    types: list[str]
+    """The type names of the objects (e.g. `Sound`). Type names are interned. Use `EObjectType.from_type_name` to get
+    the matching `EObjectType`."""
+    
+    paths: list[str]
+    """The project paths of the objects."""
+    
+    values: dict[EReturnOptions | str, _array | list] = _field(default_factory=dict)
+    """The other requested columns (properties and return options), per key (as requested). Numeric columns are
+    `array.array` instances: `q` (64-bit integers) if all values are integers, `b` if all values are booleans, or `d`
+    (floats, with NaN for objects that do not have the property) otherwise. Other columns are lists, with `None` for
+    objects that do not have the value. Arrays support the buffer protocol (e.g. `numpy.frombuffer(column)`)."""
+    
+    def __len__(self) -> int:
+        """:return: The amount of objects (rows)."""
+        return len(self.guids)
+    
+    def __getitem__(self, key: EReturnOptions | str) -> _array | list:
+        """
+        Gets a column.
+        :param key: The key of the column, as requested (e.g. `"@Volume"`), or one of the default return options.
+        :raise KeyError: If the column was not requested.
+        :return: The column.
+        """
+        match key:
+            case EReturnOptions.GUID:
+                return self.guids
+            case EReturnOptions.NAME:
+                return self.names
+            case EReturnOptions.TYPE:
+                return self.types
+            case EReturnOptions.PATH:
+                return self.paths
+        return self.values[key]
+    
+    @classmethod
+    def from_dicts(cls, objects: ListOrTuple[dict[str, _Any]], keys: ListOrTuple[EReturnOptions | str] = ()) -> _Self:
+        """
+        Uses the results of `ak.wwise.core.object.get` to initialize a new instance.
+        :param objects: The objects returned by Wwise, as dictionaries.
+        :param keys: The keys of the columns to extract, besides the GUIDs, names, types and paths.
+        :return: A new instance.
+        """
+        guids = [obj.get("id") for obj in objects]
+        names = [_intern(name) if (name := obj.get("name")) is not None else "" for obj in objects]
+        types = [_intern(etype) if (etype := obj.get("type")) is not None else "" for obj in objects]
+        paths = [obj.get("path", "") for obj in objects]
+        values = {key: cls._to_column([obj.get(key) for obj in objects]) for key in keys}
+        return cls(guids, names, types, paths, values)
+    
+    @staticmethod
+    def _to_column(values: list[_Any]) -> _array | list:
+        """
+        Converts the values of a column to the most compact container that can hold them.
+        :param values: The values, one per object (`None` if the object does not have the value).
+        :return: An `array.array` for numeric and boolean values, or the list of values (with strings interned).
+        """
+        kinds = set(map(type, values))
+        if kinds and kinds <= {int, float, _NoneType}:
+            if kinds == {int}:
+                try:
+                    return _array("q", values)
+                except OverflowError:
+                    pass
+            if kinds != {_NoneType}:
+                return _array("d", [_nan if value is None else value for value in values])
+        elif kinds == {bool}:
+            return _array("b", values)
+        elif kinds <= {str, _NoneType}:
+            return [_intern(value) if value is not None else None for value in values]
+        return values
 
 
 @_dataclass
@@ -396,7 +532,7 @@ class SoundBankInclusion:
         return as_dict
 
 
-@_dataclass
+@_dataclass(slots=True)
 class LogItem:
     """A log item."""
     
@@ -438,7 +574,7 @@ class SwitchContainerAssignment:
     """The State or Switch value to switch the child object is linked (assigned) to."""
 
 
-@_dataclass
+@_dataclass(slots=True)
 class CaptureLogItem:
     """A console log item."""
     
@@ -947,7 +1083,7 @@ class VoiceContributionHierarchy:
         return as_dict
 
 
-@_dataclass
+@_dataclass(slots=True)
 class PlayingVoiceProperties:
     """Data class containing information about the properties of a playing voice."""
     
@@ -1502,3 +1638,76 @@ class SetOperation:
         for prop in self.properties:
             _dict[f"@{prop[0]}"] = prop[1]
         return {k: v for k, v in _dict.items() if v is not None}
+
+
+@_dataclass(frozen=True)
+class WaapiCallRecord:
+    """Data-only class representing a single WAAPI call, as measured by a connection's call instrumentation."""
+    
+    uri: str
+    """The URI of the function that was called (e.g. `ak.wwise.core.object.get`)."""
+    
+    latency: float
+    """The wall-clock time between the call and its result, in seconds."""
+    
+    request_size: int
+    """The size of the arguments and options, serialized as JSON, in bytes."""
+    
+    response_size: int
+    """The size of the result, serialized as JSON, in bytes. Zero if the call failed."""
+    
+    succeeded: bool
+    """Whether the call returned a result. False if it raised an exception or returned `None`."""
+
+
+@_dataclass
+class WaapiCallStats:
+    """Data-only class representing the aggregated statistics of all calls made to a WAAPI URI."""
+    
+    uri: str
+    """The URI of the function (e.g. `ak.wwise.core.object.get`)."""
+    
+    count: int = 0
+    """The amount of calls."""
+    
+    error_count: int = 0
+    """The amount of calls that failed."""
+    
+    total_latency: float = 0.0
+    """The sum of the latencies of all calls, in seconds."""
+    
+    min_latency: float = float("inf")
+    """The lowest latency, in seconds."""
+    
+    max_latency: float = 0.0
+    """The highest latency, in seconds."""
+    
+    latency_histogram: dict[float, int] = _field(default_factory=dict)
+    """The amount of calls per latency bucket. Each key is the (inclusive) upper bound of a bucket, in seconds; the
+    last bucket is unbounded (`inf`)."""
+    
+    request_bytes: int = 0
+    """The total size of all requests, serialized as JSON, in bytes."""
+    
+    response_bytes: int = 0
+    """The total size of all responses, serialized as JSON, in bytes."""
+    
+    @property
+    def mean_latency(self) -> float:
+        """:return: The average latency of all calls, in seconds. Zero if there were no calls."""
+        return self.total_latency / self.count if self.count else 0.0
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Estimates a latency percentile from the histogram.
+        :param percent: The percentile, between 0 and 100 (e.g. 95).
+        :return: The upper bound of the bucket containing the percentile, in seconds (capped to the highest latency).
+                 Zero if there were no calls.
+        """
+        target = self.count * percent / 100
+        seen = 0
+        for bound, amount in sorted(self.latency_histogram.items()):
+            seen += amount
+            if seen >= target and amount:
+                return min(bound, self.max_latency)
+        return self.max_latency
@@ -1,4 +1,5 @@
 # Copyright 2025 Matheus Vilano
 # SPDX-License-Identifier: Apache-2.0
 
-from pywwise.waapi.ak import Ak, WwiseConnection
+from pywwise.waapi.ak import Ak, AsyncAk, AsyncWwiseConnection, WwiseConnection
+from pywwise.waapi.pool import WwiseConnectionPool
@@ -2,3 +2,4 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pywwise.waapi.ak.ak import Ak, WwiseConnection
+from pywwise.waapi.ak.async_ak import AsyncAk, AsyncWwiseConnection
@@ -1,12 +1,24 @@
 # Copyright 2024 Matheus Vilano
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Self as _Self, TypeAlias as _TypeAlias
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from threading import local as _local, Lock as _Lock
+from typing import Any as _Any, Callable as _Callable, Self as _Self, TypeAlias as _TypeAlias
+from weakref import WeakValueDictionary as _WeakValueDictionary
 
 from waapi import CallbackExecutor, SequentialThreadExecutor, WaapiClient as _WaapiClient
 
-from pywwise.aliases import ListOrTuple
-from pywwise.structs import WwiseObjectWatch
+from pywwise.aliases import ListOrTuple, SystemPath
+from pywwise.decorators import synchronized_cached_property
+from pywwise.structs import WaapiCallRecord, WaapiCallStats, WwiseObjectWatch
+from pywwise.waapi.batch import WriteBatch
+from pywwise.waapi.clients import (PipelinedWaapiClient as _PipelinedWaapiClient,
+                                   SequentialWaapiClient as _SequentialWaapiClient)
+from pywwise.waapi.fetch_tracker import FetchTracker as _FetchTracker
+from pywwise.waapi.instrumentation import CallInstrumentation as _CallInstrumentation
+from pywwise.waapi.property_cache import PropertyCache
+from pywwise.waapi.proxies import FutureApiProxy as _FutureApiProxy
+from pywwise.waapi.recording import RecordingWaapiClient as _RecordingWaapiClient
 from pywwise.waapi.ak.soundengine import SoundEngine as _SoundEngine
 from pywwise.waapi.ak.wwise import Wwise as _Wwise
 
@@ -18,9 +30,10 @@ class Ak:
     """List of all active connections to Wwise."""
     
     def __init__(self, url: str = "ws://127.0.0.1:8080/waapi", allow_exception: bool = False,
-                 callback_executor: CallbackExecutor = SequentialThreadExecutor,
+                 callback_executor: type[CallbackExecutor] = SequentialThreadExecutor,
                  is_debug_build: bool = False, is_console_instance: bool = False,
-                 watch_list: ListOrTuple[WwiseObjectWatch] = ()):
+                 watch_list: ListOrTuple[WwiseObjectWatch] = (), *, pipelined: bool = False,
+                 max_concurrency: int = 64, client: _WaapiClient | None = None, record_to: SystemPath | None = None):
         """
         Constructor.
         :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
@@ -31,12 +44,54 @@ class Ak:
                                     functions/topics are required.
         :param watch_list: A tuple of `WwiseObjectWatch` instances. This will be used to set up the
                            `ak.wwise.core.object.property_changed` event.
+        :param pipelined: Whether to use a `PipelinedWaapiClient`, which sends requests without waiting for the results
+                          of previous ones. Recommended when making calls from several threads, or through `futures`.
+                          Otherwise, a `SequentialWaapiClient` is used, which sends one request at a time.
+        :param max_concurrency: The maximum amount of functions called through `futures` that can be in flight at once.
+        :param client: An already-connected client to use (e.g. a `BlockingClient`). If specified, `url`,
+                       `allow_exception`, `callback_executor` and `pipelined` are ignored.
+        :param record_to: If specified, every call and every published event is written to a log at this path (see
+                          `pywwise.new_replay_connection`). If the path ends with `.gz`, the log is compressed.
         """
-        self._client = _WaapiClient(url, allow_exception, callback_executor)
-        self.soundengine = _SoundEngine(self._client)
-        self.wwise = _Wwise(self._client, is_debug_build, is_console_instance, watch_list)
+        if client is None:
+            client_type = _PipelinedWaapiClient if pipelined else _SequentialWaapiClient
+            client = client_type(url, allow_exception, callback_executor)
+        if record_to is not None:
+            client = _RecordingWaapiClient(client, record_to)
+        self._client = client
+        self._instrumentation = _CallInstrumentation(client)
+        self._max_concurrency = max_concurrency
+        self._executor: _ThreadPoolExecutor | None = None  # Created along with `futures`, on first use.
+        self._futures: _FutureApiProxy | None = None
+        self._futures_lock = _Lock()
+        self._batches = _local()  # The active write batches, per thread.
+        self._objects = _WeakValueDictionary[tuple[type, str, str | None], _Any]()  # Identity map (see `_get_object`).
+        self._objects_lock = _Lock()
+        self._is_debug_build = is_debug_build
+        self._is_console_instance = is_console_instance
+        self._watch_list = watch_list
         self._connections.append(self)
     
+    @synchronized_cached_property
+    def soundengine(self) -> _SoundEngine:
+        """:return: ak.soundengine"""
+        return _SoundEngine(self._client)
+    
+    @synchronized_cached_property
+    def wwise(self) -> _Wwise:
+        """:return: ak.wwise"""
+        return _Wwise(self._client, self._is_debug_build, self._is_console_instance, self._watch_list)
+    
+    @synchronized_cached_property
+    def property_cache(self) -> PropertyCache:
+        """:return: The cache of values read through `WwiseProperty` attributes (see `enable_property_cache`)."""
+        return PropertyCache(self.wwise.core.object)
+    
+    @synchronized_cached_property
+    def _fetch_tracker(self) -> _FetchTracker:
+        """:return: The tracker discarding the values fetched by `WwiseObject.fetch` once they change in Wwise."""
+        return _FetchTracker(self.wwise.core.object)
+    
     def __del__(self):
         """Disconnect, then delete this connection object."""
         if self.is_connected():
@@ -72,6 +127,133 @@ class Ak:
         """
         return tuple(cls._connections)
     
+    @property
+    def client(self) -> _WaapiClient:
+        """:return: The underlying client (e.g. for direct calls to URIs that are not wrapped by PyWwise)."""
+        return self._client
+    
+    @property
+    def futures(self) -> _FutureApiProxy:
+        """
+        This connection, with every function of `soundengine` and `wwise` returning a `concurrent.futures.Future`
+        instead of blocking (e.g. `ak.futures.soundengine.set_rtpc_value(...)`). With a pipelined connection, the
+        requests of all pending calls are in flight at the same time.
+        :return: This connection, as a proxy whose functions return futures.
+        """
+        with self._futures_lock:
+            if self._futures is None:
+                self._executor = _ThreadPoolExecutor(self._max_concurrency, thread_name_prefix="pywwise-futures")
+                self._futures = _FutureApiProxy(self, self._executor)
+            return self._futures
+    
+    def enable_call_stats(self, callback: _Callable[[WaapiCallRecord], _Any] | None = None):
+        """
+        Starts recording statistics (latency, payload sizes, errors) for every function called through this connection.
+        Until this function is called, calls are not measured at all.
+        :param callback: A function to call with the `WaapiCallRecord` of each call (e.g. to forward it to a metrics
+                         system). It is called on the thread that made the call, right after the call returns.
+        """
+        self._instrumentation.enable(callback)
+    
+    def disable_call_stats(self):
+        """Stops recording call statistics. The statistics recorded so far are kept until `reset_call_stats`."""
+        self._instrumentation.disable()
+    
+    def get_call_stats(self) -> dict[str, WaapiCallStats]:
+        """
+        Gets the statistics recorded since `enable_call_stats` (or the last `reset_call_stats`).
+        :return: A copy of the statistics, per URI (e.g. `ak.wwise.core.object.get`).
+        """
+        return self._instrumentation.get_stats()
+    
+    def reset_call_stats(self):
+        """Discards the call statistics recorded so far."""
+        self._instrumentation.reset()
+    
+    def enable_property_cache(self, max_properties: int = 256):
+        """
+        Starts caching the values read through `WwiseProperty` attributes (e.g. `Sound.volume`) of objects using this
+        connection. Cached values are invalidated when Wwise reports a change (see `PropertyCache`), so repeated reads
+        of unchanged values do not call Wwise.
+        :param max_properties: The maximum amount of properties whose changes are watched (and whose values are cached).
+                               The least recently read ones are discarded first.
+        """
+        self.property_cache.enable(max_properties)
+    
+    def disable_property_cache(self):
+        """Stops caching the values read through `WwiseProperty` attributes, and discards the cached values."""
+        if "property_cache" in vars(self):
+            self.property_cache.disable()
+    
+    def enable_query_cache(self, max_size: int = 256, max_age: float | None = None):
+        """
+        Starts caching the results of `ak.wwise.core.object.get`, per WAQL query, return options and platform. Cached
+        results are invalidated when Wwise reports a change, or when the project is modified through this connection
+        (see `QueryCache`), so repeated queries whose results did not change do not call Wwise.
+        :param max_size: The maximum amount of cached results. The least recently used ones are discarded first.
+        :param max_age: The maximum age of cached results, in seconds, or `None` to keep them until they are
+                        invalidated.
+        """
+        self.wwise.core.object.query_cache.enable(max_size, max_age)
+    
+    def disable_query_cache(self):
+        """Stops caching the results of `ak.wwise.core.object.get`, and discards the cached results."""
+        obj = self.wwise.core.object
+        if "query_cache" in vars(obj):
+            obj.query_cache.disable()
+    
+    def batch(self, display_name: str = "PyWwise Batch", max_objects_per_call: int = 1000) -> WriteBatch:
+        """
+        Creates a write batch, to use in a `with` statement (e.g. `with ak.batch(): ...`). Within it, the properties and
+        references set through `WwiseObject` instances of this connection, on the same thread, are queued, then set
+        with as few `ak.wwise.core.object.set` calls as possible, inside a single undo group. If an exception is raised
+        within the `with` statement, the batch is discarded and undone; if any value cannot be set, the batch is undone
+        too, and a `RuntimeError` is raised. Batches can be nested.
+        :param display_name: The name of the undo group, as displayed in Wwise.
+        :param max_objects_per_call: The maximum amount of objects set by each `ak.wwise.core.object.set` call.
+        :return: The batch. Values are only queued once its `with` statement is entered.
+        """
+        return WriteBatch(self, display_name, max_objects_per_call)
+    
+    @property
+    def active_batch(self) -> WriteBatch | None:
+        """:return: The innermost write batch active on the current thread, or `None` if there is none."""
+        batches = getattr(self._batches, "stack", None)
+        return batches[-1] if batches else None
+    
+    def _push_batch(self, batch: WriteBatch):
+        """
+        Activates a write batch on the current thread.
+        :param batch: The batch to activate.
+        """
+        if not hasattr(self._batches, "stack"):
+            self._batches.stack = list[WriteBatch]()
+        self._batches.stack.append(batch)
+    
+    def _pop_batch(self, batch: WriteBatch):
+        """
+        Deactivates a write batch on the current thread.
+        :param batch: The batch to deactivate.
+        """
+        batches = getattr(self._batches, "stack", [])
+        if batch in batches:
+            batches.remove(batch)
+    
+    def _get_object(self, key: tuple[type, str, str | None], create: _Callable[[], _Any]) -> _Any:
+        """
+        Gets the `WwiseObject` instance of a class, GUID and platform using this connection, creating it if there is
+        none. Instances are only referenced weakly: once an instance is no longer used, the next request creates a new
+        one.
+        :param key: The class, GUID (upper case) and platform of the instance.
+        :param create: The function creating a new (uninitialized) instance.
+        :return: The instance.
+        """
+        with self._objects_lock:
+            instance = self._objects.get(key)
+            if instance is None:
+                instance = self._objects[key] = create()
+            return instance
+    
     def is_connected(self) -> bool:
         """
         Check if this instance is connected to Wwise.
@@ -86,6 +268,9 @@ class Ak:
         """
         if self in self._connections:
             self._connections.remove(self)
+        with self._futures_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
         return self._client.disconnect()
 
 
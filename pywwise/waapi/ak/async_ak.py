@@ -0,0 +1,135 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from asyncio import get_running_loop as _get_running_loop
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from functools import partial as _partial
+from typing import Any as _Any, Callable as _Callable, Self as _Self, TypeAlias as _TypeAlias
+
+from waapi import CallbackExecutor, SequentialThreadExecutor
+
+from pywwise.aliases import ListOrTuple
+from pywwise.structs import WwiseObjectWatch
+from pywwise.waapi.ak.ak import Ak as _Ak
+from pywwise.waapi.clients import AsyncWaapiClient as _AsyncWaapiClient, BlockingClient as _BlockingClient
+from pywwise.waapi.proxies import AsyncApiProxy as _AsyncApiProxy
+
+
+class AsyncAk:
+    """
+    ak (asyncio). Exposes the same `soundengine` and `wwise` trees as `Ak`, but every function is awaitable. All
+    requests share a single socket; they are written as soon as they are made, and their results are matched as they
+    come in. Events (e.g. `ak.wwise.core.object.created`) can be subscribed to from the event loop; the topic
+    subscription is then scheduled. Use `AsyncAk.connect` (or `pywwise.new_async_waapi_connection`) to instantiate this
+    class.
+    
+    The wrapper functions are synchronous (they convert arguments and results around a blocking call), so each awaited
+    function runs on a thread of this connection's executor, and that thread is blocked until the result comes in. At
+    most `max_concurrency` functions are therefore in flight at once; further calls wait for a free thread. Use
+    `client` to make calls that do not use a thread at all (e.g. thousands of concurrent raw calls).
+    """
+    
+    def __init__(self, ak: _Ak, client: _AsyncWaapiClient, executor: _ThreadPoolExecutor):
+        """
+        Constructor. Use `AsyncAk.connect` instead.
+        :param ak: The synchronous connection to expose with awaitable functions. It must use a `BlockingClient`.
+        :param client: The asyncio-native client backing the synchronous connection.
+        :param executor: The executor used to run the wrapped functions.
+        """
+        self._ak = ak
+        self._client = client
+        self._executor = executor
+        self.soundengine = _AsyncApiProxy(ak.soundengine, executor)
+        self.wwise = _AsyncApiProxy(ak.wwise, executor)
+    
+    @classmethod
+    async def connect(cls, url: str = "ws://127.0.0.1:8080/waapi", allow_exception: bool = False,
+                      callback_executor: type[CallbackExecutor] | None = SequentialThreadExecutor,
+                      is_debug_build: bool = False, is_console_instance: bool = False,
+                      watch_list: ListOrTuple[WwiseObjectWatch] = (), max_concurrency: int = 64) -> _Self:
+        """
+        Connects to an instance of Wwise, using the running event loop.
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :param callback_executor: Executor strategy for event callbacks. If `None`, callbacks are called directly on the
+                                  event loop; in that case, event listeners must not call blocking functions.
+        :param is_debug_build: Should be set to true if the instance of Wwise is a debug build and debug-only.
+        :param is_console_instance: Should be set to true if the instance of Wwise is running in a console window.
+        :param watch_list: A tuple of `WwiseObjectWatch` instances. This will be used to set up the
+                           `ak.wwise.core.object.property_changed` event.
+        :param max_concurrency: The maximum amount of functions that can be in flight at once (i.e. the amount of
+                                threads of the executor running them).
+        :raise CannotConnectToWaapiException: If the connection could not be established.
+        :return: A connection with awaitable functions.
+        """
+        client = await _AsyncWaapiClient.connect(url, allow_exception, callback_executor)
+        executor = _ThreadPoolExecutor(max_concurrency, thread_name_prefix="pywwise-async")
+        build = _partial(_Ak, is_debug_build=is_debug_build, is_console_instance=is_console_instance,
+                         watch_list=watch_list, client=_BlockingClient(client))
+        ak = await _get_running_loop().run_in_executor(executor, build)  # Subscriptions block; not on the loop.
+        return cls(ak, client, executor)
+    
+    async def __aenter__(self) -> _Self:
+        """
+        Enter the context (re: `async with` statement).
+        :return: This instance of the `AsyncAk` class.
+        """
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit the context (re: `async with` statement).
+        :param exc_type: The exception type, if any.
+        :param exc_value: The exception value, if any.
+        :param traceback: The traceback, if any exception(s) were raised.
+        :return: False, so that exceptions are never suppressed.
+        """
+        await self.disconnect()
+        return False
+    
+    @property
+    def client(self) -> _AsyncWaapiClient:
+        """:return: The asyncio-native client, for direct (awaitable) calls to URIs that are not wrapped by PyWwise."""
+        return self._client
+    
+    @property
+    def sync(self) -> _Ak:
+        """
+        The synchronous connection sharing this connection's socket. It can be used from any thread other than the one
+        running the event loop (e.g. inside `run`).
+        :return: The synchronous connection.
+        """
+        return self._ak
+    
+    async def run(self, func: _Callable[..., _Any], *args, **kwargs) -> _Any:
+        """
+        Runs a blocking function on this connection's executor (e.g. a function using `WwiseObject` properties, or
+        several wrapper calls in a row), without blocking the event loop.
+        :param func: The function to run.
+        :param args: The positional arguments to pass to the function.
+        :param kwargs: The keyword arguments to pass to the function.
+        :return: The result of the function.
+        """
+        return await _get_running_loop().run_in_executor(self._executor, _partial(func, *args, **kwargs))
+    
+    def is_connected(self) -> bool:
+        """
+        Check if this instance is connected to Wwise.
+        :return: Whether this instance is connected to Wwise.
+        """
+        return self._client.is_connected()
+    
+    async def disconnect(self) -> bool:
+        """
+        Disconnect from Wwise.
+        :return: Whether the disconnection was successful.
+        """
+        if self._ak in _Ak.get_connections():
+            self._ak.disconnect()  # Called on the loop: only unregisters the connection and schedules the disconnection.
+        result = await self._client.disconnect()
+        self._executor.shutdown(wait=False)
+        return result
+
+
+AsyncWwiseConnection: _TypeAlias = AsyncAk
+"""Represents an asyncio-native connection to Wwise."""
@@ -3,6 +3,7 @@
 
 from waapi import WaapiClient as _WaapiClient
 
+from pywwise.decorators import synchronized_cached_property
 from pywwise.waapi.ak.wwise.console.project import Project as _Project
 
 
@@ -16,4 +17,9 @@ class Console:
         :param is_console_instance: Should be set to true if the instance of Wwise is running in a console window.
         """
         self._client = client
-        self.project = _Project(self._client, is_console_instance)
+        self._is_console_instance = is_console_instance
+    
+    @synchronized_cached_property
+    def project(self) -> _Project:
+        """:return: ak.wwise.console.project"""
+        return _Project(self._client, self._is_console_instance)
@@ -4,10 +4,11 @@
 from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple, SystemPath
-from pywwise.decorators import console_instance_only
+from pywwise.decorators import console_instance_only, invalidates_query_cache
 from pywwise.enums import EBasePlatform
 from pywwise.primitives import Name
 from pywwise.structs import PlatformInfo
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class Project:
@@ -22,6 +23,11 @@ class Project:
         self._client = client
         self._is_console_instance = is_console_instance
     
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
+    
+    @invalidates_query_cache
     @console_instance_only
     def close(self) -> bool:
         """
@@ -32,6 +38,7 @@ class Project:
         results = self._client.call("ak.wwise.console.project.close")
         return results.get("hadProjectOpen", False) if results is not None else False
     
+    @invalidates_query_cache
     @console_instance_only
     def create(self, project_path: SystemPath,
                platforms: ListOrTuple[PlatformInfo] = (PlatformInfo("Windows", EBasePlatform.WINDOWS),),
@@ -54,6 +61,7 @@ class Project:
             args["platforms"].append({"name": platform.name, "basePlatform": platform.base})
         return self._client.call("ak.wwise.console.project.create", args) is not None
     
+    @invalidates_query_cache
     @console_instance_only
     def open(self, project_path: SystemPath,
              is_migration_allowed: bool,
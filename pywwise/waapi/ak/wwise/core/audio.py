@@ -5,11 +5,13 @@ from simplevent import RefEvent as _RefEvent
 from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple, SystemPath
-from pywwise.decorators import callback
+from pywwise.decorators import callback, invalidates_query_cache
 from pywwise.enums import EAudioImportOperation, EImportOperation, ELogSeverity, EObjectType, EReturnOptions
 from pywwise.primitives import GUID, Name, ProjectPath
 from pywwise.statics import EnumStatics
 from pywwise.structs import AudioImportEntry, ConversionLogItem, WwiseObjectInfo
+from pywwise.waapi.events import TopicEvent as _TopicEvent
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class Audio:
@@ -22,7 +24,12 @@ class Audio:
         """
         self._client = client
         
-        self.imported = _RefEvent(EImportOperation, tuple[WwiseObjectInfo, ...], tuple[SystemPath, ...])
+        imported_args = {"return": [EReturnOptions.GUID.value, EReturnOptions.NAME.value,
+                                    EReturnOptions.TYPE.value, EReturnOptions.PATH.value]}
+        
+        self.imported = _TopicEvent(client, "ak.wwise.core.audio.imported", self._on_imported,
+                                    EImportOperation, tuple[WwiseObjectInfo, ...], tuple[SystemPath, ...],
+                                    options=(imported_args,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_audio_imported.html
         \nSent at the end of an import operation.
@@ -31,11 +38,10 @@ class Audio:
         \n- A tuple of WwiseObjectInfo instances, representing objects created as part of the import operation.
         \n- A tuple of SystemPath instances, representing the paths of the imported assets.
         """
-        
-        imported_args = {"return": [EReturnOptions.GUID.value, EReturnOptions.NAME.value,
-                                    EReturnOptions.TYPE.value, EReturnOptions.PATH.value]}
-        self._imported = self._client.subscribe("ak.wwise.core.audio.imported", self._on_imported,
-                                                imported_args)
+    
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
     
     @callback
     def _on_imported(self, event: _RefEvent, **kwargs):
@@ -69,6 +75,7 @@ class Audio:
                                        error.get("message", "")) for error in result.get("errors", ()))
     
     # "import" is a reserved keyword, so function name does not match that of WAAPI
+    @invalidates_query_cache
     def import_files(self, imports: ListOrTuple[AudioImportEntry],
                      operation: EAudioImportOperation = EAudioImportOperation.USE_EXISTING,
                      version_control_auto_add: bool = True,
@@ -115,6 +122,7 @@ class Audio:
                                      ProjectPath(obj["path"]))
                      for obj in objects)
     
+    @invalidates_query_cache
     def import_tab_delimited(self,
                              tsv_file: SystemPath,
                              language: Name | GUID,
@@ -192,6 +200,7 @@ class Audio:
         """
         return self._client.call("ak.wwise.core.audio.resetSolo") is not None
     
+    @invalidates_query_cache
     def set_conversion_plugin(self, conversion: GUID | Name | ProjectPath, plugin: Name, platform: GUID | Name) -> bool:
         """
         https://www.audiokinetic.com/en/library/2024.1.0_8598/?source=SDK&id=ak_wwise_core_audio_setconversionplugin.html \n
@@ -9,6 +9,7 @@ from pywwise.enums import ECaptureLogItemType, ECaptureLogSeverity
 from pywwise.primitives import GameObjectID, GUID, Name, PlayingID, ShortID
 from pywwise.statics import EnumStatics
 from pywwise.structs import CaptureLogItem
+from pywwise.waapi.events import TopicEvent as _TopicEvent
 
 
 class CaptureLog:
@@ -21,15 +22,14 @@ class CaptureLog:
         """
         self._client = client
         
-        self.item_added = _RefEvent(CaptureLogItem)
+        self.item_added = _TopicEvent(client, "ak.wwise.core.profiler.captureLog.itemAdded", self._on_item_added,
+                                      CaptureLogItem)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_profiler_capturelog_itemadded.html
         \nSent when a new entry is added to the capture log.
         \n**Event Data**:
         \n- An instance of CaptureLogItem, which contains information such as type, time, severity, etc.
         """
-        
-        self._item_added = self._client.subscribe("ak.wwise.core.profiler.captureLog.itemAdded", self._on_item_added)
     
     @callback
     def _on_item_added(self, event: _RefEvent, **kwargs):
@@ -6,6 +6,7 @@ from typing import Any as _Any
 from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple, SystemPath
+from pywwise.decorators import invalidates_query_cache, synchronized_cached_property
 from pywwise.enums import EBasePlatform, EObjectType, EReturnOptions, EWwiseBuildConfiguration, EWwiseBuildPlatform
 from pywwise.primitives import GUID, Name, ProjectPath
 from pywwise.statics import EnumStatics
@@ -25,6 +26,7 @@ from pywwise.waapi.ak.wwise.core.source_control import SourceControl as _SourceC
 from pywwise.waapi.ak.wwise.core.switch_container import SwitchContainer as _SwitchContainer
 from pywwise.waapi.ak.wwise.core.transport import Transport as _Transport
 from pywwise.waapi.ak.wwise.core.undo import Undo as _Undo
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class Core:
@@ -38,21 +40,83 @@ class Core:
                            `ak.wwise.core.object.property_changed` event.
         """
         self._client = client
-        self.audio = _Audio(client)
-        self.audio_source_peaks = _AudioSourcePeaks(client)
-        self.game_parameter = _GameParameter(client)
-        self.log = _Log(client)
-        self.object = _Object(client, watch_list)
-        self.profiler = _Profiler(client)
-        self.project = _Project(client)
-        self.remote = _Remote(client)
-        self.sound = _Sound(client)
-        self.soundbank = _SoundBank(client)
-        self.source_control = _SourceControl(client)
-        self.switch_container = _SwitchContainer(client)
-        self.transport = _Transport(client)
-        self.undo = _Undo(client)
+        self._watch_list = watch_list
     
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
+    
+    @synchronized_cached_property
+    def audio(self) -> _Audio:
+        """:return: ak.wwise.core.audio"""
+        return _Audio(self._client)
+    
+    @synchronized_cached_property
+    def audio_source_peaks(self) -> _AudioSourcePeaks:
+        """:return: ak.wwise.core.audioSourcePeaks"""
+        return _AudioSourcePeaks(self._client)
+    
+    @synchronized_cached_property
+    def game_parameter(self) -> _GameParameter:
+        """:return: ak.wwise.core.gameParameter"""
+        return _GameParameter(self._client)
+    
+    @synchronized_cached_property
+    def log(self) -> _Log:
+        """:return: ak.wwise.core.log"""
+        return _Log(self._client)
+    
+    @synchronized_cached_property
+    def object(self) -> _Object:
+        """:return: ak.wwise.core.object"""
+        return _Object(self._client, self._watch_list)
+    
+    @synchronized_cached_property
+    def profiler(self) -> _Profiler:
+        """:return: ak.wwise.core.profiler"""
+        return _Profiler(self._client)
+    
+    @synchronized_cached_property
+    def project(self) -> _Project:
+        """:return: ak.wwise.core.project"""
+        return _Project(self._client)
+    
+    @synchronized_cached_property
+    def remote(self) -> _Remote:
+        """:return: ak.wwise.core.remote"""
+        return _Remote(self._client)
+    
+    @synchronized_cached_property
+    def sound(self) -> _Sound:
+        """:return: ak.wwise.core.sound"""
+        return _Sound(self._client)
+    
+    @synchronized_cached_property
+    def soundbank(self) -> _SoundBank:
+        """:return: ak.wwise.core.soundbank"""
+        return _SoundBank(self._client)
+    
+    @synchronized_cached_property
+    def source_control(self) -> _SourceControl:
+        """:return: ak.wwise.core.sourceControl"""
+        return _SourceControl(self._client)
+    
+    @synchronized_cached_property
+    def switch_container(self) -> _SwitchContainer:
+        """:return: ak.wwise.core.switchContainer"""
+        return _SwitchContainer(self._client)
+    
+    @synchronized_cached_property
+    def transport(self) -> _Transport:
+        """:return: ak.wwise.core.transport"""
+        return _Transport(self._client)
+    
+    @synchronized_cached_property
+    def undo(self) -> _Undo:
+        """:return: ak.wwise.core.undo"""
+        return _Undo(self._client)
+    
+    @invalidates_query_cache
     def execute_lua_script(self, lua_script: SystemPath,
                            lua_paths: ListOrTuple[SystemPath] = (),
                            requires: ListOrTuple[str] = (),
@@ -3,8 +3,10 @@
 
 from waapi import WaapiClient as _WaapiClient
 
+from pywwise.decorators import invalidates_query_cache
 from pywwise.enums import EGameParameterValueChangeAction
 from pywwise.primitives import GUID, Name, ProjectPath
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class GameParameter:
@@ -17,6 +19,11 @@ class GameParameter:
         """
         self._client = client
     
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
+    
+    @invalidates_query_cache
     def set_range(self, game_parameter: GUID | Name | ProjectPath, min_value: float, max_value: float,
                   on_curve_update: EGameParameterValueChangeAction) -> bool:
         """
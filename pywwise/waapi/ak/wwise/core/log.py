@@ -9,6 +9,7 @@ from pywwise.decorators import callback
 from pywwise.enums import ELogChannel, ELogSeverity
 from pywwise.statics import EnumStatics
 from pywwise.structs import LogItem
+from pywwise.waapi.events import TopicEvent as _TopicEvent
 
 
 class Log:
@@ -21,7 +22,7 @@ class Log:
         """
         self._client = client
         
-        self.item_added = _RefEvent(ELogChannel, LogItem)
+        self.item_added = _TopicEvent(client, "ak.wwise.core.log.itemAdded", self._on_item_added, ELogChannel, LogItem)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_log_itemadded.html
         \nSent when an item is added to the log. To retrieve the complete log, refer to `ak.wwise.core.log.get`.
@@ -29,8 +30,6 @@ class Log:
         \n- The channel on which the item was added.
         \n- The item added to the log.
         """
-        
-        self._item_added = self._client.subscribe("ak.wwise.core.log.itemAdded", self._on_item_added)
     
     @callback
     def _on_item_added(self, event: _RefEvent, **kwargs):
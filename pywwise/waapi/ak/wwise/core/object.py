@@ -4,18 +4,24 @@
 from types import NoneType as _NoneType
 from typing import Any as _Any, Collection as _Collection
 
-from simplevent import RefEvent as _RefEvent
-from waapi import EventHandler as _EventHandler, WaapiClient as _WaapiClient
+from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple
-from pywwise.decorators import callback
+from pywwise.decorators import callback, invalidates_query_cache, synchronized_cached_property
 from pywwise.enums import (EAttenuationCurveShape, EAttenuationCurveType, EAttenuationCurveUsage, EListMode,
                            ENameConflictStrategy, EObjectType, EPropertyPasteMode, EReturnOptions, ERtpcMode)
 from pywwise.primitives import GUID, Name, ProjectPath
 from pywwise.statics import EnumStatics
-from pywwise.structs import (AttenuationCurve, GraphPoint2D, PropertyInfo, SetOperation, Vector2, WwiseObjectInfo,
-                             WwiseObjectWatch)
-from pywwise.waql import WaqlQuery
+from pywwise.structs import (AttenuationCurve, GraphPoint2D, PropertyInfo, SetOperation, Vector2, WwiseObjectColumns,
+                             WwiseObjectInfo, WwiseObjectWatch)
+from pywwise.waapi.events import TopicEvent as _TopicEvent
+from pywwise.waapi.live_query import LiveQuery
+from pywwise.waapi.live_snapshot import LiveProjectSnapshot
+from pywwise.waapi.query_cache import QueryCache
+from pywwise.waql import PreparedWaqlQuery, WaqlQuery
+
+_OBJECT_QUERY = PreparedWaqlQuery.prepare("$ from object {object:object} take 1")
+"""Gets a single object."""
 
 
 class Object:
@@ -33,7 +39,9 @@ class Object:
         return_options = {"return": [EReturnOptions.GUID, EReturnOptions.NAME,
                                      EReturnOptions.TYPE, EReturnOptions.PATH]}
         
-        self.attenuation_curve_changed = _RefEvent(WwiseObjectInfo, EAttenuationCurveType)
+        self.attenuation_curve_changed = _TopicEvent(client, "ak.wwise.core.object.attenuationCurveChanged",
+                                                     self._on_attenuation_curve_changed,
+                                                     WwiseObjectInfo, EAttenuationCurveType, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_attenuationcurvechanged.html
         \nSent when an attenuation curve is changed.
@@ -42,11 +50,10 @@ class Object:
         \n- The type of the curve that changed.
         """
         
-        self._attenuation_curve_changed = self._client.subscribe(
-            "ak.wwise.core.object.attenuationCurveChanged",
-            self._on_attenuation_curve_changed, return_options)
-        
-        self.attenuation_curve_link_changed = _RefEvent(WwiseObjectInfo, EAttenuationCurveType)
+        self.attenuation_curve_link_changed = _TopicEvent(client, "ak.wwise.core.object.attenuationCurveLinkChanged",
+                                                          self._on_attenuation_curve_link_changed,
+                                                          WwiseObjectInfo, EAttenuationCurveType,
+                                                          options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_attenuationcurvelinkchanged.html
         \nSent when an attenuation curve's link/unlink is changed. NOTE: this event often multi-triggers.
@@ -55,11 +62,8 @@ class Object:
         \n- The type of the curve that had its link changed.
         """
         
-        self._attenuation_curve_link_changed = self._client.subscribe(
-            "ak.wwise.core.object.attenuationCurveLinkChanged",
-            self._on_attenuation_curve_link_changed, return_options)
-        
-        self.child_added = _RefEvent(WwiseObjectInfo, WwiseObjectInfo)
+        self.child_added = _TopicEvent(client, "ak.wwise.core.object.childAdded", self._on_child_added,
+                                       WwiseObjectInfo, WwiseObjectInfo, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_childadded.html
         \nSent when an object is added as a child to another object.
@@ -68,10 +72,8 @@ class Object:
         \n- A WwiseObjectInfo instance representing the parent of the new child object.
         """
         
-        self._child_added = self._client.subscribe("ak.wwise.core.object.childAdded",
-                                                   self._on_child_added, return_options)
-        
-        self.child_removed = _RefEvent(WwiseObjectInfo, WwiseObjectInfo)
+        self.child_removed = _TopicEvent(client, "ak.wwise.core.object.childRemoved", self._on_child_removed,
+                                         WwiseObjectInfo, WwiseObjectInfo, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_childadded.html
         \nSent when an object is removed from the children of another object.
@@ -80,10 +82,8 @@ class Object:
         \n- A WwiseObjectInfo instance representing the former parent of the child object.
         """
         
-        self._child_removed = self._client.subscribe("ak.wwise.core.object.childRemoved",
-                                                     self._on_child_removed, return_options)
-        
-        self.created = _RefEvent(WwiseObjectInfo)
+        self.created = _TopicEvent(client, "ak.wwise.core.object.created", self._on_created, WwiseObjectInfo,
+                                   options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_created.html
         \nSent when an object is created. The name and path are not available at the time of creation.
@@ -91,10 +91,8 @@ class Object:
         \n- A WwiseObject instance representing the newly created object.
         """
         
-        self._created = self._client.subscribe("ak.wwise.core.object.created",
-                                               self._on_created, return_options)
-        
-        self.curve_changed = _RefEvent(WwiseObjectInfo, WwiseObjectInfo)
+        self.curve_changed = _TopicEvent(client, "ak.wwise.core.object.curveChanged", self._on_curve_changed,
+                                         WwiseObjectInfo, WwiseObjectInfo, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_curvechanged.html
         \nSent when one or many curves are changed.
@@ -103,10 +101,8 @@ class Object:
         \n- A WwiseObjectInfo instance representing the owner of the curve that changed.
         """
         
-        self._curve_changed = self._client.subscribe("ak.wwise.core.object.curveChanged",
-                                                     self._on_curve_changed, return_options)
-        
-        self.name_changed = _RefEvent(WwiseObjectInfo, str)
+        self.name_changed = _TopicEvent(client, "ak.wwise.core.object.nameChanged", self._on_name_changed,
+                                        WwiseObjectInfo, str, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_namechanged.html
         \nSent when an object is renamed. Publishes the renamed object.
@@ -115,10 +111,8 @@ class Object:
         \n- A string containing the old name.
         """
         
-        self._name_changed = self._client.subscribe("ak.wwise.core.object.nameChanged",
-                                                    self._on_name_changed, return_options)
-        
-        self.notes_changed = _RefEvent(WwiseObjectInfo, str, str)
+        self.notes_changed = _TopicEvent(client, "ak.wwise.core.object.notesChanged", self._on_notes_changed,
+                                         WwiseObjectInfo, str, str, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_noteschanged.html
         \nSent when the object's notes are changed.
@@ -128,10 +122,8 @@ class Object:
         \n- A string containing the new notes.
         """
         
-        self._notes_changed = self._client.subscribe("ak.wwise.core.object.notesChanged",
-                                                     self._on_notes_changed, return_options)
-        
-        self.post_deleted = _RefEvent(WwiseObjectInfo)
+        self.post_deleted = _TopicEvent(client, "ak.wwise.core.object.postDeleted", self._on_post_deleted,
+                                        WwiseObjectInfo, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_postdeleted.html
         \nSent following an object's deletion.
@@ -139,10 +131,8 @@ class Object:
         \n- A WwiseObjectInfo instance representing the object that was deleted.
         """
         
-        self._post_deleted = self._client.subscribe("ak.wwise.core.object.postDeleted",
-                                                    self._on_post_deleted, return_options)
-        
-        self.pre_deleted = _RefEvent(WwiseObjectInfo)
+        self.pre_deleted = _TopicEvent(client, "ak.wwise.core.object.preDeleted", self._on_pre_deleted, WwiseObjectInfo,
+                                       options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_predeleted.html
         \nSent prior to an object's deletion.
@@ -150,10 +140,11 @@ class Object:
         \n- A WwiseObjectInfo instance representing the object that will be deleted.
         """
         
-        self._pre_deleted = self._client.subscribe("ak.wwise.core.object.preDeleted",
-                                                   self._on_pre_deleted, return_options)
+        property_options = tuple({**return_options, "object": watch.guid, "property": prop}
+                                 for watch in watch_list for prop in watch.properties)
         
-        self.property_changed = _RefEvent(WwiseObjectInfo, Name, _Any, _Any, GUID)
+        self.property_changed = _TopicEvent(client, "ak.wwise.core.object.propertyChanged", self._on_property_changed,
+                                            WwiseObjectInfo, Name, _Any, _Any, GUID, options=property_options)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_propertychanged.html
         \nSent when the watched property of an object changes.
@@ -168,16 +159,9 @@ class Object:
         \n- This event will only happen for the objects and properties included in the `watch_list`.
         """
         
-        self._property_changed = list[_EventHandler]()
-        for watch in watch_list:
-            for prop in watch.properties:  # `property` is a built-in identifier, so using `prop` instead
-                prop_options = dict(return_options)
-                prop_options["object"] = watch.guid
-                prop_options["property"] = prop
-                self._property_changed.append(self._client.subscribe("ak.wwise.core.object.propertyChanged",
-                                                                     self._on_property_changed, prop_options))
-        
-        self.reference_changed = _RefEvent(WwiseObjectInfo)
+        self.reference_changed = _TopicEvent(client, "ak.wwise.core.object.referenceChanged",
+                                             self._on_reference_changed, WwiseObjectInfo, WwiseObjectInfo,
+                                             WwiseObjectInfo, options=(return_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_referencechanged.html
         \nSent when an object reference is changed.
@@ -186,9 +170,16 @@ class Object:
         \n- A WwiseObjectInfo instance representing the previous referenced object.
         \n- A WwiseObjectInfo instance representing the new referenced object.
         """
-        
-        self._reference_changed = self._client.subscribe("ak.wwise.core.object.referenceChanged",
-                                                         self._on_reference_changed, return_options)
+    
+    @synchronized_cached_property
+    def query_cache(self) -> QueryCache:
+        """:return: The cache of results of `get` (see `pywwise.waapi.ak.ak.Ak.enable_query_cache`)."""
+        return QueryCache(self)
+    
+    def _invalidate_query_cache(self):
+        """Discards the results of `get` cached so far, after a change that Wwise may not publish (e.g. a property)."""
+        if (cache := vars(self).get("query_cache")) is not None:
+            cache.clear()
     
     @callback
     def _on_attenuation_curve_changed(self, event, **kwargs):
@@ -326,6 +317,7 @@ class Object:
         new = WwiseObjectInfo.from_dict(kwargs["new"])
         event(obj, old, new)
     
+    @invalidates_query_cache
     def copy(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
              parent: GUID | tuple[EObjectType, Name] | ProjectPath,
              name_conflict_strategy: ENameConflictStrategy = ENameConflictStrategy.FAIL,
@@ -359,9 +351,10 @@ class Object:
         if results is None:
             return None
         
-        obj_info = self.get(f"$ from object \"{results.get('id', GUID.get_null())}\" take 1")  # force single match
+        obj_info = self.get(_OBJECT_QUERY.bind(results.get("id", GUID.get_null())))  # force single match
         return obj_info[0] if len(obj_info) > 0 else None  # WwiseObjectInfo has valid path and type attributes
     
+    @invalidates_query_cache
     def create(self, name: Name | str, etype: EObjectType, parent: GUID | tuple[EObjectType, Name] | ProjectPath,
                name_conflict_strategy: ENameConflictStrategy = ENameConflictStrategy.FAIL, notes: str = "",
                version_control_auto_add: bool = True, platform: Name | GUID = None) -> WwiseObjectInfo | None:
@@ -394,9 +387,10 @@ class Object:
         if results is None:
             return None
         
-        new_obj = self.get(f"$ from object \"{results.get('id', GUID.get_null())}\" take 1")
+        new_obj = self.get(_OBJECT_QUERY.bind(results.get("id", GUID.get_null())))
         return new_obj[0] if len(new_obj) > 0 else None
     
+    @invalidates_query_cache
     def delete(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
                version_control_auto_checkout: bool = True) -> bool:
         """
@@ -431,8 +425,8 @@ class Object:
         results = self._client.call("ak.wwise.core.object.diff", args)
         return results.get("properties", tuple[str]()), results.get("lists", tuple[str]())
     
-    def get(self, waql: WaqlQuery | str, returns_and_properties: tuple[EReturnOptions | str, ...] = ()) -> tuple[
-        WwiseObjectInfo, ...]:
+    def get(self, waql: WaqlQuery | str, returns_and_properties: tuple[EReturnOptions | str, ...] = (),
+            platform: GUID | Name | None = None) -> tuple[WwiseObjectInfo, ...]:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_get.html \n
         Performs a query and returns the data, as specified in the options, for each object in the query result. The
@@ -445,22 +439,97 @@ class Object:
                                        Objects Reference** page on Audiokinetic's official documentation page. The
                                        requested results will be available in the `other` property of each
                                        `WwiseObjectInfo` instance.
+        :param platform: The platform to get the values of properties for, or `None` for the current platform.
+        :return: A collection of `WwiseObjectInfo` instances representing the objects found. If the query cache is
+                 enabled (see `query_cache`), the instances are decoded from the cached results on every call, so they
+                 can be modified; the values within `other` (e.g. references) are shared, though, and must not be.
+        """
+        cache = vars(self).get("query_cache")  # Only exists once caching was enabled on the connection.
+        if cache is None or not cache.is_enabled():
+            return self._get(waql, returns_and_properties, platform)
+        returns = tuple(map(str, (*EReturnOptions.get_defaults(), *returns_and_properties)))
+        rows = cache.get(str(waql), returns, platform, lambda: self._get_dicts(waql, returns_and_properties, platform))
+        return tuple(WwiseObjectInfo.from_dicts(rows))
+    
+    def _get(self, waql: WaqlQuery | str, returns_and_properties: tuple[EReturnOptions | str, ...] = (),
+             platform: GUID | Name | None = None) -> tuple[WwiseObjectInfo, ...]:
+        """
+        Performs a query, like `get`, but always calls Wwise (i.e. bypasses the query cache).
+        :param waql: A WAQL query, as either a WAQL object or a raw string.
+        :param returns_and_properties: Additional return options and properties.
+        :param platform: The platform to get the values of properties for, or `None` for the current platform.
         :return: A collection of `WwiseObjectInfo` instances representing the objects found.
         """
+        return tuple(WwiseObjectInfo.from_dicts(self._get_dicts(waql, returns_and_properties, platform)))
+    
+    def _get_dicts(self, waql: WaqlQuery | str, returns_and_properties: tuple[EReturnOptions | str, ...] = (),
+                   platform: GUID | Name | None = None) -> list[dict[str, _Any]]:
+        """
+        Performs a query, like `_get`, but returns the objects as WAAPI returns them (i.e. without decoding them).
+        :param waql: A WAQL query, as either a WAQL object or a raw string.
+        :param returns_and_properties: Additional return options and properties.
+        :param platform: The platform to get the values of properties for, or `None` for the current platform.
+        :return: The objects found, as dictionaries (per return option or property).
+        """
         args = {"waql": str(waql)}  # str conversion needed because of JSON serialization
         
         options = {"return": [*EReturnOptions.get_defaults(), *returns_and_properties]}
+        if platform is not None:
+            options["platform"] = platform
         
         objects = self._client.call("ak.wwise.core.object.get", args, options=options)
-        objects = objects.get("return", ()) if objects is not None else ()
-        
-        infos = list[WwiseObjectInfo]()
-        for obj in objects:
-            info = WwiseObjectInfo.from_dict(obj)
-            info.other = {key: value for key, value in obj.items() if key not in EReturnOptions.get_defaults()}
-            infos.append(info)
-        
-        return tuple(infos)
+        return objects.get("return", []) if objects is not None else []
+    
+    def get_columns(self, waql: WaqlQuery | str, returns_and_properties: tuple[EReturnOptions | str, ...] = (),
+                    platform: GUID | Name | None = None) -> WwiseObjectColumns:
+        """
+        https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_get.html \n
+        Performs a query, like `get`, but returns the data column by column: one list (or `array.array`, for numeric
+        values) per return option or property, instead of one `WwiseObjectInfo` per object. Recommended for queries
+        returning many objects (e.g. to filter or aggregate the values of a property across a whole project).
+        :param waql: A WAQL query, as either a WAQL object or a raw string.
+        :param returns_and_properties: Additional return options (e.g. `EReturnOptions.WORK_UNIT`) and properties (e.g.
+                                       `"@Volume"`). Each of them is a column in the `values` of the result, under the
+                                       same key.
+        :param platform: The platform to get the values of properties for, or `None` for the current platform.
+        :return: The columns of the objects found.
+        """
+        return WwiseObjectColumns.from_dicts(self._get_dicts(waql, returns_and_properties, platform),
+                                             returns_and_properties)
+    
+    def live_query(self, waql: WaqlQuery | str,
+                   returns_and_properties: tuple[EReturnOptions | str, ...] = ()) -> LiveQuery:
+        """
+        Performs a query, like `get`, then keeps its result set up to date from the object topics (e.g. `name_changed`),
+        re-checking only the affected objects when possible, instead of running the query again. Changes to the result
+        set are sent through the `added`, `removed` and `changed` events of the returned `LiveQuery`. Call its `stop`
+        function (or use it in a `with` statement) once it is not needed anymore.
+        :param waql: A WAQL query, as either a WAQL object or a raw string.
+        :param returns_and_properties: Additional return options (e.g. `EReturnOptions.WORK_UNIT`) and properties (e.g.
+                                       `"@Volume"`). Properties are watched (for all objects), so that changes of their
+                                       values are sent as `changed` deltas.
+        :return: The live query, already started.
+        """
+        query = LiveQuery(self, waql, returns_and_properties)
+        query.start()
+        return query
+    
+    def snapshot(self, returns_and_properties: tuple[EReturnOptions | str, ...] = (),
+                 chunk_size: int = 10000) -> LiveProjectSnapshot:
+        """
+        Loads the whole project into an in-memory index (see `ProjectSnapshot`: objects per GUID, path, type, parent
+        and typed name), with one `from project` query per `chunk_size` objects, then keeps it up to date from the
+        object topics. Recommended for tools that repeatedly read the structure of the project (e.g. linting, or
+        reports), which can then run WAQL queries locally (see `pywwise.waql.CompiledWaqlQuery`). Call its `stop`
+        function (or use it in a `with` statement) once it is not needed anymore.
+        :param returns_and_properties: Additional return options (e.g. `EReturnOptions.NOTES`) and properties (e.g.
+                                       `"@Volume"`) to store for each object.
+        :param chunk_size: The maximum amount of objects to get per query.
+        :return: The snapshot, already loaded and started.
+        """
+        snapshot = LiveProjectSnapshot(self, returns_and_properties, chunk_size)
+        snapshot.start()
+        return snapshot
     
     def get_attenuation_curve(self, obj: GUID | Name | ProjectPath, etype: EAttenuationCurveType,
                               platform: GUID | Name = None) -> AttenuationCurve | None:
@@ -601,6 +670,7 @@ class Object:
         results = self._client.call("ak.wwise.core.object.isPropertyEnabled", args)
         return results.get("return")
     
+    @invalidates_query_cache
     def move(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
              parent: GUID | tuple[EObjectType, Name] | ProjectPath,
              name_conflict_strategy: ENameConflictStrategy = ENameConflictStrategy.FAIL,
@@ -626,9 +696,10 @@ class Object:
         if results is None:
             return None
         
-        obj_info = self.get(f"$ from object \"{results.get('id', GUID.get_null())}\" take 1")  # force single match
+        obj_info = self.get(_OBJECT_QUERY.bind(results.get("id", GUID.get_null())))  # force single match
         return obj_info[0] if len(obj_info) > 0 else None  # WwiseObjectInfo has valid path and type attributes
     
+    @invalidates_query_cache
     def paste_properties(self, source: GUID | tuple[EObjectType, Name] | ProjectPath,
                          targets: _Collection[GUID | tuple[EObjectType, Name] | ProjectPath],
                          paste_mode: EPropertyPasteMode = EPropertyPasteMode.REPLACE_ENTIRE, *,
@@ -665,6 +736,7 @@ class Object:
         
         return self._client.call("ak.wwise.core.object.pasteProperties", args) is not None
     
+    @invalidates_query_cache
     def set(self, operations: ListOrTuple[SetOperation],
             platform: GUID | Name = None,
             on_name_conflict: ENameConflictStrategy = ENameConflictStrategy.FAIL,
@@ -691,6 +763,7 @@ class Object:
                 **({"autoAddToSourceControl": False} if not version_control_auto_add else {})}
         return self._client.call("ak.wwise.core.object.set", args) is not None
     
+    @invalidates_query_cache
     def set_attenuation_curve(self, obj: GUID | Name | ProjectPath,
                               curve_type: EAttenuationCurveType,
                               usage: EAttenuationCurveUsage,
@@ -715,6 +788,7 @@ class Object:
                 **({"platform": platform} if platform is not None else {})}
         return self._client.call("ak.wwise.core.object.setAttenuationCurve", args) is not None
     
+    @invalidates_query_cache
     def set_linked(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath, property_name: str,
                    platform: GUID | Name, is_linked: bool) -> bool:
         """
@@ -732,6 +806,7 @@ class Object:
                 "property": property_name, "platform": platform, "linked": is_linked}
         return self._client.call("ak.wwise.core.object.setLinked", args) is not None
     
+    @invalidates_query_cache
     def set_name(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath, new_name: Name | str) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_setname.html \n
@@ -745,6 +820,7 @@ class Object:
                 "value": new_name}
         return self._client.call("ak.wwise.core.object.setName", args) is not None
     
+    @invalidates_query_cache
     def set_notes(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath, notes: str) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_object_setnotes.html \n
@@ -757,6 +833,7 @@ class Object:
         args = {"object": obj if not isinstance(obj, tuple) else f"{obj[0].get_type_name()}:{obj[1]}", "value": notes}
         return self._client.call("ak.wwise.core.object.setNotes", args) is not None
     
+    @invalidates_query_cache
     def set_property(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
                      property_name: str, value: _NoneType | bool | int | float | str,
                      platform: GUID | Name = None) -> bool:
@@ -780,6 +857,7 @@ class Object:
                 **({"platform": platform} if platform is not None else {})}
         return self._client.call("ak.wwise.core.object.setProperty", args) is not None
     
+    @invalidates_query_cache
     def set_randomizer(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath, property_name: str,
                        enabled: bool, min_value: float = None, max_value: float = None,
                        platform: GUID | Name = None) -> bool:
@@ -804,6 +882,7 @@ class Object:
                 **({"platform": platform} if platform is not None else {})}
         return self._client.call("ak.wwise.core.object.setRandomizer", args) is not None
     
+    @invalidates_query_cache
     def set_reference(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
                       reference_name: str, value: GUID | tuple[EObjectType, Name] | ProjectPath,
                       platform: GUID | Name = None) -> bool:
@@ -826,6 +905,7 @@ class Object:
                 **({"platform": platform} if platform is not None else {})}
         return self._client.call("ak.wwise.core.object.setReference", args) is not None
     
+    @invalidates_query_cache
     def set_state_groups(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
                          groups: ListOrTuple[GUID | Name | ProjectPath]) -> bool:
         """
@@ -845,6 +925,7 @@ class Object:
                 "stateGroups": groups}
         return self._client.call("ak.wwise.core.object.setStateGroups", args) is not None
     
+    @invalidates_query_cache
     def set_state_properties(self, obj: GUID | tuple[EObjectType, Name] | ProjectPath,
                              properties: ListOrTuple[str]) -> bool:
         """
@@ -1,11 +1,12 @@
 # Copyright 2024 Matheus Vilano
 # SPDX-License-Identifier: Apache-2.0
 
+
 from simplevent import RefEvent as _RefEvent
 from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple, SystemPath
-from pywwise.decorators import callback
+from pywwise.decorators import callback, synchronized_cached_property
 from pywwise.enums import (EAudioObjectOptions, EBusOptions, EDataTypes, EObjectType, EReturnOptions, ETimeCursor,
                            EVoicePipelineReturnOptions)
 from pywwise.primitives import GameObjectID, GUID, Name, ProjectPath, ShortID
@@ -14,6 +15,7 @@ from pywwise.structs import (ActiveRTPCInfo, AudioObjectInfo, AudioObjectMetadat
                              PlayingVoiceProperties, StreamObjectInfo, VoiceContributionHierarchy,
                              VoiceContributionParameter, VoiceInspectorContribution, WwiseObjectInfo)
 from pywwise.waapi.ak.wwise.core.capture_log import CaptureLog as _CaptureLog
+from pywwise.waapi.events import TopicEvent as _TopicEvent
 
 
 class Profiler:
@@ -25,9 +27,9 @@ class Profiler:
         :param client: The WAAPI client to use.
         """
         self._client = client
-        self.capture_log = _CaptureLog(client)
         
-        self.game_object_registered = _RefEvent(int, GameObjectID, Name)
+        self.game_object_registered = _TopicEvent(client, "ak.wwise.core.profiler.gameObjectRegistered",
+                                                  self._on_game_object_registered, int, GameObjectID, Name)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_profiler_gameobjectregistered.html
         \nSent when a game object has been registered.
@@ -37,19 +39,15 @@ class Profiler:
         \n- The game object name for the entry.
         """
         
-        self._game_object_registered = self._client.subscribe("ak.wwise.core.profiler.gameObjectRegistered",
-                                                              self._on_game_object_registered)
-        
-        self.game_object_reset = _RefEvent()
+        self.game_object_reset = _TopicEvent(client, "ak.wwise.core.profiler.gameObjectReset",
+                                             self._on_game_object_reset)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_profiler_gameobjectreset.html
         \nSent when the game objects have been reset, such as closing a connection to a game while profiling.
         """
         
-        self._game_object_reset = self._client.subscribe("ak.wwise.core.profiler.gameObjectReset",
-                                                         self._on_game_object_reset)
-        
-        self.game_object_unregistered = _RefEvent(int, GameObjectID, Name)
+        self.game_object_unregistered = _TopicEvent(client, "ak.wwise.core.profiler.gameObjectUnregistered",
+                                                    self._on_game_object_unregistered, int, GameObjectID, Name)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_profiler_gameobjectunregistered.html
         \nSent when a game object has been unregistered.
@@ -59,13 +57,11 @@ class Profiler:
         \n- The game object name for the entry.
         """
         
-        self._game_object_unregistered = self._client.subscribe("ak.wwise.core.profiler.gameObjectUnregistered",
-                                                                self._on_game_object_unregistered)
-        
         # The return options below are needed so we can retrieve information about Switch and States, plus their Groups.
         change_args = {"return": [EReturnOptions.GUID, EReturnOptions.NAME, EReturnOptions.TYPE, EReturnOptions.PATH]}
         
-        self.state_changed = _RefEvent(WwiseObjectInfo, WwiseObjectInfo)
+        self.state_changed = _TopicEvent(client, "ak.wwise.core.profiler.stateChanged", self._on_state_changed,
+                                         WwiseObjectInfo, WwiseObjectInfo, options=(change_args,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_profiler_statechanged.html
         \nSent when a state group state has been changed. Does not require the profiler capture log to be started.
@@ -74,10 +70,8 @@ class Profiler:
         \n-A WwiseObjectInfo instance containing information about the new active State.
         """
         
-        self._state_changed = self._client.subscribe("ak.wwise.core.profiler.stateChanged",
-                                                     self._on_state_changed, change_args)
-        
-        self.switch_changed = _RefEvent(WwiseObjectInfo, WwiseObjectInfo, GameObjectID)
+        self.switch_changed = _TopicEvent(client, "ak.wwise.core.profiler.switchChanged", self._on_switch_changed,
+                                          WwiseObjectInfo, WwiseObjectInfo, GameObjectID, options=(change_args,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_profiler_switchchanged.html
         \nSent when a switch group state has been changed. Does not require the profiler capture log to be started.
@@ -86,9 +80,11 @@ class Profiler:
         \n-A WwiseObjectInfo instance containing information about the new active Switch.
         \n-The ID of the game object on which the change happened.
         """
-        
-        self._switch_changed = self._client.subscribe("ak.wwise.core.profiler.switchChanged",
-                                                      self._on_switch_changed, change_args)
+    
+    @synchronized_cached_property
+    def capture_log(self) -> _CaptureLog:
+        """:return: ak.wwise.core.profiler.captureLog"""
+        return _CaptureLog(self._client)
     
     @callback
     def _on_game_object_registered(self, event: _RefEvent, **kwargs):
@@ -641,7 +637,7 @@ class Profiler:
         for voice in results:
             pipeline_id = int(voice[EVoicePipelineReturnOptions.PIPELINE_ID])
             game_object_id = GameObjectID(voice[EVoicePipelineReturnOptions.GAME_OBJECT_ID])
-            object_guid = GUID(voice[EVoicePipelineReturnOptions.OBJECT_GUID])
+            object_guid = GUID.intern(voice[EVoicePipelineReturnOptions.OBJECT_GUID], False)  # Often shared by voices.
             other = {key: value for key, value in voice.items() if key not in returns}
             voices.append(PlayingVoiceProperties(pipeline_id, game_object_id, object_guid, other))
         
@@ -6,6 +6,7 @@ from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import SystemPath
 from pywwise.decorators import callback
+from pywwise.waapi.events import TopicEvent as _TopicEvent
 
 
 class Project:
@@ -18,39 +19,31 @@ class Project:
         """
         self._client = client
         
-        self.loaded = _RefEvent()
+        self.loaded = _TopicEvent(client, "ak.wwise.core.project.loaded", self._on_loaded)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_project_loaded.html
         \nSent when the project has been successfully loaded.
         """
         
-        self._loaded = self._client.subscribe("ak.wwise.core.project.loaded", self._on_loaded)
-        
-        self.post_closed = _RefEvent()
+        self.post_closed = _TopicEvent(client, "ak.wwise.core.project.postClosed", self._on_post_closed)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_project_postclosed.html
         \nSent when the after the project is completely closed.
         """
         
-        self._post_closed = self._client.subscribe("ak.wwise.core.project.postClosed", self._on_post_closed)
-        
-        self.pre_closed = _RefEvent()
+        self.pre_closed = _TopicEvent(client, "ak.wwise.core.project.preClosed", self._on_pre_closed)
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_project_preclosed.html
         \nSent when the project begins closing.
         """
         
-        self._pre_closed = self._client.subscribe("ak.wwise.core.project.preClosed", self._on_pre_closed)
-        
-        self.saved = _RefEvent(tuple[SystemPath, ...])
+        self.saved = _TopicEvent(client, "ak.wwise.core.project.saved", self._on_saved, tuple[SystemPath, ...])
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_project_saved.html
         \nSent when the project has been saved.
         \n**Event Data**:
         \n- A tuple containing the absolute paths to the Work Unit and Project files that were modified.
         """
-        
-        self._saved = self._client.subscribe("ak.wwise.core.project.saved", self._on_saved)
     
     @callback
     def _on_loaded(self, event: _RefEvent):
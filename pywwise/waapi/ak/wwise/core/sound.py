@@ -3,9 +3,11 @@
 
 from waapi import WaapiClient as _WaapiClient
 
+from pywwise.decorators import invalidates_query_cache
 from pywwise.enums import EObjectType
 from pywwise.primitives import GUID, Name, ProjectPath
 from pywwise.structs import PlatformInfo
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class Sound:
@@ -18,6 +20,11 @@ class Sound:
         """
         self._client = client
     
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
+    
+    @invalidates_query_cache
     def set_active_source(self, sound: GUID | Name | ProjectPath, source: GUID | Name | ProjectPath,
                           platform: PlatformInfo | Name | GUID = None) -> bool:
         """
@@ -5,13 +5,15 @@ from simplevent import RefEvent as _RefEvent
 from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple, SystemPath
-from pywwise.decorators import callback
+from pywwise.decorators import callback, invalidates_query_cache
 from pywwise.enums import (EGeneratedSoundBankType, EInclusionFilter, EInclusionOperation, ELogSeverity, EObjectType,
                            EReturnOptions)
 from pywwise.primitives import GUID, Name, ProjectPath, ShortID
 from pywwise.statics import EnumStatics
 from pywwise.structs import (ExternalSourceInfo, LogItem, PluginLibraryInfo, SoundBankData, SoundBankGenerationInfo,
                              SoundBankInclusion, SoundBankInfo)
+from pywwise.waapi.events import TopicEvent as _TopicEvent
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class SoundBank:
@@ -24,7 +26,12 @@ class SoundBank:
         """
         self._client = client
         
-        self.generated = _RefEvent(SoundBankGenerationInfo)
+        generated_args = {"infoFile": True, "bankData": True, "pluginInfo": True,
+                          "return": [EReturnOptions.GUID, EReturnOptions.NAME,
+                                     EReturnOptions.TYPE, EReturnOptions.PATH]}
+        
+        self.generated = _TopicEvent(client, "ak.wwise.core.soundbank.generated", self._on_generated,
+                                     SoundBankGenerationInfo, options=(generated_args,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_soundbank_generated.html
         \nSent when a SoundBank is generated. Can multi-trigger during SoundBank generation, per bank and per platform.
@@ -32,23 +39,18 @@ class SoundBank:
         \n- A SoundBankGenerationInfo instance, which contains information about the generated SoundBank.
         """
         
-        generated_args = {"infoFile": True, "bankData": True, "pluginInfo": True,
-                          "return": [EReturnOptions.GUID, EReturnOptions.NAME,
-                                     EReturnOptions.TYPE, EReturnOptions.PATH]}
-        
-        self._generated = self._client.subscribe("ak.wwise.core.soundbank.generated",
-                                                 self._on_generated, generated_args)
-        
-        self.generation_done = _RefEvent(tuple[LogItem])
+        self.generation_done = _TopicEvent(client, "ak.wwise.core.soundbank.generationDone", self._on_generation_done,
+                                           tuple[LogItem])
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_soundbank_generationdone.html
         \nSent when all SoundBanks are generated. Do not use to check if `ak.wwise.core.soundbank.generate` has completed.
         \n**Event Data**:
         \n- A tuple of LogItems representing the SoundBank generation log. Empty when used in WwiseConsole.
         """
-        
-        self._generation_done = self._client.subscribe("ak.wwise.core.soundbank.generationDone",
-                                                       self._on_generation_done)
+    
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
     
     @callback
     def _on_generated(self, event: _RefEvent, **kwargs):
@@ -241,6 +243,7 @@ class SoundBank:
         args = {"files": [str(file) for file in list(dict.fromkeys(files))]}  # File paths should be unique.
         return self._client.call("ak.wwise.core.soundbank.processDefinitionFiles", args) is not None
     
+    @invalidates_query_cache
     def set_inclusions(self, sound_bank: Name | GUID | ProjectPath, operation: EInclusionOperation,
                        inclusions: ListOrTuple[SoundBankInclusion]) -> bool:
         """
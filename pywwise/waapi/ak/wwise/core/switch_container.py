@@ -4,10 +4,12 @@
 from simplevent import RefEvent as _RefEvent
 from waapi import WaapiClient as _WaapiClient
 
-from pywwise.decorators import callback
+from pywwise.decorators import callback, invalidates_query_cache
 from pywwise.enums import EReturnOptions
 from pywwise.primitives import GUID, ProjectPath
 from pywwise.structs import SwitchContainerAssignment, WwiseObjectInfo
+from pywwise.waapi.events import TopicEvent as _TopicEvent
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class SwitchContainer:
@@ -23,7 +25,10 @@ class SwitchContainer:
         assignment_args = {"return": [EReturnOptions.GUID, EReturnOptions.NAME,
                                       EReturnOptions.TYPE, EReturnOptions.PATH]}
         
-        self.assignment_added = _RefEvent(WwiseObjectInfo, WwiseObjectInfo, WwiseObjectInfo)
+        self.assignment_added = _TopicEvent(client, "ak.wwise.core.switchContainer.assignmentAdded",
+                                            self._on_assignment_added,
+                                            WwiseObjectInfo, WwiseObjectInfo, WwiseObjectInfo,
+                                            options=(assignment_args,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_switchcontainer_assignmentadded.html
         \nSent when an assignment is added to a Switch Container.
@@ -33,10 +38,10 @@ class SwitchContainer:
         \n- A WwiseObjectInfo instance representing the State or Switch to which the child object was assigned.
         """
         
-        self._assignment_added = self._client.subscribe("ak.wwise.core.switchContainer.assignmentAdded",
-                                                        self._on_assignment_added, assignment_args)
-        
-        self.assignment_removed = _RefEvent(WwiseObjectInfo, WwiseObjectInfo, WwiseObjectInfo)
+        self.assignment_removed = _TopicEvent(client, "ak.wwise.core.switchContainer.assignmentRemoved",
+                                              self._on_assignment_removed,
+                                              WwiseObjectInfo, WwiseObjectInfo, WwiseObjectInfo,
+                                              options=(assignment_args,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_switchcontainer_assignmentadded.html
         \nSent when an assignment is removed from a Switch Container.
@@ -45,9 +50,10 @@ class SwitchContainer:
         \n- A WwiseObjectInfo instance representing the child object that was part of the removed assignment.
         \n- A WwiseObjectInfo instance representing the State or Switch to which the child object was assigned.
         """
-        
-        self._assignment_added = self._client.subscribe("ak.wwise.core.switchContainer.assignmentRemoved",
-                                                        self._on_assignment_removed, assignment_args)
+    
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
     
     @callback
     def _on_assignment_added(self, event: _RefEvent, **kwargs):
@@ -79,6 +85,7 @@ class SwitchContainer:
         sync = WwiseObjectInfo.from_dict(kwargs["stateOrSwitch"])
         return container, child, sync
     
+    @invalidates_query_cache
     def add_assignment(self, child: GUID | ProjectPath, state_or_switch: GUID | ProjectPath) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_switchcontainer_addassignment.html \n
@@ -108,6 +115,7 @@ class SwitchContainer:
         results = results.get("return", ())
         return tuple(SwitchContainerAssignment(result["child"], result["stateOrSwitch"]) for result in results)
     
+    @invalidates_query_cache
     def remove_assignment(self, child: GUID | ProjectPath, state_or_switch: GUID | ProjectPath) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_switchcontainer_removeassignment.html \n
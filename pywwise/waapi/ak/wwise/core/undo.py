@@ -3,6 +3,9 @@
 
 from waapi import WaapiClient as _WaapiClient
 
+from pywwise.decorators import invalidates_query_cache
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
+
 
 class Undo:
     """ak.wwise.core.undo"""
@@ -14,6 +17,10 @@ class Undo:
         """
         self._client = client
     
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
+    
     def begin_group(self) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_undo_begingroup.html \n
@@ -25,6 +32,7 @@ class Undo:
         """
         return self._client.call("ak.wwise.core.undo.beginGroup") is not None
     
+    @invalidates_query_cache
     def cancel_group(self, undo: bool = False) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_undo_cancelgroup.html \n
@@ -43,6 +51,7 @@ class Undo:
         """
         return self._client.call("ak.wwise.core.undo.endGroup", {"displayName": display_name}) is not None
     
+    @invalidates_query_cache
     def redo(self) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_undo_redo.html \n
@@ -51,6 +60,7 @@ class Undo:
         """
         return self._client.call("ak.wwise.core.undo.redo") is not None
     
+    @invalidates_query_cache
     def undo(self) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_core_undo_undo.html \n
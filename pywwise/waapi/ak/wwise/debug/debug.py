@@ -9,6 +9,7 @@ from waapi import WaapiClient as _WaapiClient
 from pywwise.aliases import SystemPath
 from pywwise.decorators import callback, debug_build_only
 from pywwise.enums import EBitDepth, ESampleRate, ESpeakerBitMask, EWaveformStr
+from pywwise.waapi.events import TopicEvent as _TopicEvent
 
 
 class Debug:
@@ -25,7 +26,8 @@ class Debug:
         
         self._is_debug_build = is_debug_build
         
-        self.assert_failed = _RefEvent(str, str, int, str, str)
+        self.assert_failed = _TopicEvent(client, "ak.wwise.debug.assertFailed", self._on_assert_failed,
+                                         str, str, int, str, str, options=({},) if is_debug_build else ())
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_debug_assertfailed.html
         \nSent when an assert has failed. **This is only available in Debug builds**.
@@ -36,9 +38,6 @@ class Debug:
         \n- The callstack from the location of the assert.
         \n- An explanatory message accompanying the assert. May be empty.
         """
-        
-        if self._is_debug_build:
-            self._assert_failed = self._client.subscribe("ak.wwise.debug.assertFailed", self._on_assert_failed)
     
     @callback
     def _on_assert_failed(self, event: _RefEvent, **kwargs):
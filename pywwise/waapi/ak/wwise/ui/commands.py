@@ -4,11 +4,13 @@
 from simplevent import RefEvent as _RefEvent
 from waapi import WaapiClient as _WaapiClient
 
-from pywwise.decorators import callback
+from pywwise.decorators import callback, invalidates_query_cache
 from pywwise.enums import ECommand, EObjectType, EReturnOptions
 from pywwise.primitives import GUID, Name, ProjectPath, ShortID
 from pywwise.statics import EnumStatics
 from pywwise.structs import CommandInfo, PlatformInfo, WwiseObjectInfo
+from pywwise.waapi.events import TopicEvent as _TopicEvent
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class Commands:
@@ -21,7 +23,11 @@ class Commands:
         """
         self._client = client
         
-        self.executed = _RefEvent(ECommand, tuple[WwiseObjectInfo, ...], tuple[str, ...])
+        executed_options = {"return": [EReturnOptions.GUID.value, EReturnOptions.NAME.value,
+                                       EReturnOptions.TYPE.value, EReturnOptions.PATH.value]}
+        
+        self.executed = _TopicEvent(client, "ak.wwise.ui.commands.executed", self._on_executed,
+                                    ECommand, tuple[WwiseObjectInfo, ...], tuple[str, ...], options=(executed_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_ui_commands_executed.html
         \nSent when a command is executed. The objects for which the command is executed are sent in the publication.
@@ -30,11 +36,10 @@ class Commands:
         \n- A tuple of objects (WwiseObjectInfo instances) for which the command was executed. May be empty.
         \n- A tuple of platforms (GUID or name, as a string) for which the command was executed.
         """
-        
-        executed_options = {"return": [EReturnOptions.GUID.value, EReturnOptions.NAME.value,
-                                       EReturnOptions.TYPE.value, EReturnOptions.PATH.value]}
-        self._executed = self._client.subscribe("ak.wwise.ui.commands.executed", self._on_executed,
-                                                executed_options)
+    
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
     
     @callback
     def _on_executed(self, event: _RefEvent, **kwargs):
@@ -57,6 +62,7 @@ class Commands:
         commands = self._client.call("ak.wwise.ui.commands.getCommands").get("commands")
         return tuple(commands) if commands is not None else ()
     
+    @invalidates_query_cache
     def execute(self, command: ECommand,
                 objects: tuple[WwiseObjectInfo | GUID | ProjectPath | ShortID | tuple[EObjectType, Name]] = None,
                 platforms: set[PlatformInfo | Name | GUID] = None, value: str | float | bool = None) -> bool:
@@ -3,8 +3,10 @@
 
 from waapi import WaapiClient as _WaapiClient
 
+from pywwise.decorators import invalidates_query_cache
 from pywwise.aliases import SystemPath
 from pywwise.structs import PlatformInfo
+from pywwise.waapi.query_cache import QueryCache as _QueryCache
 
 
 class Project:
@@ -17,6 +19,11 @@ class Project:
         """
         self._client = client
     
+    def _invalidate_query_cache(self):
+        """Discards the results of `ak.wwise.core.object.get` cached for this connection (see `QueryCache`)."""
+        _QueryCache.invalidate(self._client)
+    
+    @invalidates_query_cache
     def close(self, bypass_save: bool = True) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_ui_project_close.html \n
@@ -30,6 +37,7 @@ class Project:
         result = self._client.call("ak.wwise.ui.project.close", args)
         return result.get("hadProjectOpen")
     
+    @invalidates_query_cache
     def create(self, path: SystemPath, platforms: set[PlatformInfo] = None, languages: set[str] = None) -> bool:
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_ui_project_create.html \n
@@ -57,6 +65,7 @@ class Project:
         self._client.call("ak.wwise.ui.project.create", args)
         return path.exists()
     
+    @invalidates_query_cache
     def open(self, path: SystemPath, is_migration_required: bool = False, bypass_save: bool = True,
              version_control_auto_checkout: bool = True) -> bool:
         """
@@ -9,12 +9,13 @@ from simplevent import RefEvent as _RefEvent
 from waapi import WaapiClient as _WaapiClient
 
 from pywwise.aliases import ListOrTuple, SystemPath
-from pywwise.decorators import callback
+from pywwise.decorators import callback, synchronized_cached_property
 from pywwise.enums import EObjectType, EReturnOptions
 from pywwise.primitives import GUID, Name, ProjectPath
 from pywwise.structs import Rect, WwiseObjectInfo
 from pywwise.waapi.ak.wwise.ui.commands import Commands as _Commands
 from pywwise.waapi.ak.wwise.ui.project import Project as _Project
+from pywwise.waapi.events import TopicEvent as _TopicEvent
 
 
 class UI:
@@ -27,21 +28,27 @@ class UI:
         """
         self._client = client
         
-        self.commands = _Commands(client)
-        self.project = _Project(client)
+        selection_changed_options = {"return": [EReturnOptions.GUID, EReturnOptions.NAME,
+                                                EReturnOptions.TYPE, EReturnOptions.PATH]}
         
-        self.selection_changed = _RefEvent(tuple[WwiseObjectInfo, ...])
+        self.selection_changed = _TopicEvent(client, "ak.wwise.ui.selectionChanged", self._on_selection_changed,
+                                             tuple[WwiseObjectInfo, ...], options=(selection_changed_options,))
         """
         https://www.audiokinetic.com/library/edge/?source=SDK&id=ak_wwise_ui_selectionchanged.html
         \nSent when the selection changes in the project.
         \n**Event Data**:
         \n- A tuple of WwiseObjectInfo instances (each containing a GUID, a name, a type, and a path).
         """
-        
-        selection_changed_options = {"return": [EReturnOptions.GUID, EReturnOptions.NAME,
-                                                EReturnOptions.TYPE, EReturnOptions.PATH]}
-        self._selection_changed = self._client.subscribe("ak.wwise.ui.selectionChanged", self._on_selection_changed,
-                                                         selection_changed_options)
+    
+    @synchronized_cached_property
+    def commands(self) -> _Commands:
+        """:return: ak.wwise.ui.commands"""
+        return _Commands(self._client)
+    
+    @synchronized_cached_property
+    def project(self) -> _Project:
+        """:return: ak.wwise.ui.project"""
+        return _Project(self._client)
     
     @callback
     def _on_selection_changed(self, event: _RefEvent, **kwargs):
@@ -3,6 +3,7 @@
 
 from waapi import WaapiClient as _WaapiClient
 
+from pywwise.decorators import synchronized_cached_property
 from pywwise.structs import WwiseObjectWatch
 from pywwise.waapi.ak.wwise.console import Console as _Console
 from pywwise.waapi.ak.wwise.core import Core as _Core
@@ -26,8 +27,31 @@ class Wwise:
                            `ak.wwise.core.object.property_changed` event.
         """
         self._client = client
-        self.console = _Console(client, is_console_instance)
-        self.core = _Core(client, watch_list)
-        self.debug = _Debug(client, is_debug_build)
-        self.ui = _UI(client)
-        self.waapi = _Waapi(client)
+        self._is_debug_build = is_debug_build
+        self._is_console_instance = is_console_instance
+        self._watch_list = watch_list
+    
+    @synchronized_cached_property
+    def console(self) -> _Console:
+        """:return: ak.wwise.console"""
+        return _Console(self._client, self._is_console_instance)
+    
+    @synchronized_cached_property
+    def core(self) -> _Core:
+        """:return: ak.wwise.core"""
+        return _Core(self._client, self._watch_list)
+    
+    @synchronized_cached_property
+    def debug(self) -> _Debug:
+        """:return: ak.wwise.debug"""
+        return _Debug(self._client, self._is_debug_build)
+    
+    @synchronized_cached_property
+    def ui(self) -> _UI:
+        """:return: ak.wwise.ui"""
+        return _UI(self._client)
+    
+    @synchronized_cached_property
+    def waapi(self) -> _Waapi:
+        """:return: ak.wwise.waapi"""
+        return _Waapi(self._client)
@@ -0,0 +1,157 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from threading import Lock as _Lock
+from typing import Any as _Any, Self as _Self, TYPE_CHECKING as _TYPE_CHECKING
+
+from pywwise.primitives import GUID, Name
+from pywwise.structs import SetOperation
+
+if _TYPE_CHECKING:
+    from pywwise.objects.abc import WwiseObject
+    from pywwise.waapi.ak.ak import Ak
+
+
+class WriteBatch:
+    """
+    Queues the properties and references set through `WwiseObject` instances (e.g. `sound.volume = -6.0`) of a
+    connection, instead of setting each of them with its own call. Queued values are merged per object, then set with
+    as few `ak.wwise.core.object.set` calls as possible. While the batch is active (within a `with` statement), the
+    calls are made inside a single undo group, so the whole batch can be undone at once in Wwise. Values read while the
+    batch is active are the values from before the batch (queued values are not set yet).
+    """
+    
+    def __init__(self, ak: Ak, display_name: str = "PyWwise Batch", max_objects_per_call: int = 1000):
+        """
+        Constructor.
+        :param ak: The connection to set the values through.
+        :param display_name: The name of the undo group, as displayed in Wwise (e.g. in the `Edit` menu).
+        :param max_objects_per_call: The maximum amount of objects set by each call. Once that many objects have queued
+                                     values, the batch is flushed, so that requests do not grow without bounds.
+        """
+        self._ak = ak
+        self._display_name = display_name
+        self._max_objects_per_call = max(1, max_objects_per_call)
+        self._values = dict[tuple[GUID | Name | None, GUID], dict[str, tuple[_Any, bool]]]()  # Per (platform, object).
+        self._written = list[tuple["WwiseObject", str]]()
+        self._lock = _Lock()
+        self._is_active = False
+        self._is_failed = False  # Whether a call failed while this batch was active.
+    
+    def __len__(self) -> int:
+        """:return: The amount of values queued, and not set yet."""
+        with self._lock:
+            return sum(len(values) for values in self._values.values())
+    
+    def __enter__(self) -> _Self:
+        """
+        Enter the context (re: `with` statement). Begins an undo group, and activates this batch on the current thread.
+        :return: This batch.
+        """
+        self._ak.wwise.core.undo.begin_group()
+        self._ak._push_batch(self)
+        self._is_active = True
+        self._is_failed = False
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit the context (re: `with` statement). If no exception was raised, flushes the queued values, then ends the
+        undo group. Otherwise, or if any value could not be set, the queued values are discarded, and the values that
+        were already set by this batch are undone (the undo group is cancelled).
+        :param exc_type: The exception type, if any.
+        :param exc_value: The exception value, if any.
+        :param traceback: The traceback, if any exception(s) were raised.
+        :raise RuntimeError: If any value could not be set (the whole batch is undone).
+        :return: False, so that exceptions are never suppressed.
+        """
+        self._is_active = False
+        self._ak._pop_batch(self)
+        if exc_type is not None:
+            self.discard()
+            self._ak.wwise.core.undo.cancel_group(True)
+            return False
+        try:
+            is_successful = self.flush() and not self._is_failed
+        except BaseException:
+            self._ak.wwise.core.undo.cancel_group(True)
+            raise
+        if not is_successful:
+            self._ak.wwise.core.undo.cancel_group(True)
+            raise RuntimeError("Some of the values of the batch could not be set. The whole batch was undone.")
+        self._ak.wwise.core.undo.end_group(self._display_name)
+        return False
+    
+    def is_active(self) -> bool:
+        """:return: Whether this batch is active (i.e. within its `with` statement)."""
+        return self._is_active
+    
+    def set_property(self, obj: WwiseObject, name: str, value: _Any, is_reference: bool = False,
+                     platform: GUID | Name | None = None):
+        """
+        Queues a property or reference value. Setting the same property of the same object again replaces the queued
+        value. Clearing a reference (`None`) is queued too, but cannot be merged (it is set with its own call).
+        :param obj: The object to set the value on.
+        :param name: The name of the property or reference (e.g. `Volume`, or `OutputBus`).
+        :param value: The new value. For references, the GUID (or project path) of the referenced object.
+        :param is_reference: Whether the value is a reference.
+        :param platform: The platform to set the value on, or `None` to set it on the current platform.
+        """
+        with self._lock:
+            values = self._values.setdefault((platform, obj.guid), {})
+            values[name] = (value, is_reference)
+            self._written.append((obj, name))
+            is_full = len(self._values) >= self._max_objects_per_call
+        if is_full:
+            self.flush()
+    
+    def discard(self):
+        """Discards the queued values, without setting them."""
+        with self._lock:
+            self._values.clear()
+            self._written.clear()
+    
+    def flush(self) -> bool:
+        """
+        Sets the queued values now, with one `ak.wwise.core.object.set` call per platform and per
+        `max_objects_per_call` objects. Each object is set once, with all of its queued values. If a call fails while
+        this batch is active, the whole batch is undone when it exits (see `__exit__`).
+        :return: Whether all calls were successful.
+        """
+        with self._lock:
+            queued = self._values
+            written = self._written
+            self._values = {}
+            self._written = []
+        
+        operations = dict[GUID | Name | None, list[SetOperation]]()
+        cleared = list[tuple[GUID | Name | None, GUID, str]]()
+        for (platform, guid), values in queued.items():
+            properties = list[tuple[str, _Any]]()
+            for name, (value, is_reference) in values.items():
+                if value is None and is_reference:
+                    cleared.append((platform, guid, name))  # `SetOperation` omits `None` values.
+                else:
+                    properties.append((name, value))
+            if properties:
+                operations.setdefault(platform, []).append(SetOperation(guid, properties=properties))
+        
+        obj = self._ak.wwise.core.object
+        is_successful = True
+        for platform, platform_operations in operations.items():
+            for start in range(0, len(platform_operations), self._max_objects_per_call):
+                chunk = platform_operations[start:start + self._max_objects_per_call]
+                is_successful &= obj.set(chunk, platform)
+        for platform, guid, name in cleared:
+            is_successful &= obj.set_reference(guid, name, None, platform)
+        
+        for written_obj, name in written:  # Values read while the batch was active are outdated now.
+            written_obj._discard_fetched(name)
+        if (cache := vars(self._ak).get("property_cache")) is not None:
+            for written_obj, name in written:
+                cache.invalidate(written_obj.guid, name)
+        if self._is_active and not is_successful:
+            self._is_failed = True
+        return is_successful
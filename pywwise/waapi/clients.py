@@ -0,0 +1,477 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from asyncio import (AbstractEventLoop as _AbstractEventLoop, Future as _Future, Task as _Task,
+                     get_running_loop as _get_running_loop, new_event_loop as _new_event_loop,
+                     run_coroutine_threadsafe as _run_coroutine_threadsafe, TimeoutError as _TimeoutError,
+                     wait_for as _wait_for)
+from concurrent.futures import Future as _ConcurrentFuture
+from copy import copy as _copy
+from logging import getLogger as _getLogger
+from threading import current_thread as _current_thread, Lock as _Lock, Thread as _Thread
+from typing import Any as _Any, Coroutine as _Coroutine, Self as _Self
+
+import txaio as _txaio
+from autobahn.asyncio.websocket import WampWebSocketClientFactory as _WampWebSocketClientFactory
+from autobahn.wamp import ApplicationError as _ApplicationError
+from autobahn.wamp.exception import TransportLost as _TransportLost
+from autobahn.websocket.util import parse_url as _parse_url
+from waapi import (CallbackExecutor, CannotConnectToWaapiException, EventHandler as _EventHandler,
+                   SequentialThreadExecutor, WaapiRequestFailed)
+from waapi.client.interface import UnsubscribeHandler as _UnsubscribeHandler
+from waapi.wamp.ak_autobahn import AkComponent as _AkComponent
+
+_logger = _getLogger("waapi")  # Same logger as `waapi-client`, so `pywwise.set_waapi_logging` applies to both.
+
+
+def _merge_args_to_kwargs(args: tuple, kwargs: dict) -> dict:
+    """
+    Merges a single dictionary passed as a positional argument into the keyword arguments, like `waapi.WaapiClient`.
+    :param args: The positional arguments. Only the first one is considered, and only if it is a dictionary.
+    :param kwargs: The keyword arguments.
+    :return: The updated keyword arguments.
+    """
+    if len(args) > 0 and isinstance(args[0], dict):
+        kwargs.update(args[0])
+    return kwargs
+
+
+class _AkSession(_AkComponent):
+    """A WAMP session that reports when it joins and disconnects, instead of owning the event loop it runs on."""
+    
+    def __init__(self, joined: _Future, closed: _Future):
+        """
+        Constructor.
+        :param joined: The future to resolve once the session joined the realm.
+        :param closed: The future to resolve once the session was disconnected.
+        """
+        super().__init__()
+        self._joined = joined
+        self._closed = closed
+    
+    async def onJoin(self, details):
+        """
+        Called by autobahn when the session joined the realm.
+        :param details: The session details.
+        """
+        if not self._joined.done():
+            self._joined.set_result(self)
+    
+    def onDisconnect(self):
+        """Called by autobahn when the transport was lost or closed."""
+        super().onDisconnect()
+        if not self._joined.done():
+            self._joined.set_exception(CannotConnectToWaapiException("The connection was closed before joining."))
+        if not self._closed.done():
+            self._closed.set_result(True)
+
+
+class AsyncWaapiClient:
+    """
+    An asyncio-native WAAPI client. Unlike `waapi.WaapiClient`, which processes one request at a time on a dedicated
+    thread, this client runs on the caller's event loop and every call is an awaitable; any number of calls can be in
+    flight at once, and results are matched to their requests as they come in. No thread is involved in calls; only
+    event callbacks may run on the callback executor. Use `AsyncWaapiClient.connect` to instantiate it. Note that
+    `waapi.WaapiClient` pins txaio's global event loop to its own, which prevents this client from running on any other
+    loop: both clients should not be used in the same process.
+    """
+    
+    def __init__(self, session: _AkSession, closed: _Future, url: str, allow_exception: bool = False,
+                 callback_executor: type[CallbackExecutor] | None = None):
+        """
+        Constructor. Use `AsyncWaapiClient.connect` instead.
+        :param session: A WAMP session that already joined the realm.
+        :param closed: The future that will be resolved once the session is disconnected.
+        :param url: URL of the Wwise Authoring API WAMP server.
+        :param allow_exception: Allow errors on call and subscribe to throw an exception.
+        :param callback_executor: Executor strategy for event callbacks, as with `waapi.WaapiClient`. It is
+                                  instantiated and started by this client. If `None`, callbacks are called directly on
+                                  the event loop.
+        """
+        self._session = session
+        self._closed = closed
+        self._url = url
+        self._allow_exception = allow_exception
+        self._callback_executor = callback_executor() if callback_executor is not None else None
+        if self._callback_executor is not None:
+            self._callback_executor.start()
+        self._is_leaving = False
+        self._loop = _get_running_loop()
+        self._subscriptions = set[_EventHandler]()
+    
+    @classmethod
+    async def connect(cls, url: str = "ws://127.0.0.1:8080/waapi", allow_exception: bool = False,
+                      callback_executor: type[CallbackExecutor] | None = None, timeout: float = 5.0) -> _Self:
+        """
+        Connects to an instance of Wwise, using the running event loop.
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :param callback_executor: Executor strategy for event callbacks. If `None`, callbacks are called directly on the
+                                  event loop, which is the expected behaviour for asyncio code.
+        :param timeout: How long to wait for the connection to be established, in seconds.
+        :raise CannotConnectToWaapiException: If the connection could not be established.
+        :return: A connected client.
+        """
+        loop = _get_running_loop()
+        
+        _txaio.use_asyncio()
+        
+        joined, closed = loop.create_future(), loop.create_future()
+        factory = _WampWebSocketClientFactory(lambda: _AkSession(joined, closed), url=url)
+        factory.setProtocolOptions(failByDrop=False, openHandshakeTimeout=timeout, closeHandshakeTimeout=1.0)
+        
+        is_secure, host, port, _, _, _ = _parse_url(url)
+        try:
+            await loop.create_connection(factory, host, port, ssl=is_secure)
+            session = await _wait_for(joined, timeout)
+        except (OSError, _TimeoutError) as error:
+            raise CannotConnectToWaapiException(f"Could not connect to {url}") from error
+        
+        return cls(session, closed, url, allow_exception, callback_executor)
+    
+    @property
+    def loop(self) -> _AbstractEventLoop:
+        """:return: The event loop this client runs on."""
+        return self._loop
+    
+    @property
+    def url(self) -> str:
+        """:return: URL of the Wwise Authoring API WAMP server."""
+        return self._url
+    
+    def is_connected(self) -> bool:
+        """
+        Check if this client is connected to Wwise.
+        :return: Whether this client is connected to Wwise.
+        """
+        return not self._is_leaving and not self._closed.done() and self._session.is_attached()
+    
+    async def disconnect(self) -> bool:
+        """
+        Gracefully disconnect from Wwise.
+        :return: Whether this call caused the disconnection.
+        """
+        if not self.is_connected():
+            return False
+        self._is_leaving = True
+        self._session.leave()
+        try:
+            await _wait_for(self._closed, 1.0)
+        except _TimeoutError:
+            self._session.disconnect()  # The server did not acknowledge the GOODBYE; close the transport ourselves.
+        self._subscriptions.clear()
+        if self._callback_executor is not None:
+            self._callback_executor.stop()
+        return True
+    
+    async def call(self, _uri: str, *args, **kwargs) -> dict[str, _Any] | None:
+        """
+        Do a Remote Procedure Call (RPC) to Wwise. Arguments follow the same conventions as `waapi.WaapiClient.call`:
+        a single dictionary may be passed as a positional argument, and options are passed using the key `options`.
+        :param _uri: URI of the remote procedure to be called.
+        :param args: Optionally, a single dictionary containing the arguments.
+        :param kwargs: Keyword arguments to be passed. Options may be passed using the key `options`.
+        :raise WaapiRequestFailed: If the call failed and `allow_exception` is `True`.
+        :return: Result from the remote procedure call, or `None` if the call failed.
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        if not self.is_connected():
+            return None
+        try:
+            result = await self._session.call(_uri, **kwargs)
+        except _ApplicationError as error:
+            _logger.error(f"AsyncWaapiClient (ERROR): {error}")
+            if self._allow_exception:
+                raise WaapiRequestFailed(error) from None
+            return None
+        except _TransportLost:
+            return None
+        return result.kwresults if result else {}
+    
+    async def subscribe(self, _uri: str, callback_or_handler: _Any = None, *args, **kwargs) -> _EventHandler | None:
+        """
+        Subscribe to a topic. Arguments follow the same conventions as `waapi.WaapiClient.subscribe`. Callbacks are
+        called by this client's callback executor (or on its event loop, if it has none), with the event data passed as
+        keyword arguments.
+        :param _uri: URI of the topic.
+        :param callback_or_handler: A callback, or an instance of `waapi.EventHandler`.
+        :param args: Optionally, a single dictionary containing the options.
+        :param kwargs: The subscription options.
+        :raise WaapiRequestFailed: If the subscription failed and `allow_exception` is `True`.
+        :return: The event handler managing the subscription, or `None` if the subscription failed.
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        
+        if isinstance(callback_or_handler, _EventHandler):
+            event_handler = callback_or_handler
+        else:
+            event_handler = _EventHandler(self, callback_or_handler)
+        
+        def on_event(*_, **event_data):
+            if self._callback_executor is None:
+                event_handler.on_event(**event_data)
+            else:
+                self._callback_executor.execute(event_handler.on_event, event_data)
+        
+        if not self.is_connected():
+            return None
+        try:
+            subscription = await self._session.subscribe(on_event, topic=_uri, options=kwargs)
+        except _ApplicationError as error:
+            _logger.error(f"AsyncWaapiClient (ERROR): {error}")
+            if self._allow_exception:
+                raise WaapiRequestFailed(error) from None
+            return None
+        except _TransportLost:
+            return None
+        
+        event_handler.subscription = subscription
+        event_handler._unsubscribe_handler = self
+        self._subscriptions.add(event_handler)
+        return event_handler
+    
+    async def unsubscribe(self, event_handler: _EventHandler) -> bool:
+        """
+        Unsubscribe from a topic managed by the passed event handler.
+        :param event_handler: An event handler returned by `subscribe`.
+        :return: Whether the handler was successfully unsubscribed.
+        """
+        if event_handler not in self._subscriptions:
+            return False
+        try:
+            await event_handler.subscription.unsubscribe()
+        except (_ApplicationError, _TransportLost):
+            return False
+        self._subscriptions.remove(event_handler)
+        event_handler.subscription = None
+        return True
+    
+    def subscriptions(self) -> set[_EventHandler]:
+        """:return: A copy of the set of subscriptions belonging to this client."""
+        return _copy(self._subscriptions)
+
+
+class BlockingClient(_UnsubscribeHandler):
+    """
+    A synchronous facade over an `AsyncWaapiClient`, exposing the same interface as `waapi.WaapiClient`. Each call
+    blocks the calling thread only; the request itself runs on the event loop of the underlying client, so calls made
+    from several threads at once are all in flight at the same time. Blocking calls cannot be made from the thread
+    running the event loop, since blocking it would prevent the request from ever completing; subscriptions made from
+    that thread are scheduled instead.
+    """
+    
+    def __init__(self, client: AsyncWaapiClient):
+        """
+        Constructor.
+        :param client: The asyncio-native client to forward requests to.
+        """
+        super().__init__()
+        self._client = client
+        self._pending_subscriptions = dict[_EventHandler, _Task]()
+    
+    def _is_on_loop(self) -> bool:
+        """:return: Whether the calling thread is the one running the event loop of the underlying client."""
+        try:
+            return _get_running_loop() is self._client.loop
+        except RuntimeError:  # No loop running in this thread.
+            return False
+    
+    def _run(self, coroutine: _Coroutine) -> _Any:
+        """
+        Runs a coroutine on the event loop of the underlying client, blocking the calling thread until it is done.
+        :param coroutine: The coroutine to run.
+        :raise RuntimeError: If called from the thread running the event loop.
+        :return: The result of the coroutine.
+        """
+        if self._is_on_loop():
+            coroutine.close()
+            raise RuntimeError("Blocking WAAPI calls cannot be made from the thread running the event loop. Await the "
+                               "asynchronous connection's functions instead.")
+        return _run_coroutine_threadsafe(coroutine, self._client.loop).result()
+    
+    @property
+    def client(self) -> AsyncWaapiClient:
+        """:return: The underlying asyncio-native client."""
+        return self._client
+    
+    def is_connected(self) -> bool:
+        """
+        Check if this client is connected to Wwise. A client whose event loop is no longer running is not connected.
+        :return: Whether this client is connected to Wwise.
+        """
+        return self._client.loop.is_running() and self._client.is_connected()
+    
+    def disconnect(self) -> bool:
+        """
+        Gracefully disconnect from Wwise. If called from the thread running the event loop, the disconnection is
+        scheduled instead.
+        :return: Whether this call caused (or scheduled) the disconnection.
+        """
+        if not self.is_connected():
+            return False
+        if self._is_on_loop():
+            self._client.loop.create_task(self._client.disconnect())
+            return True
+        return self._run(self._client.disconnect())
+    
+    def call_async(self, _uri: str, *args, **kwargs) -> _ConcurrentFuture:
+        """
+        Do a Remote Procedure Call (RPC) to Wwise, without waiting for its result. The request is written to the socket
+        right away, so many calls can be in flight at once; their results are matched to their futures as they come in.
+        This function can be called from any thread, including the one running the event loop.
+        :param _uri: URI of the remote procedure to be called.
+        :param args: Optionally, a single dictionary containing the arguments.
+        :param kwargs: Keyword arguments to be passed. Options may be passed using the key `options`.
+        :return: A future for the result of the remote procedure call (`None` if the call failed).
+        """
+        return _run_coroutine_threadsafe(self._client.call(_uri, *args, **kwargs), self._client.loop)
+    
+    def call(self, _uri: str, *args, **kwargs) -> dict[str, _Any] | None:
+        """
+        Do a Remote Procedure Call (RPC) to Wwise. See `waapi.WaapiClient.call`.
+        :param _uri: URI of the remote procedure to be called.
+        :param args: Optionally, a single dictionary containing the arguments.
+        :param kwargs: Keyword arguments to be passed. Options may be passed using the key `options`.
+        :return: Result from the remote procedure call, or `None` if the call failed.
+        """
+        return self._run(self._client.call(_uri, *args, **kwargs))
+    
+    def subscribe(self, _uri: str, callback_or_handler: _Any = None, *args, **kwargs) -> _EventHandler | None:
+        """
+        Subscribe to a topic. See `waapi.WaapiClient.subscribe`. If called from the thread running the event loop, the
+        subscription is scheduled, and its event handler is returned right away.
+        :param _uri: URI of the topic.
+        :param callback_or_handler: A callback, or an instance of `waapi.EventHandler`.
+        :param args: Optionally, a single dictionary containing the options.
+        :param kwargs: The subscription options.
+        :return: The event handler managing the subscription, or `None` if the subscription failed.
+        """
+        if self._is_on_loop():
+            if isinstance(callback_or_handler, _EventHandler):
+                event_handler = callback_or_handler
+            else:
+                event_handler = _EventHandler(self, callback_or_handler)
+            
+            def on_subscribed(_):
+                self._pending_subscriptions.pop(event_handler, None)
+                event_handler._unsubscribe_handler = self
+            
+            task = self._client.loop.create_task(self._client.subscribe(_uri, event_handler, *args, **kwargs))
+            task.add_done_callback(on_subscribed)
+            self._pending_subscriptions[event_handler] = task
+            return event_handler
+        
+        event_handler = self._run(self._client.subscribe(_uri, callback_or_handler, *args, **kwargs))
+        if event_handler is not None:
+            event_handler._unsubscribe_handler = self  # So that `EventHandler.unsubscribe` stays synchronous.
+        return event_handler
+    
+    def unsubscribe(self, event_handler: _EventHandler) -> bool:
+        """
+        Unsubscribe from a topic managed by the passed event handler. If called from the thread running the event loop,
+        the unsubscription is scheduled (after the subscription itself, if it is still pending).
+        :param event_handler: An event handler returned by `subscribe`.
+        :return: Whether the handler was successfully unsubscribed (or whether the unsubscription was scheduled).
+        """
+        if self._is_on_loop():
+            pending = self._pending_subscriptions.get(event_handler)
+            
+            async def unsubscribe_when_subscribed():
+                if pending is not None:
+                    await pending
+                return await self._client.unsubscribe(event_handler)
+            
+            self._client.loop.create_task(unsubscribe_when_subscribed())
+            return True
+        
+        return self._run(self._client.unsubscribe(event_handler))
+    
+    def subscriptions(self) -> set[_EventHandler]:
+        """:return: A copy of the set of subscriptions belonging to this client."""
+        return self._client.subscriptions()
+
+
+class PipelinedWaapiClient(BlockingClient):
+    """
+    A drop-in replacement for `waapi.WaapiClient` that pipelines requests. `waapi.WaapiClient` sends one request at a
+    time and waits for its result before sending the next one; this client tags each request and writes it to the
+    socket right away, matching results to their requests as they come in. Calls made from several threads at once (or
+    made with `call_async`) are therefore all in flight at the same time, and throughput is no longer bound by the round
+    trip to Wwise. The connection runs on an event loop owned by a background thread.
+    """
+    
+    def __init__(self, url: str = "ws://127.0.0.1:8080/waapi", allow_exception: bool = False,
+                 callback_executor: type[CallbackExecutor] = SequentialThreadExecutor):
+        """
+        Constructor. Connects to an instance of Wwise.
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :param callback_executor: Executor strategy for event callbacks.
+        :raise CannotConnectToWaapiException: If the connection could not be established.
+        """
+        loop = _new_event_loop()
+        thread = _Thread(target=loop.run_forever, name="pywwise-pipeline", daemon=True)
+        thread.start()
+        try:
+            connection = AsyncWaapiClient.connect(url, allow_exception, callback_executor)
+            client = _run_coroutine_threadsafe(connection, loop).result()
+        except BaseException:
+            self._stop(loop, thread)
+            raise
+        super().__init__(client)
+        self._thread = thread
+    
+    @staticmethod
+    def _stop(loop: _AbstractEventLoop, thread: _Thread):
+        """
+        Stops an event loop running on a background thread, then closes it.
+        :param loop: The event loop to stop.
+        :param thread: The thread running the event loop.
+        """
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    def disconnect(self) -> bool:
+        """
+        Gracefully disconnect from Wwise, then stop the background event loop.
+        :return: Whether this call caused the disconnection.
+        """
+        result = super().disconnect()
+        if result and self._thread.is_alive() and _current_thread() is not self._thread:
+            self._stop(self._client.loop, self._thread)
+        return result
+
+
+class SequentialWaapiClient(PipelinedWaapiClient):
+    """
+    A drop-in replacement for `waapi.WaapiClient`, sending one request at a time like it does (calls made from several
+    threads at once wait for each other), but without taking over the calling thread's event loop, nor pinning txaio's
+    global event loop. The connection runs on an event loop owned by a background thread. Requests made with
+    `call_async` are still pipelined.
+    """
+    
+    def __init__(self, url: str = "ws://127.0.0.1:8080/waapi", allow_exception: bool = False,
+                 callback_executor: type[CallbackExecutor] = SequentialThreadExecutor):
+        """
+        Constructor. Connects to an instance of Wwise.
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :param callback_executor: Executor strategy for event callbacks.
+        :raise CannotConnectToWaapiException: If the connection could not be established.
+        """
+        self._request_lock = _Lock()
+        super().__init__(url, allow_exception, callback_executor)
+    
+    def _run(self, coroutine: _Coroutine) -> _Any:
+        """
+        Runs a coroutine on the event loop of the underlying client, blocking the calling thread until it is done. Only
+        one coroutine runs at a time.
+        :param coroutine: The coroutine to run.
+        :raise RuntimeError: If called from the thread running the event loop.
+        :return: The result of the coroutine.
+        """
+        if self._is_on_loop():
+            return super()._run(coroutine)  # Raises, rather than waiting for a lock that the loop may be holding.
+        with self._request_lock:
+            return super()._run(coroutine)
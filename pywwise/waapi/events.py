@@ -0,0 +1,136 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from threading import RLock as _RLock
+from typing import Any as _Any, Callable as _Callable
+
+from simplevent import RefEvent as _RefEvent
+from waapi import EventHandler as _EventHandler, WaapiClient as _WaapiClient
+
+
+class TopicEvent(_RefEvent):
+    """
+    A `RefEvent` backed by a WAAPI topic. The topic is only subscribed to when the event gets its first subscriber, and
+    unsubscribed from when the event loses its last subscriber; no subscription (and no event traffic) exists otherwise.
+    """
+    
+    def __init__(self, client: _WaapiClient, topic: str, callback: _Callable[..., _Any], *types: type,
+                 options: tuple[dict[str, _Any], ...] = ({},)):
+        """
+        Constructor.
+        :param client: The WAAPI client to use.
+        :param topic: The URI of the topic (e.g. `ak.wwise.core.object.created`).
+        :param callback: The function to call when the topic is published. It receives the event data as keyword
+                         arguments, and is expected to invoke this event.
+        :param types: The param types of the event. When calling the event, these types must be obeyed, in order.
+        :param options: The subscription options. The topic is subscribed to once per entry (e.g. once per watched
+                        property); if empty, the topic is never subscribed to.
+        """
+        super().__init__(*types)
+        self._client = client
+        self._topic = topic
+        self._callback = callback
+        self._options = list(options)
+        self._handlers = list[tuple[dict[str, _Any], _EventHandler]]()
+        self._lock = _RLock()
+    
+    @property
+    def topic(self) -> str:
+        """:return: The URI of the topic backing this event."""
+        return self._topic
+    
+    def is_subscribed(self) -> bool:
+        """:return: Whether the topic is currently subscribed to."""
+        return len(self._handlers) > 0
+    
+    def add(self, subscriber: _Callable) -> bool:
+        """
+        Adds a new subscriber. If it is the first one, the topic is subscribed to.
+        :param subscriber: The new subscriber.
+        :return: True if the subscriber was added, False otherwise.
+        """
+        with self._lock:
+            added = super().add(subscriber)
+            self._update_subscription()
+            return added
+    
+    def insert(self, i: int, subscriber: _Callable) -> bool:
+        """
+        Inserts a new subscriber (at the specified index). If it is the first one, the topic is subscribed to.
+        :param i: The index where to insert the new subscriber.
+        :param subscriber: The new subscriber.
+        :return: True if the subscriber was inserted, False otherwise.
+        """
+        with self._lock:
+            inserted = super().insert(i, subscriber)
+            self._update_subscription()
+            return inserted
+    
+    def remove(self, subscriber: _Callable) -> bool:
+        """
+        Removes a subscriber. If it was the last one, the topic is unsubscribed from.
+        :param subscriber: The subscriber to remove.
+        :return: True if the subscriber was removed, False otherwise.
+        """
+        with self._lock:
+            if subscriber not in self._subs:
+                return False
+            self._subs.remove(subscriber)
+            self._update_subscription()
+            return True
+    
+    def clear(self) -> bool:
+        """
+        Removes all subscribers, then unsubscribes from the topic.
+        :return: True if all subscribers were removed; otherwise, False (usually when there are no subscribers).
+        """
+        with self._lock:
+            cleared = super().clear()
+            self._update_subscription()
+            return cleared
+    
+    def add_options(self, options: dict[str, _Any]):
+        """
+        Adds a subscription with the specified options. If the event has subscribers, the topic is subscribed to right
+        away with these options; otherwise, it will be when the event gets its first subscriber.
+        :param options: The subscription options.
+        """
+        with self._lock:
+            self._options.append(options)
+            if self._subs:
+                self._subscribe(options)
+    
+    def remove_options(self, options: dict[str, _Any]) -> bool:
+        """
+        Removes a subscription added with `add_options`. If the topic is subscribed to with these options, it is
+        unsubscribed from (for these options only).
+        :param options: The subscription options, as passed to `add_options` (compared by identity).
+        :return: True if the options were removed, False otherwise.
+        """
+        with self._lock:
+            if not any(entry is options for entry in self._options):
+                return False
+            self._options = [entry for entry in self._options if entry is not options]
+            for entry in [entry for entry in self._handlers if entry[0] is options]:
+                self._client.unsubscribe(entry[1])
+                self._handlers.remove(entry)
+            return True
+    
+    def _subscribe(self, options: dict[str, _Any]):
+        """
+        Subscribes to the topic.
+        :param options: The subscription options.
+        """
+        handler = self._client.subscribe(self._topic, self._callback, options)
+        if handler is not None:
+            self._handlers.append((options, handler))
+    
+    def _update_subscription(self):
+        """Subscribes to the topic if this event has subscribers, or unsubscribes from it if it has none."""
+        if self._subs and not self._handlers:
+            for options in self._options:
+                self._subscribe(options)
+        elif not self._subs and self._handlers:
+            for _, handler in self._handlers:
+                self._client.unsubscribe(handler)
+            self._handlers.clear()
@@ -0,0 +1,612 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from asyncio import (AbstractEventLoop as _AbstractEventLoop, IncompleteReadError as _IncompleteReadError,
+                     new_event_loop as _new_event_loop, run_coroutine_threadsafe as _run_coroutine_threadsafe,
+                     sleep as _sleep, start_server as _start_server, StreamReader as _StreamReader,
+                     StreamWriter as _StreamWriter)
+from base64 import b64encode as _b64encode
+from hashlib import sha1 as _sha1
+from itertools import count as _count
+from json import dumps as _dumps, loads as _loads
+from threading import Thread as _Thread
+from typing import Any as _Any, Callable as _Callable, Self as _Self
+
+from pywwise.snapshot import new_guid as _new_guid, ProjectSnapshot
+from pywwise.waql import evaluate_waql as _evaluate_waql
+
+_NULL_GUID = "{00000000-0000-0000-0000-000000000000}"
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+"""The GUID used to compute the `Sec-WebSocket-Accept` header of the opening handshake (see RFC 6455)."""
+
+_DEFAULT_ROOTS = ("Actor-Mixer Hierarchy", "Attenuations", "Audio Devices", "Conversion Settings", "Effects", "Events",
+                  "Game Parameters", "Interactive Music Hierarchy", "Master-Mixer Hierarchy", "SoundBanks", "States",
+                  "Switches", "Triggers")
+"""The top-level folders of a new project. Each of them has a `Default Work Unit`."""
+
+_SOUND_ENGINE_URIS = ("executeActionOnEvent", "loadBank", "postMsgMonitor", "postTrigger", "registerGameObj",
+                      "resetRTPCValue", "seekOnEvent", "setDefaultListeners", "setGameObjectAuxSendValues",
+                      "setGameObjectOutputBusVolume", "setListeners", "setListenerSpatialization",
+                      "setMultiplePositions", "setObjectObstructionAndOcclusion", "setPosition", "setRTPCValue",
+                      "setScalingFactor", "stopAll", "stopPlayingID", "unloadBank", "unregisterGameObj")
+"""The `ak.soundengine` functions that are accepted without any effect (they return an empty result)."""
+
+
+def new_synthetic_project(sound_count: int = 1000, sounds_per_container: int = 100,
+                          with_events: bool = True) -> ProjectSnapshot:
+    """
+    Creates a synthetic project: the default folders and work units, a `Master Audio Bus`, and a hierarchy of Actor-
+    Mixers, Random Containers and Sounds (with a few properties and an output bus reference). Values are deterministic.
+    :param sound_count: The amount of Sounds to create.
+    :param sounds_per_container: The amount of Sounds per Random Container. There is one Actor-Mixer per 10 containers.
+    :param with_events: Whether to create one Event (with a Play action targeting the Sound) per Sound.
+    :return: The project, as a snapshot.
+    """
+    project = ProjectSnapshot()
+    work_units = dict[str, str]()
+    for root in _DEFAULT_ROOTS:
+        folder = project.add({"name": root, "type": "Folder"})
+        work_units[root] = project.add({"name": "Default Work Unit", "type": "WorkUnit"}, folder["id"])["id"]
+    
+    master_bus = project.add({"name": "Master Audio Bus", "type": "Bus"}, work_units["Master-Mixer Hierarchy"])
+    
+    actor_mixer = container = None
+    for index in range(sound_count):
+        if index % (sounds_per_container * 10) == 0:
+            actor_mixer = project.add({"name": f"ActorMixer_{index // (sounds_per_container * 10):04}",
+                                       "type": "ActorMixer"}, work_units["Actor-Mixer Hierarchy"])
+        if index % sounds_per_container == 0:
+            container = project.add({"name": f"Container_{index // sounds_per_container:05}",
+                                     "type": "RandomSequenceContainer"}, actor_mixer["id"])
+        sound = project.add({"name": f"Sound_{index:06}", "type": "Sound", "@Volume": -float(index % 24),
+                             "@Pitch": (index % 5) * 100, "@IsStreamingEnabled": index % 7 == 0,
+                             "@OutputBus": {"id": master_bus["id"]}}, container["id"])
+        if with_events:
+            event = project.add({"name": f"Play_Sound_{index:06}", "type": "Event"}, work_units["Events"])
+            project.add({"name": "Play", "type": "Action", "@ActionType": 1, "@Target": {"id": sound["id"]}},
+                        event["id"])
+    
+    return project
+
+
+class _FakeWaapiError(Exception):
+    """An error to return to the caller, as a WAMP error."""
+    
+    def __init__(self, uri: str, message: str):
+        """
+        Constructor.
+        :param uri: The URI of the error (e.g. `ak.wwise.invalid_arguments`).
+        :param message: The message describing the error.
+        """
+        super().__init__(message)
+        self.uri = uri
+        self.message = message
+
+
+class _FakeWampSession:
+    """
+    A WAMP session (one per client), over a minimal WebSocket implementation (RFC 6455: text frames, ping and close).
+    Only the subset of WAMP used by WAAPI clients is implemented. Autobahn is not used on the server side, because it
+    shares its event loop configuration (via `txaio`) with the WAAPI client, which typically runs in the same process.
+    """
+    
+    def __init__(self, server: "FakeWaapiServer", reader: _StreamReader, writer: _StreamWriter):
+        """
+        Constructor.
+        :param server: The server this session belongs to.
+        :param reader: The stream to read from.
+        :param writer: The stream to write to.
+        """
+        self.server = server
+        self.subscriptions = dict[int, tuple[str, dict[str, _Any]]]()
+        self._reader = reader
+        self._writer = writer
+    
+    async def run(self):
+        """Performs the opening handshake, then handles messages until the connection is closed."""
+        request = await self._reader.readuntil(b"\r\n\r\n")
+        headers = dict(line.split(":", 1) for line in request.decode("latin-1").split("\r\n")[1:] if ":" in line)
+        headers = {name.strip().lower(): value.strip() for name, value in headers.items()}
+        accept = _b64encode(_sha1(f"{headers['sec-websocket-key']}{_WEBSOCKET_GUID}".encode()).digest()).decode()
+        self._writer.write(f"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                           f"Sec-WebSocket-Accept: {accept}\r\nSec-WebSocket-Protocol: wamp.2.json\r\n\r\n".encode())
+        
+        message = bytearray()
+        while True:
+            opcode, payload = await self._read_frame()
+            match opcode:
+                case 0x0 | 0x1 | 0x2:  # Continuation, text or binary.
+                    message += payload[1:]
+                    if payload[0]:  # Final fragment.
+                        self.on_message(_loads(message))
+                        message.clear()
+                case 0x8:  # Close.
+                    self._write_frame(0x8, payload[1:3])
+                    break
+                case 0x9:  # Ping.
+                    self._write_frame(0xA, payload[1:])
+            await self._writer.drain()
+    
+    async def _read_frame(self) -> tuple[int, bytes]:
+        """
+        Reads a WebSocket frame, unmasking its payload.
+        :return: The opcode, and the payload prefixed with a byte indicating whether this is the final fragment.
+        """
+        header = await self._reader.readexactly(2)
+        length = header[1] & 0x7F
+        if length == 126:
+            length = int.from_bytes(await self._reader.readexactly(2), "big")
+        elif length == 127:
+            length = int.from_bytes(await self._reader.readexactly(8), "big")
+        mask = await self._reader.readexactly(4) if header[1] & 0x80 else b"\0\0\0\0"
+        payload = await self._reader.readexactly(length)
+        key = int.from_bytes((mask * (length // 4 + 1))[:length], "big")
+        unmasked = (int.from_bytes(payload, "big") ^ key).to_bytes(length, "big")
+        return header[0] & 0x0F, bytes((header[0] >> 7,)) + unmasked
+    
+    def _write_frame(self, opcode: int, payload: bytes):
+        """
+        Writes a final, unmasked WebSocket frame.
+        :param opcode: The opcode (e.g. 0x1 for text).
+        :param payload: The payload.
+        """
+        length = len(payload)
+        if length < 126:
+            header = bytes((0x80 | opcode, length))
+        elif length < 65536:
+            header = bytes((0x80 | opcode, 126)) + length.to_bytes(2, "big")
+        else:
+            header = bytes((0x80 | opcode, 127)) + length.to_bytes(8, "big")
+        self._writer.write(header + payload)
+    
+    def close(self):
+        """Closes the connection, without a closing handshake."""
+        self._writer.close()
+    
+    def send(self, message: list):
+        """
+        Sends a WAMP message.
+        :param message: The message.
+        """
+        self._write_frame(0x1, _dumps(message).encode())
+    
+    def on_message(self, message: list):
+        """
+        Handles a WAMP message (hello, goodbye, call, subscribe or unsubscribe).
+        :param message: The message.
+        """
+        match message[0]:
+            case 1:  # HELLO
+                self.send([2, next(self.server._ids), {"roles": {"broker": {}, "dealer": {}}}])
+            case 6:  # GOODBYE
+                self.send([6, {}, "wamp.close.normal"])  # As autobahn replies; other reasons are logged as warnings.
+            case 32:  # SUBSCRIBE
+                subscription = next(self.server._ids)
+                self.subscriptions[subscription] = (message[3], message[2])
+                self.send([33, message[1], subscription])
+            case 34:  # UNSUBSCRIBE
+                self.subscriptions.pop(message[2], None)
+                self.send([35, message[1]])
+            case 48:  # CALL
+                request, options, uri = message[1], message[2], message[3]
+                args = message[5] if len(message) > 5 else {}
+                if self.server.latency > 0.0:
+                    self.server._loop.create_task(self._call_later(request, uri, args, options))
+                else:
+                    self._call(request, uri, args, options)
+    
+    async def _call_later(self, request: int, uri: str, args: dict[str, _Any], options: dict[str, _Any]):
+        """
+        Handles a call after the server's latency.
+        :param request: The ID of the request.
+        :param uri: The URI of the function.
+        :param args: The arguments.
+        :param options: The options.
+        """
+        await _sleep(self.server.latency)
+        self._call(request, uri, args, options)
+    
+    def _call(self, request: int, uri: str, args: dict[str, _Any], options: dict[str, _Any]):
+        """
+        Handles a call, then sends its result (or error).
+        :param request: The ID of the request.
+        :param uri: The URI of the function.
+        :param args: The arguments.
+        :param options: The options.
+        """
+        handler = self.server._procedures.get(uri)
+        try:
+            if handler is None:
+                raise _FakeWaapiError("wamp.error.no_such_procedure", f"Unknown function: {uri}.")
+            self.send([50, request, {}, [], handler(args, options)])
+        except _FakeWaapiError as error:
+            self.send([8, 48, request, {}, error.uri, [], {"message": error.message}])
+        except (KeyError, TypeError, ValueError) as error:
+            self.send([8, 48, request, {}, "ak.wwise.invalid_arguments", [], {"message": repr(error)}])
+
+
+class FakeWaapiServer:
+    """
+    A local stand-in for the WAAPI server of Wwise, backed by an in-memory project (see `ProjectSnapshot` and
+    `new_synthetic_project`). It implements the core `ak.wwise.core.object` functions (`get` with a subset of WAQL,
+    `create`, `delete`, `move`, `set`, `setName`, `setNotes`, `setProperty`, `setReference`), `ak.wwise.core.getInfo`,
+    `ak.soundengine` functions, and publishes the matching `ak.wwise.core.object` topics. A latency can be added to
+    every call, to simulate the time Wwise takes. The server runs on its own thread; the project must not be modified
+    from other threads while the server is running (use WAAPI functions instead).
+    """
+    
+    def __init__(self, project: ProjectSnapshot | None = None, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0):
+        """
+        Constructor. The server is not started until `start` is called (or a `with` statement is entered).
+        :param project: The project to serve. If `None`, a small synthetic project is created.
+        :param host: The host to listen on.
+        :param port: The port to listen on. If 0, a free port is picked (see `url`).
+        :param latency: The time to wait before handling each call, in seconds.
+        """
+        self._project = project if project is not None else new_synthetic_project(100)
+        self._host = host
+        self._port = port
+        self.latency = latency
+        """The time to wait before handling each call, in seconds."""
+        self._ids = _count(1)
+        self._sessions = set[_FakeWampSession]()
+        self._loop: _AbstractEventLoop | None = None
+        self._thread: _Thread | None = None
+        self._server = None
+        self._states = dict[str, dict[str, str]]()
+        self._switches = dict[tuple[int, str], dict[str, str]]()
+        self._procedures = dict[str, _Callable[[dict[str, _Any], dict[str, _Any]], dict[str, _Any]]]()
+        
+        self.register("ak.wwise.core.getInfo", self._get_info)
+        self.register("ak.wwise.core.object.get", self._get)
+        self.register("ak.wwise.core.object.create", self._create)
+        self.register("ak.wwise.core.object.delete", self._delete)
+        self.register("ak.wwise.core.object.move", self._move)
+        self.register("ak.wwise.core.object.set", self._set)
+        self.register("ak.wwise.core.object.setName", self._set_name)
+        self.register("ak.wwise.core.object.setNotes", self._set_notes)
+        self.register("ak.wwise.core.object.setProperty", self._set_property)
+        self.register("ak.wwise.core.object.setReference", self._set_reference)
+        self.register("ak.soundengine.postEvent", self._post_event)
+        self.register("ak.soundengine.getState", self._get_state)
+        self.register("ak.soundengine.setState", self._set_state)
+        self.register("ak.soundengine.getSwitch", self._get_switch)
+        self.register("ak.soundengine.setSwitch", self._set_switch)
+        for uri in _SOUND_ENGINE_URIS:
+            self.register(f"ak.soundengine.{uri}", lambda args, options: {})
+        for uri in ("beginGroup", "endGroup", "cancelGroup"):  # Undo is not supported; groups are accepted.
+            self.register(f"ak.wwise.core.undo.{uri}", lambda args, options: {})
+    
+    def __enter__(self) -> _Self:
+        """
+        Enter the context (re: `with` statement). Starts the server.
+        :return: This instance of the `FakeWaapiServer` class.
+        """
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit the context (re: `with` statement). Stops the server.
+        :param exc_type: The exception type, if any.
+        :param exc_value: The exception value, if any.
+        :param traceback: The traceback, if any exception(s) were raised.
+        :return: False, so that exceptions are propagated.
+        """
+        self.stop()
+        return False
+    
+    @property
+    def project(self) -> ProjectSnapshot:
+        """:return: The project served by this server."""
+        return self._project
+    
+    @property
+    def url(self) -> str:
+        """:return: The URL to connect to (e.g. with `pywwise.new_waapi_connection`)."""
+        return f"ws://{self._host}:{self._port}/waapi"
+    
+    def is_running(self) -> bool:
+        """:return: Whether the server is running."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> _Self:
+        """
+        Starts listening, on a background thread.
+        :return: This instance of the `FakeWaapiServer` class.
+        """
+        if self.is_running():
+            return self
+        
+        self._loop = _new_event_loop()
+        self._thread = _Thread(target=self._loop.run_forever, name="pywwise-fake-server", daemon=True)
+        self._thread.start()
+        self._server = _run_coroutine_threadsafe(_start_server(self._serve, self._host, self._port),
+                                                 self._loop).result()
+        self._port = self._server.sockets[0].getsockname()[1]
+        return self
+    
+    def stop(self):
+        """Stops listening, and closes all connections."""
+        if not self.is_running():
+            return
+        
+        async def close():
+            self._server.close()
+            for session in tuple(self._sessions):
+                session.close()
+        
+        _run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+    
+    async def _serve(self, reader: _StreamReader, writer: _StreamWriter):
+        """
+        Serves a connection, until it is closed.
+        :param reader: The stream to read from.
+        :param writer: The stream to write to.
+        """
+        session = _FakeWampSession(self, reader, writer)
+        self._sessions.add(session)
+        try:
+            await session.run()
+        except (ConnectionError, _IncompleteReadError):
+            pass  # The client disconnected without a closing handshake.
+        finally:
+            self._sessions.discard(session)
+            writer.close()
+    
+    def register(self, uri: str, handler: _Callable[[dict[str, _Any], dict[str, _Any]], dict[str, _Any]]):
+        """
+        Implements (or replaces) a function. Handlers run on the server's thread.
+        :param uri: The URI of the function (e.g. `ak.wwise.core.getProjectInfo`).
+        :param handler: The function to call with the arguments and options of each call. It returns the result, or
+                        raises a `KeyError`, `TypeError` or `ValueError` (the caller then gets an error).
+        """
+        self._procedures[uri] = handler
+    
+    def publish(self, topic: str, make_kwargs: _Callable[[dict[str, _Any]], dict[str, _Any] | None]):
+        """
+        Publishes an event to all sessions subscribed to a topic. Can be called from any thread.
+        :param topic: The URI of the topic (e.g. `ak.wwise.core.object.nameChanged`).
+        :param make_kwargs: A function making the event data for a subscription, given its options. If it returns
+                            `None`, the subscription does not get the event (e.g. a property that is not watched).
+        """
+        if self._loop is not None and self.is_running():
+            self._loop.call_soon_threadsafe(self._publish, topic, make_kwargs)
+    
+    def _publish(self, topic: str, make_kwargs: _Callable[[dict[str, _Any]], dict[str, _Any] | None]):
+        """
+        Publishes an event. Must be called on the server's thread.
+        :param topic: The URI of the topic.
+        :param make_kwargs: A function making the event data for a subscription, given its options.
+        """
+        for session in tuple(self._sessions):
+            for subscription, (subscribed_topic, options) in tuple(session.subscriptions.items()):
+                if subscribed_topic == topic and (kwargs := make_kwargs(options)) is not None:
+                    session.send([36, subscription, next(self._ids), {}, [], kwargs])
+    
+    def _find(self, reference: str) -> str:
+        """
+        Finds an object of the project.
+        :param reference: A GUID, project path, or typed name.
+        :raise _FakeWaapiError: If there is no such object.
+        :return: The GUID of the object.
+        """
+        guid = self._project.find(reference)
+        if guid is None:
+            raise _FakeWaapiError("ak.wwise.invalid_object", f"Object not found: {reference}.")
+        return guid
+    
+    @staticmethod
+    def _returns(options: dict[str, _Any]) -> list[str]:
+        """
+        Gets the `return` options of a call or subscription.
+        :param options: The options.
+        :return: The keys to return (`id`, `name` and `type` by default).
+        """
+        return options.get("return") or ["id", "name", "type"]
+    
+    def _info(self, guid: str, options: dict[str, _Any]) -> dict[str, _Any]:
+        """
+        Gets the values of an object, as requested by a call or subscription.
+        :param guid: The GUID of the object.
+        :param options: The options of the call or subscription.
+        :return: The values.
+        """
+        return self._project.values(guid, self._returns(options))
+    
+    def _get_info(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.getInfo`"""
+        version = {"displayName": "v2024.1.0", "year": 2024, "major": 1, "minor": 0, "build": 0,
+                   "nickname": "", "schema": 0}
+        directories = {"install": "", "authoring": "", "bin": "", "help": "", "user": ""}
+        return {"sessionId": _NULL_GUID, "apiVersion": 0, "displayName": "Fake Wwise", "branch": "fake",
+                "version": version, "configuration": "release", "platform": "x64", "isCommandLine": True,
+                "processId": 0, "processPath": "", "directories": directories, "copyright": ""}
+    
+    def _get(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.get`"""
+        try:
+            guids = _evaluate_waql(args["waql"], self._project)
+        except ValueError as error:
+            raise _FakeWaapiError("ak.wwise.query.invalid", str(error))
+        returns = self._returns(options)
+        return {"return": [self._project.values(guid, returns) for guid in guids]}
+    
+    def _create(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.create`"""
+        parent = self._find(args["parent"])
+        name = args["name"]
+        existing = self._project.find(f"{self._project.get(parent)['path']}\\{name}")
+        
+        if existing is not None:
+            match args.get("onNameConflict", "fail"):
+                case "merge":
+                    return {"id": existing, "name": name}
+                case "replace":
+                    self._delete({"object": existing}, {})
+                case "rename":
+                    suffixes = (f"{name}_{number:02}" for number in _count(1))
+                    name = next(candidate for candidate in suffixes
+                                if self._project.find(f"{self._project.get(parent)['path']}\\{candidate}") is None)
+                case _:
+                    raise _FakeWaapiError("ak.wwise.invalid_arguments", f"Name conflict: {name}.")
+        
+        record = {"id": _new_guid(), "name": name, "type": args["type"]}
+        if args.get("notes"):
+            record["notes"] = args["notes"]
+        guid = self._project.add(record, parent)["id"]
+        
+        self._publish("ak.wwise.core.object.created", lambda opts: {"object": self._info(guid, opts)})
+        self._publish("ak.wwise.core.object.childAdded",
+                      lambda opts: {"parent": self._info(parent, opts), "child": self._info(guid, opts)})
+        return {"id": guid, "name": name}
+    
+    def _delete(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.delete`"""
+        guid = self._find(args["object"])
+        parent = self._project.parent(guid)
+        deleted = [guid, *self._project.descendants(guid)]
+        
+        keys = {"parent", "childrenCount"}
+        for current in deleted:
+            keys.update(self._project.get(current))
+        saved = {current: self._project.values(current, keys) for current in deleted}
+        
+        def saved_info(current: str, opts: dict[str, _Any]) -> dict[str, _Any]:
+            return {key: saved[current][key] for key in self._returns(opts) if key in saved[current]}
+        
+        for current in deleted:
+            self._publish("ak.wwise.core.object.preDeleted", lambda opts, c=current: {"object": saved_info(c, opts)})
+        self._project.remove(guid)
+        for current in deleted:
+            self._publish("ak.wwise.core.object.postDeleted", lambda opts, c=current: {"object": saved_info(c, opts)})
+        if parent is not None:
+            self._publish("ak.wwise.core.object.childRemoved",
+                          lambda opts: {"parent": self._info(parent, opts), "child": saved_info(guid, opts)})
+        return {}
+    
+    def _move(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.move`"""
+        guid = self._find(args["object"])
+        old_parent = self._project.parent(guid)
+        parent = self._find(args["parent"])
+        self._project.move(guid, parent)
+        
+        if old_parent is not None:
+            self._publish("ak.wwise.core.object.childRemoved",
+                          lambda opts: {"parent": self._info(old_parent, opts), "child": self._info(guid, opts)})
+        self._publish("ak.wwise.core.object.childAdded",
+                      lambda opts: {"parent": self._info(parent, opts), "child": self._info(guid, opts)})
+        return {"id": guid, "name": self._project.get(guid)["name"]}
+    
+    def _set_name(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.setName`"""
+        guid = self._find(args["object"])
+        old_name = self._project.rename(guid, args["value"])
+        self._publish("ak.wwise.core.object.nameChanged",
+                      lambda opts: {"object": self._info(guid, opts), "newName": args["value"], "oldName": old_name})
+        return {}
+    
+    def _set_notes(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.setNotes`"""
+        guid = self._find(args["object"])
+        old_notes = self._project.set_value(guid, "notes", args["value"]) or ""
+        self._publish("ak.wwise.core.object.notesChanged",
+                      lambda opts: {"object": self._info(guid, opts), "newNotes": args["value"], "oldNotes": old_notes})
+        return {}
+    
+    def _set(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.set` (properties and references only; creating children is not supported)"""
+        objects = [(self._find(entry["object"]), entry) for entry in args["objects"]]
+        for guid, entry in objects:
+            if "children" in entry or "import" in entry:
+                raise _FakeWaapiError("ak.wwise.invalid_arguments", "Creating objects is not supported.")
+        for guid, entry in objects:
+            for key, value in entry.items():
+                if not key.startswith("@"):
+                    continue
+                is_reference = isinstance(value, str) and value.startswith(("{", "\\"))  # A GUID or a project path.
+                if is_reference and (target := self._project.find(value)) is not None:
+                    self._apply_reference(guid, key[1:], target)
+                else:
+                    self._apply_property(guid, key[1:], value)
+        return {"objects": [{"id": guid, "name": self._project.get(guid)["name"]} for guid, _ in objects]}
+    
+    def _set_property(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.setProperty`"""
+        self._apply_property(self._find(args["object"]), args["property"], args["value"])
+        return {}
+    
+    def _set_reference(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.wwise.core.object.setReference`"""
+        value = self._find(args["value"]) if args.get("value") else None
+        self._apply_reference(self._find(args["object"]), args["reference"], value)
+        return {}
+    
+    def _apply_property(self, guid: str, name: str, value: _Any):
+        """
+        Sets a property, then publishes `ak.wwise.core.object.propertyChanged`.
+        :param guid: The GUID of the object.
+        :param name: The name of the property.
+        :param value: The new value.
+        """
+        old = self._project.set_value(guid, f"@{name}", value)
+        
+        def make_kwargs(opts: dict[str, _Any]) -> dict[str, _Any] | None:
+            if ("property" in opts and opts["property"] != name
+                    or "object" in opts and self._project.find(str(opts["object"])) != guid):
+                return None  # Wwise only publishes changes of the watched property and object (if any).
+            return {"object": self._info(guid, opts), "property": name, "old": old, "new": value,
+                    "platform": _NULL_GUID}
+        
+        self._publish("ak.wwise.core.object.propertyChanged", make_kwargs)
+    
+    def _apply_reference(self, guid: str, name: str, value: str | None):
+        """
+        Sets a reference, then publishes `ak.wwise.core.object.referenceChanged`.
+        :param guid: The GUID of the object.
+        :param name: The name of the reference.
+        :param value: The GUID of the referenced object, or `None` to clear the reference.
+        """
+        old = self._project.set_value(guid, f"@{name}", {"id": value} if value is not None else None)
+        old = old.get("id") if isinstance(old, dict) and old.get("id") in self._project else None
+        
+        def make_kwargs(opts: dict[str, _Any]) -> dict[str, _Any]:
+            return {"object": self._info(guid, opts), "reference": name,
+                    "old": self._info(old, opts) if old is not None else {},
+                    "new": self._info(value, opts) if value is not None else {}, "platform": _NULL_GUID}
+        
+        self._publish("ak.wwise.core.object.referenceChanged", make_kwargs)
+    
+    def _post_event(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.soundengine.postEvent`"""
+        return {"return": next(self._ids)}
+    
+    def _get_state(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.soundengine.getState`"""
+        return {"return": self._states.get(str(args["stateGroup"]), {"name": "None", "id": _NULL_GUID})}
+    
+    def _set_state(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.soundengine.setState`"""
+        state = self._project.find(str(args["state"]))
+        self._states[str(args["stateGroup"])] = {"name": self._project.get(state)["name"] if state else str(
+            args["state"]), "id": state or _NULL_GUID}
+        return {}
+    
+    def _get_switch(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.soundengine.getSwitch`"""
+        key = (args["gameObject"], str(args["switchGroup"]))
+        return {"return": self._switches.get(key, {"name": "None", "id": _NULL_GUID})}
+    
+    def _set_switch(self, args: dict[str, _Any], options: dict[str, _Any]) -> dict[str, _Any]:
+        """`ak.soundengine.setSwitch`"""
+        switch = self._project.find(str(args["switchState"]))
+        self._switches[(args["gameObject"], str(args["switchGroup"]))] = {
+            "name": self._project.get(switch)["name"] if switch else str(args["switchState"]),
+            "id": switch or _NULL_GUID}
+        return {}
@@ -0,0 +1,120 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from threading import RLock as _RLock
+from typing import Any as _Any, TYPE_CHECKING as _TYPE_CHECKING
+from weakref import WeakSet as _WeakSet
+
+from pywwise.enums import EReturnOptions
+from pywwise.primitives import GUID, Name
+from pywwise.structs import WwiseObjectInfo
+
+if _TYPE_CHECKING:
+    from pywwise.objects.abc import WwiseObject as _WwiseObject
+    from pywwise.waapi.ak.wwise.core.object import Object as _Object
+
+
+class FetchTracker:
+    """
+    Discards the values fetched by `WwiseObject.fetch` when Wwise reports a change. Each connection shares a single
+    `WwiseObject` instance per object (see `WwiseObject.__new__`), so fetched values are seen by every holder of the
+    instance; they must not outlive the values in Wwise. Changes are picked up from `nameChanged` (the name of the
+    object, and the paths of all objects, since descendants are renamed too), `childAdded` (the paths of all objects,
+    for moves), `propertyChanged` (subscribed to once, for all objects and properties, which requires Wwise 2022.1 or
+    newer), `referenceChanged` and `postDeleted` (all the values of the object). Topics are only subscribed to once
+    something is fetched; fetching more properties (or objects) never adds subscriptions.
+    """
+    
+    def __init__(self, obj: "_Object"):
+        """
+        Constructor.
+        :param obj: The `ak.wwise.core.object` wrapper of the connection, whose topics invalidate fetched values.
+        """
+        self._object = obj
+        self._instances = dict[str, _WeakSet]()  # The instances holding fetched values, per GUID (upper case).
+        self._watch = {"return": list(EReturnOptions.get_defaults())}  # `propertyChanged`, for all properties.
+        self._generation = 0  # Incremented by every invalidation.
+        self._lock = _RLock()
+        self._is_subscribed = False
+    
+    def begin(self, instance: "_WwiseObject") -> int:
+        """
+        Prepares fetching values: subscribes to the topics reporting their changes, if not done yet. Must be called
+        before getting the values from Wwise, so that no change can be missed.
+        :param instance: The instance fetching the values.
+        :return: The generation to pass to `store`, once the values are loaded.
+        """
+        with self._lock:
+            if not self._is_subscribed:
+                self._is_subscribed = True
+                obj = self._object
+                obj.name_changed.add(self._on_name_changed)
+                obj.child_added.add(self._on_child_added)
+                obj.property_changed.add(self._on_property_changed)
+                obj.property_changed.add_options(self._watch)
+                obj.reference_changed.add(self._on_reference_changed)
+                obj.post_deleted.add(self._on_post_deleted)
+            self._instances.setdefault(instance.guid.upper(), _WeakSet()).add(instance)
+            return self._generation
+    
+    def store(self, instance: "_WwiseObject", generation: int, values: dict[str, _Any]) -> bool:
+        """
+        Stores fetched values on an instance, unless anything was invalidated while they were being loaded, since they
+        may already be outdated.
+        :param instance: The instance that fetched the values.
+        :param generation: The generation returned by `begin`.
+        :param values: The fetched values, per name.
+        :return: Whether the values were stored.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            if instance._fetched is None:
+                instance._fetched = dict[str, _Any]()
+            instance._fetched.update(values)
+            return True
+    
+    def _discard(self, guid: GUID, *names: str):
+        """
+        Discards the fetched values of an object, on all its instances.
+        :param guid: The GUID of the object.
+        :param names: The names of the values to discard. If none are specified, all values are discarded.
+        """
+        with self._lock:
+            self._generation += 1
+            instances = self._instances.get(guid.upper(), ()) if names else self._instances.pop(guid.upper(), ())
+            for instance in tuple(instances):
+                if names:
+                    instance._discard_fetched(*names)
+                else:
+                    instance._fetched = None
+    
+    def _discard_paths(self):
+        """Discards the fetched paths of all objects."""
+        with self._lock:
+            self._generation += 1
+            for instances in self._instances.values():
+                for instance in tuple(instances):
+                    instance._discard_fetched("path")
+            self._instances = {guid: instances for guid, instances in self._instances.items() if instances}
+    
+    def _on_name_changed(self, obj: WwiseObjectInfo, old_name: str):
+        """Discards the name of a renamed object, and all paths (`ak.wwise.core.object.name_changed`)."""
+        self._discard(obj.guid, "name")
+        self._discard_paths()
+    
+    def _on_child_added(self, child: WwiseObjectInfo, parent: WwiseObjectInfo):
+        """Discards all paths, since the child may have been moved (`ak.wwise.core.object.child_added`)."""
+        self._discard_paths()
+    
+    def _on_property_changed(self, obj: WwiseObjectInfo, name: Name, old: _Any, new: _Any, platform: GUID):
+        """Discards a property whose value changed (`ak.wwise.core.object.property_changed`)."""
+        self._discard(obj.guid, name)
+    
+    def _on_reference_changed(self, obj: WwiseObjectInfo, old: WwiseObjectInfo, new: WwiseObjectInfo):
+        """Discards all values of an object whose reference changed (`ak.wwise.core.object.reference_changed`)."""
+        self._discard(obj.guid)
+    
+    def _on_post_deleted(self, obj: WwiseObjectInfo):
+        """Discards all values of a deleted object (`ak.wwise.core.object.post_deleted`)."""
+        self._discard(obj.guid)
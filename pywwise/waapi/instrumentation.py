@@ -0,0 +1,114 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from copy import deepcopy as _deepcopy
+from json import dumps as _dumps
+from threading import Lock as _Lock
+from time import perf_counter as _perf_counter
+from typing import Any as _Any, Callable as _Callable
+
+from pywwise.structs import WaapiCallRecord, WaapiCallStats
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+"""The upper bounds of the latency histogram buckets, in seconds."""
+
+
+def _json_size(value: _Any) -> int:
+    """
+    Measures the size of a value, serialized as JSON.
+    :param value: The value to measure.
+    :return: The size, in bytes.
+    """
+    return len(_dumps(value, separators=(",", ":"), default=str).encode())
+
+
+class CallInstrumentation:
+    """
+    Measures the calls made through a WAAPI client. While enabled, the client's `call` function is replaced (on the
+    instance) by one that records the URI, latency, payload sizes and outcome of each call; while disabled, the client
+    is left untouched, so there is no overhead at all.
+    """
+    
+    def __init__(self, client: _Any):
+        """
+        Constructor. The instrumentation starts disabled.
+        :param client: The client to instrument (e.g. a `WaapiClient`).
+        """
+        self._client = client
+        self._callback: _Callable[[WaapiCallRecord], _Any] | None = None
+        self._stats = dict[str, WaapiCallStats]()
+        self._lock = _Lock()
+    
+    def is_enabled(self) -> bool:
+        """:return: Whether calls are currently being recorded."""
+        return "call" in vars(self._client)
+    
+    def enable(self, callback: _Callable[[WaapiCallRecord], _Any] | None = None):
+        """
+        Starts recording calls. Statistics recorded previously are kept (see `reset`).
+        :param callback: A function to call with each `WaapiCallRecord` (e.g. to forward it to a metrics system). It is
+                         called on the thread that made the call, right after the call returns.
+        """
+        self._callback = callback
+        if self.is_enabled():
+            return
+        
+        call = self._client.call
+        
+        def instrumented_call(_uri: str, *args, **kwargs) -> dict[str, _Any] | None:
+            start = _perf_counter()
+            try:
+                result = call(_uri, *args, **kwargs)
+            except BaseException:
+                self._record(_uri, _perf_counter() - start, args, kwargs, None)
+                raise
+            self._record(_uri, _perf_counter() - start, args, kwargs, result)
+            return result
+        
+        self._client.call = instrumented_call
+    
+    def disable(self):
+        """Stops recording calls. Statistics recorded so far are kept (see `reset`)."""
+        if self.is_enabled():
+            del self._client.call
+        self._callback = None
+    
+    def get_stats(self) -> dict[str, WaapiCallStats]:
+        """:return: A copy of the statistics recorded so far, per URI."""
+        with self._lock:
+            return _deepcopy(self._stats)
+    
+    def reset(self):
+        """Discards the statistics recorded so far."""
+        with self._lock:
+            self._stats.clear()
+    
+    def _record(self, uri: str, latency: float, args: tuple, kwargs: dict[str, _Any], result: _Any):
+        """
+        Records a call.
+        :param uri: The URI of the function that was called.
+        :param latency: The time it took for the call to return, in seconds.
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call (e.g. `options`).
+        :param result: The result of the call. `None` if it failed.
+        """
+        succeeded = result is not None
+        record = WaapiCallRecord(uri, latency, _json_size([args, kwargs]), _json_size(result) if succeeded else 0,
+                                 succeeded)
+        bucket = next(bound for bound in LATENCY_BUCKETS if latency <= bound)
+        
+        with self._lock:
+            stats = self._stats.get(uri)
+            if stats is None:
+                stats = self._stats[uri] = WaapiCallStats(uri)
+            stats.count += 1
+            stats.error_count += not succeeded
+            stats.total_latency += latency
+            stats.min_latency = min(stats.min_latency, latency)
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.latency_histogram[bucket] = stats.latency_histogram.get(bucket, 0) + 1
+            stats.request_bytes += record.request_size
+            stats.response_bytes += record.response_size
+        
+        if (callback := self._callback) is not None:
+            callback(record)
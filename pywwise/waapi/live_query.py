@@ -0,0 +1,347 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import deque as _deque
+from threading import RLock as _RLock
+from typing import Any as _Any, Iterator as _Iterator, Self as _Self, TYPE_CHECKING as _TYPE_CHECKING
+
+from simplevent import RefEvent as _RefEvent
+
+from pywwise.enums import EReturnOptions
+from pywwise.primitives import GUID, Name
+from pywwise.structs import WwiseObjectInfo
+from pywwise.waql import PreparedWaqlQuery, tokenize_waql, WaqlQuery
+
+if _TYPE_CHECKING:
+    from pywwise.waapi.ak.wwise.core.object import Object as _Object
+
+_CANDIDATES_QUERY = PreparedWaqlQuery.prepare("$ from object {objects:object}")
+"""Gets the objects to re-check (see `LiveQuery._check`)."""
+
+_STAGE_KEYWORDS = frozenset(("where", "select", "skip", "take", "distinct", "orderBy"))
+"""The WAQL keywords starting a new stage of a query."""
+
+_NON_PROPERTY_WORDS = frozenset(("and", "or", "not", "true", "false", "null", "id", "name", "type", "path", "notes",
+                                 "parent", "childrencount"))
+"""The words of a `where` condition that are not property names (compared in lower case)."""
+
+
+class LiveQuery:
+    """
+    The result set of an `ak.wwise.core.object.get` query, kept up to date from the object topics of Wwise, instead
+    of running the query again. Changes are published as deltas: `added`, `removed` and `changed`. When the query
+    consists of an optional `from type` or `from project` source and `where` conditions only, each change only
+    re-checks the affected objects against the conditions: the changed object itself (for property, reference and notes
+    changes), or the changed object and its descendants (for creations, renames and moves, which can change paths).
+    Other queries (e.g. using `select`, or `take`) are run again entirely on each change, and the result set is
+    compared with the previous one. Note that Wwise only publishes `propertyChanged` for watched properties: the
+    properties used by the conditions and the return options are watched (once per property, for all objects), so
+    objects join or leave the result set (or change) as soon as those properties change. Deltas are sent in the order
+    they were found, without holding the lock of the result set, so subscribers may read it (or call `refresh`).
+    """
+    
+    def __init__(self, obj: "_Object", waql: WaqlQuery | str, returns_and_properties: tuple[EReturnOptions | str, ...]):
+        """
+        Constructor. The query is not run until `start` is called.
+        :param obj: The `ak.wwise.core.object` wrapper of the connection to run the query on.
+        :param waql: The WAQL query.
+        :param returns_and_properties: Additional return options and properties, as for `ak.wwise.core.object.get`.
+        """
+        self._object = obj
+        self._waql = str(waql)
+        self._returns = tuple(returns_and_properties)
+        self._results = dict[str, WwiseObjectInfo]()
+        self._watches = list[dict[str, _Any]]()  # The `propertyChanged` options, per watched property.
+        self._lock = _RLock()
+        self._pending = _deque[tuple[_RefEvent, tuple[WwiseObjectInfo, ...]]]()  # The deltas left to send.
+        self._is_sending = False
+        self._is_active = False
+        self._types, self._condition, self._properties = self._parse(self._waql)
+        self._properties += tuple(str(option)[1:] for option in self._returns if str(option).startswith("@"))
+        self._properties = tuple(dict.fromkeys(self._properties))
+        
+        self.added = _RefEvent(WwiseObjectInfo)
+        """Sent when an object joins the result set. **Event Data**: the object, with the requested values."""
+        
+        self.removed = _RefEvent(WwiseObjectInfo)
+        """Sent when an object leaves the result set. **Event Data**: the object, as it was in the result set."""
+        
+        self.changed = _RefEvent(WwiseObjectInfo, WwiseObjectInfo)
+        """
+        Sent when an object stays in the result set, but its values (e.g. its name, or a returned property) changed.
+        **Event Data**: the object as it was in the result set, then the object with its new values.
+        """
+    
+    def __len__(self) -> int:
+        """:return: The amount of objects in the result set."""
+        with self._lock:
+            return len(self._results)
+    
+    def __iter__(self) -> _Iterator[WwiseObjectInfo]:
+        """:return: An iterator over a copy of the objects in the result set (safe to use during updates)."""
+        return iter(self.results)
+    
+    def __contains__(self, guid: GUID | str) -> bool:
+        """
+        Checks if an object is in the result set.
+        :param guid: The GUID of the object.
+        :return: Whether the object is in the result set.
+        """
+        with self._lock:
+            return guid.upper() in self._results
+    
+    def __enter__(self) -> _Self:
+        """
+        Enter the context (re: `with` statement). Starts this query, if it was not started yet.
+        :return: This query.
+        """
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit the context (re: `with` statement). Stops this query.
+        :param exc_type: The exception type, if any.
+        :param exc_value: The exception value, if any.
+        :param traceback: The traceback, if any exception(s) were raised.
+        :return: False, so that exceptions are never suppressed.
+        """
+        self.stop()
+        return False
+    
+    @property
+    def waql(self) -> str:
+        """:return: The WAQL query."""
+        return self._waql
+    
+    @property
+    def results(self) -> tuple[WwiseObjectInfo, ...]:
+        """:return: The objects in the result set, in the order they joined it."""
+        with self._lock:
+            return tuple(self._results.values())
+    
+    def is_active(self) -> bool:
+        """:return: Whether the result set is being kept up to date."""
+        return self._is_active
+    
+    def is_incremental(self) -> bool:
+        """:return: Whether changes only re-check the affected objects (instead of running the whole query again)."""
+        return self._condition is not None
+    
+    def start(self):
+        """Subscribes to the object topics, then runs the query (sending `added` for each object found)."""
+        if self._is_active:
+            return
+        self._is_active = True
+        obj = self._object
+        obj.created.add(self._on_created)
+        obj.post_deleted.add(self._on_post_deleted)
+        obj.name_changed.add(self._on_name_changed)
+        obj.notes_changed.add(self._on_notes_changed)
+        obj.child_added.add(self._on_child_changed)
+        obj.child_removed.add(self._on_child_changed)
+        obj.property_changed.add(self._on_property_changed)
+        obj.reference_changed.add(self._on_reference_changed)
+        self._watches = [{"return": list(EReturnOptions.get_defaults()), "property": name} for name in self._properties]
+        for options in self._watches:
+            obj.property_changed.add_options(options)
+        self.refresh()
+    
+    def stop(self):
+        """Unsubscribes from the object topics. The result set is kept as it is, but not updated anymore."""
+        if not self._is_active:
+            return
+        self._is_active = False
+        obj = self._object
+        obj.created.remove(self._on_created)
+        obj.post_deleted.remove(self._on_post_deleted)
+        obj.name_changed.remove(self._on_name_changed)
+        obj.notes_changed.remove(self._on_notes_changed)
+        obj.child_added.remove(self._on_child_changed)
+        obj.child_removed.remove(self._on_child_changed)
+        obj.property_changed.remove(self._on_property_changed)
+        obj.reference_changed.remove(self._on_reference_changed)
+        for options in self._watches:
+            obj.property_changed.remove_options(options)
+        self._watches = []
+    
+    def refresh(self):
+        """Runs the whole query again, and sends the differences with the current result set as deltas."""
+        found = {info.guid.upper(): info for info in self._get(self._waql)}
+        with self._lock:
+            self._update(set(found).union(self._results), found)
+        self._send()
+    
+    def _get(self, waql: str) -> tuple[WwiseObjectInfo, ...]:
+        """
+        Runs a query, bypassing the query cache of the connection (whose results may not be invalidated yet).
+        :param waql: The query.
+        :return: The objects found, with the requested values.
+        """
+        return self._object._get(waql, self._returns)
+    
+    def _check(self, guids: list[str], with_descendants: bool):
+        """
+        Re-checks objects against the query, and sends the deltas.
+        :param guids: The GUIDs of the changed objects.
+        :param with_descendants: Whether the descendants of the objects may have changed too (e.g. their paths).
+        """
+        if not self._is_active or not guids:
+            return
+        if self._condition is None:
+            self.refresh()
+            return
+        
+        selection = " select this, descendants" if with_descendants else ""
+        candidates = set[str]()
+        found = dict[str, WwiseObjectInfo]()
+        for query in _CANDIDATES_QUERY.bind_many(guids):
+            if with_descendants:
+                candidates.update(info.guid.upper() for info in self._object._get(query + selection, ()))
+            else:
+                candidates.update(guid.upper() for guid in guids)
+            for info in self._get(f"{query}{selection}{self._condition}"):
+                if self._types is None or info.type.get_type_name().lower() in self._types:
+                    found[info.guid.upper()] = info
+        with self._lock:
+            self._update(candidates, found)
+        self._send()
+    
+    def _update(self, candidates: set[str], found: dict[str, WwiseObjectInfo]):
+        """
+        Updates the result set, and queues the deltas (see `_send`). Must be called with the lock held.
+        :param candidates: The GUIDs of the objects that were checked.
+        :param found: The objects that match the query, among the candidates, per GUID.
+        """
+        added = list[tuple[_RefEvent, tuple[WwiseObjectInfo, ...]]]()
+        changed = list[tuple[_RefEvent, tuple[WwiseObjectInfo, ...]]]()
+        for guid in candidates:
+            old = self._results.get(guid)
+            new = found.get(guid)
+            if old is None and new is not None:
+                self._results[guid] = new
+                added.append((self.added, (new,)))
+            elif old is not None and new is None:
+                del self._results[guid]
+                self._pending.append((self.removed, (old,)))
+            elif old is not None and old != new:
+                self._results[guid] = new
+                changed.append((self.changed, (old, new)))
+        self._pending.extend(added)
+        self._pending.extend(changed)
+    
+    def _send(self):
+        """
+        Sends the queued deltas, in order, without holding the lock. Only one thread sends at a time; deltas queued by
+        other threads (or by subscribers, e.g. calling `refresh`) meanwhile are sent by that thread.
+        """
+        with self._lock:
+            if self._is_sending:
+                return
+            self._is_sending = True
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._is_sending = False
+                        return
+                    event, args = self._pending.popleft()
+                event(*args)
+        except BaseException:
+            with self._lock:
+                self._is_sending = False
+            raise
+    
+    @staticmethod
+    def _parse(waql: str) -> tuple[frozenset[str] | None, str | None, tuple[str, ...]]:
+        """
+        Splits a query into the parts used to re-check objects.
+        :param waql: The query.
+        :return: The names of the types of the source (lower case), or `None` for any type; the `where` conditions,
+                 combined into a single `where` stage (or `None` if the query cannot be checked incrementally); and
+                 the names of the properties used by the conditions.
+        """
+        tokens = tokenize_waql(waql)
+        if tokens[:1] == ["$"]:
+            tokens.pop(0)
+        
+        types = None
+        if tokens[:2] == ["from", "type"]:
+            del tokens[:2]
+            names = [tokens.pop(0)] if tokens else []
+            while tokens[:1] == [","] and len(tokens) > 1:
+                del tokens[0]
+                names.append(tokens.pop(0))
+            types = frozenset(name.lower() for name in names)
+        elif tokens[:2] == ["from", "project"]:
+            del tokens[:2]
+        elif tokens[:1] == ["from"] or (tokens and tokens[0].startswith('"')):
+            return None, None, ()
+        
+        conditions = list[list[str]]()
+        for token in tokens:
+            if token in _STAGE_KEYWORDS:
+                if token != "where":
+                    return types, None, ()
+                conditions.append([])
+            elif not conditions:
+                return types, None, ()
+            else:
+                conditions[-1].append(token)
+        
+        properties = list[str]()
+        for condition in conditions:
+            for index, token in enumerate(condition):
+                if (token[0].isalpha() or token[0] in "_@") and token.lower() not in _NON_PROPERTY_WORDS \
+                        and (index == 0 or condition[index - 1] != "."):
+                    properties.append(token.lstrip("@"))
+        text = " and ".join(f"({LiveQuery._join(condition)})" for condition in conditions)
+        return types, f" where {text}" if text else "", tuple(properties)
+    
+    @staticmethod
+    def _join(tokens: list[str]) -> str:
+        """
+        Joins WAQL tokens back into text.
+        :param tokens: The tokens (see `pywwise.waql.tokenize_waql`).
+        :return: The text. Nested accessors (e.g. `parent.name`) are joined without spaces.
+        """
+        text = ""
+        for token in tokens:
+            if text and token != "." and not text.endswith("."):
+                text += " "
+            text += token
+        return text
+    
+    def _on_created(self, obj: WwiseObjectInfo):
+        """Checks a new object (`ak.wwise.core.object.created`)."""
+        self._check([obj.guid], True)
+    
+    def _on_post_deleted(self, obj: WwiseObjectInfo):
+        """Removes a deleted object, and its descendants (`ak.wwise.core.object.post_deleted`)."""
+        with self._lock:
+            guid = obj.guid.upper()
+            path = self._results[guid].path if guid in self._results else obj.path
+            descendants = {key for key, info in self._results.items() if path and info.path.startswith(f"{path}\\")}
+            self._update({guid} | descendants, {})
+        self._send()
+    
+    def _on_name_changed(self, obj: WwiseObjectInfo, old_name: str):
+        """Checks a renamed object and its descendants, whose paths changed (`ak.wwise.core.object.name_changed`)."""
+        self._check([obj.guid], True)
+    
+    def _on_notes_changed(self, obj: WwiseObjectInfo, new_notes: str, old_notes: str):
+        """Checks an object whose notes changed (`ak.wwise.core.object.notes_changed`)."""
+        self._check([obj.guid], False)
+    
+    def _on_child_changed(self, child: WwiseObjectInfo, parent: WwiseObjectInfo):
+        """Checks a moved object and its descendants (`ak.wwise.core.object.child_added` and `child_removed`)."""
+        self._check([child.guid], True)
+    
+    def _on_property_changed(self, obj: WwiseObjectInfo, name: Name, old: _Any, new: _Any, platform: GUID):
+        """Checks an object whose watched property changed, if it matters (`ak.wwise.core.object.property_changed`)."""
+        if self._types is None or obj.guid.upper() in self or obj.type.get_type_name().lower() in self._types:
+            self._check([obj.guid], False)
+    
+    def _on_reference_changed(self, obj: WwiseObjectInfo, old: WwiseObjectInfo, new: WwiseObjectInfo):
+        """Checks an object whose reference changed (`ak.wwise.core.object.reference_changed`)."""
+        self._check([obj.guid], False)
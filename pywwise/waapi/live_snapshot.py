@@ -0,0 +1,253 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from threading import Lock as _Lock, RLock as _RLock
+from typing import Any as _Any, Callable as _Callable, Self as _Self, TYPE_CHECKING as _TYPE_CHECKING
+
+from pywwise.enums import EReturnOptions
+from pywwise.primitives import GUID, Name
+from pywwise.snapshot import ProjectSnapshot
+from pywwise.structs import WwiseObjectInfo
+from pywwise.waql import PreparedWaqlQuery
+
+if _TYPE_CHECKING:
+    from pywwise.waapi.ak.wwise.core.object import Object as _Object
+
+_PROJECT_QUERY = PreparedWaqlQuery.prepare("$ from project skip {skip:int} take {take:int}")
+"""Gets a chunk of the objects of the project (see `LiveProjectSnapshot.load`)."""
+
+_WHOLE_PROJECT_QUERY = "$ from project"
+"""Gets all the objects of the project at once (see `LiveProjectSnapshot.load`)."""
+
+_OBJECT_QUERY = PreparedWaqlQuery.prepare("$ from object {object:object}")
+"""Gets a single object (see `LiveProjectSnapshot._on_reference_changed`)."""
+
+_SUBTREE_QUERY = PreparedWaqlQuery.prepare("$ from object {object:object} select this, descendants")
+"""Gets an object and its descendants (see `LiveProjectSnapshot._load_subtree`)."""
+
+_STRUCTURAL_KEYS = frozenset(("id", "name", "type", "path", "parent"))
+"""The keys of WAAPI results that are stored as the structure of the snapshot, rather than as values."""
+
+
+class LiveProjectSnapshot(ProjectSnapshot):
+    """
+    A `ProjectSnapshot` of a whole Wwise project, loaded with chunked `from project` queries, then kept up to date from
+    the object topics: `childAdded` (new and moved objects), `postDeleted`, `nameChanged`, `notesChanged`,
+    `propertyChanged` and `referenceChanged`. Besides the structure (GUID, name, type, path and parent) of each
+    object, the snapshot stores the requested return options and properties (e.g. `@Volume`). Note that Wwise only
+    publishes `propertyChanged` for watched properties (see `WwiseObjectWatch`); other property changes are picked up
+    by `load`. Updates are made on the thread publishing the topics: use `lock` for consistent reads across several
+    calls. Topics published during `load` are queued, then applied once it is done. Queries can be run against the
+    snapshot without Wwise (see `pywwise.waql.CompiledWaqlQuery`).
+    """
+    
+    def __init__(self, obj: "_Object", returns_and_properties: tuple[EReturnOptions | str, ...] = (),
+                 chunk_size: int = 10000):
+        """
+        Constructor. The snapshot starts empty, until `start` (or `load`) is called.
+        :param obj: The `ak.wwise.core.object` wrapper of the connection to load the project from.
+        :param returns_and_properties: Additional return options (e.g. `notes`) and properties (e.g. `@Volume`) to
+                                       store for each object.
+        :param chunk_size: The maximum amount of objects to get per query.
+        """
+        super().__init__()
+        self._object = obj
+        self._values_keys = tuple(dict.fromkeys(str(option) for option in returns_and_properties
+                                                if str(option) not in _STRUCTURAL_KEYS))
+        self._returns = (EReturnOptions.PARENT, *self._values_keys)
+        self._chunk_size = max(1, chunk_size)
+        self._lock = _RLock()
+        self._load_lock = _Lock()
+        self._queue: list[tuple[_Callable, tuple]] | None = None  # The topics published during `load`, if loading.
+        self._is_active = False
+    
+    def __enter__(self) -> _Self:
+        """
+        Enter the context (re: `with` statement). Starts this snapshot, if it was not started yet.
+        :return: This snapshot.
+        """
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit the context (re: `with` statement). Stops this snapshot.
+        :param exc_type: The exception type, if any.
+        :param exc_value: The exception value, if any.
+        :param traceback: The traceback, if any exception(s) were raised.
+        :return: False, so that exceptions are never suppressed.
+        """
+        self.stop()
+        return False
+    
+    @property
+    def lock(self) -> _RLock:
+        """:return: The lock held while this snapshot is updated (e.g. `with snapshot.lock: ...`)."""
+        return self._lock
+    
+    def is_active(self) -> bool:
+        """:return: Whether this snapshot is being kept up to date."""
+        return self._is_active
+    
+    def start(self):
+        """Subscribes to the object topics, then loads the project."""
+        if self._is_active:
+            return
+        self._is_active = True
+        obj = self._object
+        obj.child_added.add(self._on_child_added)
+        obj.post_deleted.add(self._on_post_deleted)
+        obj.name_changed.add(self._on_name_changed)
+        obj.notes_changed.add(self._on_notes_changed)
+        obj.property_changed.add(self._on_property_changed)
+        obj.reference_changed.add(self._on_reference_changed)
+        self.load()
+    
+    def stop(self):
+        """Unsubscribes from the object topics. The snapshot is kept as it is, but not updated anymore."""
+        if not self._is_active:
+            return
+        self._is_active = False
+        obj = self._object
+        obj.child_added.remove(self._on_child_added)
+        obj.post_deleted.remove(self._on_post_deleted)
+        obj.name_changed.remove(self._on_name_changed)
+        obj.notes_changed.remove(self._on_notes_changed)
+        obj.property_changed.remove(self._on_property_changed)
+        obj.reference_changed.remove(self._on_reference_changed)
+    
+    def load(self):
+        """
+        Discards the current contents, then loads the whole project again, `chunk_size` objects per query. Topics
+        published meanwhile are queued, then applied once the project is loaded. If objects were added, moved, renamed
+        or deleted meanwhile, the chunks may have shifted (skipping or repeating objects), so the project is loaded
+        again, with a single query.
+        """
+        with self._load_lock:
+            with self._lock:
+                self._queue = []
+            try:
+                rows = list[dict[str, _Any]]()
+                while True:
+                    chunk = self._object._get_dicts(_PROJECT_QUERY.bind(len(rows), self._chunk_size), self._returns)
+                    rows.extend(chunk)
+                    if len(chunk) < self._chunk_size:
+                        break
+                with self._lock:
+                    structural = (self._on_child_added, self._on_post_deleted, self._on_name_changed)
+                    is_shifted = len(rows) >= self._chunk_size and any(handler in structural
+                                                                       for handler, _ in self._queue)
+                if is_shifted:
+                    rows = self._object._get_dicts(_WHOLE_PROJECT_QUERY, self._returns)
+                with self._lock:
+                    queue, self._queue = self._queue, None
+                    ProjectSnapshot.__init__(self)
+                    self._add_rows(rows)
+                    for handler, args in queue:
+                        handler(*args)
+            finally:
+                with self._lock:
+                    self._queue = None
+    
+    def _is_queued(self, handler: _Callable, *args) -> bool:
+        """
+        Queues a topic, if it was published during `load`. Must be called with the lock held.
+        :param handler: The function handling the topic.
+        :param args: The arguments of the topic.
+        :return: Whether the topic was queued (in which case it must not be handled yet).
+        """
+        if self._queue is None:
+            return False
+        self._queue.append((handler, args))
+        return True
+    
+    def _add_rows(self, rows: list[dict[str, _Any]]):
+        """
+        Adds objects, parents first, at their WAAPI paths. Objects that are already in this snapshot only get their
+        values updated. Objects whose parent is not in this snapshot (e.g. deleted meanwhile) are skipped. Must be
+        called with the lock held.
+        :param rows: The objects, as returned by WAAPI (with `parent`).
+        """
+        for row in sorted(rows, key=lambda item: item["path"].rstrip("\\").count("\\")):
+            guid = row["id"]
+            if guid in self:
+                self._set_values(guid, row)
+                continue
+            parent = (row.get("parent") or {}).get("id")
+            if parent is None or parent in self:
+                record = {key: value for key, value in row.items() if key != "parent" and value is not None}
+                self._insert(record, parent)
+    
+    def _set_values(self, guid: str, row: dict[str, _Any]):
+        """
+        Updates the stored values of an object. Must be called with the lock held.
+        :param guid: The GUID of the object.
+        :param row: The object, as returned by WAAPI. Missing values are removed.
+        """
+        for key in self._values_keys:
+            self.set_value(guid, key, row.get(key))
+    
+    def _load_subtree(self, guid: str):
+        """
+        Loads an object and its descendants, and adds them (or updates their values). If the parent of the object is
+        not in this snapshot either, the subtree of the parent is loaded instead. Must be called with the lock held.
+        :param guid: The GUID of the object (upper case).
+        """
+        rows = self._object._get_dicts(_SUBTREE_QUERY.bind(guid), self._returns)
+        parent = next(((row.get("parent") or {}).get("id") for row in rows if row["id"].upper() == guid), None)
+        if parent is not None and parent not in self:
+            self._load_subtree(parent.upper())
+        else:
+            self._add_rows(rows)
+    
+    def _on_child_added(self, child: WwiseObjectInfo, parent: WwiseObjectInfo):
+        """Adds a new object, or moves an existing one (`ak.wwise.core.object.child_added`)."""
+        with self._lock:
+            if self._is_queued(self._on_child_added, child, parent):
+                return
+            guid, parent_guid = child.guid.upper(), parent.guid.upper()
+            if guid not in self or parent_guid not in self:
+                self._load_subtree(parent_guid if parent_guid not in self else guid)
+            elif self.parent(guid) != parent_guid:
+                self.move(guid, parent_guid)
+    
+    def _on_post_deleted(self, obj: WwiseObjectInfo):
+        """Removes a deleted object, and its descendants (`ak.wwise.core.object.post_deleted`)."""
+        with self._lock:
+            if self._is_queued(self._on_post_deleted, obj):
+                return
+            if obj.guid.upper() in self:
+                self.remove(obj.guid.upper())
+    
+    def _on_name_changed(self, obj: WwiseObjectInfo, old_name: str):
+        """Renames an object, updating the paths of its descendants (`ak.wwise.core.object.name_changed`)."""
+        with self._lock:
+            if self._is_queued(self._on_name_changed, obj, old_name):
+                return
+            if obj.guid.upper() in self:
+                self.rename(obj.guid.upper(), obj.name)
+    
+    def _on_notes_changed(self, obj: WwiseObjectInfo, new_notes: str, old_notes: str):
+        """Updates the stored notes of an object (`notes_changed`, which sends the new notes before the old ones)."""
+        with self._lock:
+            if self._is_queued(self._on_notes_changed, obj, new_notes, old_notes):
+                return
+            if obj.guid.upper() in self and EReturnOptions.NOTES in self._values_keys:
+                self.set_value(obj.guid.upper(), EReturnOptions.NOTES, new_notes or None)
+    
+    def _on_property_changed(self, obj: WwiseObjectInfo, name: Name, old: _Any, new: _Any, platform: GUID):
+        """Updates a (watched) property, if it is stored (`ak.wwise.core.object.property_changed`)."""
+        with self._lock:
+            if self._is_queued(self._on_property_changed, obj, name, old, new, platform):
+                return
+            if obj.guid.upper() in self and f"@{name}" in self._values_keys:
+                self.set_value(obj.guid.upper(), f"@{name}", new)
+    
+    def _on_reference_changed(self, obj: WwiseObjectInfo, old: WwiseObjectInfo, new: WwiseObjectInfo):
+        """Reloads the values of an object whose reference changed (`ak.wwise.core.object.reference_changed`)."""
+        with self._lock:
+            if self._is_queued(self._on_reference_changed, obj, old, new):
+                return
+            if obj.guid.upper() in self:
+                for row in self._object._get_dicts(_OBJECT_QUERY.bind(obj.guid.upper()), self._returns):
+                    self._set_values(row["id"], row)
@@ -0,0 +1,158 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from contextlib import contextmanager as _contextmanager
+from threading import Lock as _Lock
+from typing import Any as _Any, Callable as _Callable, Iterable as _Iterable, Iterator as _Iterator, Self as _Self
+
+from waapi import CallbackExecutor, SequentialThreadExecutor
+
+from pywwise.enums import EDispatchStrategy
+from pywwise.waapi.ak.ak import Ak as _Ak
+
+
+class WwiseConnectionPool:
+    """
+    A pool of connections to the same instance of Wwise. Each connection has its own socket, so independent requests
+    (e.g. read-only queries) can be handled by several of Wwise's server threads at once. Requests are dispatched to
+    connections either in turn or based on how busy each connection is (see `EDispatchStrategy`).
+    """
+    
+    def __init__(self, size: int = 4, url: str = "ws://127.0.0.1:8080/waapi", allow_exception: bool = False,
+                 callback_executor: type[CallbackExecutor] = SequentialThreadExecutor, *,
+                 strategy: EDispatchStrategy = EDispatchStrategy.LEAST_BUSY, max_workers: int | None = None,
+                 pipelined: bool = False):
+        """
+        Constructor. Connects to an instance of Wwise, once per connection in the pool.
+        :param size: The amount of connections in the pool.
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to `ws://127.0.0.1:8080/waapi`.
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :param callback_executor: Executor strategy for event callbacks.
+        :param strategy: How to pick a connection for each request.
+        :param max_workers: The amount of threads used by `submit` and `map`. Defaults to one per connection, or 16 per
+                            connection if connections are pipelined.
+        :param pipelined: Whether connections should send requests without waiting for the results of previous ones.
+        :raise ValueError: If `size` is lower than 1.
+        :raise CannotConnectToWaapiException: If any of the connections could not be established.
+        """
+        if size < 1:
+            raise ValueError(f"A connection pool needs at least one connection; got {size}.")
+        
+        connections = list[_Ak]()
+        try:
+            for _ in range(size):
+                connections.append(_Ak(url, allow_exception, callback_executor, pipelined=pipelined))
+        except BaseException:
+            for connection in connections:
+                connection.disconnect()
+            raise
+        
+        self._connections = tuple(connections)
+        self._strategy = strategy
+        self._in_flight = [0] * size
+        self._next = 0
+        self._lock = _Lock()
+        self._executor = _ThreadPoolExecutor(max_workers or size * (16 if pipelined else 1),
+                                             thread_name_prefix="pywwise-pool")
+    
+    def __enter__(self) -> _Self:
+        """
+        Enter the context (re: `with` statement).
+        :return: This instance of the `WwiseConnectionPool` class.
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Exit the context (re: `with` statement).
+        :param exc_type: The exception type, if any.
+        :param exc_value: The exception value, if any.
+        :param traceback: The traceback, if any exception(s) were raised.
+        :return: False, so that exceptions are never suppressed.
+        """
+        self.disconnect()
+        return False
+    
+    def __len__(self) -> int:
+        """:return: The amount of connections in the pool."""
+        return len(self._connections)
+    
+    @property
+    def connections(self) -> tuple[_Ak, ...]:
+        """:return: The connections in this pool."""
+        return self._connections
+    
+    @property
+    def strategy(self) -> EDispatchStrategy:
+        """:return: How a connection is picked for each request."""
+        return self._strategy
+    
+    def _pick(self) -> int:
+        """
+        Picks a connection according to the dispatch strategy. Must be called while holding the lock.
+        :return: The index of the picked connection.
+        """
+        if self._strategy == EDispatchStrategy.LEAST_BUSY:
+            return min(range(len(self._connections)), key=self._in_flight.__getitem__)
+        index = self._next
+        self._next = (index + 1) % len(self._connections)
+        return index
+    
+    @_contextmanager
+    def acquire(self) -> _Iterator[_Ak]:
+        """
+        Picks a connection, according to the dispatch strategy, for the duration of a `with` block. The connection is
+        not reserved: other threads may use it at the same time, but it will count as busy until the block exits.
+        :return: A connection from this pool.
+        """
+        with self._lock:
+            index = self._pick()
+            self._in_flight[index] += 1
+        try:
+            yield self._connections[index]
+        finally:
+            with self._lock:
+                self._in_flight[index] -= 1
+    
+    def submit(self, fn: _Callable[..., _Any], *args, **kwargs) -> _Future:
+        """
+        Runs a function on this pool's threads. The function receives a connection as its first argument.
+        :param fn: The function to run (e.g. `lambda ak, waql: ak.wwise.core.object.get(waql)`).
+        :param args: The positional arguments to pass to the function, after the connection.
+        :param kwargs: The keyword arguments to pass to the function.
+        :return: A future for the result of the function.
+        """
+        
+        def run():
+            with self.acquire() as ak:
+                return fn(ak, *args, **kwargs)
+        
+        return self._executor.submit(run)
+    
+    def map(self, fn: _Callable[[_Ak, _Any], _Any], items: _Iterable[_Any], timeout: float | None = None) -> list[_Any]:
+        """
+        Calls a function once per item, in parallel, spreading the calls over this pool's connections.
+        :param fn: The function to call. It receives a connection and an item (e.g. `lambda ak, guid: ...`).
+        :param items: The items to call the function with.
+        :param timeout: The maximum amount of seconds to wait for each result. If `None`, there is no limit.
+        :raise TimeoutError: If a result is not available in time.
+        :return: The results, in the same order as the items. If a call raised an exception, it is raised again here.
+        """
+        futures = [self.submit(fn, item) for item in items]
+        return [future.result(timeout) for future in futures]
+    
+    def is_connected(self) -> bool:
+        """
+        Check if all connections in this pool are connected to Wwise.
+        :return: Whether all connections in this pool are connected to Wwise.
+        """
+        return all(connection.is_connected() for connection in self._connections)
+    
+    def disconnect(self) -> bool:
+        """
+        Disconnect all connections in this pool from Wwise.
+        :return: Whether all disconnections were successful.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        return all([connection.disconnect() for connection in self._connections])
@@ -0,0 +1,201 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import OrderedDict as _OrderedDict
+from threading import RLock as _RLock
+from typing import Any as _Any, Callable as _Callable, Iterable as _Iterable, TYPE_CHECKING as _TYPE_CHECKING
+
+from pywwise.enums import EReturnOptions
+from pywwise.primitives import GUID, Name
+from pywwise.structs import WwiseObjectInfo
+
+if _TYPE_CHECKING:
+    from pywwise.waapi.ak.wwise.core.object import Object as _Object
+
+
+class PropertyCache:
+    """
+    Caches the values read through `WwiseProperty` attributes, per object, property, and platform. Cached values are
+    invalidated when Wwise reports a change: `propertyChanged`, `nameChanged`, `referenceChanged`, `childAdded` (for
+    all objects, since the cache does not know which ones are below a moved object) and `postDeleted`. `propertyChanged`
+    is subscribed to once per cached property, for all objects (i.e. without the `object` option, which requires Wwise
+    2022.1 or newer), so only the first read of each property waits for a subscription. At most `max_properties`
+    properties are watched; the least recently read ones are unwatched first, and their values discarded. While
+    disabled, nothing is cached and no topic is subscribed to.
+    """
+    
+    def __init__(self, obj: "_Object"):
+        """
+        Constructor. The cache starts disabled.
+        :param obj: The `ak.wwise.core.object` wrapper of the connection, whose topics invalidate the cache.
+        """
+        self._object = obj
+        self._values = dict[str, dict[tuple[str, GUID | Name | None], _Any]]()
+        self._generation = 0  # Incremented by every invalidation.
+        self._watches = _OrderedDict[str, dict[str, _Any]]()  # The `propertyChanged` options, per property name.
+        self._max_properties = 256
+        self._lock = _RLock()
+        self._is_enabled = False
+        self.hits = 0
+        """The amount of reads served from the cache."""
+        self.misses = 0
+        """The amount of reads that had to call Wwise."""
+    
+    def __len__(self) -> int:
+        """:return: The amount of cached values."""
+        with self._lock:
+            return sum(len(values) for values in self._values.values())
+    
+    def is_enabled(self) -> bool:
+        """:return: Whether values are currently being cached."""
+        return self._is_enabled
+    
+    def enable(self, max_properties: int = 256):
+        """
+        Starts caching values, and subscribes to the topics invalidating them. If already enabled, only the limit is
+        updated.
+        :param max_properties: The maximum amount of watched properties (i.e. `propertyChanged` subscriptions).
+        """
+        with self._lock:
+            self._max_properties = max(1, max_properties)
+            evicted = self._evict()
+        self._unwatch(evicted)
+        if self._is_enabled:
+            return
+        self._is_enabled = True
+        self._object.property_changed.add(self._on_property_changed)
+        self._object.name_changed.add(self._on_name_changed)
+        self._object.reference_changed.add(self._on_reference_changed)
+        self._object.child_added.add(self._on_child_added)
+        self._object.post_deleted.add(self._on_post_deleted)
+    
+    def disable(self):
+        """Stops caching values, discards all cached values, and unsubscribes from the topics."""
+        if not self._is_enabled:
+            return
+        self._is_enabled = False
+        self._object.property_changed.remove(self._on_property_changed)
+        self._object.name_changed.remove(self._on_name_changed)
+        self._object.reference_changed.remove(self._on_reference_changed)
+        self._object.child_added.remove(self._on_child_added)
+        self._object.post_deleted.remove(self._on_post_deleted)
+        self.clear()
+    
+    def clear(self):
+        """Discards all cached values, and stops watching their properties."""
+        with self._lock:
+            self._generation += 1
+            self._values.clear()
+            watches = tuple(self._watches.values())
+            self._watches.clear()
+        self._unwatch(watches)
+    
+    def get(self, guid: GUID, name: str, platform: GUID | Name | None, load: _Callable[[], _Any]) -> _Any:
+        """
+        Gets a cached value, loading (and caching) it on a miss. If any value is invalidated while it is being loaded,
+        it is returned but not cached, since it may already be outdated.
+        :param guid: The GUID of the object.
+        :param name: The name of the property.
+        :param platform: The platform of the value, or `None` for the current platform.
+        :param load: The function to call on a miss, to get the value from Wwise.
+        :return: The value.
+        """
+        key = guid.upper()
+        with self._lock:
+            values = self._values.get(key)
+            if values is not None and (name, platform) in values:
+                self._watches.move_to_end(name)
+                self.hits += 1
+                return values[(name, platform)]
+            self.misses += 1
+        
+        generation = self._watch(name)  # Before loading, so that no change can be missed.
+        value = load()
+        
+        with self._lock:
+            if self._is_enabled and self._generation == generation:
+                self._values.setdefault(key, {})[(name, platform)] = value
+        return value
+    
+    def invalidate(self, guid: GUID, name: str | None = None):
+        """
+        Discards cached values of an object.
+        :param guid: The GUID of the object.
+        :param name: The name of the property to discard (on all platforms). If `None`, all properties are discarded.
+        """
+        key = guid.upper()
+        with self._lock:
+            self._generation += 1
+            values = self._values.get(key)
+            if values is None:
+                return
+            if name is None:
+                del self._values[key]
+            else:
+                for cached in [cached for cached in values if cached[0] == name]:
+                    del values[cached]
+    
+    def _watch(self, name: str):
+        """
+        Subscribes to `propertyChanged` for a property of all objects, unless it is already watched. If too many
+        properties are watched, the least recently read ones are unwatched.
+        :param name: The name of the property.
+        :return: The generation of the cache once the property is watched, to check whether a value loaded afterward
+                 may be cached.
+        """
+        with self._lock:
+            if name in self._watches:
+                self._watches.move_to_end(name)
+                return self._generation
+            options = self._watches[name] = {"return": list(EReturnOptions.get_defaults()), "property": name}
+            evicted = self._evict()
+        self._object.property_changed.add_options(options)
+        self._unwatch(evicted)
+        with self._lock:
+            return self._generation
+    
+    def _evict(self) -> list[dict[str, _Any]]:
+        """
+        Stops tracking the least recently read properties, until at most `max_properties` are watched, and discards
+        their values, since their changes will not be reported anymore. Must be called with the lock held.
+        :return: The `propertyChanged` options of the evicted properties, to pass to `_unwatch` (without the lock).
+        """
+        evicted = list[dict[str, _Any]]()
+        while len(self._watches) > self._max_properties:
+            name, options = self._watches.popitem(last=False)
+            evicted.append(options)
+            self._generation += 1
+            for values in self._values.values():
+                for cached in [cached for cached in values if cached[0] == name]:
+                    del values[cached]
+        return evicted
+    
+    def _unwatch(self, watches: _Iterable[dict[str, _Any]]):
+        """
+        Unsubscribes from `propertyChanged` for properties that are no longer watched.
+        :param watches: The `propertyChanged` options of the properties.
+        """
+        for options in watches:
+            self._object.property_changed.remove_options(options)
+    
+    def _on_property_changed(self, obj: WwiseObjectInfo, name: Name, old: _Any, new: _Any, platform: GUID):
+        """Invalidates a property whose value changed (`ak.wwise.core.object.property_changed`)."""
+        self.invalidate(obj.guid, name)
+    
+    def _on_name_changed(self, obj: WwiseObjectInfo, old_name: str):
+        """Invalidates a renamed object (`ak.wwise.core.object.name_changed`)."""
+        self.invalidate(obj.guid)
+    
+    def _on_reference_changed(self, obj: WwiseObjectInfo, old: WwiseObjectInfo, new: WwiseObjectInfo):
+        """Invalidates an object whose reference changed (`ak.wwise.core.object.reference_changed`)."""
+        self.invalidate(obj.guid)
+    
+    def _on_child_added(self, child: WwiseObjectInfo, parent: WwiseObjectInfo):
+        """Invalidates all objects when a child is added or moved (`ak.wwise.core.object.child_added`)."""
+        with self._lock:  # Values inherited by the whole subtree of the child (e.g. the output bus) may have changed.
+            self._generation += 1
+            self._values.clear()
+    
+    def _on_post_deleted(self, obj: WwiseObjectInfo):
+        """Invalidates a deleted object (`ak.wwise.core.object.post_deleted`)."""
+        self.invalidate(obj.guid)
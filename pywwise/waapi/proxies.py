@@ -0,0 +1,108 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+from asyncio import get_running_loop as _get_running_loop
+from concurrent.futures import Executor as _Executor, Future as _Future
+from functools import partial as _partial, wraps as _wraps
+from inspect import ismethod as _ismethod
+from typing import Any as _Any, Callable as _Callable
+
+from simplevent import Event as _Event
+
+
+class _ApiProxy(_ABC):
+    """
+    Base class for proxies exposing a WAAPI wrapper (e.g. `ak.wwise.core.object`) with functions that do not block the
+    caller. Nested wrappers (e.g. `ak.wwise.core`) are exposed as proxies as well; any other attribute (e.g. events) is
+    returned as is.
+    """
+    
+    def __init__(self, target: _Any, executor: _Executor):
+        """
+        Constructor.
+        :param target: The wrapper to proxy.
+        :param executor: The executor to run the wrapped functions on.
+        """
+        self._target = target
+        self._executor = executor
+        self._proxies = dict[str, _Any]()
+    
+    def __getattr__(self, name: str) -> _Any:
+        """
+        Gets an attribute of the wrapped object, as a non-blocking function or nested proxy where applicable.
+        :param name: The name of the attribute.
+        :return: The attribute.
+        """
+        if name in self._proxies:
+            return self._proxies[name]
+        
+        attribute = getattr(self._target, name)
+        
+        if _ismethod(attribute):
+            proxy = self._wrap(attribute)
+        elif hasattr(attribute, "_client") and not isinstance(attribute, _Event):  # Wrappers store it in `_client`.
+            proxy = type(self)(attribute, self._executor)
+        else:
+            return attribute
+        
+        self._proxies[name] = proxy
+        return proxy
+    
+    def __dir__(self):
+        """:return: The attributes of the wrapped object."""
+        return dir(self._target)
+    
+    def __repr__(self) -> str:
+        """:return: A representation of this proxy, including the wrapped object."""
+        return f"{type(self).__name__}({self._target!r})"
+    
+    @_abstractmethod
+    def _wrap(self, function: _Callable) -> _Callable:
+        """
+        Wraps a function into its non-blocking counterpart.
+        :param function: The function to wrap.
+        :return: The wrapped function.
+        """
+        pass
+
+
+class AsyncApiProxy(_ApiProxy):
+    """
+    Exposes a WAAPI wrapper (e.g. `ak.wwise.core.object`) with awaitable functions. Each function call runs the
+    wrapped (blocking) function on an executor, so that many calls can be awaited concurrently on the same event loop.
+    """
+    
+    def _wrap(self, function: _Callable) -> _Callable:
+        """
+        Wraps a function into a coroutine function that runs it on the executor.
+        :param function: The function to wrap.
+        :return: The coroutine function.
+        """
+        
+        @_wraps(function)
+        async def wrapper(*args, **kwargs):
+            return await _get_running_loop().run_in_executor(self._executor, _partial(function, *args, **kwargs))
+        
+        return wrapper
+
+
+class FutureApiProxy(_ApiProxy):
+    """
+    Exposes a WAAPI wrapper (e.g. `ak.wwise.core.object`) with functions returning a `concurrent.futures.Future`. Each
+    function call is submitted to an executor and returns right away. With a pipelined client, the requests of all
+    pending calls are in flight at the same time.
+    """
+    
+    def _wrap(self, function: _Callable) -> _Callable:
+        """
+        Wraps a function into a function that submits it to the executor.
+        :param function: The function to wrap.
+        :return: The wrapped function, returning a future.
+        """
+        
+        @_wraps(function)
+        def wrapper(*args, **kwargs) -> _Future:
+            return self._executor.submit(function, *args, **kwargs)
+        
+        return wrapper
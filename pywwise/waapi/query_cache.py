@@ -0,0 +1,169 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import OrderedDict as _OrderedDict
+from threading import RLock as _RLock
+from time import monotonic as _monotonic
+from typing import Any as _Any, Callable as _Callable, TYPE_CHECKING as _TYPE_CHECKING
+from weakref import ref as _ref, WeakKeyDictionary as _WeakKeyDictionary
+
+from pywwise.primitives import GUID, Name
+from pywwise.structs import WwiseObjectInfo
+
+if _TYPE_CHECKING:
+    from pywwise.waapi.ak.wwise.core.object import Object as _Object
+
+_QUERY_CACHES = _WeakKeyDictionary[_Any, "_ref[QueryCache]"]()
+"""The query cache of each WAAPI client (see `QueryCache.invalidate`). Neither is kept alive by this mapping."""
+
+
+class QueryCache:
+    """
+    Caches the results of `ak.wwise.core.object.get`, per WAQL query, return options and platform. At most `max_size`
+    results are kept; the least recently used ones are discarded first. Since any change can affect the result of any
+    query (e.g. a renamed object may start matching a `where name : ...` condition), every change reported by Wwise
+    invalidates all cached results: `created`, `postDeleted`, `nameChanged`, `notesChanged`, `childAdded`,
+    `childRemoved`, `propertyChanged` and `referenceChanged`. Note that Wwise only publishes `propertyChanged` for
+    watched properties (see `WwiseObjectWatch`); properties set through the same connection (or through any other
+    function modifying the project, e.g. `ak.wwise.core.undo.undo`) invalidate the cache anyway. Results are cached as
+    returned by WAAPI, and must not be modified. While disabled, nothing is cached and no topic is subscribed to.
+    """
+    
+    def __init__(self, obj: "_Object"):
+        """
+        Constructor. The cache starts disabled.
+        :param obj: The `ak.wwise.core.object` wrapper of the connection, whose topics invalidate the cache.
+        """
+        self._object = obj
+        self._results = _OrderedDict[tuple[str, tuple[str, ...], str | None], tuple[float, _Any]]()
+        self._generation = 0  # Incremented by every invalidation.
+        self._lock = _RLock()
+        self._is_enabled = False
+        self._max_size = 256
+        self._max_age: float | None = None
+        self.hits = 0
+        """The amount of queries served from the cache."""
+        self.misses = 0
+        """The amount of queries that had to call Wwise."""
+        _QUERY_CACHES[obj._client] = _ref(self)
+    
+    def __len__(self) -> int:
+        """:return: The amount of cached results."""
+        with self._lock:
+            return len(self._results)
+    
+    def is_enabled(self) -> bool:
+        """:return: Whether results are currently being cached."""
+        return self._is_enabled
+    
+    def enable(self, max_size: int = 256, max_age: float | None = None):
+        """
+        Starts caching results, and subscribes to the topics invalidating them. If already enabled, only the limits
+        are updated.
+        :param max_size: The maximum amount of cached results.
+        :param max_age: The maximum age of cached results, in seconds, or `None` to keep them until they are
+                        invalidated. Useful to also pick up changes that Wwise does not publish.
+        """
+        with self._lock:
+            self._max_size = max(1, max_size)
+            self._max_age = max_age
+            while len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+        if self._is_enabled:
+            return
+        self._is_enabled = True
+        self._subscribe(True)
+    
+    def disable(self):
+        """Stops caching results, discards all cached results, and unsubscribes from the topics."""
+        if not self._is_enabled:
+            return
+        self._is_enabled = False
+        self._subscribe(False)
+        self.clear()
+    
+    def clear(self):
+        """Discards all cached results."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+    
+    @staticmethod
+    def invalidate(client: _Any):
+        """
+        Discards all results cached for a WAAPI client, if any. Called by the functions modifying a project (see
+        `pywwise.decorators.invalidates_query_cache`), whichever wrapper of the connection they belong to.
+        :param client: The WAAPI client of the connection.
+        """
+        if (cache := _QUERY_CACHES.get(client, lambda: None)()) is not None:
+            cache.clear()
+    
+    def get(self, waql: str, returns: tuple[str, ...], platform: GUID | Name | None, load: _Callable[[], _Any]) -> _Any:
+        """
+        Gets a cached result, loading (and caching) it on a miss. If the cache is invalidated while the result is being
+        loaded, it is returned but not cached, since it may already be outdated.
+        :param waql: The WAQL query.
+        :param returns: The return options and properties.
+        :param platform: The platform of the query, or `None` for the current platform.
+        :param load: The function to call on a miss, to get the result from Wwise.
+        :return: The result.
+        """
+        key = (waql, returns, platform)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and (self._max_age is None or _monotonic() - cached[0] <= self._max_age):
+                self._results.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            generation = self._generation
+        
+        result = load()
+        
+        with self._lock:
+            if self._is_enabled and self._generation == generation:
+                self._results[key] = (_monotonic(), result)
+                self._results.move_to_end(key)
+                if len(self._results) > self._max_size:
+                    self._results.popitem(last=False)
+        return result
+    
+    def _subscribe(self, is_subscribing: bool):
+        """
+        Subscribes to (or unsubscribes from) the topics invalidating the cache.
+        :param is_subscribing: Whether to subscribe, or unsubscribe.
+        """
+        obj = self._object
+        for event, handler in ((obj.created, self._on_object_changed), (obj.post_deleted, self._on_object_changed),
+                               (obj.name_changed, self._on_name_changed), (obj.notes_changed, self._on_notes_changed),
+                               (obj.child_added, self._on_child_changed), (obj.child_removed, self._on_child_changed),
+                               (obj.property_changed, self._on_property_changed),
+                               (obj.reference_changed, self._on_reference_changed)):
+            if is_subscribing:
+                event.add(handler)
+            else:
+                event.remove(handler)
+    
+    def _on_object_changed(self, obj: WwiseObjectInfo):
+        """Invalidates all results when an object is created or deleted (`created` and `post_deleted`)."""
+        self.clear()
+    
+    def _on_name_changed(self, obj: WwiseObjectInfo, old_name: str):
+        """Invalidates all results when an object is renamed (`ak.wwise.core.object.name_changed`)."""
+        self.clear()
+    
+    def _on_notes_changed(self, obj: WwiseObjectInfo, new_notes: str, old_notes: str):
+        """Invalidates all results when the notes of an object change (`ak.wwise.core.object.notes_changed`)."""
+        self.clear()
+    
+    def _on_child_changed(self, child: WwiseObjectInfo, parent: WwiseObjectInfo):
+        """Invalidates all results when an object is added or removed as a child (`child_added` and `child_removed`)."""
+        self.clear()
+    
+    def _on_property_changed(self, obj: WwiseObjectInfo, name: Name, old: _Any, new: _Any, platform: GUID):
+        """Invalidates all results when a (watched) property changes (`ak.wwise.core.object.property_changed`)."""
+        self.clear()
+    
+    def _on_reference_changed(self, obj: WwiseObjectInfo, old: WwiseObjectInfo, new: WwiseObjectInfo):
+        """Invalidates all results when a reference changes (`ak.wwise.core.object.reference_changed`)."""
+        self.clear()
@@ -0,0 +1,299 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import defaultdict as _defaultdict, deque as _deque
+from gzip import open as _gzip_open
+from itertools import count as _count
+from json import dumps as _dumps, loads as _loads
+from logging import getLogger as _getLogger
+from pathlib import Path as _Path
+from threading import Lock as _Lock
+from time import perf_counter as _perf_counter, sleep as _sleep
+from typing import Any as _Any, IO as _IO
+
+from waapi import EventHandler as _EventHandler, WaapiClient as _WaapiClient, WaapiRequestFailed
+from waapi.client.interface import UnsubscribeHandler as _UnsubscribeHandler
+
+from pywwise.aliases import SystemPath
+from pywwise.waapi.clients import _merge_args_to_kwargs
+
+_logger = _getLogger("waapi")
+
+
+def _open_log(path: SystemPath, mode: str) -> _IO[str]:
+    """
+    Opens a traffic log. Logs whose name ends with `.gz` are compressed.
+    :param path: The path of the log.
+    :param mode: The mode to open the log with (`r` or `w`).
+    :return: The log, as a text stream.
+    """
+    path = _Path(path)
+    if path.suffix == ".gz":
+        return _gzip_open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _dump(value: _Any, sort_keys: bool = False) -> str:
+    """
+    Serializes a value as compact JSON. Values that are not JSON types (e.g. paths) are serialized as strings.
+    :param value: The value to serialize.
+    :param sort_keys: Whether to sort the keys of dictionaries (to compare requests).
+    :return: The JSON string.
+    """
+    return _dumps(value, separators=(",", ":"), sort_keys=sort_keys, default=str)
+
+
+def _request_key(uri: str, args: _Any, kwargs: _Any) -> tuple[str, str]:
+    """
+    Makes a key identifying a request, regardless of how its arguments were passed (see `waapi.WaapiClient.call`).
+    :param uri: The URI of the function.
+    :param args: The positional arguments of the call.
+    :param kwargs: The keyword arguments of the call.
+    :return: The key.
+    """
+    arguments = _merge_args_to_kwargs(args, dict(kwargs))
+    return uri, _dump(_loads(_dump(arguments)), True)  # Round trip, so tuples and lists compare equal.
+
+
+class RecordingWaapiClient:
+    """
+    Wraps a WAAPI client, writing every call (URI, arguments, options, result and duration), every subscription (URI
+    and options) and every published event (along with the subscription it was published to) to a log, one JSON object
+    per line. The log can then be served by a `ReplayWaapiClient`, without an instance of Wwise. Any other attribute is
+    forwarded to the wrapped client.
+    """
+    
+    def __init__(self, client: _WaapiClient, path: SystemPath):
+        """
+        Constructor.
+        :param client: The client to record the traffic of.
+        :param path: The path of the log to write. If it ends with `.gz`, the log is compressed.
+        """
+        self._client = client
+        self._log = _open_log(path, "w")
+        self._lock = _Lock()
+        self._start = _perf_counter()
+        self._subscription_ids = _count(1)
+        self._on_events = dict[_EventHandler, _Any]()  # The `on_event` functions replaced by `subscribe`, per handler.
+    
+    def __getattr__(self, name: str) -> _Any:
+        """
+        Gets an attribute of the wrapped client.
+        :param name: The name of the attribute.
+        :return: The attribute.
+        """
+        return getattr(self._client, name)
+    
+    def _write(self, entry: dict[str, _Any]):
+        """
+        Writes an entry to the log, timestamped relative to the creation of this client.
+        :param entry: The entry to write.
+        """
+        entry["time"] = _perf_counter() - self._start
+        line = _dump(entry)
+        with self._lock:
+            if not self._log.closed:
+                self._log.write(f"{line}\n")
+    
+    def is_connected(self) -> bool:
+        """:return: Whether the wrapped client is connected to Wwise."""
+        return self._client.is_connected()
+    
+    def disconnect(self) -> bool:
+        """
+        Disconnects the wrapped client, then closes the log.
+        :return: Whether the disconnection was successful.
+        """
+        result = self._client.disconnect()
+        with self._lock:
+            self._log.close()
+        return result
+    
+    def call(self, _uri: str, *args, **kwargs) -> dict[str, _Any] | None:
+        """
+        Do a Remote Procedure Call (RPC) to Wwise, and record it. See `waapi.WaapiClient.call`.
+        :param _uri: URI of the remote procedure to be called.
+        :param args: Optionally, a single dictionary containing the arguments.
+        :param kwargs: Keyword arguments to be passed. Options may be passed using the key `options`.
+        :return: Result from the remote procedure call, or `None` if the call failed.
+        """
+        start = _perf_counter()
+        result = self._client.call(_uri, *args, **kwargs)
+        self._write({"kind": "call", "uri": _uri, "args": args, "kwargs": kwargs, "result": result,
+                     "duration": _perf_counter() - start})
+        return result
+    
+    def subscribe(self, _uri: str, callback_or_handler: _Any = None, *args, **kwargs) -> _EventHandler | None:
+        """
+        Subscribe to a topic, recording the subscription and every event published to it. See
+        `waapi.WaapiClient.subscribe`. An event handler is wrapped in place (its `on_event` function records the events
+        first), so the handler passed is the one returned, and can be unsubscribed.
+        :param _uri: URI of the topic.
+        :param callback_or_handler: A callback, or an instance of `waapi.EventHandler`.
+        :param args: Optionally, a single dictionary containing the options.
+        :param kwargs: The subscription options.
+        :return: The event handler managing the subscription, or `None` if the subscription failed.
+        """
+        if isinstance(callback_or_handler, _EventHandler):
+            event_handler = callback_or_handler
+        else:
+            event_handler = _EventHandler(self, callback_or_handler)
+        subscription = next(self._subscription_ids)
+        on_event = event_handler.on_event
+        
+        def record_event(*event_args, **event_kwargs):
+            self._write({"kind": "event", "uri": _uri, "subscription": subscription, "args": event_args,
+                         "kwargs": event_kwargs})
+            on_event(*event_args, **event_kwargs)
+        
+        event_handler.on_event = record_event
+        if self._client.subscribe(_uri, event_handler, *args, **kwargs) is None:
+            event_handler.on_event = on_event
+            return None
+        event_handler._unsubscribe_handler = self
+        self._on_events[event_handler] = on_event
+        self._write({"kind": "subscribe", "uri": _uri, "subscription": subscription, "args": args, "kwargs": kwargs})
+        return event_handler
+    
+    def unsubscribe(self, event_handler: _EventHandler) -> bool:
+        """
+        Unsubscribe from a topic managed by the passed event handler, and stop recording its events.
+        :param event_handler: An event handler returned by `subscribe`.
+        :return: Whether the handler was successfully unsubscribed.
+        """
+        if not self._client.unsubscribe(event_handler):
+            return False
+        if (on_event := self._on_events.pop(event_handler, None)) is not None:
+            event_handler.on_event = on_event
+        return True
+
+
+class ReplayWaapiClient(_UnsubscribeHandler):
+    """
+    A stand-in for `waapi.WaapiClient` serving the traffic recorded by a `RecordingWaapiClient`, without an instance
+    of Wwise. Each call returns the result recorded for the same URI and arguments; if the same request was recorded
+    several times, its results are returned in the recorded order (the last one is then repeated). Each subscription is
+    matched the same way, with a recorded subscription to the same URI with the same options. Recorded events are
+    published on demand, with `publish_events`, to the subscription matching the one they were recorded for.
+    """
+    
+    def __init__(self, path: SystemPath, allow_exception: bool = False):
+        """
+        Constructor. Loads a traffic log.
+        :param path: The path of the log to replay. If it ends with `.gz`, the log is expected to be compressed.
+        :param allow_exception: Whether to raise an exception for calls that were not recorded (or that failed).
+        """
+        super().__init__()
+        self._allow_exception = allow_exception
+        self._results = _defaultdict[tuple[str, str], _deque](_deque)
+        self._events = list[dict[str, _Any]]()
+        self._subscriptions = _defaultdict[tuple[str, str], _deque](_deque)  # The recorded IDs, per URI and options.
+        self._handlers = _defaultdict[int, list[_EventHandler]](list)  # Per recorded subscription ID.
+        self._is_connected = True
+        
+        with _open_log(path, "r") as log:
+            for line in log:
+                entry = _loads(line)
+                if entry["kind"] == "call":
+                    self._results[_request_key(entry["uri"], entry["args"], entry["kwargs"])].append(entry["result"])
+                elif entry["kind"] == "subscribe":
+                    key = _request_key(entry["uri"], entry["args"], entry["kwargs"])
+                    self._subscriptions[key].append(entry["subscription"])
+                elif entry["kind"] == "event":
+                    self._events.append(entry)
+    
+    @property
+    def events(self) -> tuple[dict[str, _Any], ...]:
+        """
+        :return: The recorded events, in order. Each event has a `uri`, a `subscription` (the ID of the recorded
+                 subscription), `args`, `kwargs` and a `time` (seconds).
+        """
+        return tuple(self._events)
+    
+    def is_connected(self) -> bool:
+        """:return: Whether this client has not been disconnected yet."""
+        return self._is_connected
+    
+    def disconnect(self) -> bool:
+        """
+        Disconnects this client, removing all subscriptions.
+        :return: Whether this call caused the disconnection.
+        """
+        was_connected = self._is_connected
+        self._is_connected = False
+        self._handlers.clear()
+        return was_connected
+    
+    def call(self, _uri: str, *args, **kwargs) -> dict[str, _Any] | None:
+        """
+        Serves the recorded result of a call. See `waapi.WaapiClient.call`.
+        :param _uri: URI of the remote procedure to be called.
+        :param args: Optionally, a single dictionary containing the arguments.
+        :param kwargs: Keyword arguments to be passed. Options may be passed using the key `options`.
+        :raise WaapiRequestFailed: If `allow_exception` is True and no result (or `None`) was recorded for this call.
+        :return: The recorded result, or `None` if there is none.
+        """
+        results = self._results.get(_request_key(_uri, args, kwargs))
+        result = (results.popleft() if len(results) > 1 else results[0]) if results else None
+        if result is None:
+            message = f"No recorded result for {_uri} with arguments {args} and {kwargs}."
+            if self._allow_exception:
+                raise WaapiRequestFailed(message)
+            _logger.error(message)
+        return result
+    
+    def subscribe(self, _uri: str, callback_or_handler: _Any = None, *args, **kwargs) -> _EventHandler | None:
+        """
+        Subscribe to a topic. The subscription receives the events recorded for the matching recorded subscription (same
+        URI and options); if there is none, it receives no events.
+        :param _uri: URI of the topic.
+        :param callback_or_handler: A callback, or an instance of `waapi.EventHandler`.
+        :param args: Optionally, a single dictionary containing the options.
+        :param kwargs: The subscription options.
+        :return: The event handler managing the subscription.
+        """
+        if isinstance(callback_or_handler, _EventHandler):
+            event_handler = callback_or_handler
+            event_handler._unsubscribe_handler = self
+        else:
+            event_handler = _EventHandler(self, callback_or_handler)
+        subscriptions = self._subscriptions.get(_request_key(_uri, args, kwargs))
+        subscription = (subscriptions.popleft() if len(subscriptions) > 1 else subscriptions[0]) if subscriptions else 0
+        self._handlers[subscription].append(event_handler)
+        return event_handler
+    
+    def unsubscribe(self, event_handler: _EventHandler) -> bool:
+        """
+        Unsubscribe from a topic managed by the passed event handler.
+        :param event_handler: An event handler returned by `subscribe`.
+        :return: Whether the handler was successfully unsubscribed.
+        """
+        for handlers in self._handlers.values():
+            if event_handler in handlers:
+                handlers.remove(event_handler)
+                return True
+        return False
+    
+    def subscriptions(self) -> set[_EventHandler]:
+        """:return: The event handlers currently subscribed."""
+        return {handler for handlers in self._handlers.values() for handler in handlers}
+    
+    def publish_events(self, realtime: bool = False) -> int:
+        """
+        Publishes the recorded events, in order, to the handlers of the subscriptions matching the ones they were
+        recorded for. Handlers are called on the calling thread.
+        :param realtime: Whether to wait between events as long as was recorded. If False, events are published as
+                         fast as possible (e.g. to profile how they are handled).
+        :return: The amount of events that had at least one subscriber.
+        """
+        published = 0
+        previous_time = self._events[0]["time"] if self._events else 0.0
+        for event in self._events:
+            if realtime:
+                _sleep(max(0.0, event["time"] - previous_time))
+                previous_time = event["time"]
+            handlers = tuple(self._handlers.get(event["subscription"], ()))
+            for handler in handlers:
+                handler.on_event(*event["args"], **event["kwargs"])
+            published += len(handlers) > 0
+        return published
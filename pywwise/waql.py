@@ -1,11 +1,17 @@
 # Copyright 2024 Matheus Vilano
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Iterator as _Iterator, Self as _Self
+from operator import ge as _ge, gt as _gt, le as _le, lt as _lt
+from re import compile as _re_compile, IGNORECASE as _RE_IGNORECASE, Pattern as _Pattern
+from typing import Any as _Any, Callable as _Callable, Iterable as _Iterable, Iterator as _Iterator, Self as _Self
 
 from pywwise.aliases import RegexPattern
 from pywwise.enums import EObjectType, EWaqlLogicalOperator, EWaqlSelectExpression
 from pywwise.primitives import GUID, Name, ProjectPath, ShortID
+from pywwise.snapshot import ProjectSnapshot
+
+__all__ = ["CompiledWaqlQuery", "PreparedWaqlQuery", "ProjectSnapshot", "WaqlQuery", "evaluate_waql",
+           "tokenize_waql"]
 
 
 class WaqlQuery:
@@ -165,7 +171,7 @@ class WaqlQuery:
         """
         if logic_operator == "==":  # Fixing common user mistake :)
             logic_operator = EWaqlLogicalOperator.EQUAL
-        if str(logic_operator) not in EWaqlLogicalOperator:
+        if str(logic_operator) not in _WAQL_OPERATORS:  # `in EWaqlLogicalOperator` raises for `str` before 3.12.
             raise ValueError(f"Invalid logic operator for WAQL: '{logic_operator}'")
         match value_or_ref_or_regex:
             case str() | ProjectPath() | GUID():
@@ -203,3 +209,695 @@ class WaqlQuery:
         **and_expression**, **or_expression**, **open_bracket**, and **close_bracket** to create compound expressions.
         """
         self._components.append(")")
+
+
+_WAQL_PLACEHOLDER = _re_compile(r"\{([A-Za-z_]\w*)(?::([a-z]+))?}")
+"""Matches a placeholder of a prepared query (e.g. `{target:object}`). GUID literals never match (they contain `-`)."""
+
+_WAQL_BATCH_BREAKERS = frozenset(("skip", "take", "distinct"))
+"""The WAQL keywords whose result depends on the whole input sequence; queries using them cannot be batched."""
+
+_WAQL_PREPARED_CACHE_SIZE = 256
+"""The maximum amount of templates kept by `PreparedWaqlQuery.prepare`."""
+
+
+def _quote_waql(text: str) -> str:
+    """
+    Formats a WAQL string literal.
+    :param text: The text.
+    :return: The text, escaped and enclosed in double quotes.
+    """
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _format_waql_object(value: _Any) -> str:
+    """
+    Formats a reference to an object (for the `object` placeholder kind).
+    :param value: A GUID, a project path, an `(EObjectType, Name)` tuple, or anything with a `guid` (e.g. a
+                  `WwiseObject` or a `WwiseObjectInfo`).
+    :raise TypeError: If the value cannot refer to an object.
+    :return: The reference, as a WAQL string literal.
+    """
+    if isinstance(value, str):
+        return _quote_waql(value)
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], EObjectType):
+        return _quote_waql(f"{value[0].get_type_name()}:{value[1]}")
+    if isinstance(getattr(value, "guid", None), str):
+        return _quote_waql(value.guid)
+    raise TypeError(f"Cannot refer to an object with {value!r}.")
+
+
+def _format_waql_number(value: _Any) -> str:
+    """
+    Formats a number (for the `int` and `float` placeholder kinds).
+    :param value: The number. Booleans are rejected.
+    :raise TypeError: If the value is not a number.
+    :return: The number, as a WAQL literal.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"Expected a number, got {value!r}.")
+    return str(value)
+
+
+def _format_waql_bool(value: _Any) -> str:
+    """
+    Formats a boolean (for the `bool` placeholder kind).
+    :param value: The boolean.
+    :raise TypeError: If the value is not a boolean.
+    :return: `true` or `false`.
+    """
+    if not isinstance(value, bool):
+        raise TypeError(f"Expected a boolean, got {value!r}.")
+    return "true" if value else "false"
+
+
+def _format_waql_type(value: _Any) -> str:
+    """
+    Formats an object type (for the `type` placeholder kind).
+    :param value: The type, as an `EObjectType`.
+    :raise TypeError: If the value is not an `EObjectType`.
+    :return: The name of the type (e.g. `Sound`).
+    """
+    if not isinstance(value, EObjectType):
+        raise TypeError(f"Expected an EObjectType, got {value!r}.")
+    return value.get_type_name()
+
+
+def _format_waql_regex(value: _Any) -> str:
+    """
+    Formats a regular expression (for the `regex` placeholder kind).
+    :param value: The expression, as a `RegexPattern` or a `str`.
+    :return: The expression, enclosed in slashes.
+    """
+    pattern = value.pattern if isinstance(value, RegexPattern) else str(value)
+    return "/" + pattern.replace("/", "\\/") + "/"
+
+
+def _format_waql_any(value: _Any) -> str:
+    """
+    Formats a value whose kind is inferred from its type (for placeholders without a kind), the same way
+    `WaqlQuery.expression` does.
+    :param value: The value.
+    :return: The value, as a WAQL literal.
+    """
+    if isinstance(value, bool):
+        return _format_waql_bool(value)
+    if isinstance(value, (int, float)):
+        return _format_waql_number(value)
+    if isinstance(value, RegexPattern):
+        return _format_waql_regex(value)
+    if isinstance(value, EObjectType):
+        return _format_waql_type(value)
+    if isinstance(value, str):
+        return _quote_waql(value)
+    return _format_waql_object(value)
+
+
+_WAQL_FORMATTERS = {"object": _format_waql_object, "str": lambda value: _quote_waql(str(value)),
+                    "int": _format_waql_number, "float": _format_waql_number, "bool": _format_waql_bool,
+                    "type": _format_waql_type, "regex": _format_waql_regex, "any": _format_waql_any}
+"""The formatter of each placeholder kind."""
+
+
+class PreparedWaqlQuery:
+    """
+    A WAQL query template, parsed once and bound to values many times. Placeholders are written `{name}` or
+    `{name:kind}`, where the kind is one of `object`, `str`, `int`, `float`, `bool`, `type`, `regex` or `any` (the
+    default, which infers the kind from the value). Bound values are validated and escaped according to their kind.
+    Example: `PreparedWaqlQuery.prepare("$ from object {target:object} select children").bind(guid)`.
+    """
+    
+    _cache = dict[str, "PreparedWaqlQuery"]()
+    """The prepared queries, per template (see `prepare`)."""
+    
+    def __init__(self, template: str):
+        """
+        Constructor. Parses the template. Prefer `prepare`, which reuses already-parsed templates.
+        :param template: The template (e.g. `$ from object {target:object} take 1`).
+        :raise ValueError: If a placeholder has an unknown kind, or if the same name is used twice.
+        """
+        self._template = template
+        self._literals = list[str]()
+        self._names = list[str]()
+        self._formatters = list[_Any]()
+        position = 0
+        for match in _WAQL_PLACEHOLDER.finditer(template):
+            name, kind = match.group(1), match.group(2) or "any"
+            if kind not in _WAQL_FORMATTERS:
+                raise ValueError(f"Unknown WAQL placeholder kind: '{kind}'.")
+            if name in self._names:
+                raise ValueError(f"The WAQL placeholder '{name}' is used more than once.")
+            self._literals.append(template[position:match.start()])
+            self._names.append(name)
+            self._formatters.append(_WAQL_FORMATTERS[kind])
+            position = match.end()
+        self._literals.append(template[position:])
+        
+        words = set(_re_compile(r"[A-Za-z_]\w*").findall(_WAQL_PLACEHOLDER.sub("", template).lower()))
+        self._is_batchable = (len(self._names) == 1 and self._formatters[0] is _format_waql_object
+                              and self._literals[0].rstrip().endswith("from object")
+                              and not words & _WAQL_BATCH_BREAKERS)
+    
+    def __str__(self) -> str:
+        """:return: The template."""
+        return self._template
+    
+    def __repr__(self) -> str:
+        """:return: The template, as a `PreparedWaqlQuery` expression."""
+        return f"PreparedWaqlQuery({self._template!r})"
+    
+    @classmethod
+    def prepare(cls, template: str) -> _Self:
+        """
+        Gets the prepared query of a template, parsing it only the first time. Only the most recently used templates
+        are kept.
+        :param template: The template.
+        :raise ValueError: If the template is invalid (see the constructor).
+        :return: The prepared query.
+        """
+        prepared = cls._cache.pop(template, None)
+        if prepared is None:
+            prepared = cls(template)
+            if len(cls._cache) >= _WAQL_PREPARED_CACHE_SIZE:
+                cls._cache.pop(next(iter(cls._cache)), None)
+        cls._cache[template] = prepared
+        return prepared
+    
+    @property
+    def names(self) -> tuple[str, ...]:
+        """:return: The names of the placeholders, in order."""
+        return tuple(self._names)
+    
+    def is_batchable(self) -> bool:
+        """
+        Checks whether several bindings can be merged into a single query (see `bind_many`). That is the case for
+        templates with a single `object` placeholder, right after `from object`, and without `skip`, `take` or
+        `distinct` (whose results would differ when merged).
+        :return: Whether the template is batchable.
+        """
+        return self._is_batchable
+    
+    def bind(self, *args: _Any, **kwargs: _Any) -> str:
+        """
+        Binds values to the placeholders.
+        :param args: The values, in placeholder order.
+        :param kwargs: The values, per placeholder name.
+        :raise TypeError: If a value does not match the kind of its placeholder, or if values are missing.
+        :return: The query.
+        """
+        if len(args) + len(kwargs) != len(self._names):
+            raise TypeError(f"Expected {len(self._names)} values ({', '.join(self._names)}), got "
+                            f"{len(args) + len(kwargs)}.")
+        if kwargs:
+            try:
+                args += tuple(kwargs[name] for name in self._names[len(args):])
+            except KeyError as error:
+                raise TypeError(f"Missing value for the WAQL placeholder {error}.") from None
+        parts = [self._literals[0]]
+        for formatter, value, literal in zip(self._formatters, args, self._literals[1:]):
+            parts.append(formatter(value))
+            parts.append(literal)
+        return "".join(parts)
+    
+    def _to_args(self, value: _Any) -> tuple[_Any, ...]:
+        """
+        Converts a set of values (as accepted by `bind_many`) to positional values.
+        :param value: A `tuple` (in placeholder order), a `dict` (per placeholder name) or, for templates with a single
+                      placeholder, the value itself.
+        :raise KeyError: If a `dict` is missing a placeholder.
+        :return: The values, in placeholder order.
+        """
+        if isinstance(value, dict):
+            return tuple(value[name] for name in self._names)
+        is_typed_name = isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], EObjectType)
+        if isinstance(value, tuple) and not (is_typed_name and len(self._names) == 1):
+            return value
+        return value,
+    
+    def bind_many(self, values: _Iterable[_Any], chunk_size: int = 1000) -> list[str]:
+        """
+        Binds several sets of values. If the template is batchable (see `is_batchable`), the values are merged into as
+        few queries as possible (e.g. `$ from object "a", "b", "c"`); otherwise, there is one query per set of values.
+        :param values: The sets of values. Each one is a `tuple` (in placeholder order) or a `dict` (per placeholder
+                       name); for templates with a single placeholder, the value itself can be used instead.
+        :param chunk_size: The maximum amount of objects per merged query.
+        :raise TypeError: If a value does not match the kind of its placeholder.
+        :return: The queries.
+        """
+        values = [self._to_args(value) for value in values]
+        chunk_size = max(1, chunk_size)
+        if not self._is_batchable:
+            return [self.bind(*value) for value in values]
+        
+        references = [_format_waql_object(value[0]) for value in values]
+        prefix, suffix = self._literals
+        return [f"{prefix}{', '.join(references[start:start + chunk_size])}{suffix}"
+                for start in range(0, len(references), chunk_size)]
+
+
+_WAQL_TOKEN = _re_compile(r'\s*(?:("(?:[^"\\]|\\.)*")|(/(?:[^/\\]|\\.)*/)|(-?\d+(?:\.\d+)?)(?![\w.])'
+                          r'|(!=|<=|>=|[=<>:,$().])|([A-Za-z_@][\w@]*))')
+"""Matches a single WAQL token: a string, a regular expression, a number, an operator or punctuation, or a word."""
+
+_WAQL_STRING_ESCAPE = _re_compile(r'\\(["\\])')
+"""Matches an escaped quote or backslash in a WAQL string literal. Other backslashes (e.g. in paths) are kept as is."""
+
+_WAQL_BUILT_IN_KEYS = {"id": "id", "name": "name", "type": "type", "path": "path", "notes": "notes",
+                       "parent": "parent", "childrencount": "childrenCount"}
+"""The WAQL accessors that are not properties, and the keys they map to (see `ProjectSnapshot.values`)."""
+
+_WAQL_OPERATORS = frozenset(operator.value for operator in EWaqlLogicalOperator)
+"""The comparison operators of WAQL (e.g. `=`, or `:`)."""
+
+_WAQL_NUMBER_COMPARISONS = {EWaqlLogicalOperator.LESS_THAN: _lt, EWaqlLogicalOperator.LESS_OR_EQUAL: _le,
+                            EWaqlLogicalOperator.GREATER: _gt, EWaqlLogicalOperator.GREATER_OR_EQUAL: _ge}
+"""The ordering operators of WAQL, as functions (used when comparing numbers)."""
+
+_WAQL_COMPILED_CACHE_SIZE = 1024
+"""The maximum amount of queries kept by `CompiledWaqlQuery.compile`."""
+
+
+def tokenize_waql(waql: str) -> list[str]:
+    """
+    Splits a WAQL query into tokens (e.g. `$ from type Sound where Volume > -3` into `$`, `from`, `type`, `Sound`,
+    `where`, `Volume`, `>` and `-3`).
+    :param waql: The query.
+    :raise ValueError: If the query contains characters that cannot be tokenized.
+    :return: The tokens. Strings keep their quotes, and regular expressions their slashes.
+    """
+    tokens = list[str]()
+    position = 0
+    waql = waql.strip()
+    while position < len(waql):
+        match = _WAQL_TOKEN.match(waql, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid WAQL at position {position}: {waql[position:]!r}")
+        tokens.append(next(group for group in match.groups() if group is not None))
+        position = match.end()
+    return tokens
+
+
+def _parse_waql_literal(token: str) -> _Any:
+    """
+    Converts a WAQL literal token into a value.
+    :param token: The token (e.g. `"Footstep"`, `/^Foot/`, `-6.5`, or `true`).
+    :raise ValueError: If the token is not a literal.
+    :return: The value. Regular expressions are returned as compiled patterns.
+    """
+    if token.startswith('"'):
+        return _WAQL_STRING_ESCAPE.sub(r"\1", token[1:-1])
+    if token.startswith("/"):
+        return _re_compile(token[1:-1], _RE_IGNORECASE)
+    if token in ("true", "false"):
+        return token == "true"
+    if token == "null":
+        return None
+    try:
+        return float(token) if "." in token else int(token)
+    except ValueError:
+        raise ValueError(f"Invalid WAQL literal: '{token}'") from None
+
+
+def _get_waql_value(snapshot: ProjectSnapshot, guid: str, accessor: str) -> _Any:
+    """
+    Gets the value an accessor refers to, for an object of a snapshot.
+    :param snapshot: The snapshot containing the object.
+    :param guid: The GUID of the object.
+    :param accessor: The accessor (e.g. `name`, or a property name such as `Volume`). Not case-sensitive.
+    :return: The value, or `None` if the object has no such value.
+    """
+    record = snapshot.get(guid)
+    key = _WAQL_BUILT_IN_KEYS.get(accessor.lower())
+    if key is not None:
+        return record[key] if key in record else snapshot.values(guid, (key,)).get(key)
+    key = f"@{accessor.lstrip('@')}"
+    if key not in record:  # Properties are not case-sensitive, but usually written with the right case.
+        key = next((name for name in record if name.lower() == key.lower()), None)
+    value = record.get(key)
+    if isinstance(value, dict):  # References get their current name.
+        return snapshot.values(guid, (key,)).get(key)
+    return value
+
+
+def _get_waql_work_unit(snapshot: ProjectSnapshot, guid: str) -> str | None:
+    """
+    Gets the work unit containing an object.
+    :param snapshot: The snapshot containing the object.
+    :param guid: The GUID of the object.
+    :return: The GUID of the work unit (which is the object itself, for work units), or `None` if there is none.
+    """
+    while guid is not None and snapshot.get(guid)["type"].lower() != "workunit":
+        guid = snapshot.parent(guid)
+    return guid
+
+
+def _navigate_waql(snapshot: ProjectSnapshot, guid: str, accessor: str) -> str | None:
+    """
+    Follows a non-final part of a nested accessor (e.g. `parent` in `parent.name`).
+    :param snapshot: The snapshot containing the object.
+    :param guid: The GUID of the object.
+    :param accessor: The part to follow: `parent`, `workunit`, or a reference (e.g. `OutputBus`).
+    :return: The GUID of the object the part refers to, or `None` if there is none.
+    """
+    match accessor.lower():
+        case "parent":
+            return snapshot.parent(guid)
+        case "workunit":
+            return _get_waql_work_unit(snapshot, guid)
+    value = _get_waql_value(snapshot, guid, accessor)
+    return snapshot.find(str(value.get("id"))) if isinstance(value, dict) else None
+
+
+def _compare_waql_values(value: _Any, operator: str, expected: _Any) -> bool:
+    """
+    Evaluates a WAQL comparison. Strings are compared without case sensitivity, and references (`{"id": ...}`) are
+    compared by GUID or by name.
+    :param value: The value of the object.
+    :param operator: The operator (e.g. `=`, `<` or `:`).
+    :param expected: The value in the query.
+    :return: Whether the comparison holds.
+    """
+    if isinstance(value, dict):  # Reference.
+        if operator in (EWaqlLogicalOperator.EQUAL, EWaqlLogicalOperator.NOT_EQUAL) and isinstance(expected, str):
+            matches = expected.upper() == str(value.get("id")).upper() or expected == value.get("name")
+            return matches == (operator == EWaqlLogicalOperator.EQUAL)
+        value = value.get("name")
+    if isinstance(value, str) and isinstance(expected, str):
+        value, expected = value.lower(), expected.lower()
+    match operator:
+        case EWaqlLogicalOperator.EQUAL:
+            return value == expected
+        case EWaqlLogicalOperator.NOT_EQUAL:
+            return value != expected
+        case EWaqlLogicalOperator.CONTAINS if isinstance(expected, _Pattern):
+            return value is not None and expected.search(str(value)) is not None
+        case EWaqlLogicalOperator.CONTAINS:
+            return value is not None and str(expected).lower() in str(value).lower()
+    if value is None or expected is None or isinstance(value, str) != isinstance(expected, str):
+        return False
+    match operator:
+        case EWaqlLogicalOperator.LESS_THAN:
+            return value < expected
+        case EWaqlLogicalOperator.LESS_OR_EQUAL:
+            return value <= expected
+        case EWaqlLogicalOperator.GREATER:
+            return value > expected
+        case EWaqlLogicalOperator.GREATER_OR_EQUAL:
+            return value >= expected
+    raise ValueError(f"Invalid logic operator for WAQL: '{operator}'")
+
+
+class _WaqlParser:
+    """A recursive-descent parser, turning the tokens of a WAQL query into functions (see `CompiledWaqlQuery`)."""
+    
+    def __init__(self, waql: str):
+        """
+        Constructor.
+        :param waql: The query.
+        :raise ValueError: If the query contains characters that cannot be tokenized.
+        """
+        self._tokens = tokenize_waql(waql)
+        self._position = 1 if self._tokens and self._tokens[0] == "$" else 0
+    
+    def peek(self) -> str | None:
+        """:return: The next token, or `None` at the end of the query."""
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+    
+    def next(self) -> str:
+        """
+        Consumes the next token.
+        :raise ValueError: At the end of the query.
+        :return: The token.
+        """
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of WAQL query.")
+        self._position += 1
+        return token
+    
+    def expect(self, token: str):
+        """
+        Consumes the next token, which must be a specific one.
+        :param token: The expected token.
+        :raise ValueError: If the next token is another one.
+        """
+        if (actual := self.next()) != token:
+            raise ValueError(f"Expected '{token}' in WAQL query, got '{actual}'.")
+    
+    def items(self) -> list[str]:
+        """:return: The next tokens, as a comma-separated list."""
+        items = [self.next()]
+        while self.peek() == ",":
+            self._position += 1
+            items.append(self.next())
+        return items
+    
+    def source(self) -> _Callable[[ProjectSnapshot], list[str]]:
+        """
+        Parses the source of the query (e.g. `from type Sound`). A query without a source starts from the whole
+        project.
+        :raise ValueError: If the source is not supported.
+        :return: A function getting the GUIDs of the source objects of a snapshot.
+        """
+        if self.peek() is not None and self.peek().startswith('"'):
+            return self._objects_source([_parse_waql_literal(token) for token in self.items()])
+        if self.peek() != "from":
+            return lambda snapshot: list(snapshot)
+        self._position += 1
+        match self.next():
+            case "type":
+                type_names = self.items()
+                return lambda snapshot: [guid for type_name in type_names for guid in snapshot.of_type(type_name)]
+            case "object":
+                return self._objects_source([_parse_waql_literal(token) for token in self.items()])
+            case "project":
+                return lambda snapshot: list(snapshot)
+            case "search":
+                text = str(_parse_waql_literal(self.next())).lower()
+                return lambda snapshot: [guid for guid in snapshot if text in snapshot.get(guid)["name"].lower()]
+            case source:
+                raise ValueError(f"Unsupported WAQL source: '{source}'")
+    
+    @staticmethod
+    def _objects_source(references: list[str]) -> _Callable[[ProjectSnapshot], list[str]]:
+        """
+        Makes the source of `from object`.
+        :param references: The GUIDs, paths or typed names of the objects.
+        :return: A function getting the GUIDs of the objects of a snapshot. Unknown objects are omitted.
+        """
+        return lambda snapshot: [guid for reference in references if (guid := snapshot.find(reference)) is not None]
+    
+    def stage(self) -> _Callable[[ProjectSnapshot, list[str]], list[str]]:
+        """
+        Parses a stage of the query (e.g. `where ...`, `select ...`, or `take 10`).
+        :raise ValueError: If the stage is invalid or not supported.
+        :return: A function filtering or transforming GUIDs.
+        """
+        match self.next():
+            case "where":
+                predicate = self.disjunction()
+                return lambda snapshot, guids: [guid for guid in guids if predicate(snapshot, guid)]
+            case "select":
+                return self._select(self.items())
+            case "skip":
+                count = int(self.next())
+                return lambda snapshot, guids: guids[count:]
+            case "take":
+                count = int(self.next())
+                return lambda snapshot, guids: guids[:count]
+            case "distinct":
+                return lambda snapshot, guids: list(dict.fromkeys(guids))
+            case keyword:
+                raise ValueError(f"Unsupported WAQL keyword: '{keyword}'")
+    
+    @staticmethod
+    def _select(expressions: list[str]) -> _Callable[[ProjectSnapshot, list[str]], list[str]]:
+        """
+        Makes a `select` stage.
+        :param expressions: The select expressions (e.g. `children`).
+        :raise ValueError: If an expression is not supported.
+        :return: A function getting the selected objects of GUIDs.
+        """
+        supported = (EWaqlSelectExpression.THIS, EWaqlSelectExpression.CHILDREN, EWaqlSelectExpression.DESCENDANTS,
+                     EWaqlSelectExpression.PARENT, EWaqlSelectExpression.ANCESTORS,
+                     EWaqlSelectExpression.REFERENCES_TO, EWaqlSelectExpression.WORK_UNIT)
+        for expression in expressions:
+            if expression not in supported:
+                raise ValueError(f"Unsupported WAQL select expression: '{expression}'")
+        
+        def select(snapshot: ProjectSnapshot, guids: list[str]) -> list[str]:
+            selected = list[str]()
+            for expression in expressions:
+                if expression == EWaqlSelectExpression.REFERENCES_TO:
+                    selected.extend(referrer for guid in guids for referrer in snapshot.referrers(guid))
+                    continue
+                for guid in guids:
+                    match expression:
+                        case EWaqlSelectExpression.THIS:
+                            selected.append(guid)
+                        case EWaqlSelectExpression.CHILDREN:
+                            selected.extend(snapshot.children(guid))
+                        case EWaqlSelectExpression.DESCENDANTS:
+                            selected.extend(snapshot.descendants(guid))
+                        case EWaqlSelectExpression.PARENT:
+                            selected.extend(parent for parent in (snapshot.parent(guid),) if parent is not None)
+                        case EWaqlSelectExpression.ANCESTORS:
+                            ancestor = snapshot.parent(guid)
+                            while ancestor is not None:
+                                selected.append(ancestor)
+                                ancestor = snapshot.parent(ancestor)
+                        case EWaqlSelectExpression.WORK_UNIT:
+                            selected.extend(unit for unit in (_get_waql_work_unit(snapshot, guid),) if unit is not None)
+            return selected
+        
+        return select
+    
+    def disjunction(self) -> _Callable[[ProjectSnapshot, str], bool]:
+        """:return: A predicate for conditions combined with `or`."""
+        predicates = [self.conjunction()]
+        while self.peek() == "or":
+            self._position += 1
+            predicates.append(self.conjunction())
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda snapshot, guid: any(predicate(snapshot, guid) for predicate in predicates)
+    
+    def conjunction(self) -> _Callable[[ProjectSnapshot, str], bool]:
+        """:return: A predicate for conditions combined with `and` (which takes precedence over `or`)."""
+        predicates = [self.condition()]
+        while self.peek() == "and":
+            self._position += 1
+            predicates.append(self.condition())
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda snapshot, guid: all(predicate(snapshot, guid) for predicate in predicates)
+    
+    def condition(self) -> _Callable[[ProjectSnapshot, str], bool]:
+        """
+        Parses a single condition: a negation (`not ...`), a bracketed disjunction, a comparison (e.g. `Volume < -6`),
+        or an accessor alone (true if its value is truthy).
+        :return: A predicate for the condition.
+        """
+        if self.peek() == "not":
+            self._position += 1
+            predicate = self.condition()
+            return lambda snapshot, guid: not predicate(snapshot, guid)
+        if self.peek() == "(":
+            self._position += 1
+            predicate = self.disjunction()
+            self.expect(")")
+            return predicate
+        
+        accessor = self.accessor()
+        if self.peek() not in _WAQL_OPERATORS:
+            return lambda snapshot, guid: bool(accessor(snapshot, guid))
+        operator = EWaqlLogicalOperator(self.next())
+        expected = _parse_waql_literal(self.next())
+        compare = _WAQL_NUMBER_COMPARISONS.get(operator)
+        if compare is not None and isinstance(expected, (int, float)) and not isinstance(expected, bool):
+            def compare_numbers(snapshot: ProjectSnapshot, guid: str) -> bool:  # Skips the generic comparison.
+                value = accessor(snapshot, guid)
+                return isinstance(value, (int, float)) and compare(value, expected)
+            
+            return compare_numbers
+        return lambda snapshot, guid: _compare_waql_values(accessor(snapshot, guid), operator, expected)
+    
+    def accessor(self) -> _Callable[[ProjectSnapshot, str], _Any]:
+        """
+        Parses an accessor, which may be nested (e.g. `Volume`, `parent.name`, or `OutputBus.parent.name`).
+        :return: A function getting the value of the accessor, for an object of a snapshot.
+        """
+        parts = [self.next()]
+        while self.peek() == ".":
+            self._position += 1
+            parts.append(self.next())
+        *navigation, last = parts
+        if not navigation:
+            return lambda snapshot, guid: _get_waql_value(snapshot, guid, last)
+        
+        def get(snapshot: ProjectSnapshot, guid: str) -> _Any:
+            for part in navigation:
+                guid = _navigate_waql(snapshot, guid, part)
+                if guid is None:
+                    return None
+            return _get_waql_value(snapshot, guid, last)
+        
+        return get
+
+
+class CompiledWaqlQuery:
+    """
+    A WAQL query, parsed once and run many times against project snapshots (see `ProjectSnapshot`), without Wwise.
+    Only a subset of WAQL is supported:\n
+    - Sources: `from type`, `from object` (GUIDs, paths or typed names), `from project` and `from search`. A query
+    without a source starts from the whole project.
+    - `where` with `=`, `!=`, `<`, `<=`, `>`, `>=` and `:` (contains, or regular expression), combined with `and`, `or`
+    and `not`, and grouped with brackets. Accessors can be nested (e.g. `parent.name`, or `OutputBus.name`).
+    - `select children`, `descendants`, `parent`, `ancestors`, `referencesTo`, `workunit` and `this`.
+    - `skip`, `take` and `distinct`.
+    Example: `CompiledWaqlQuery.compile('$ from type Sound where not (Volume > -6 or parent.name : "Loop")')`.
+    """
+    
+    _cache = dict[str, "CompiledWaqlQuery"]()
+    """The compiled queries, per query (see `compile`)."""
+    
+    def __init__(self, waql: WaqlQuery | str):
+        """
+        Constructor. Parses the query. Prefer `compile`, which reuses already-parsed queries.
+        :param waql: The query.
+        :raise ValueError: If the query is invalid or uses unsupported WAQL.
+        """
+        self._waql = str(waql)
+        parser = _WaqlParser(self._waql)
+        self._source = parser.source()
+        self._stages = list[_Callable[[ProjectSnapshot, list[str]], list[str]]]()
+        while parser.peek() is not None:
+            self._stages.append(parser.stage())
+    
+    def __str__(self) -> str:
+        """:return: The query."""
+        return self._waql
+    
+    def __repr__(self) -> str:
+        """:return: The query, as a `CompiledWaqlQuery` expression."""
+        return f"CompiledWaqlQuery({self._waql!r})"
+    
+    @classmethod
+    def compile(cls, waql: WaqlQuery | str) -> _Self:
+        """
+        Gets the compiled form of a query, parsing it only the first time. Only the most recently used queries are
+        kept.
+        :param waql: The query.
+        :raise ValueError: If the query is invalid or uses unsupported WAQL.
+        :return: The compiled query.
+        """
+        waql = str(waql)
+        compiled = cls._cache.pop(waql, None)
+        if compiled is None:
+            compiled = cls(waql)
+            if len(cls._cache) >= _WAQL_COMPILED_CACHE_SIZE:
+                cls._cache.pop(next(iter(cls._cache)), None)
+        cls._cache[waql] = compiled
+        return compiled
+    
+    def evaluate(self, snapshot: ProjectSnapshot) -> list[str]:
+        """
+        Runs the query against a project snapshot.
+        :param snapshot: The snapshot to run the query against.
+        :return: The GUIDs of the resulting objects, in order.
+        """
+        guids = self._source(snapshot)
+        for stage in self._stages:
+            guids = stage(snapshot, guids)
+        return guids
+
+
+def evaluate_waql(waql: WaqlQuery | str, snapshot: ProjectSnapshot) -> list[str]:
+    """
+    Runs a WAQL query against a project snapshot, without Wwise (see `CompiledWaqlQuery` for the supported subset).
+    :param waql: The query.
+    :param snapshot: The snapshot to run the query against.
+    :raise ValueError: If the query is invalid or uses unsupported WAQL.
+    :return: The GUIDs of the resulting objects, in order.
+    """
+    return CompiledWaqlQuery.compile(waql).evaluate(snapshot)
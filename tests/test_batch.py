@@ -0,0 +1,91 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import GUID, new_waapi_connection, Sound
+from pywwise.snapshot import new_guid
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+
+
+class WriteBatchTest(TestCase):
+    """Tests that a `WriteBatch` merges the values it queues, and undoes them all if any of them cannot be set."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project).start()
+        cls.ak = new_waapi_connection(cls.server.url)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.ak.disconnect()
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def setUp(self):
+        super().setUp()
+        self.ak.enable_call_stats()
+        self.ak.reset_call_stats()
+    
+    def tearDown(self):
+        self.ak.disable_call_stats()
+        super().tearDown()
+    
+    def get_counts(self) -> dict[str, int]:
+        """:return: The amount of calls made since the test started, per URI."""
+        return {uri: stats.count for uri, stats in self.ak.get_call_stats().items()}
+    
+    def test_flush_merges_values_in_one_undo_group(self):
+        sounds = [Sound(GUID(guid), self.ak) for guid in self.project.of_type("Sound")[:3]]
+        with self.ak.batch("Mix") as batch:
+            for index, sound in enumerate(sounds):
+                sound.volume = -1.0 - index
+                sound.pitch = 100 + index
+            self.assertEqual(len(batch), 6)
+            self.assertNotIn("ak.wwise.core.object.set", self.get_counts())
+        
+        counts = self.get_counts()
+        self.assertEqual(counts["ak.wwise.core.object.set"], 1)
+        self.assertEqual(counts["ak.wwise.core.undo.beginGroup"], 1)
+        self.assertEqual(counts["ak.wwise.core.undo.endGroup"], 1)
+        self.assertNotIn("ak.wwise.core.undo.cancelGroup", counts)
+        for index, sound in enumerate(sounds):
+            self.assertEqual(self.project.values(sound.guid, ("@Volume", "@Pitch")),
+                             {"@Volume": -1.0 - index, "@Pitch": 100 + index})
+    
+    def test_max_objects_per_call(self):
+        sounds = [Sound(GUID(guid), self.ak) for guid in self.project.of_type("Sound")[3:8]]
+        with self.ak.batch(max_objects_per_call=2):
+            for sound in sounds:
+                sound.volume = -4.0
+        self.assertEqual(self.get_counts()["ak.wwise.core.object.set"], 3)
+    
+    def test_failed_set_cancels_the_undo_group(self):
+        sound = Sound(GUID(self.project.of_type("Sound")[8]), self.ak)
+        missing = Sound(GUID(new_guid()), self.ak)
+        with self.assertRaises(RuntimeError):
+            with self.ak.batch():
+                sound.volume = -5.0
+                missing.volume = -5.0
+        
+        counts = self.get_counts()
+        self.assertEqual(counts["ak.wwise.core.undo.cancelGroup"], 1)
+        self.assertNotIn("ak.wwise.core.undo.endGroup", counts)
+        self.assertIsNone(self.ak.active_batch)
+    
+    def test_exception_discards_queued_values(self):
+        sound = Sound(GUID(self.project.of_type("Sound")[9]), self.ak)
+        with self.assertRaises(KeyError):
+            with self.ak.batch():
+                sound.volume = -6.0
+                raise KeyError("Stop.")
+        
+        counts = self.get_counts()
+        self.assertNotIn("ak.wwise.core.object.set", counts)
+        self.assertEqual(counts["ak.wwise.core.undo.cancelGroup"], 1)
+
+
+if __name__ == "__main__":
+    main()
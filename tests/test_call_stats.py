@@ -0,0 +1,81 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import new_waapi_connection, WaapiCallRecord
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+
+
+class CallStatsTest(TestCase):
+    """Tests that call statistics count every call made through a connection, and only while enabled."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project, latency=0.02).start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def setUp(self):
+        super().setUp()
+        self.ak = new_waapi_connection(self.server.url)
+    
+    def tearDown(self):
+        self.ak.disconnect()
+        super().tearDown()
+    
+    def test_counts(self):
+        records = list[WaapiCallRecord]()
+        self.assertNotIn("call", vars(self.ak.client))  # Disabled connections are not instrumented at all.
+        self.ak.wwise.core.get_info()
+        self.assertEqual(self.ak.get_call_stats(), {})
+        
+        self.ak.enable_call_stats(records.append)
+        for _ in range(5):
+            self.ak.wwise.core.get_info()
+        for guid in self.project.of_type("Sound")[:3]:
+            self.ak.wwise.core.object.get(f'$ from object "{guid}"')
+        self.assertIsNone(self.ak.client.call("ak.wwise.unknown"))
+        
+        stats = self.ak.get_call_stats()
+        self.assertEqual({uri: stat.count for uri, stat in stats.items()},
+                         {"ak.wwise.core.getInfo": 5, "ak.wwise.core.object.get": 3, "ak.wwise.unknown": 1})
+        self.assertEqual({uri: stat.error_count for uri, stat in stats.items()},
+                         {"ak.wwise.core.getInfo": 0, "ak.wwise.core.object.get": 0, "ak.wwise.unknown": 1})
+        self.assertEqual(len(records), 9)
+        
+        get_info = stats["ak.wwise.core.getInfo"]
+        self.assertEqual(sum(get_info.latency_histogram.values()), 5)
+        self.assertGreaterEqual(get_info.min_latency, 0.02)
+        self.assertLessEqual(get_info.min_latency, get_info.mean_latency)
+        self.assertLessEqual(get_info.mean_latency, get_info.max_latency)
+        self.assertLessEqual(get_info.percentile(95), get_info.max_latency)
+        self.assertGreater(get_info.request_bytes, 0)
+        self.assertEqual(get_info.response_bytes, sum(record.response_size for record in records
+                                                      if record.uri == "ak.wwise.core.getInfo"))
+        self.assertEqual(stats["ak.wwise.unknown"].response_bytes, 0)
+        
+        self.ak.disable_call_stats()
+        self.assertNotIn("call", vars(self.ak.client))
+        self.ak.wwise.core.get_info()
+        self.assertEqual(self.ak.get_call_stats()["ak.wwise.core.getInfo"].count, 5)
+        self.assertEqual(len(records), 9)
+        
+        self.ak.reset_call_stats()
+        self.assertEqual(self.ak.get_call_stats(), {})
+    
+    def test_stats_are_copies(self):
+        self.ak.enable_call_stats()
+        self.ak.wwise.core.get_info()
+        stats = self.ak.get_call_stats()
+        stats["ak.wwise.core.getInfo"].count = 100
+        self.assertEqual(self.ak.get_call_stats()["ak.wwise.core.getInfo"].count, 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from asyncio import gather, get_event_loop_policy, run, sleep
+from threading import Thread
+from time import perf_counter
+from unittest import TestCase, main
+
+from pywwise import (EDispatchStrategy, GUID, WwiseConnectionPool, new_async_waapi_connection,
+                     new_waapi_connection)
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+
+
+class AsyncConnectionTest(TestCase):
+    """Tests that an asynchronous connection keeps many calls in flight at once, on the caller's event loop."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project, latency=0.05).start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def test_raw_calls_are_concurrent(self):
+        async def call_all() -> tuple[list, float]:
+            async with await new_async_waapi_connection(self.server.url) as ak:
+                start = perf_counter()
+                results = await gather(*[ak.client.call("ak.wwise.core.getInfo") for _ in range(200)])
+                return results, perf_counter() - start
+        
+        results, duration = run(call_all())
+        self.assertEqual(len(results), 200)
+        self.assertTrue(all(result for result in results))
+        self.assertLess(duration, 2.0)  # Sequential calls would take 10 seconds.
+    
+    def test_wrapper_calls_and_events(self):
+        guid = self.project.of_type("Sound")[0]
+        
+        async def rename() -> list[str]:
+            names = list[str]()
+            async with await new_async_waapi_connection(self.server.url) as ak:
+                ak.wwise.core.object.name_changed.add(lambda obj, old_name: names.append(obj.name))
+                await sleep(0.2)  # The subscription is scheduled.
+                infos = await gather(*[ak.wwise.core.get_info() for _ in range(10)])
+                self.assertTrue(all(info is not None for info in infos))
+                await ak.wwise.core.object.set_name(GUID(guid), "RenamedAsync")
+                for _ in range(100):
+                    if names:
+                        break
+                    await sleep(0.01)
+            return names
+        
+        self.assertEqual(run(rename()), ["RenamedAsync"])
+
+
+class PipelinedConnectionTest(TestCase):
+    """Tests that a pipelined connection keeps the calls of several threads (or futures) in flight at once."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project, latency=0.05).start()
+        cls.ak = new_waapi_connection(cls.server.url, pipelined=True)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.ak.disconnect()
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def test_raw_futures(self):
+        start = perf_counter()
+        futures = [self.ak.client.call_async("ak.wwise.core.getInfo") for _ in range(100)]
+        self.assertTrue(all(future.result(5.0) for future in futures))
+        self.assertLess(perf_counter() - start, 2.0)  # Sequential calls would take 5 seconds.
+    
+    def test_wrapper_futures(self):
+        sounds = self.project.of_type("Sound")
+        start = perf_counter()
+        futures = [self.ak.futures.wwise.core.object.get(f'$ from object "{guid}"') for guid in sounds]
+        results = [future.result(5.0) for future in futures]
+        self.assertLess(perf_counter() - start, 0.5)  # Sequential calls would take 1 second.
+        self.assertEqual([result[0].guid.upper() for result in results], list(sounds))
+    
+    def test_calls_from_several_threads(self):
+        results = list[bool]()
+        threads = [Thread(target=lambda: results.append(self.ak.wwise.core.get_info() is not None)) for _ in range(20)]
+        start = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5.0)
+        self.assertLess(perf_counter() - start, 0.5)  # Sequential calls would take 1 second.
+        self.assertEqual(results, [True] * 20)
+
+
+class ConnectionPoolTest(TestCase):
+    """Tests that a connection pool spreads calls over its connections, and returns results in order."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project, latency=0.05).start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def test_map(self):
+        sounds = self.project.of_type("Sound")
+        used = set[int]()
+        
+        def get(ak, guid):
+            used.add(id(ak))
+            return ak.wwise.core.object.get(f'$ from object "{guid}"')[0].guid.upper()
+        
+        for strategy in EDispatchStrategy:
+            with self.subTest(strategy=strategy), WwiseConnectionPool(4, self.server.url, strategy=strategy) as pool:
+                used.clear()
+                start = perf_counter()
+                self.assertEqual(pool.map(get, sounds, 5.0), list(sounds))
+                self.assertLess(perf_counter() - start, 0.6)  # A single connection would take 1 second.
+                self.assertEqual(used, {id(ak) for ak in pool.connections})
+    
+    def test_map_raises_exceptions(self):
+        def get(ak, index):
+            if index == 3:
+                raise ValueError(index)
+            return ak.wwise.core.get_info() is not None
+        
+        with WwiseConnectionPool(2, self.server.url) as pool:
+            self.assertEqual(pool.map(get, range(3), 5.0), [True] * 3)
+            with self.assertRaises(ValueError):
+                pool.map(get, range(5), 5.0)
+
+
+class SequentialConnectionTest(TestCase):
+    """Tests that synchronous connections leave the event loop of the calling thread alone."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = FakeWaapiServer(new_synthetic_project(5)).start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def test_connect_from_a_thread_without_a_loop(self):
+        results = list[object]()
+        
+        def connect():
+            ak = new_waapi_connection(self.server.url)
+            results.append(ak.wwise.core.get_info() is not None)
+            ak.disconnect()
+            try:
+                get_event_loop_policy().get_event_loop()
+            except RuntimeError:  # No loop was set on this thread.
+                results.append(None)
+        
+        thread = Thread(target=connect)
+        thread.start()
+        thread.join(10.0)
+        self.assertEqual(results, [True, None])
+    
+    def test_connect_from_a_running_loop(self):
+        async def connect() -> bool:
+            ak = new_waapi_connection(self.server.url)  # Blocks the loop, but does not take it over.
+            try:
+                return ak.wwise.core.get_info() is not None
+            finally:
+                ak.disconnect()
+        
+        self.assertTrue(run(connect()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from enum import Enum
+from unittest import TestCase, main
+
+from pywwise import ELogSeverity, EObjectType, EWaqlLogicalOperator
+from pywwise.statics import EnumStatics
+
+
+class _EPlain(Enum):
+    """A plain enum, whose members only equal themselves."""
+    FIRST = 1
+    SECOND = 2
+
+
+class _EUnhashable(tuple, Enum):
+    """An enum whose values contain lists, so they cannot be indexed."""
+    FIRST = 1, [1]
+    SECOND = 2, [2]
+
+
+class EnumLookupTest(TestCase):
+    """Tests the lookup of enum members by value, type name, plugin ID and class ID."""
+    
+    def test_from_value(self):
+        self.assertIs(EnumStatics.from_value(EWaqlLogicalOperator, ">="), EWaqlLogicalOperator.GREATER_OR_EQUAL)
+        self.assertIs(EnumStatics.from_value(EObjectType, (5, 327696, "Action")), EObjectType.ACTION)
+        self.assertIs(EnumStatics.from_value(ELogSeverity, ELogSeverity.ERROR), ELogSeverity.ERROR)
+        self.assertIs(EnumStatics.from_value(_EUnhashable, (2, [2])), _EUnhashable.SECOND)
+        with self.assertRaises(ValueError):
+            EnumStatics.from_value(EWaqlLogicalOperator, "=~")
+    
+    def test_from_value_of_plain_enums(self):
+        self.assertIs(EnumStatics.from_value(_EPlain, _EPlain.SECOND), _EPlain.SECOND)
+        with self.assertRaises(ValueError):
+            EnumStatics.from_value(_EPlain, 2)
+    
+    def test_object_types(self):
+        for etype in EObjectType:
+            with self.subTest(etype=etype):
+                self.assertIs(EObjectType.from_type_name(etype.get_type_name()), etype)
+                self.assertIs(EObjectType.from_type_name(etype.get_type_name().lower()), etype)
+                self.assertEqual(EObjectType.from_class_id(etype.get_class_id()).get_class_id(), etype.get_class_id())
+                self.assertEqual(EObjectType.from_plugin_id(etype.get_plugin_id()).get_plugin_id(),
+                                 etype.get_plugin_id())
+
+
+if __name__ == "__main__":
+    main()
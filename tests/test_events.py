@@ -0,0 +1,108 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import GUID, new_waapi_connection
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from testclass import wait_until
+
+
+class TopicEventTest(TestCase):
+    """Tests that a `TopicEvent` only subscribes to its topic while it has subscribers."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project).start()
+        cls.other = new_waapi_connection(cls.server.url)  # Makes changes that trigger the topics.
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.other.disconnect()
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def setUp(self):
+        super().setUp()
+        self.ak = new_waapi_connection(self.server.url)
+    
+    def tearDown(self):
+        self.ak.disconnect()
+        super().tearDown()
+    
+    def subscriptions(self, topic: str) -> list[dict]:
+        """Returns the options of each subscription to a topic, across all sessions of the fake server."""
+        return [options for session in tuple(self.server._sessions)
+                for subscribed_topic, options in tuple(session.subscriptions.values()) if subscribed_topic == topic]
+    
+    def test_subscribes_with_the_first_subscriber_only(self):
+        event = self.ak.wwise.core.object.name_changed
+        guid = GUID(self.project.of_type("Sound")[0])
+        first, second = list[str](), list[str]()
+        
+        def on_first(obj, old_name):
+            first.append(obj.name)
+        
+        def on_second(obj, old_name):
+            second.append(obj.name)
+        
+        self.assertFalse(event.is_subscribed())
+        self.assertEqual(self.subscriptions(event.topic), [])
+        
+        event.add(on_first)
+        event.add(on_second)
+        self.assertTrue(event.is_subscribed())
+        self.assertEqual(len(self.subscriptions(event.topic)), 1)
+        
+        self.other.wwise.core.object.set_name(guid, "RenamedOnce")
+        self.assertTrue(wait_until(lambda: first == second == ["RenamedOnce"]))
+        
+        event.remove(on_first)
+        self.assertEqual(len(self.subscriptions(event.topic)), 1)
+        event.remove(on_second)
+        self.assertFalse(event.is_subscribed())
+        self.assertTrue(wait_until(lambda: not self.subscriptions(event.topic)))
+        
+        self.other.wwise.core.object.set_name(guid, "RenamedTwice")
+        self.assertEqual(self.ak.wwise.core.object.get(f'$ from object "{guid}"')[0].name, "RenamedTwice")
+        self.assertEqual(first, ["RenamedOnce"])
+        
+        event.add(on_first)
+        self.assertEqual(len(self.subscriptions(event.topic)), 1)
+        event.clear()
+        self.assertTrue(wait_until(lambda: not self.subscriptions(event.topic)))
+    
+    def test_options_follow_subscribers(self):
+        event = self.ak.wwise.core.object.property_changed
+        guid = GUID(self.project.of_type("Sound")[1])
+        volume = {"object": guid, "property": "Volume"}
+        pitch = {"object": guid, "property": "Pitch"}
+        changes = list[str]()
+        
+        def on_changed(obj, name, new_value, old_value, platform):
+            changes.append(name)
+        
+        event.add_options(volume)
+        self.assertEqual(self.subscriptions(event.topic), [])
+        
+        event.add(on_changed)
+        event.add_options(pitch)
+        self.assertEqual(sorted(options["property"] for options in self.subscriptions(event.topic)),
+                         ["Pitch", "Volume"])
+        
+        self.assertTrue(event.remove_options(volume))
+        self.assertFalse(event.remove_options(volume))
+        self.assertTrue(wait_until(lambda: len(self.subscriptions(event.topic)) == 1))
+        
+        self.other.wwise.core.object.set_property(guid, "Volume", -3.0)
+        self.other.wwise.core.object.set_property(guid, "Pitch", 100.0)
+        self.assertTrue(wait_until(lambda: changes == ["Pitch"]))
+        
+        event.remove(on_changed)
+        self.assertTrue(wait_until(lambda: not self.subscriptions(event.topic)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import EObjectType, GUID, new_waapi_connection
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from pywwise.waapi.live_query import LiveQuery
+from testclass import wait_until
+
+
+class LiveQueryTest(TestCase):
+    """Tests the deltas sent by a `LiveQuery` when the project is changed by another connection."""
+    
+    def setUp(self):
+        super().setUp()
+        self.project = new_synthetic_project(48, 12)
+        self.server = FakeWaapiServer(self.project).start()
+        self.ak = new_waapi_connection(self.server.url)
+        self.other = new_waapi_connection(self.server.url)  # Makes changes that `ak` only learns about from topics.
+        self.deltas = []
+    
+    def tearDown(self):
+        self.other.disconnect()
+        self.ak.disconnect()
+        self.server.stop()
+        super().tearDown()
+    
+    def live_query(self, waql, returns_and_properties=()):
+        """:return: A live query (not started yet), whose deltas are appended to `deltas` as `(kind, name)` pairs."""
+        query = LiveQuery(self.ak.wwise.core.object, waql, returns_and_properties)
+        query.added.add(lambda obj: self.deltas.append(("added", obj.name)))
+        query.removed.add(lambda obj: self.deltas.append(("removed", obj.name)))
+        query.changed.add(lambda old, new: self.deltas.append(("changed", new.name)))
+        return query
+    
+    def expected_guids(self, waql):
+        """:return: The GUIDs of the objects of the project matching a query."""
+        return {info.guid.upper() for info in self.other.wwise.core.object.get(waql)}
+    
+    def test_property_deltas(self):
+        waql = "$ from type Sound where Volume < -20"
+        sounds = self.project.of_type("Sound")
+        with self.live_query(waql, ("@Volume",)) as query:
+            self.assertTrue(query.is_incremental())
+            self.assertEqual(len(self.deltas), 6)
+            self.deltas.clear()
+            
+            self.other.wwise.core.object.set_property(GUID(sounds[21]), "Volume", 0.0)
+            self.other.wwise.core.object.set_property(GUID(sounds[0]), "Volume", -30.0)
+            self.other.wwise.core.object.set_property(GUID(sounds[22]), "Volume", -40.0)
+            self.other.wwise.core.object.set_name(GUID(sounds[23]), "Renamed")
+            self.assertTrue(wait_until(lambda: len(self.deltas) == 4))
+            self.assertEqual(self.deltas, [("removed", "Sound_000021"), ("added", "Sound_000000"),
+                                           ("changed", "Sound_000022"), ("changed", "Renamed")])
+            self.assertEqual({info.guid.upper() for info in query}, self.expected_guids(waql))
+    
+    def test_notes_deltas(self):
+        waql = '$ from type Sound where notes : "todo"'
+        sounds = self.project.of_type("Sound")
+        with self.live_query(waql) as query:
+            self.assertEqual(len(query), 0)
+            self.other.wwise.core.object.set_notes(GUID(sounds[3]), "TODO: replace")
+            self.assertTrue(wait_until(lambda: self.deltas == [("added", "Sound_000003")]))
+            self.other.wwise.core.object.set_notes(GUID(sounds[3]), "")
+            self.assertTrue(wait_until(lambda: self.deltas[-1:] == [("removed", "Sound_000003")]))
+    
+    def test_full_query_deltas(self):
+        container = self.project.parent(self.project.of_type("Sound")[0])
+        waql = f'$ from object "{container}" select children'
+        with self.live_query(waql) as query:
+            self.assertFalse(query.is_incremental())
+            self.assertEqual(len(query), 12)
+            self.deltas.clear()
+            self.other.wwise.core.object.create("NewSound", EObjectType.SOUND, GUID(container))
+            self.assertTrue(wait_until(lambda: self.deltas == [("added", "NewSound")]))
+            self.assertEqual({info.guid.upper() for info in query}, self.expected_guids(waql))
+
+
+if __name__ == "__main__":
+    main()
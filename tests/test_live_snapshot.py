@@ -0,0 +1,85 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import EObjectType, GUID, new_waapi_connection
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from testclass import wait_until
+
+
+class LiveProjectSnapshotTest(TestCase):
+    """Tests that a `LiveProjectSnapshot` keeps the changes made to the project while it is being loaded."""
+    
+    def setUp(self):
+        super().setUp()
+        self.project = new_synthetic_project(300, 50)
+        self.server = FakeWaapiServer(self.project).start()
+        self.ak = new_waapi_connection(self.server.url)
+        self.other = new_waapi_connection(self.server.url)  # Makes changes while `ak` loads the snapshot.
+    
+    def tearDown(self):
+        self.other.disconnect()
+        self.ak.disconnect()
+        self.server.stop()
+        super().tearDown()
+    
+    def load_snapshot(self, change):
+        """
+        Loads a snapshot of the project, making changes from the other connection once the first chunk is loaded.
+        :param change: Makes the changes, then returns a condition that is true once `ak` received their topics.
+        :return: The snapshot, already started.
+        """
+        obj = self.ak.wwise.core.object
+        get_dicts = obj._get_dicts
+        
+        def get_dicts_then_change(*args, **kwargs):
+            rows = get_dicts(*args, **kwargs)
+            del obj._get_dicts
+            self.assertTrue(wait_until(change()))
+            return rows
+        
+        obj._get_dicts = get_dicts_then_change
+        return obj.snapshot(("@Volume",), chunk_size=100)
+    
+    def assert_in_sync(self, snapshot):
+        """Asserts that a snapshot has the same objects, paths and parents as the project."""
+        with snapshot.lock:
+            self.assertEqual(set(snapshot), set(self.project))
+            for guid in self.project:
+                self.assertEqual(snapshot.get(guid)["path"], self.project.get(guid)["path"])
+                self.assertEqual(snapshot.parent(guid), self.project.parent(guid))
+    
+    def test_post_deleted_during_load(self):
+        sounds = self.project.of_type("Sound")
+        deleted = []
+        
+        def change():
+            self.ak.wwise.core.object.post_deleted.add(lambda obj: deleted.append(obj.guid.upper()))
+            self.other.wwise.core.object.delete(GUID(self.project.parent(sounds[0])))  # In the first chunk.
+            self.other.wwise.core.object.delete(GUID(sounds[250]))  # In a later chunk.
+            return lambda: sounds[250] in deleted
+        
+        with self.load_snapshot(change) as snapshot:
+            self.assertNotIn(sounds[0], snapshot)
+            self.assertNotIn(sounds[250], snapshot)
+            self.assert_in_sync(snapshot)
+    
+    def test_child_added_during_load(self):
+        sounds = self.project.of_type("Sound")
+        added = []
+        
+        def change():
+            self.ak.wwise.core.object.child_added.add(lambda child, parent: added.append(child.name))
+            self.other.wwise.core.object.move(GUID(sounds[0]), GUID(self.project.parent(sounds[280])))  # Loaded.
+            self.other.wwise.core.object.create("NewSound", EObjectType.SOUND, GUID(self.project.parent(sounds[1])))
+            return lambda: "NewSound" in added
+        
+        with self.load_snapshot(change) as snapshot:
+            self.assertEqual(snapshot.parent(sounds[0]), self.project.parent(sounds[280]))
+            self.assertIsNotNone(snapshot.find(f"{self.project.get(self.project.parent(sounds[1]))['path']}\\NewSound"))
+            self.assert_in_sync(snapshot)
+
+
+if __name__ == "__main__":
+    main()
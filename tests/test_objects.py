@@ -0,0 +1,209 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from gc import collect
+from threading import Barrier, Thread
+from unittest import TestCase, main
+from weakref import ref
+
+from pywwise import Bus, EReturnOptions, GUID, new_waapi_connection, Sound
+from pywwise.objects.abc import WwiseObject
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from testclass import wait_until
+
+
+class FetchedValuesTest(TestCase):
+    """Tests that values fetched by a shared `WwiseObject` instance are discarded once they change in Wwise."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project).start()
+        cls.ak = new_waapi_connection(cls.server.url)
+        cls.other = new_waapi_connection(cls.server.url)  # Makes changes that `ak` only learns about from topics.
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.other.disconnect()
+        cls.ak.disconnect()
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def test_two_holders_see_a_rename(self):
+        guid = GUID(self.project.of_type("Sound")[0])
+        first = Sound(guid, self.ak)
+        second = Sound(GUID(guid.lower()), self.ak)
+        self.assertIs(first, second)
+        
+        first.fetch("Volume")
+        self.assertEqual(second.name, self.project.values(guid, ("name",))["name"])
+        
+        self.other.wwise.core.object.set_name(guid, "RenamedByOther")
+        self.assertTrue(wait_until(lambda: second.name == "RenamedByOther"))
+        self.assertEqual(first.name, "RenamedByOther")
+        self.assertTrue(second.path.endswith("\\RenamedByOther"))
+    
+    def test_fetched_property_changed_elsewhere(self):
+        guid = GUID(self.project.of_type("Sound")[1])
+        sound = Sound(guid, self.ak)
+        sound.fetch("Volume")
+        
+        self.other.wwise.core.object.set_property(guid, "Volume", -7.5)
+        self.assertTrue(wait_until(lambda: Sound(guid, self.ak).volume == -7.5))
+    
+    def test_fetch_subscribes_once(self):
+        ak = new_waapi_connection(self.server.url)
+        try:
+            Sound(GUID(self.project.of_type("Sound")[3]), ak).fetch()
+            Sound(GUID(self.project.of_type("Sound")[4]), ak).fetch("Volume", "Pitch")
+            self.assertEqual(len(ak.wwise.core.object.property_changed._handlers), 1)
+        finally:
+            ak.disconnect()
+    
+    def test_objects_are_slotted(self):
+        sound = Sound(GUID(self.project.of_type("Sound")[5]), self.ak)
+        sound.fetch("Volume")
+        self.assertFalse(hasattr(sound, "__dict__"))
+        self.assertFalse(hasattr(self.ak.wwise.core.object.get(sound._query)[0], "__dict__"))
+        
+        classes = list(WwiseObject.__subclasses__())
+        for cls in classes:
+            classes.extend(cls.__subclasses__())
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(cls.__dictoffset__, 0, f"{cls.__name__} does not declare `__slots__`.")
+    
+    def test_prefetch_keeps_earlier_values_only(self):
+        guid = GUID(self.project.of_type("Sound")[2])
+        sound = Sound(guid, self.ak)
+        sound.fetch("Volume")
+        with sound.prefetch("Pitch"):
+            self.assertIn("Pitch", sound._fetched)
+        self.assertIn("Volume", sound._fetched)
+        self.assertNotIn("Pitch", sound._fetched)
+
+
+class PropertyCacheTest(TestCase):
+    """Tests that the values cached by `PropertyCache` are discarded once they change in Wwise."""
+    
+    def setUp(self):
+        super().setUp()
+        self.project = new_synthetic_project(40, 10)
+        self.server = FakeWaapiServer(self.project).start()
+        self.ak = new_waapi_connection(self.server.url)
+        self.other = new_waapi_connection(self.server.url)  # Makes changes that `ak` only learns about from topics.
+        self.ak.enable_property_cache()
+    
+    def tearDown(self):
+        self.other.disconnect()
+        self.ak.disconnect()
+        self.server.stop()
+        super().tearDown()
+    
+    def test_reads_are_cached(self):
+        sound = Sound(GUID(self.project.of_type("Sound")[0]), self.ak)
+        self.assertEqual(sound.volume, sound.volume)
+        self.assertEqual((self.ak.property_cache.hits, self.ak.property_cache.misses), (1, 1))
+    
+    def test_moving_an_ancestor_discards_the_subtree(self):
+        sounds = self.project.of_type("Sound")
+        cached = [Sound(GUID(guid), self.ak) for guid in sounds[:2]]
+        for sound in cached:
+            self.assertIsNotNone(sound.volume)
+        self.assertEqual(len(self.ak.property_cache), 2)
+        
+        container = self.project.parent(sounds[0])
+        self.other.wwise.core.object.move(GUID(container), GUID(self.project.parent(self.project.parent(container))))
+        self.assertTrue(wait_until(lambda: len(self.ak.property_cache) == 0))
+
+
+class ColumnsTest(TestCase):
+    """Tests that `get_columns` returns the same values as the project, one column per return option or property."""
+    
+    def test_get_columns(self):
+        project = new_synthetic_project(30)
+        with FakeWaapiServer(project) as server:
+            ak = new_waapi_connection(server.url)
+            try:
+                ak.enable_call_stats()
+                columns = ak.wwise.core.object.get_columns("$ from type Sound", ("@Volume", "@IsStreamingEnabled",
+                                                                                 "@OutputBus"))
+                self.assertEqual(ak.get_call_stats()["ak.wwise.core.object.get"].count, 1)
+            finally:
+                ak.disconnect()
+        
+        sounds = project.of_type("Sound")
+        self.assertEqual(len(columns), len(sounds))
+        self.assertEqual(columns.guids, list(sounds))
+        self.assertEqual(columns[EReturnOptions.NAME], [project.get(guid)["name"] for guid in sounds])
+        self.assertEqual(columns["@Volume"].typecode, "d")
+        self.assertEqual(columns["@IsStreamingEnabled"].typecode, "b")
+        for key in ("@Volume", "@IsStreamingEnabled", "@OutputBus"):
+            with self.subTest(key=key):
+                self.assertEqual(list(columns[key]), [project.values(guid, (key,))[key] for guid in sounds])
+
+
+class IdentityMapTest(TestCase):
+    """Tests that each connection keeps a single `WwiseObject` instance per class, GUID and platform, while in use."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(20)
+        cls.server = FakeWaapiServer(cls.project).start()
+        cls.ak = new_waapi_connection(cls.server.url)
+        cls.other = new_waapi_connection(cls.server.url)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.other.disconnect()
+        cls.ak.disconnect()
+        cls.server.stop()
+        super().tearDownClass()
+    
+    def test_one_instance_per_key(self):
+        guid = GUID(self.project.of_type("Sound")[0])
+        sound = Sound(guid, self.ak)
+        self.assertIs(Sound(GUID(guid.lower()), self.ak), sound)
+        self.assertIs(Sound(self.ak.wwise.core.object.get(sound._query)[0], self.ak), sound)
+        self.assertIsNot(Sound(guid, self.other), sound)
+        self.assertIsNot(Sound(guid, self.ak, "Windows"), sound)
+        self.assertIs(Sound(guid, self.ak, "Windows"), Sound(guid, self.ak, "Windows"))
+    
+    def test_references_are_shared(self):
+        first, second = (Sound(GUID(guid), self.ak) for guid in self.project.of_type("Sound")[1:3])
+        bus = first.output_bus
+        self.assertIsInstance(bus, Bus)
+        self.assertIs(second.output_bus, bus)
+        self.assertIs(Bus(bus.guid, self.ak), bus)
+    
+    def test_unused_instances_are_freed(self):
+        guid = GUID(self.project.of_type("Sound")[3])
+        sound = Sound(guid, self.ak)
+        sound.fetch("Volume")
+        instance = ref(sound)
+        del sound
+        collect()
+        self.assertIsNone(instance())
+        self.assertIsNone(Sound(guid, self.ak)._fetched)
+    
+    def test_concurrent_creation(self):
+        guid = GUID(self.project.of_type("Sound")[4])
+        barrier = Barrier(8)
+        instances = list[Sound]()
+        
+        def create():
+            barrier.wait()
+            instances.append(Sound(guid, self.ak))
+        
+        threads = [Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5.0)
+        self.assertEqual(len(instances), 8)
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from importlib import import_module
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from unittest import TestCase, main
+
+import pywwise
+from pywwise import _names
+
+
+class PackageTest(TestCase):
+    """Tests the lazy resolution of the public names of the `pywwise` package."""
+    
+    def test_generated_names_are_current(self):
+        source = Path(_names.__file__).read_text()
+        self.assertIn(f"# BEGIN GENERATED NAMES\n{_names.render()}\n# END GENERATED NAMES\n", source,
+                      "pywwise/_names.py is outdated: run `python -m pywwise._names`.")
+    
+    def test_names_resolve(self):
+        for name, module_name in pywwise._LAZY_NAMES.items():
+            with self.subTest(name=name):
+                self.assertIs(getattr(pywwise, name), getattr(import_module(module_name), name))
+    
+    def test_unknown_name_imports_nothing(self):
+        code = ("import sys, pywwise\n"
+                "before = set(sys.modules)\n"
+                "assert not hasattr(pywwise, 'NotAPyWwiseName')\n"
+                "assert not hasattr(pywwise, 'EnumStatics')\n"
+                "print(sorted(set(sys.modules) - before))\n")
+        result = run([executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from gc import collect
+from unittest import TestCase, main
+from weakref import ref
+
+from pywwise import GUID, new_waapi_connection
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+
+
+class GuidTest(TestCase):
+    """Tests the compact (integer) and interned forms of GUIDs, using GUIDs returned by the fake server."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.project = new_synthetic_project(50, 10)
+        with FakeWaapiServer(cls.project) as server:
+            ak = new_waapi_connection(server.url)
+            try:
+                cls.guids = [info.guid for info in ak.wwise.core.object.get("$ from type Sound, ActorMixer, Event")]
+            finally:
+                ak.disconnect()
+    
+    def test_int_round_trip(self):
+        self.assertGreater(len(self.guids), 50)
+        integers = {guid.to_int() for guid in self.guids}
+        self.assertEqual(len(integers), len(set(self.guids)))
+        for guid in self.guids:
+            with self.subTest(guid=guid):
+                self.assertEqual(GUID.from_int(guid.to_int()), guid.upper())
+                self.assertEqual(GUID(guid.lower()).to_int(), guid.to_int())
+                self.assertIsInstance(GUID.from_int(guid.to_int()), GUID)
+    
+    def test_int_bounds(self):
+        self.assertEqual(GUID.get_null().to_int(), 0)
+        self.assertEqual(GUID.from_int(0), GUID.get_null())
+        self.assertEqual(GUID.from_int((1 << 128) - 1), "{FFFFFFFF-FFFF-FFFF-FFFF-FFFFFFFFFFFF}")
+        for value in (-1, 1 << 128):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                GUID.from_int(value)
+    
+    def test_intern(self):
+        guid = str(self.guids[0])
+        interned = GUID.intern(guid)
+        self.assertIs(GUID.intern(guid), interned)
+        self.assertIs(GUID.intern(GUID(guid)), interned)
+        self.assertIs(GUID.intern(guid, False), interned)
+        with self.assertRaises(ValueError):
+            GUID.intern("{not-a-guid}")
+        
+        instance = ref(interned)
+        del interned
+        collect()
+        self.assertIsNone(instance())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import GUID, new_waapi_connection
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from testclass import wait_until
+
+
+class QueryCacheTest(TestCase):
+    """Tests that the query cache serves repeated queries, and discards its results when the project changes."""
+    
+    QUERY = "$ from type Sound where name : \"_00000\""
+    
+    def setUp(self):
+        super().setUp()
+        self.project = new_synthetic_project(20)
+        self.server = FakeWaapiServer(self.project).start()
+        self.ak = new_waapi_connection(self.server.url)
+        self.other = new_waapi_connection(self.server.url)  # Makes changes that `ak` only learns about from topics.
+        self.ak.enable_query_cache()
+        self.cache = self.ak.wwise.core.object.query_cache
+    
+    def tearDown(self):
+        self.other.disconnect()
+        self.ak.disconnect()
+        self.server.stop()
+        super().tearDown()
+    
+    def test_hits_return_new_instances(self):
+        first = self.ak.wwise.core.object.get(self.QUERY, ("@Volume",))
+        first[0].other["@Volume"] = 12.0
+        second = self.ak.wwise.core.object.get(self.QUERY, ("@Volume",))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual([info.guid for info in second], [info.guid for info in first])
+        self.assertIsNot(second[0], first[0])
+        self.assertEqual(second[0].other["@Volume"], -0.0)
+    
+    def test_changes_from_this_connection(self):
+        for change in (lambda: self.ak.wwise.core.undo.undo(), lambda: self.ak.wwise.core.undo.redo(),
+                       lambda: self.ak.wwise.core.object.set_name(GUID(self.project.of_type("Sound")[5]), "Renamed")):
+            self.ak.wwise.core.object.get(self.QUERY)
+            self.assertEqual(len(self.cache), 1)
+            change()
+            self.assertEqual(len(self.cache), 0)
+    
+    def test_changes_from_other_connections(self):
+        self.assertEqual(len(self.ak.wwise.core.object.get(self.QUERY)), 10)
+        self.other.wwise.core.object.set_name(GUID(self.project.of_type("Sound")[0]), "Renamed")
+        self.assertTrue(wait_until(lambda: len(self.cache) == 0))
+        self.assertEqual(len(self.ak.wwise.core.object.get(self.QUERY)), 9)
+
+
+if __name__ == "__main__":
+    main()
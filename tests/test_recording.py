@@ -0,0 +1,77 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from waapi import EventHandler
+
+from pywwise import EReturnOptions, GUID, new_replay_connection, new_waapi_connection
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from testclass import wait_until
+
+
+def watch(name: str) -> dict:
+    """:return: The options to watch a property of all objects."""
+    return {"return": list(EReturnOptions.get_defaults()), "property": name}
+
+
+class RecordAndReplayTest(TestCase):
+    """Tests that the traffic recorded by a connection is served back by a replay connection."""
+    
+    def setUp(self):
+        super().setUp()
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name, "traffic.jsonl.gz")
+        self.project = new_synthetic_project(10)
+        self.server = FakeWaapiServer(self.project).start()
+    
+    def tearDown(self):
+        self.server.stop()
+        self.directory.cleanup()
+        super().tearDown()
+    
+    def test_round_trip(self):
+        sounds = self.project.of_type("Sound")
+        ak = new_waapi_connection(self.server.url, record_to=self.path)
+        other = new_waapi_connection(self.server.url)
+        recorded = list[tuple[str, str]]()
+        obj = ak.wwise.core.object
+        obj.property_changed.add_options(watch("Volume"))
+        obj.property_changed.add_options(watch("Pitch"))
+        obj.property_changed.add(lambda info, name, old, new, platform: recorded.append((info.name, name)))
+        infos = obj.get("$ from type Sound", ("@Volume",))
+        other.wwise.core.object.set_property(GUID(sounds[0]), "Volume", -3.0)
+        other.wwise.core.object.set_property(GUID(sounds[1]), "Pitch", 50)
+        self.assertTrue(wait_until(lambda: len(recorded) == 2))
+        other.disconnect()
+        ak.disconnect()
+        
+        replay = new_replay_connection(self.path)
+        replayed = list[tuple[str, str]]()
+        obj = replay.wwise.core.object
+        obj.property_changed.add_options(watch("Volume"))
+        obj.property_changed.add_options(watch("Pitch"))
+        obj.property_changed.add(lambda info, name, old, new, platform: replayed.append((info.name, name)))
+        self.assertEqual(obj.get("$ from type Sound", ("@Volume",)), infos)
+        self.assertEqual(replay.client.publish_events(), 2)
+        self.assertEqual(replayed, recorded)  # Each event reaches the subscription it was recorded for, only.
+        replay.disconnect()
+    
+    def test_subscribe_returns_the_handler(self):
+        ak = new_waapi_connection(self.server.url, record_to=self.path)
+        try:
+            events = list[dict]()
+            handler = EventHandler(callback=lambda **kwargs: events.append(kwargs))
+            self.assertIs(ak.client.subscribe("ak.wwise.core.object.nameChanged", handler, {}), handler)
+            ak.wwise.core.object.set_name(GUID(self.project.of_type("Sound")[2]), "Renamed")
+            self.assertTrue(wait_until(lambda: len(events) == 1))
+            self.assertTrue(ak.client.unsubscribe(handler))
+            self.assertNotIn(handler, ak.client.subscriptions())
+        finally:
+            ak.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright 2025 Matheus Vilano
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, main
+
+from pywwise import (EObjectType, evaluate_waql, EWaqlLogicalOperator, GUID, new_waapi_connection, PreparedWaqlQuery,
+                     tokenize_waql, WaqlQuery)
+from pywwise.waapi.fake_server import FakeWaapiServer, new_synthetic_project
+from pywwise.waql import _parse_waql_literal, _WAQL_PREPARED_CACHE_SIZE
+from testclass import wait_until
+
+
+class WaqlQueryTest(TestCase):
+    """Tests the expressions built by `WaqlQuery`."""
+    
+    def test_expression_operators(self):
+        for operator, expected in (("=", "="), ("==", "="), (":", ":"), (EWaqlLogicalOperator.GREATER, ">")):
+            with self.subTest(operator=operator):
+                query = WaqlQuery()
+                query.expression("Volume", operator, 0)
+                self.assertEqual(str(query), f"$ Volume {expected} 0")
+        with self.assertRaises(ValueError):
+            WaqlQuery().expression("Volume", "=~", 0)
+
+
+class PreparedWaqlQueryTest(TestCase):
+    """Tests the binding of values to `PreparedWaqlQuery` templates."""
+    
+    def test_bound_strings_stay_literals(self):
+        prepared = PreparedWaqlQuery.prepare('$ from type Sound where name = {name:str}')
+        for value in ("C:\\Sounds\\", 'Foot"step', '\\" or name : "', "\\\\"):
+            with self.subTest(value=value):
+                tokens = tokenize_waql(prepared.bind(value))
+                self.assertEqual(len(tokens), 8)
+                self.assertEqual(_parse_waql_literal(tokens[-1]), value)
+    
+    def test_bind_many_merges_objects(self):
+        prepared = PreparedWaqlQuery.prepare("$ from object {target:object} select children")
+        guids = [GUID.from_int(index) for index in range(5)]
+        self.assertTrue(prepared.is_batchable())
+        self.assertEqual(prepared.bind_many(guids, chunk_size=2),
+                         [f'$ from object "{guids[0]}", "{guids[1]}" select children',
+                          f'$ from object "{guids[2]}", "{guids[3]}" select children',
+                          f'$ from object "{guids[4]}" select children'])
+        self.assertEqual(prepared.bind_many([(EObjectType.EVENT, "Play")]),
+                         ['$ from object "Event:Play" select children'])
+    
+    def test_bind_many_without_batching(self):
+        prepared = PreparedWaqlQuery.prepare("$ from object {target:object} take {count:int}")
+        self.assertFalse(prepared.is_batchable())
+        self.assertEqual(prepared.bind_many([("\\Events\\", 1), {"target": "\\Busses", "count": 2}]),
+                         ['$ from object "\\\\Events\\\\" take 1', '$ from object "\\\\Busses" take 2'])
+        with self.assertRaises(TypeError):
+            prepared.bind_many([("\\Events", "1")])
+    
+    def test_cache_is_bounded(self):
+        first = PreparedWaqlQuery.prepare("$ from type Sound where name = {name:str}")
+        for index in range(_WAQL_PREPARED_CACHE_SIZE - 1):
+            PreparedWaqlQuery.prepare(f"$ from type Sound where name = {{name:str}} take {index}")
+            self.assertIs(PreparedWaqlQuery.prepare("$ from type Sound where name = {name:str}"), first)
+        PreparedWaqlQuery.prepare("$ from type Event where name = {name:str}")
+        self.assertLessEqual(len(PreparedWaqlQuery._cache), _WAQL_PREPARED_CACHE_SIZE)
+        self.assertIs(PreparedWaqlQuery.prepare("$ from type Sound where name = {name:str}"), first)
+
+
+class WaqlEvaluatorTest(TestCase):
+    """Tests local WAQL evaluation, against a live snapshot of a project, by comparing it with the server's results."""
+    
+    QUERIES = ('$ from type Sound where Volume < -20',
+               '$ from type Sound where name : "_0000" select parent distinct',
+               '$ from object "\\Actor-Mixer Hierarchy\\Default Work Unit" select descendants where type = "Sound"',
+               '$ from type Sound take 5 select referencesTo select parent',
+               '$ from type Bus select referencesTo')
+    
+    def setUp(self):
+        super().setUp()
+        self.project = new_synthetic_project(200, 20)
+        self.server = FakeWaapiServer(self.project).start()
+        self.ak = new_waapi_connection(self.server.url)
+    
+    def tearDown(self):
+        self.ak.disconnect()
+        self.server.stop()
+        super().tearDown()
+    
+    def assert_same_results(self, snapshot):
+        """Asserts that every query gives the same objects, in the same order, locally and on the server."""
+        for query in self.QUERIES:
+            with self.subTest(query=query), snapshot.lock:
+                expected = [info.guid.upper() for info in self.ak.wwise.core.object.get(query)]
+                self.assertTrue(expected)
+                self.assertEqual(evaluate_waql(query, snapshot), expected)
+    
+    def test_matches_server(self):
+        with self.ak.wwise.core.object.snapshot(("@Volume", "@Target", "@OutputBus")) as snapshot:
+            self.assert_same_results(snapshot)
+    
+    def test_references_follow_changes(self):
+        sounds, actions = self.project.of_type("Sound"), self.project.of_type("Action")
+        with self.ak.wwise.core.object.snapshot(("@Volume", "@Target", "@OutputBus")) as snapshot:
+            self.assertEqual(snapshot.referrers(sounds[0]), (actions[0],))
+            self.ak.wwise.core.object.set_reference(GUID(actions[1]), "Target", GUID(sounds[0]))
+            self.assertTrue(wait_until(lambda: len(snapshot.referrers(sounds[0])) == 2))
+            self.assertEqual(snapshot.referrers(sounds[1]), ())
+            self.ak.wwise.core.object.delete(GUID(self.project.parent(actions[0])))
+            self.assertTrue(wait_until(lambda: snapshot.referrers(sounds[0]) == (actions[1],)))
+            self.assert_same_results(snapshot)
+
+
+if __name__ == "__main__":
+    main()
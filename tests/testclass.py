@@ -2,11 +2,22 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from asyncio import new_event_loop as asyncio_new_event_loop, set_event_loop as asyncio_set_event_loop
+from time import monotonic, sleep
 from unittest import TestCase
 
 from pywwise import new_waapi_connection
 
 
+def wait_until(condition, timeout: float = 2.0) -> bool:
+    """Polls a condition until it is true, or until the timeout expires. Returns whether the condition was met."""
+    deadline = monotonic() + timeout
+    while not condition():
+        if monotonic() > deadline:
+            return False
+        sleep(0.01)
+    return True
+
+
 class PyWwiseTest(TestCase):
     """Base class for PyWwise test cases. Handles instantiating and deleting Ak instances automatically."""
     